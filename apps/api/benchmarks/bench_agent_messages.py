@@ -0,0 +1,116 @@
+"""Benchmark agent message persistence against the configured Postgres.
+
+Streams ``--messages`` formatted agent messages for each of ``--agents``
+concurrent agents and persists them two ways:
+
+- ``per-message``: the previous behaviour - one session, one INSERT and one
+  commit per message, awaited inline before the next message.
+- ``buffered``: ``AgentMessageBuffer`` with the given batch size and delay;
+  the loop only queues rows and the buffer is closed at the end.
+
+Each simulated agent awaits ``--loop-latency-ms`` between messages (the SDK
+stream and WebSocket broadcast). Reports messages per second and how long
+the message loop itself was blocked on persistence. Rows are written under a
+throwaway organization that is deleted afterwards.
+
+Usage:
+    uv run python benchmarks/bench_agent_messages.py
+    uv run python benchmarks/bench_agent_messages.py --agents 20 --messages 500 --batch 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from uuid import uuid4
+
+import structlog
+from sqlalchemy import delete
+
+from sibyl.db import AgentMessage, Organization, get_session
+from sibyl.jobs.agents import AgentMessageBuffer, _build_agent_message
+
+
+def formatted_message(num: int) -> dict[str, object]:
+    if num % 2:
+        return {
+            "role": "assistant",
+            "type": "tool_use",
+            "tool_name": "Read",
+            "tool_id": f"toolu_{num}",
+            "preview": "Read src/main.py",
+            "input": {"file_path": "src/main.py"},
+        }
+    return {"role": "tool", "type": "tool_result", "content": "x" * 400, "tool_id": f"toolu_{num}"}
+
+
+async def per_message_agent(agent_id: str, org_id: str, args: argparse.Namespace) -> float:
+    blocked = 0.0
+    for num in range(1, args.messages + 1):
+        await asyncio.sleep(args.loop_latency_ms / 1000)
+        start = time.perf_counter()
+        async with get_session() as session:
+            session.add(_build_agent_message(agent_id, org_id, num, formatted_message(num)))
+            await session.commit()
+        blocked += time.perf_counter() - start
+    return blocked
+
+
+async def buffered_agent(agent_id: str, org_id: str, args: argparse.Namespace) -> float:
+    blocked = 0.0
+    buffer = AgentMessageBuffer(
+        agent_id, org_id, max_batch=args.batch, max_delay=args.delay_ms / 1000
+    )
+    for num in range(1, args.messages + 1):
+        await asyncio.sleep(args.loop_latency_ms / 1000)
+        start = time.perf_counter()
+        buffer.add(num, formatted_message(num))
+        blocked += time.perf_counter() - start
+    await buffer.close()
+    assert buffer.rows_written == args.messages
+    return blocked
+
+
+async def run(args: argparse.Namespace) -> None:
+    org_id = uuid4()
+    async with get_session() as session:
+        session.add(Organization(id=org_id, name="bench", slug=f"bench-{org_id.hex[:12]}"))
+
+    total = args.agents * args.messages
+    print(f"{args.agents} agents x {args.messages} messages = {total:,} rows")
+    try:
+        for label, agent in (("per-message", per_message_agent), ("buffered", buffered_agent)):
+            start = time.perf_counter()
+            blocked = await asyncio.gather(
+                *(agent(f"bench_{label}_{i}", str(org_id), args) for i in range(args.agents))
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:12s} {elapsed:7.2f} s   {total / elapsed:9.1f} msg/s   "
+                f"loop blocked {sum(blocked) / args.agents * 1000:9.1f} ms/agent"
+            )
+    finally:
+        async with get_session() as session:
+            await session.execute(
+                delete(AgentMessage).where(AgentMessage.organization_id == org_id)
+            )
+            await session.execute(delete(Organization).where(Organization.id == org_id))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=500.0)
+    parser.add_argument("--loop-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
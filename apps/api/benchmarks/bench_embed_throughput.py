@@ -0,0 +1,158 @@
+"""Benchmark bulk embedding throughput against a local stub embedding server.
+
+Starts an OpenAI-compatible ``/v1/embeddings`` stub in process (uvicorn on a
+free port) that sleeps a fixed base latency plus a per-token cost for every
+request, then embeds the same synthetic chunk set with
+``EmbeddingService.embed_texts`` at each concurrency level:
+
+- ``serial``: the previous behaviour - batches of ``--batch-size`` items,
+  one request at a time.
+- ``concurrency=N``: token-budget packing with N requests in flight.
+
+The stub can also enforce a requests-per-minute cap and answer 429 with
+Retry-After, to exercise the backoff path (``--stub-rpm``).
+
+Usage:
+    uv run python benchmarks/bench_embed_throughput.py
+    uv run python benchmarks/bench_embed_throughput.py --chunks 5000 --concurrency 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import socket
+import time
+from collections import deque
+
+import structlog
+import uvicorn
+from openai import AsyncOpenAI
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from sibyl.crawler.embedder import EmbeddingService, RequestBudget
+
+
+def make_stub(
+    *, base_latency: float, per_token_latency: float, dimensions: int, rpm: int
+) -> Starlette:
+    """OpenAI-compatible embeddings endpoint with simulated latency."""
+    recent: deque[float] = deque()
+
+    async def embeddings(request: Request) -> JSONResponse:
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+
+        if rpm > 0:
+            now = time.monotonic()
+            while recent and now - recent[0] >= 60:
+                recent.popleft()
+            if len(recent) >= rpm:
+                return JSONResponse(
+                    {"error": {"message": "Rate limit reached", "type": "requests"}},
+                    status_code=429,
+                    headers={"retry-after": "1"},
+                )
+            recent.append(now)
+
+        tokens = sum(len(text) // 4 + 1 for text in inputs)
+        await asyncio.sleep(base_latency + tokens * per_token_latency)
+        return JSONResponse(
+            {
+                "object": "list",
+                "model": body["model"],
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": [0.0] * dimensions}
+                    for i in range(len(inputs))
+                ],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            }
+        )
+
+    return Starlette(routes=[Route("/v1/embeddings", embeddings, methods=["POST"])])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_texts(count: int, rng: random.Random) -> list[str]:
+    """Chunk-sized texts (roughly 100-1000 estimated tokens)."""
+    return ["lorem ipsum " * rng.randint(35, 350) for _ in range(count)]
+
+
+async def run(args: argparse.Namespace) -> None:
+    port = free_port()
+    app = make_stub(
+        base_latency=args.base_latency_ms / 1000,
+        per_token_latency=args.per_token_us / 1_000_000,
+        dimensions=args.dimensions,
+        rpm=args.stub_rpm,
+    )
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning", access_log=False))
+    serve = asyncio.create_task(server.serve())
+    while not server.started:  # noqa: ASYNC110 - uvicorn exposes no startup event
+        await asyncio.sleep(0.01)
+
+    client = AsyncOpenAI(base_url=f"http://127.0.0.1:{port}/v1", api_key="bench", max_retries=0)
+    texts = make_texts(args.chunks, random.Random(args.seed))
+    total_tokens = sum(len(text) // 4 + 1 for text in texts)
+    print(f"{len(texts):,} chunks, ~{total_tokens:,} tokens")
+
+    runs: list[tuple[str, int, int]] = [("serial", 1, args.batch_size)]
+    runs += [(f"concurrency={n}", n, 2048) for n in args.concurrency]
+    try:
+        for label, concurrency, max_items in runs:
+            service = EmbeddingService(
+                model="stub",
+                dimensions=args.dimensions,
+                batch_size=max_items,
+                max_batch_tokens=args.max_batch_tokens if label != "serial" else 10**9,
+                concurrency=concurrency,
+                budget=RequestBudget(rpm=args.rpm, tpm=args.tpm),
+            )
+            service._client = client
+
+            start = time.perf_counter()
+            embeddings = await service.embed_texts(texts)
+            elapsed = time.perf_counter() - start
+            assert len(embeddings) == len(texts)
+            print(
+                f"{label:16s} {elapsed:7.2f} s   "
+                f"{len(texts) / elapsed:8.1f} chunks/s   {total_tokens / elapsed:10,.0f} tokens/s"
+            )
+    finally:
+        await client.close()
+        server.should_exit = True
+        await serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch-size", type=int, default=100, help="Items per serial request")
+    parser.add_argument("--max-batch-tokens", type=int, default=20_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--base-latency-ms", type=float, default=150.0)
+    parser.add_argument("--per-token-us", type=float, default=5.0)
+    parser.add_argument("--rpm", type=int, default=0, help="Client request budget")
+    parser.add_argument("--tpm", type=int, default=0, help="Client token budget")
+    parser.add_argument("--stub-rpm", type=int, default=0, help="Stub 429s above this rate")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
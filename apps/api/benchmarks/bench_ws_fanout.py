@@ -0,0 +1,202 @@
+"""Benchmark WebSocket fan-out with thousands of simulated clients.
+
+Registers ``--sockets`` fake sockets spread evenly across ``--orgs``
+organizations on a ``ConnectionManager``. Each socket's ``send_text`` sleeps a
+small jittered latency; ``--slow-fraction`` of them stall for
+``--slow-latency-ms`` per send, like a browser tab on a bad connection.
+
+Every org then receives a burst of ``agent_message`` events plus a few
+must-deliver ``entity_created`` events, interleaved across orgs the way
+concurrent agents produce them. Reported per mode:
+
+- ``broadcast``: time spent inside ``broadcast()`` calls (p50 / p99 / max).
+- ``deliver``: time from the first broadcast until every healthy client
+  received the final event of its org.
+- Sends performed, events coalesced or shed, clients dropped.
+
+``--legacy`` also runs the previous algorithm (lock-guarded list scan,
+``send_json`` per client, sends awaited one after another) for comparison.
+
+Usage:
+    uv run python benchmarks/bench_ws_fanout.py
+    uv run python benchmarks/bench_ws_fanout.py --sockets 5000 --orgs 200 --legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from sibyl.api.websocket import Connection, ConnectionManager
+
+
+class FakeSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, org_id: str, latency: float, *, slow: bool) -> None:
+        self.org_id = org_id
+        self.latency = latency
+        self.slow = slow
+        self.sends = 0
+        self.last_event_at: float | None = None
+        self.last_payload: Any = None
+
+    async def _deliver(self, message: Any) -> None:
+        await asyncio.sleep(self.latency)
+        self.sends += 1
+        self.last_payload = message
+        self.last_event_at = time.perf_counter()
+
+    async def send_text(self, text: str) -> None:
+        await self._deliver(json.loads(text))
+
+    async def send_json(self, message: dict[str, Any]) -> None:
+        # Starlette serializes on every send_json call
+        await self._deliver(json.loads(json.dumps(message)))
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+class LegacyManager:
+    """The previous broadcast path: scan, then await each send_json in turn."""
+
+    def __init__(self) -> None:
+        self.active_connections: list[Connection] = []
+        self._lock = asyncio.Lock()
+
+    async def broadcast(self, event: str, data: dict[str, Any], org_id: str | None = None) -> None:
+        message = {"event": event, "data": data, "timestamp": datetime.now(UTC).isoformat()}
+        async with self._lock:
+            connections = [c for c in self.active_connections if c.org_id == org_id]
+        for conn in connections:
+            await conn.websocket.send_json(message)
+
+
+def make_sockets(args: argparse.Namespace, rng: random.Random) -> list[FakeSocket]:
+    sockets = []
+    for i in range(args.sockets):
+        slow = rng.random() < args.slow_fraction
+        latency = args.slow_latency_ms if slow else args.latency_ms * rng.uniform(0.5, 1.5)
+        sockets.append(FakeSocket(f"org-{i % args.orgs}", latency / 1000, slow=slow))
+    return sockets
+
+
+def make_events(args: argparse.Namespace) -> list[tuple[str, dict[str, Any], str]]:
+    """Interleaved per-org bursts; the last event of each org is must-deliver."""
+    events = []
+    for step in range(args.events_per_org):
+        for org in range(args.orgs):
+            org_id = f"org-{org}"
+            if step == args.events_per_org - 1 or step % 10 == 0:
+                events.append(("entity_created", {"id": f"{org_id}-{step}"}, org_id))
+            else:
+                data = {"agent_id": f"{org_id}-agent", "content": "x" * args.payload_bytes}
+                events.append(("agent_message", data, org_id))
+    return events
+
+
+async def wait_for_final(sockets: list[FakeSocket], final: dict[str, str], within: float) -> bool:
+    """Wait until every healthy socket has received its org's final event."""
+    deadline = time.perf_counter() + within
+    healthy = [s for s in sockets if not s.slow]
+    while time.perf_counter() < deadline:
+        if all(
+            s.last_payload and s.last_payload["data"].get("id") == final[s.org_id] for s in healthy
+        ):
+            return True
+        await asyncio.sleep(0.005)
+    return False
+
+
+async def run_mode(label: str, args: argparse.Namespace, *, legacy: bool) -> None:
+    rng = random.Random(args.seed)
+    sockets = make_sockets(args, rng)
+    events = make_events(args)
+    final = {org_id: data["id"] for _event, data, org_id in events if "id" in data}
+
+    manager: ConnectionManager | LegacyManager
+    if legacy:
+        manager = LegacyManager()
+        manager.active_connections = [
+            Connection(websocket=s, org_id=s.org_id)  # type: ignore[arg-type]
+            for s in sockets
+        ]
+    else:
+        manager = ConnectionManager()
+        for s in sockets:
+            manager.register(Connection(websocket=s, org_id=s.org_id))  # type: ignore[arg-type]
+
+    call_times: list[float] = []
+    start = time.perf_counter()
+    for event, data, org_id in events:
+        t0 = time.perf_counter()
+        await manager.broadcast(event, data, org_id=org_id)
+        call_times.append(time.perf_counter() - t0)
+        # Yield between events like independent producers would
+        await asyncio.sleep(0)
+
+    delivered = await wait_for_final(sockets, final, args.timeout)
+    elapsed = time.perf_counter() - start
+
+    sends = sum(s.sends for s in sockets)
+    expected = len(events) * (args.sockets // args.orgs)
+    call_times.sort()
+    p50 = statistics.median(call_times) * 1000
+    p99 = call_times[int(len(call_times) * 0.99)] * 1000
+    worst = call_times[-1] * 1000
+    line = (
+        f"{label:8s} broadcast p50 {p50:7.3f} ms  p99 {p99:8.3f} ms  max {worst:8.1f} ms"
+        f"   deliver {elapsed:6.2f} s{'' if delivered else ' (timeout)'}"
+        f"   sends {sends:,}/{expected:,}"
+    )
+    if isinstance(manager, ConnectionManager):
+        conns = manager.active_connections
+        dropped = sum(c.outbox.dropped for c in conns)
+        line += f"   shed {dropped:,}   clients dropped {args.sockets - len(conns)}"
+        for conn in conns:
+            await manager.disconnect(conn.websocket)
+        if manager._heartbeat_task:
+            manager._heartbeat_task.cancel()
+    print(line)
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{args.sockets:,} sockets across {args.orgs} orgs, "
+        f"{args.events_per_org} events per org, {args.slow_fraction:.0%} slow clients"
+    )
+    await run_mode("indexed", args, legacy=False)
+    if args.legacy:
+        await run_mode("legacy", args, legacy=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sockets", type=int, default=5_000)
+    parser.add_argument("--orgs", type=int, default=200)
+    parser.add_argument("--events-per-org", type=int, default=50)
+    parser.add_argument("--payload-bytes", type=int, default=512)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Typical send latency")
+    parser.add_argument("--slow-fraction", type=float, default=0.01)
+    parser.add_argument("--slow-latency-ms", type=float, default=500.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--legacy", action="store_true", help="Also run the previous algorithm")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
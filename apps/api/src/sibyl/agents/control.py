@@ -0,0 +1,289 @@
+"""Push-based control signals for agents running in a worker process.
+
+The API publishes stop, pause and message signals for an agent on
+``sibyl:agent:control:{agent_id}``. Each worker keeps one pattern
+subscription for all agents and routes every signal to the
+``AgentControl`` events of the matching local agent. Agents running
+elsewhere are ignored.
+
+The subscription itself is the process-wide ``PatternSubscriber`` (see
+``sibyl.agents.subscriber``), shared with approval and question responses.
+
+Stop and pause requests are also written as short-lived Redis keys (see
+``sibyl.api.pubsub``). A slow poll reads the keys for every local agent in
+one MGET. It catches signals published while the subscriber was
+reconnecting. Message signals have no fallback; the message itself is
+already stored in Postgres by the API.
+
+Control latency (publish to dispatch) and delivery counts are kept per
+worker and published to Redis, where ``/jobs/health`` reports them.
+
+Channel naming: sibyl:agent:control:{agent_id}
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+import structlog
+
+from sibyl.agents.subscriber import PatternSubscriber, create_pubsub_redis, get_subscriber
+from sibyl.api.pubsub import AGENT_CONTROL_CHANNEL, AGENT_PAUSE_SET, AGENT_STOP_SET
+
+log = structlog.get_logger()
+
+CONTROL_CHANNEL_PREFIX = f"{AGENT_CONTROL_CHANNEL}:"
+CONTROL_STATS_PREFIX = "sibyl:agent:control_stats:"
+
+
+class ControlAction(StrEnum):
+    """Signals the API can send to a running agent."""
+
+    STOP = "stop"
+    PAUSE = "pause"
+    MESSAGE = "message"
+
+
+@dataclass
+class AgentControl:
+    """Control events for one agent running in this worker."""
+
+    agent_id: str
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    pause: asyncio.Event = field(default_factory=asyncio.Event)
+    message: asyncio.Event = field(default_factory=asyncio.Event)
+    # Set together with stop or pause
+    interrupt: asyncio.Event = field(default_factory=asyncio.Event)
+    reason: str | None = None
+    pending_messages: list[str] = field(default_factory=list)
+
+    @property
+    def interrupted(self) -> bool:
+        """True once the agent has been asked to stop or pause."""
+        return self.interrupt.is_set()
+
+    def drain_messages(self) -> list[str]:
+        """Take the user messages received so far."""
+        messages, self.pending_messages = self.pending_messages, []
+        self.message.clear()
+        return messages
+
+
+@dataclass
+class ControlStats:
+    """Delivery counts and publish-to-dispatch latency for one worker."""
+
+    pushed: int = 0
+    polled: int = 0
+    ignored: int = 0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def record(self, latency_ms: float | None, *, polled: bool) -> None:
+        if polled:
+            self.polled += 1
+        else:
+            self.pushed += 1
+        if latency_ms is not None:
+            self.latencies_ms.append(max(latency_ms, 0.0))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        ordered = sorted(self.latencies_ms)
+
+        def percentile(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(int(len(ordered) * p), len(ordered) - 1)], 1)
+
+        return {
+            "pushed": self.pushed,
+            "polled": self.polled,
+            "ignored": self.ignored,
+            "latency_ms_p50": percentile(0.50),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": round(ordered[-1], 1) if ordered else None,
+        }
+
+
+def _latency_ms(sent_at: Any) -> float | None:
+    try:
+        return (time.time() - float(sent_at)) * 1000
+    except (TypeError, ValueError):
+        return None
+
+
+class AgentControlBus:
+    """Per-worker subscriber that routes control signals to local agents."""
+
+    # Fallback poll of the stop/pause keys, in seconds
+    FALLBACK_POLL_INTERVAL = 5.0
+    # How often stats are published for /jobs/health, in seconds
+    STATS_INTERVAL = 30.0
+
+    def __init__(self, subscriber: PatternSubscriber | None = None) -> None:
+        self.stats = ControlStats()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._agents: dict[str, AgentControl] = {}
+        self._subscriber = subscriber or get_subscriber()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def register(self, agent_id: str) -> AgentControl:
+        """Start routing control signals for an agent running in this worker."""
+        control = AgentControl(agent_id=agent_id)
+        self._agents[agent_id] = control
+        if not self._tasks:
+            # Signals sent while the subscriber was away are only in the keys
+            self._subscriber.subscribe(
+                f"{CONTROL_CHANNEL_PREFIX}*", self._on_message, self._sweep_keys
+            )
+            self._tasks = [
+                asyncio.create_task(self._poll_fallback()),
+                asyncio.create_task(self._publish_stats()),
+            ]
+        return control
+
+    def unregister(self, agent_id: str) -> None:
+        """Stop routing signals for an agent."""
+        self._agents.pop(agent_id, None)
+
+    async def close(self) -> None:
+        """Stop the fallback poll and stats tasks."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def dispatch(self, agent_id: str, payload: dict[str, Any], *, polled: bool = False) -> bool:
+        """Apply a control signal to a local agent. Returns False if the agent isn't here."""
+        control = self._agents.get(agent_id)
+        if control is None:
+            if not polled:
+                self.stats.ignored += 1
+            return False
+
+        action = payload.get("action")
+        if action == ControlAction.MESSAGE:
+            content = payload.get("content")
+            if content:
+                control.pending_messages.append(content)
+            control.message.set()
+        elif action in (ControlAction.STOP, ControlAction.PAUSE):
+            event = control.stop if action == ControlAction.STOP else control.pause
+            if event.is_set():
+                return True
+            control.reason = payload.get("reason") or control.reason
+            event.set()
+            control.interrupt.set()
+        else:
+            log.warning("agent_control_unknown_action", agent_id=agent_id, action=action)
+            return False
+
+        latency = _latency_ms(payload.get("sent_at"))
+        self.stats.record(latency, polled=polled)
+        log.info(
+            "agent_control_dispatched",
+            agent_id=agent_id,
+            action=action,
+            via="poll" if polled else "push",
+            latency_ms=round(latency, 1) if latency is not None else None,
+        )
+        return True
+
+    def _on_message(self, channel: str, data: str) -> None:
+        agent_id = channel.removeprefix(CONTROL_CHANNEL_PREFIX)
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            log.warning("agent_control_invalid_json", data=data)
+            return
+        self.dispatch(agent_id, payload)
+
+    async def _poll_fallback(self) -> None:
+        """Slowly re-check the stop/pause keys in case a push was missed."""
+        while True:
+            await asyncio.sleep(self.FALLBACK_POLL_INTERVAL)
+            try:
+                await self._sweep_keys()
+            except Exception as e:
+                log.debug("agent_control_poll_failed", error=str(e))
+
+    async def _sweep_keys(self) -> None:
+        """Read the stop and pause keys for all local agents in one round trip."""
+        agent_ids = [a for a, control in self._agents.items() if not control.interrupted]
+        if not agent_ids:
+            return
+
+        keys = [f"{AGENT_STOP_SET}:{a}" for a in agent_ids]
+        keys += [f"{AGENT_PAUSE_SET}:{a}" for a in agent_ids]
+        values = await self._subscriber.redis.mget(keys)
+
+        count = len(agent_ids)
+        for i, agent_id in enumerate(agent_ids):
+            for action, value in (
+                (ControlAction.STOP, values[i]),
+                (ControlAction.PAUSE, values[count + i]),
+            ):
+                if value is not None:
+                    payload = {"action": action, "sent_at": value}
+                    self.dispatch(agent_id, payload, polled=True)
+
+    async def _publish_stats(self) -> None:
+        """Periodically publish this worker's stats for the health endpoint."""
+        while True:
+            await asyncio.sleep(self.STATS_INTERVAL)
+            snapshot = {
+                "worker_id": self.worker_id,
+                "agents": len(self._agents),
+                **self.stats.to_dict(),
+                "reconnects": self._subscriber.reconnects,
+            }
+            try:
+                await self._subscriber.redis.setex(
+                    f"{CONTROL_STATS_PREFIX}{self.worker_id}",
+                    int(self.STATS_INTERVAL * 3),
+                    json.dumps(snapshot),
+                )
+            except Exception as e:
+                log.debug("agent_control_stats_publish_failed", error=str(e))
+
+
+# Global control bus instance (one per worker process)
+_bus: AgentControlBus | None = None
+
+
+def get_control_bus() -> AgentControlBus:
+    """Get or create the worker's control bus."""
+    global _bus  # noqa: PLW0603
+    if _bus is None:
+        _bus = AgentControlBus()
+    return _bus
+
+
+async def shutdown_control_bus() -> None:
+    """Stop the worker's control bus tasks, if it was started."""
+    global _bus  # noqa: PLW0603
+    if _bus is not None:
+        await _bus.close()
+        _bus = None
+
+
+async def read_control_stats() -> list[dict[str, Any]]:
+    """Read the latest control stats published by each live worker."""
+    redis = create_pubsub_redis()
+    try:
+        keys = [key async for key in redis.scan_iter(match=f"{CONTROL_STATS_PREFIX}*")]
+        if not keys:
+            return []
+        values = await redis.mget(keys)
+        return [json.loads(value) for value in values if value]
+    finally:
+        await redis.close()
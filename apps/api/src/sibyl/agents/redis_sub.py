@@ -3,8 +3,10 @@
 The worker process needs to receive approval responses from the API process.
 Since they don't share memory, we use Redis pubsub for IPC.
 
-This module provides a simple interface for the worker to subscribe to
-approval-specific channels and wait for responses.
+Each worker process keeps one pattern subscription for all approval and
+question channels (see ResponseBroker), on the process-wide PatternSubscriber
+it shares with agent control signals; waiting on a response does not open a
+connection of its own.
 
 Channel naming: sibyl:approval:{approval_id}
 """
@@ -14,39 +16,134 @@ import json
 from typing import Any
 
 import structlog
-from redis.asyncio import Redis
 
-from sibyl.config import settings
+from sibyl.agents.subscriber import PatternSubscriber, create_pubsub_redis, get_subscriber
 
 log = structlog.get_logger()
 
-# Use same Redis DB as websocket pubsub for consistency
-PUBSUB_DB = 2
-
 # Channel prefixes for IPC messages
 APPROVAL_CHANNEL_PREFIX = "sibyl:approval:"
 QUESTION_CHANNEL_PREFIX = "sibyl:question:"
 
+# Published responses are also stored here, so waiters can recover them after
+# a reconnect. Outlives the longest wait (questions wait up to 30 minutes).
+RESPONSE_KEY_SUFFIX = ":response"
+RESPONSE_TTL = 3600
 
-async def _get_redis() -> Redis:
-    """Get a Redis connection for pubsub."""
-    return Redis(
-        host=settings.falkordb_host,
-        port=settings.falkordb_port,
-        password=settings.falkordb_password,
-        db=PUBSUB_DB,
-        decode_responses=True,
-    )
+
+class ResponseBroker:
+    """Routes approval and question responses to waiting coroutines.
+
+    One broker per process routes the approval and question patterns of the
+    shared subscriber. Each pending request waits on its own
+    future, so thousands of waiters share one Redis connection. After every
+    (re)subscribe the broker reads the stored responses of all pending
+    requests, which recovers anything published while it was disconnected.
+    """
+
+    def __init__(self, subscriber: PatternSubscriber | None = None) -> None:
+        self._waiters: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        self._subscriber = subscriber or get_subscriber()
+        self._subscribed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of requests currently waiting for a response."""
+        return len(self._waiters)
+
+    async def wait(self, channel: str, wait_timeout: float) -> dict[str, Any] | None:
+        """Wait for the response published on a channel.
+
+        Returns:
+            The response dict, or None on timeout
+        """
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(channel, []).append(future)
+
+        if not self._subscribed:
+            self._subscribed = True
+            self._subscriber.subscribe(
+                f"{APPROVAL_CHANNEL_PREFIX}*", self._on_message, self._recover
+            )
+            self._subscriber.subscribe(f"{QUESTION_CHANNEL_PREFIX}*", self._on_message)
+
+        try:
+            async with asyncio.timeout(wait_timeout):
+                return await future
+        except TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(channel)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[channel]
+
+    def dispatch(self, channel: str, data: dict[str, Any]) -> bool:
+        """Resolve the waiters for a channel. Returns False if nobody is waiting."""
+        waiters = self._waiters.pop(channel, None)
+        if not waiters:
+            return False
+        for future in waiters:
+            if not future.done():
+                future.set_result(data)
+        return True
+
+    def _on_message(self, channel: str, data: str) -> None:
+        try:
+            response = json.loads(data)
+        except json.JSONDecodeError:
+            log.warning("Invalid response payload", channel=channel)
+            return
+        self.dispatch(channel, response)
+
+    async def _recover(self) -> None:
+        """Resolve pending waiters whose response was stored while we were away."""
+        channels = list(self._waiters)
+        if not channels:
+            return
+
+        stored = await self._subscriber.redis.mget([f"{c}{RESPONSE_KEY_SUFFIX}" for c in channels])
+        recovered = 0
+        for channel, value in zip(channels, stored, strict=True):
+            if value is not None and self.dispatch(channel, json.loads(value)):
+                recovered += 1
+        if recovered:
+            log.info("Recovered missed responses", count=recovered)
+
+
+# Global broker instance (one per process)
+_broker: ResponseBroker | None = None
+
+
+def get_response_broker() -> ResponseBroker:
+    """Get or create the process-wide response broker."""
+    global _broker  # noqa: PLW0603
+    if _broker is None:
+        _broker = ResponseBroker()
+    return _broker
+
+
+async def _publish_response(channel: str, response: dict[str, Any]) -> None:
+    """Store a response and publish it to its channel."""
+    payload = json.dumps(response)
+    redis = create_pubsub_redis()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setex(f"{channel}{RESPONSE_KEY_SUFFIX}", RESPONSE_TTL, payload)
+            pipe.publish(channel, payload)
+            await pipe.execute()
+    finally:
+        await redis.close()
 
 
 async def wait_for_approval_response(
     approval_id: str,
     wait_timeout: float = 300.0,
 ) -> dict[str, Any] | None:
-    """Subscribe to an approval channel and wait for a response.
+    """Wait for the API to publish a decision for an approval request.
 
-    This is a blocking call that waits for the API to publish an approval
-    decision to the channel. Used by ApprovalService in the worker process.
+    Used by ApprovalService in the worker process.
 
     Args:
         approval_id: The approval record ID to wait for
@@ -56,39 +153,17 @@ async def wait_for_approval_response(
         The approval response dict if received, None if timeout
     """
     channel = f"{APPROVAL_CHANNEL_PREFIX}{approval_id}"
-    redis = await _get_redis()
-    pubsub = redis.pubsub()
-
-    try:
-        await pubsub.subscribe(channel)
-        log.debug("Subscribed to approval channel", channel=channel)
-
-        # Wait for message with timeout
-        async with asyncio.timeout(wait_timeout):
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    data = json.loads(message["data"])
-                    log.info(
-                        "Received approval response",
-                        approval_id=approval_id,
-                        approved=data.get("approved"),
-                    )
-                    return data
-
-    except TimeoutError:
+    data = await get_response_broker().wait(channel, wait_timeout)
+    if data is None:
         log.warning("Approval request timed out", approval_id=approval_id)
         return None
 
-    except Exception as e:
-        log.exception("Error waiting for approval", approval_id=approval_id, error=str(e))
-        return None
-
-    finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.close()
-        await redis.close()
-
-    return None
+    log.info(
+        "Received approval response",
+        approval_id=approval_id,
+        approved=data.get("approved"),
+    )
+    return data
 
 
 async def publish_approval_response(
@@ -107,10 +182,9 @@ async def publish_approval_response(
         True if published successfully, False otherwise
     """
     channel = f"{APPROVAL_CHANNEL_PREFIX}{approval_id}"
-    redis = await _get_redis()
 
     try:
-        await redis.publish(channel, json.dumps(response))
+        await _publish_response(channel, response)
         log.info(
             "Published approval response",
             approval_id=approval_id,
@@ -122,18 +196,14 @@ async def publish_approval_response(
         log.exception("Failed to publish approval response", approval_id=approval_id, error=str(e))
         return False
 
-    finally:
-        await redis.close()
-
 
 async def wait_for_question_response(
     question_id: str,
     wait_timeout: float = 300.0,
 ) -> dict[str, Any] | None:
-    """Subscribe to a question channel and wait for a user response.
+    """Wait for the API to publish a user's answer to a question.
 
-    This is a blocking call that waits for the API to publish a user's
-    answer to the question. Used by the AskUserQuestion hook in the worker.
+    Used by the AskUserQuestion hook in the worker.
 
     Args:
         question_id: The question record ID to wait for
@@ -143,39 +213,17 @@ async def wait_for_question_response(
         The response dict with 'answers' if received, None if timeout
     """
     channel = f"{QUESTION_CHANNEL_PREFIX}{question_id}"
-    redis = await _get_redis()
-    pubsub = redis.pubsub()
-
-    try:
-        await pubsub.subscribe(channel)
-        log.debug("Subscribed to question channel", channel=channel)
-
-        # Wait for message with timeout
-        async with asyncio.timeout(wait_timeout):
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    data = json.loads(message["data"])
-                    log.info(
-                        "Received question response",
-                        question_id=question_id,
-                        answers=data.get("answers"),
-                    )
-                    return data
-
-    except TimeoutError:
+    data = await get_response_broker().wait(channel, wait_timeout)
+    if data is None:
         log.warning("Question request timed out", question_id=question_id)
         return None
 
-    except Exception as e:
-        log.exception("Error waiting for question", question_id=question_id, error=str(e))
-        return None
-
-    finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.close()
-        await redis.close()
-
-    return None
+    log.info(
+        "Received question response",
+        question_id=question_id,
+        answers=data.get("answers"),
+    )
+    return data
 
 
 async def publish_question_response(
@@ -194,10 +242,9 @@ async def publish_question_response(
         True if published successfully, False otherwise
     """
     channel = f"{QUESTION_CHANNEL_PREFIX}{question_id}"
-    redis = await _get_redis()
 
     try:
-        await redis.publish(channel, json.dumps(response))
+        await _publish_response(channel, response)
         log.info(
             "Published question response",
             question_id=question_id,
@@ -208,6 +255,3 @@ async def publish_question_response(
     except Exception as e:
         log.exception("Failed to publish question response", question_id=question_id, error=str(e))
         return False
-
-    finally:
-        await redis.close()
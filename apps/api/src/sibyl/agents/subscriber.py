@@ -0,0 +1,167 @@
+"""One reconnecting Redis pattern subscription per worker process.
+
+Agent control signals (``sibyl.agents.control``) and approval/question
+responses (``sibyl.agents.redis_sub``) both arrive as pattern messages on the
+pub/sub database. PatternSubscriber holds a single connection for all of
+them: each consumer registers a pattern with a message handler, plus an
+optional hook that runs after every (re)subscribe so the consumer can read
+back anything published while the connection was down.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from redis.asyncio import Redis
+
+from sibyl.api.pubsub import PUBSUB_DB
+from sibyl.config import settings
+
+log = structlog.get_logger()
+
+# Called with (channel, raw data) for every message matching the pattern
+MessageHandler = Callable[[str, str], None]
+# Called after every (re)subscribe
+SubscribeHook = Callable[[], Awaitable[None]]
+
+
+def create_pubsub_redis() -> Redis:
+    """Create a client on the pub/sub database."""
+    return Redis(
+        host=settings.falkordb_host,
+        port=settings.falkordb_port,
+        password=settings.falkordb_password,
+        db=PUBSUB_DB,
+        decode_responses=True,
+    )
+
+
+@dataclass
+class _Route:
+    on_message: MessageHandler
+    on_subscribe: SubscribeHook | None = None
+
+
+class PatternSubscriber:
+    """Routes pattern messages to their handlers over one subscription."""
+
+    # Reconnect backoff bounds, in seconds
+    RECONNECT_MIN = 0.5
+    RECONNECT_MAX = 30.0
+
+    def __init__(self, redis: Redis | None = None) -> None:
+        self.reconnects = 0
+        self._redis = redis
+        self._routes: dict[str, _Route] = {}
+        self._pubsub: Any | None = None
+        self._listener: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    @property
+    def redis(self) -> Redis:
+        """Client for plain commands (MGET, SETEX) on the pub/sub database."""
+        if self._redis is None:
+            self._redis = create_pubsub_redis()
+        return self._redis
+
+    def subscribe(
+        self,
+        pattern: str,
+        on_message: MessageHandler,
+        on_subscribe: SubscribeHook | None = None,
+    ) -> None:
+        """Route messages matching a pattern to a handler.
+
+        Starts the listener on first use. A pattern added while the listener
+        is connected is subscribed on the live connection.
+        """
+        self._routes[pattern] = _Route(on_message, on_subscribe)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        elif self._pubsub is not None:
+            task = asyncio.create_task(self._add(self._pubsub, pattern))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def close(self) -> None:
+        """Stop the listener and close the Redis connection."""
+        tasks = [*self._pending, *([self._listener] if self._listener else [])]
+        self._listener = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def _add(self, pubsub: Any, pattern: str) -> None:
+        """Subscribe one more pattern on a live connection."""
+        try:
+            await pubsub.psubscribe(pattern)
+            route = self._routes.get(pattern)
+            if route is not None and route.on_subscribe is not None:
+                await route.on_subscribe()
+        except Exception as e:
+            # The listener sees the same failure and resubscribes every route
+            log.debug("pubsub_subscribe_failed", pattern=pattern, error=str(e))
+
+    async def _listen(self) -> None:
+        """Hold the subscription for every route, reconnecting with backoff."""
+        delay = self.RECONNECT_MIN
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                patterns = list(self._routes)
+                await pubsub.psubscribe(*patterns)
+                self._pubsub = pubsub
+                # Routes added while the subscribe was in flight
+                if missing := [p for p in self._routes if p not in patterns]:
+                    await pubsub.psubscribe(*missing)
+                log.debug("pubsub_subscribed", patterns=list(self._routes))
+                delay = self.RECONNECT_MIN
+                for route in list(self._routes.values()):
+                    if route.on_subscribe is not None:
+                        await route.on_subscribe()
+
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    route = self._routes.get(message["pattern"])
+                    if route is not None:
+                        route.on_message(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.reconnects += 1
+                log.warning("pubsub_listener_error", error=str(e), retry_in=delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX)
+            finally:
+                self._pubsub = None
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+
+# Global subscriber instance (one per process)
+_subscriber: PatternSubscriber | None = None
+
+
+def get_subscriber() -> PatternSubscriber:
+    """Get or create the process-wide pattern subscriber."""
+    global _subscriber  # noqa: PLW0603
+    if _subscriber is None:
+        _subscriber = PatternSubscriber()
+    return _subscriber
+
+
+async def shutdown_subscriber() -> None:
+    """Close the process-wide subscriber, if it was started."""
+    global _subscriber  # noqa: PLW0603
+    if _subscriber is not None:
+        await _subscriber.close()
+        _subscriber = None
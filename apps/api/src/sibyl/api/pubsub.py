@@ -14,6 +14,7 @@ to their locally connected WebSocket clients.
 import asyncio
 import contextlib
 import json
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -106,6 +107,12 @@ class RedisPubSub:
             log.exception("redis_pubsub_publish_failed", ws_event=event)
             raise
 
+    async def publish_to(self, channel: str, message: dict[str, Any]) -> None:
+        """Publish a JSON message to an arbitrary channel."""
+        if self._redis is None:
+            await self.connect()
+        await self._redis.publish(channel, json.dumps(message))  # type: ignore[union-attr]
+
     async def setex(self, key: str, ttl: int, value: str) -> None:
         """Set a key with expiry."""
         if self._redis is None:
@@ -221,28 +228,44 @@ async def publish_event(event: str, data: dict[str, Any], *, org_id: str | None
 # =============================================================================
 # Agent Control Signals
 # =============================================================================
-# These functions use a Redis set to track agent control signals.
-# The worker execution loop checks this set between message iterations.
+# Signals are pushed on a per-agent control channel; the worker running the
+# agent dispatches them immediately (see sibyl.agents.control). Stop and pause
+# are also written to short-lived keys so a worker that missed the push picks
+# them up on its slow fallback poll.
 
 AGENT_STOP_SET = "sibyl:agent:stop"
+AGENT_PAUSE_SET = "sibyl:agent:pause"
+AGENT_CONTROL_CHANNEL = "sibyl:agent:control"
+
+# Signal keys expire after 5 minutes to prevent stale signals
+AGENT_SIGNAL_TTL = 300
+
+
+async def _send_agent_signal(
+    agent_id: str, action: str, key_prefix: str | None = None, **extra: Any
+) -> None:
+    """Store (optionally) and push a control signal for an agent."""
+    pubsub = get_pubsub()
+    sent_at = time.time()
+    if key_prefix:
+        await pubsub.setex(f"{key_prefix}:{agent_id}", AGENT_SIGNAL_TTL, str(sent_at))
+    await pubsub.publish_to(
+        f"{AGENT_CONTROL_CHANNEL}:{agent_id}",
+        {"action": action, "sent_at": sent_at, **extra},
+    )
 
 
 async def request_agent_stop(agent_id: str) -> bool:
     """Request an agent to stop execution.
 
-    Adds the agent_id to a Redis key that the worker checks.
-    The signal expires after 5 minutes to prevent stale signals.
-
     Args:
         agent_id: Agent ID to stop
 
     Returns:
         True if signal was set
     """
-    pubsub = get_pubsub()
     try:
-        key = f"{AGENT_STOP_SET}:{agent_id}"
-        await pubsub.setex(key, 300, "stop")
+        await _send_agent_signal(agent_id, "stop", AGENT_STOP_SET)
         log.info("agent_stop_requested", agent_id=agent_id)
         return True
     except Exception:
@@ -250,11 +273,49 @@ async def request_agent_stop(agent_id: str) -> bool:
         return False
 
 
+async def request_agent_pause(agent_id: str, reason: str | None = None) -> bool:
+    """Request a running agent to pause after its current step.
+
+    Args:
+        agent_id: Agent ID to pause
+        reason: Reason shown to the user
+
+    Returns:
+        True if signal was set
+    """
+    try:
+        await _send_agent_signal(agent_id, "pause", AGENT_PAUSE_SET, reason=reason)
+        log.info("agent_pause_requested", agent_id=agent_id)
+        return True
+    except Exception:
+        log.exception("agent_pause_request_failed", agent_id=agent_id)
+        return False
+
+
+async def send_agent_message(agent_id: str, content: str) -> bool:
+    """Deliver a user message to a running agent.
+
+    Not stored in Redis - the message is persisted by the caller, so a missed
+    push only delays it until the agent is next resumed.
+
+    Args:
+        agent_id: Agent ID to message
+        content: Message text
+
+    Returns:
+        True if the message was published
+    """
+    try:
+        await _send_agent_signal(agent_id, "message", content=content)
+        return True
+    except Exception:
+        log.warning("agent_message_publish_failed", agent_id=agent_id)
+        return False
+
+
 async def check_agent_stop(agent_id: str) -> bool:
     """Check if an agent has been requested to stop.
 
-    Called by the worker execution loop between message iterations.
-
     Args:
         agent_id: Agent ID to check
 
@@ -272,16 +333,14 @@ async def check_agent_stop(agent_id: str) -> bool:
 
 
 async def clear_agent_stop(agent_id: str) -> None:
-    """Clear stop signal after agent has stopped.
-
-    Called after agent execution ends to clean up the signal.
+    """Clear stop and pause signals after agent execution ends.
 
     Args:
         agent_id: Agent ID to clear
     """
     pubsub = get_pubsub()
     try:
-        key = f"{AGENT_STOP_SET}:{agent_id}"
-        await pubsub.delete(key)
+        await pubsub.delete(f"{AGENT_STOP_SET}:{agent_id}")
+        await pubsub.delete(f"{AGENT_PAUSE_SET}:{agent_id}")
     except Exception:
         log.warning("agent_stop_clear_failed", agent_id=agent_id)
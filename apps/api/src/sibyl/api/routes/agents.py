@@ -536,14 +536,20 @@ async def pause_agent(
             detail=f"Cannot pause agent in {agent_status} status",
         )
 
+    from sibyl.api.pubsub import request_agent_pause
+
+    reason = request.reason or "user_request"
     await manager.update(
         agent_id,
         {
             "status": AgentStatus.PAUSED.value,
-            "paused_reason": request.reason or "user_request",
+            "paused_reason": reason,
         },
     )
 
+    # Tell the worker running the agent to stop streaming and save its session
+    await request_agent_pause(agent_id, reason)
+
     return AgentActionResponse(
         success=True,
         agent_id=agent_id,
@@ -564,6 +570,7 @@ async def resume_agent(
 
     Requires ownership or CONTRIBUTOR+ project access.
     """
+    from sibyl.api.pubsub import clear_agent_stop
     from sibyl.jobs.queue import enqueue_agent_resume
 
     ctx = auth.ctx
@@ -605,6 +612,9 @@ async def resume_agent(
         },
     )
 
+    # Drop stop/pause signals left over from the previous run
+    await clear_agent_stop(agent_id)
+
     # Enqueue resume job for worker
     await enqueue_agent_resume(agent_id, str(org.id))
 
@@ -630,8 +640,8 @@ async def terminate_agent(
     1. Updates the agent status in the graph to 'terminated'
     2. Signals the worker to stop execution via Redis
 
-    The worker checks for stop signals between message iterations and will
-    gracefully terminate when it sees the signal.
+    The worker running the agent receives the signal on its control channel
+    and stops the agent immediately, even mid-turn.
     """
     from sibyl.api.pubsub import publish_event, request_agent_stop
 
@@ -762,7 +772,8 @@ async def send_agent_message(
     """Send a message to an agent.
 
     If the agent is in a terminal state (completed/failed/terminated),
-    this will resume it using Claude's session management.
+    this will resume it using Claude's session management. A running agent
+    receives the message over its control channel.
 
     Requires ownership or CONTRIBUTOR+ project access.
     """
@@ -791,6 +802,11 @@ async def send_agent_message(
         AgentStatus.TERMINATED.value,
     )
     needs_resume = agent_status in terminal_states
+    running_states = (
+        AgentStatus.WORKING.value,
+        AgentStatus.WAITING_APPROVAL.value,
+        AgentStatus.WAITING_DEPENDENCY.value,
+    )
 
     # Validate session_id is a proper UUID (not a placeholder like "user-initiated")
     has_valid_session = _is_valid_uuid(session_id)
@@ -852,8 +868,11 @@ async def send_agent_message(
             },
         )
 
+        from sibyl.api.pubsub import clear_agent_stop
         from sibyl.jobs.queue import enqueue_agent_resume
 
+        await clear_agent_stop(agent_id)
+
         # Pass the message directly - Claude handles conversation history
         await enqueue_agent_resume(agent_id, str(org.id), prompt=request.content)
 
@@ -862,6 +881,11 @@ async def send_agent_message(
             agent_id=agent_id,
             previous_status=agent_status,
         )
+    elif agent_status in running_states:
+        from sibyl.api.pubsub import send_agent_message
+
+        # Deliver to the running agent; it replies once its current turn ends
+        await send_agent_message(agent_id, request.content)
 
     return SendMessageResponse(
         success=True,
@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
 
+from sibyl.api.errors import bad_request
 from sibyl.api.schemas import (
     EntityCreate,
     EntityListResponse,
@@ -30,7 +31,7 @@ from sibyl.db import CrawledDocument, CrawlSource, DocumentChunk, get_session
 from sibyl.db.connection import get_session_dependency
 from sibyl.db.models import Organization, OrganizationRole
 from sibyl.db.project_sync import sync_project_create, sync_project_delete, sync_project_update
-from sibyl_core.errors import EntityNotFoundError
+from sibyl_core.errors import EntityNotFoundError, ValidationError
 from sibyl_core.graph.client import get_graph_client
 from sibyl_core.graph.entities import EntityManager
 from sibyl_core.graph.relationships import RelationshipManager
@@ -185,6 +186,14 @@ async def list_entities(
     page_size: int = Query(default=50, ge=1, le=200, description="Items per page"),
     sort_by: SortField = Query(default=SortField.UPDATED_AT, description="Field to sort by"),
     sort_order: SortOrder = Query(default=SortOrder.DESC, description="Sort direction"),
+    *,
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset pagination cursor: pass an empty string for the first page, then the "
+            "previous response's next_cursor. Replaces page; sort_by must be a timestamp."
+        ),
+    ),
 ) -> EntityListResponse:
     """List entities with optional filters and pagination."""
     try:
@@ -194,10 +203,25 @@ async def list_entities(
             entity_type=entity_type,
             project_ids=project_ids,
             page=page,
+            cursor=cursor,
         )
         client = await get_graph_client()
         entity_manager = EntityManager(client, group_id=group_id)
 
+        if cursor is not None:
+            return await _list_entities_page(
+                entity_manager,
+                entity_type=entity_type,
+                language=language,
+                category=category,
+                search=search,
+                project_ids=project_ids,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                cursor=cursor,
+            )
+
         # Get entities - single query for all types, or filtered by type
         if entity_type:
             all_entities = await entity_manager.list_by_type(entity_type, limit=1000)
@@ -230,27 +254,8 @@ async def list_entities(
                     # Entity has no project - only include if unassigned is selected
                     continue
 
-            # Language filter
-            if language:
-                entity_langs = getattr(entity, "languages", []) or []
-                if language.lower() not in [lang.lower() for lang in entity_langs]:
-                    continue
-
-            # Category filter
-            if category:
-                entity_cat = getattr(entity, "category", "") or ""
-                if category.lower() not in entity_cat.lower():
-                    continue
-
-            # Search filter (name and description)
-            if search:
-                search_lower = search.lower()
-                name = (getattr(entity, "name", "") or "").lower()
-                description = (getattr(entity, "description", "") or "").lower()
-                if search_lower not in name and search_lower not in description:
-                    continue
-
-            filtered.append(entity)
+            if _passes_list_filters(entity, language, category, search):
+                filtered.append(entity)
 
         # Sort entities
         def get_sort_key(e: Any) -> Any:
@@ -272,35 +277,18 @@ async def list_entities(
         end = start + page_size
         page_entities = filtered[start:end]
 
-        # Convert to response models
-        response_entities = [
-            EntityResponse(
-                id=entity.id,
-                entity_type=entity.entity_type,
-                name=entity.name,
-                description=entity.description or "",
-                content=(entity.content or "")[:50000],  # Truncate for list view
-                category=getattr(entity, "category", None) or entity.metadata.get("category"),
-                languages=getattr(entity, "languages", None)
-                or entity.metadata.get("languages", [])
-                or [],
-                tags=getattr(entity, "tags", None) or entity.metadata.get("tags", []) or [],
-                metadata=getattr(entity, "metadata", {}) or {},
-                source_file=getattr(entity, "source_file", None),
-                created_at=getattr(entity, "created_at", None),
-                updated_at=getattr(entity, "updated_at", None),
-            )
-            for entity in page_entities
-        ]
-
         return EntityListResponse(
-            entities=response_entities,
+            entities=[_to_list_response(entity) for entity in page_entities],
             total=total,
             page=page,
             page_size=page_size,
             has_more=end < total,
         )
 
+    except HTTPException:
+        raise
+    except ValidationError as e:
+        raise bad_request(e.message) from e
     except Exception as e:
         log.exception("list_entities_failed", error=str(e))
         raise HTTPException(
@@ -308,6 +296,97 @@ async def list_entities(
         ) from e
 
 
+async def _list_entities_page(
+    entity_manager: EntityManager,
+    *,
+    entity_type: EntityType | None,
+    language: str | None,
+    category: str | None,
+    search: str | None,
+    project_ids: list[str] | None,
+    page_size: int,
+    sort_by: SortField,
+    sort_order: SortOrder,
+    cursor: str,
+) -> EntityListResponse:
+    """Keyset-paginated variant of list_entities.
+
+    Project and type filters run in the graph query; language, category and
+    search apply to the fetched page, which may therefore be short.
+    """
+    if sort_by not in (SortField.CREATED_AT, SortField.UPDATED_AT):
+        raise bad_request("Cursor pagination requires sort_by=created_at or sort_by=updated_at")
+
+    unassigned_marker = "__unassigned__"
+    real_project_ids = [pid for pid in (project_ids or []) if pid != unassigned_marker]
+    result = await entity_manager.list_page(
+        [entity_type] if entity_type else None,
+        page_size,
+        cursor=cursor,
+        order_by=sort_by.value,
+        descending=sort_order == SortOrder.DESC,
+        project_ids=real_project_ids or None,
+        include_unassigned=bool(project_ids) and unassigned_marker in project_ids,
+    )
+    entities = [
+        _to_list_response(entity)
+        for entity in result.entities
+        if _passes_list_filters(entity, language, category, search)
+    ]
+    return EntityListResponse(
+        entities=entities,
+        total=None,
+        page=1,
+        page_size=page_size,
+        has_more=result.next_cursor is not None,
+        next_cursor=result.next_cursor,
+    )
+
+
+def _passes_list_filters(
+    entity: Any, language: str | None, category: str | None, search: str | None
+) -> bool:
+    """Apply the list filters that are not stored as graph properties."""
+    # Language filter
+    if language:
+        entity_langs = getattr(entity, "languages", []) or []
+        if language.lower() not in [lang.lower() for lang in entity_langs]:
+            return False
+
+    # Category filter
+    if category:
+        entity_cat = getattr(entity, "category", "") or ""
+        if category.lower() not in entity_cat.lower():
+            return False
+
+    # Search filter (name and description)
+    if search:
+        search_lower = search.lower()
+        name = (getattr(entity, "name", "") or "").lower()
+        description = (getattr(entity, "description", "") or "").lower()
+        if search_lower not in name and search_lower not in description:
+            return False
+
+    return True
+
+
+def _to_list_response(entity: Any) -> EntityResponse:
+    return EntityResponse(
+        id=entity.id,
+        entity_type=entity.entity_type,
+        name=entity.name,
+        description=entity.description or "",
+        content=(entity.content or "")[:50000],  # Truncate for list view
+        category=getattr(entity, "category", None) or entity.metadata.get("category"),
+        languages=getattr(entity, "languages", None) or entity.metadata.get("languages", []) or [],
+        tags=getattr(entity, "tags", None) or entity.metadata.get("tags", []) or [],
+        metadata=getattr(entity, "metadata", {}) or {},
+        source_file=getattr(entity, "source_file", None),
+        created_at=getattr(entity, "created_at", None),
+        updated_at=getattr(entity, "updated_at", None),
+    )
+
+
 @router.get("/{entity_id}", response_model=EntityResponse)
 async def get_entity(
     entity_id: str,
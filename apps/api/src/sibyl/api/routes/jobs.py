@@ -69,7 +69,11 @@ async def _job_visible_to_org(
 # IMPORTANT: Health endpoint must come before /{job_id} to avoid route matching issues
 @router.get("/health")
 async def jobs_health() -> dict[str, Any]:
-    """Check job queue health."""
+    """Check job queue health.
+
+    Also reports agent control-signal delivery stats from each live worker.
+    """
+    from sibyl.agents.control import read_control_stats
     from sibyl.jobs.queue import get_pool
 
     try:
@@ -80,6 +84,7 @@ async def jobs_health() -> dict[str, Any]:
             "redis_version": info.get("redis_version", "unknown"),
             "connected_clients": info.get("connected_clients", 0),
             "used_memory_human": info.get("used_memory_human", "unknown"),
+            "agent_control": await read_control_stats(),
         }
     except Exception as e:
         log.warning("Job queue health check failed", error=str(e))
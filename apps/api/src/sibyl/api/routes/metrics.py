@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from sibyl.api.schemas import (
     AssigneeStats,
+    EmbeddingCacheMetricsResponse,
     OrgMetricsResponse,
     ProjectMetrics,
     ProjectMetricsResponse,
@@ -20,6 +21,7 @@ from sibyl.db.models import Organization, OrganizationRole
 from sibyl_core.graph.client import get_graph_client
 from sibyl_core.graph.entities import EntityManager
 from sibyl_core.models.entities import EntityType
+from sibyl_core.retrieval.embedding_cache import get_embedding_cache
 
 log = structlog.get_logger()
 
@@ -204,6 +206,17 @@ async def get_project_metrics(
         ) from e
 
 
+@router.get("/embedding-cache", response_model=EmbeddingCacheMetricsResponse)
+async def get_embedding_cache_metrics() -> EmbeddingCacheMetricsResponse:
+    """Get hit-rate metrics for the query-embedding cache of this API process."""
+    cache = get_embedding_cache()
+    return EmbeddingCacheMetricsResponse(
+        **cache.stats.to_dict(),
+        size=cache.size,
+        redis_enabled=cache.redis_enabled,
+    )
+
+
 @router.get("", response_model=OrgMetricsResponse)
 async def get_org_metrics(
     org: Organization = Depends(get_current_organization),
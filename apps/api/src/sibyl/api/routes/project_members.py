@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from sibyl.api.websocket import broadcast_event
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.auth.audit import AuditLogger
 from sibyl.auth.dependencies import get_current_org_role, get_current_organization, get_current_user
 from sibyl.db.connection import get_session_dependency
@@ -226,6 +227,7 @@ async def add_member(
         role=body.role,
     )
     session.add(membership)
+    invalidate_on_commit(session, org_id=org.id, user_id=body.user_id)
     await session.commit()
     await session.refresh(membership)
 
@@ -373,6 +375,7 @@ async def remove_member(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
 
     await session.delete(membership)
+    invalidate_on_commit(session, org_id=org.id, user_id=user_id)
     await session.commit()
 
     await AuditLogger(session).log(
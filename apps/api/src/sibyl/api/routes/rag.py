@@ -11,11 +11,12 @@ All queries are scoped to the user's organization for multi-tenant security.
 
 import hashlib
 import re
+from typing import Any
 from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, literal_column, select
 from sqlmodel import col
 
 from sibyl.api.schemas import (
@@ -27,6 +28,7 @@ from sibyl.api.schemas import (
     DocumentRelatedEntity,
     DocumentUpdateRequest,
     FullPageResponse,
+    HybridSearchRequest,
     RAGChunkResult,
     RAGPageResult,
     RAGSearchRequest,
@@ -458,16 +460,139 @@ async def get_page_by_url(
 # =============================================================================
 
 
+# Upper bound on index tuples an iterative HNSW scan visits looking for
+# in-scope rows, which caps the cost of a query from a small org sharing the
+# index with much larger ones.
+HNSW_MAX_SCAN_TUPLES = 50_000
+
+
+def _hnsw_settings(ef_search: int) -> Select[Any]:
+    """Transaction-local HNSW settings for the vector candidate stage.
+
+    The org/source filter applies after the index scan, and a plain scan
+    stops after ``ef_search`` rows, so a small org in a large shared table
+    could get no vector candidates at all. An iterative scan (pgvector 0.8+)
+    keeps walking the graph until the LIMIT is met or
+    ``HNSW_MAX_SCAN_TUPLES`` is reached. ``relaxed_order`` is enough since the
+    candidates are re-ranked by distance before fusion.
+    """
+    # is_local=true scopes each setting to the current transaction
+    return select(
+        func.set_config("hnsw.ef_search", str(ef_search), True),
+        func.set_config("hnsw.iterative_scan", "relaxed_order", True),
+        func.set_config("hnsw.max_scan_tuples", str(HNSW_MAX_SCAN_TUPLES), True),
+    )
+
+
+# Lexical matching must repeat the ix_chunks_content_fts expression verbatim,
+# with the config inlined rather than bound, or the planner cannot use the index.
+_FTS_CONFIG = literal_column("'english'")
+
+
+def _hybrid_search_statement(
+    request: HybridSearchRequest,
+    query_embedding: list[float],
+    organization_id: str,
+) -> Select[Any]:
+    """Build the two-stage hybrid query.
+
+    Stage one takes the top ``candidate_k`` chunks from the HNSW index and,
+    separately, from the GIN full-text index. Stage two fuses the two ranked
+    lists with reciprocal rank fusion and joins the winners back to their
+    documents, so only ``match_count`` rows are ever materialized in full.
+    """
+    distance = DocumentChunk.embedding.cosine_distance(query_embedding)
+    ts_vector = func.to_tsvector(_FTS_CONFIG, DocumentChunk.content)
+    ts_query = func.plainto_tsquery(_FTS_CONFIG, request.query)
+
+    def scoped(stmt: Select[Any]) -> Select[Any]:
+        stmt = (
+            stmt.join(CrawledDocument, DocumentChunk.document_id == CrawledDocument.id)
+            .join(CrawlSource, CrawledDocument.source_id == CrawlSource.id)
+            # Filter by organization for multi-tenant security
+            .where(col(CrawlSource.organization_id) == organization_id)
+        )
+        if request.source_id:
+            stmt = stmt.where(col(CrawlSource.id) == UUID(request.source_id))
+        elif request.source_name:
+            stmt = stmt.where(col(CrawlSource.name).ilike(f"%{request.source_name}%"))
+        return stmt
+
+    # ORDER BY distance LIMIT k is the only shape the HNSW index can serve
+    vector_hits = (
+        scoped(select(DocumentChunk.id.label("chunk_id"), distance.label("distance")))
+        .where(col(DocumentChunk.embedding).is_not(None))
+        .order_by(distance)
+        .limit(request.candidate_k)
+        .cte("vector_hits")
+    )
+    text_score = func.ts_rank_cd(ts_vector, ts_query).label("score")
+    text_hits = (
+        scoped(select(DocumentChunk.id.label("chunk_id"), text_score))
+        .where(ts_vector.bool_op("@@")(ts_query))
+        .order_by(text_score.desc())
+        .limit(request.candidate_k)
+        .cte("text_hits")
+    )
+
+    vector_ranked = (
+        select(
+            vector_hits.c.chunk_id,
+            func.row_number().over(order_by=vector_hits.c.distance).label("rank"),
+        )
+        .where(vector_hits.c.distance <= 1 - request.similarity_threshold)
+        .subquery("vector_ranked")
+    )
+    text_ranked = select(
+        text_hits.c.chunk_id,
+        func.row_number().over(order_by=text_hits.c.score.desc()).label("rank"),
+    ).subquery("text_ranked")
+
+    rrf_score = func.coalesce(1.0 / (request.rrf_k + vector_ranked.c.rank), 0.0) + func.coalesce(
+        1.0 / (request.rrf_k + text_ranked.c.rank), 0.0
+    )
+    fused = (
+        select(
+            func.coalesce(vector_ranked.c.chunk_id, text_ranked.c.chunk_id).label("chunk_id"),
+            rrf_score.label("rrf_score"),
+        )
+        .select_from(
+            vector_ranked.join(
+                text_ranked, vector_ranked.c.chunk_id == text_ranked.c.chunk_id, full=True
+            )
+        )
+        .order_by(rrf_score.desc())
+        .limit(request.match_count)
+        .cte("fused")
+    )
+
+    return (
+        select(
+            DocumentChunk,
+            CrawledDocument,
+            CrawlSource.name.label("source_name"),
+            CrawlSource.id.label("source_id"),
+            (1 - distance).label("similarity"),
+            fused.c.rrf_score,
+        )
+        .select_from(fused)
+        .join(DocumentChunk, DocumentChunk.id == fused.c.chunk_id)
+        .join(CrawledDocument, DocumentChunk.document_id == CrawledDocument.id)
+        .join(CrawlSource, CrawledDocument.source_id == CrawlSource.id)
+        .order_by(fused.c.rrf_score.desc())
+    )
+
+
 @router.post("/hybrid-search", response_model=RAGSearchResponse)
 async def hybrid_search(
-    request: RAGSearchRequest,
+    request: HybridSearchRequest,
     auth: AuthContext = Depends(get_auth_context),
 ) -> RAGSearchResponse:
     """Hybrid search combining vector similarity and full-text search.
 
     Uses RRF (Reciprocal Rank Fusion) to combine results from:
-    - Vector similarity (pgvector cosine distance)
-    - Full-text search (PostgreSQL tsvector)
+    - Vector similarity (top candidates from the HNSW index)
+    - Full-text search (top candidates from the GIN tsvector index)
 
     Results are scoped to the user's organization.
     """
@@ -481,54 +606,15 @@ async def hybrid_search(
         log.exception("Failed to generate query embedding", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to generate query embedding") from e
 
-    async with get_session() as session:
-        # Build hybrid query with RRF
-        # RRF score = sum(1 / (k + rank)) for each retriever
+    source_filter_name = request.source_id or request.source_name or None
+    ef_search = request.ef_search or max(request.candidate_k, 40)
 
-        # Vector similarity score
-        similarity_expr = 1 - DocumentChunk.embedding.cosine_distance(query_embedding)
-
-        # Full-text relevance using ts_rank
-        ts_query = func.plainto_tsquery("english", request.query)
-        ts_vector = func.to_tsvector("english", DocumentChunk.content)
-        fts_rank = func.ts_rank(ts_vector, ts_query)
-
-        query = (
-            select(
-                DocumentChunk,
-                CrawledDocument,
-                CrawlSource.name.label("source_name"),
-                CrawlSource.id.label("source_id"),
-                similarity_expr.label("similarity"),
-                fts_rank.label("fts_rank"),
-            )
-            .join(CrawledDocument, DocumentChunk.document_id == CrawledDocument.id)
-            .join(CrawlSource, CrawledDocument.source_id == CrawlSource.id)
-            .where(col(DocumentChunk.embedding).is_not(None))
-            # Filter by organization for multi-tenant security
-            .where(col(CrawlSource.organization_id) == auth.organization_id)
-        )
-
-        # Apply source filters
-        source_filter_name = None
-        if request.source_id:
-            query = query.where(col(CrawlSource.id) == UUID(request.source_id))
-            source_filter_name = request.source_id
-        elif request.source_name:
-            query = query.where(col(CrawlSource.name).ilike(f"%{request.source_name}%"))
-            source_filter_name = request.source_name
-
-        # Combine with RRF-style scoring (simplified: weighted combination)
-        # Higher weight for vector similarity since it's more reliable
-        combined_score = similarity_expr * 0.7 + fts_rank * 0.3
-
-        query = (
-            query.where(similarity_expr >= request.similarity_threshold)
-            .order_by(combined_score.desc())
-            .limit(request.match_count)
+    async with get_session() as session:
+        # Each scan round returns up to ef_search rows, so it must cover candidate_k
+        await session.execute(_hnsw_settings(ef_search))
+        result = await session.execute(
+            _hybrid_search_statement(request, query_embedding, auth.organization_id)
         )
-
-        result = await session.execute(query)
         rows = result.all()
 
         results: list[RAGChunkResult | RAGPageResult] = [
@@ -541,7 +627,8 @@ async def hybrid_search(
                 title=doc.title,
                 content=chunk.content,
                 context=chunk.context if request.include_context else None,
-                similarity=similarity,
+                # Full-text-only hits may not be embedded yet
+                similarity=similarity or 0.0,
                 chunk_type=chunk.chunk_type.value
                 if hasattr(chunk.chunk_type, "value")
                 else str(chunk.chunk_type),
@@ -549,7 +636,7 @@ async def hybrid_search(
                 heading_path=chunk.heading_path or [],
                 language=chunk.language,
             )
-            for chunk, doc, source_name, source_id, similarity, fts_rank in rows
+            for chunk, doc, source_name, source_id, similarity, _rrf_score in rows
         ]
 
     log.debug(
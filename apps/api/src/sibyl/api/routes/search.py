@@ -11,6 +11,7 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sibyl.api.errors import bad_request
 from sibyl.api.schemas import (
     ExploreRequest,
     ExploreResponse,
@@ -26,6 +27,7 @@ from sibyl.auth.dependencies import get_auth_context, get_current_organization,
 from sibyl.auth.errors import ProjectAccessDeniedError
 from sibyl.db.connection import get_session_dependency
 from sibyl.db.models import Organization, OrganizationRole
+from sibyl_core.errors import ValidationError
 
 log = structlog.get_logger()
 _READ_ROLES = (
@@ -172,6 +174,7 @@ async def explore(
             include_archived=request.include_archived,
             limit=request.limit,
             offset=request.offset,
+            cursor=request.cursor,
             organization_id=group_id,
         )
 
@@ -192,10 +195,13 @@ async def explore(
             offset=getattr(result, "offset", request.offset),
             has_more=getattr(result, "has_more", False),
             actual_total=getattr(result, "actual_total", None),
+            next_cursor=getattr(result, "next_cursor", None),
         )
 
     except HTTPException:
         raise
+    except ValidationError as e:
+        raise bad_request(e.message) from e
     except Exception as e:
         log.exception("explore_failed", mode=request.mode, error=str(e))
         raise HTTPException(status_code=500, detail="Explore failed. Please try again.") from e
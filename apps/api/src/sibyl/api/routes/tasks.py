@@ -12,6 +12,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sibyl.api.decorators import handle_workflow_errors
+from sibyl.api.errors import bad_request
 from sibyl.api.websocket import broadcast_event
 from sibyl.auth.authorization import ProjectRole, verify_entity_project_access
 from sibyl.auth.context import AuthContext
@@ -22,9 +23,11 @@ from sibyl.auth.dependencies import (
 )
 from sibyl.auth.rls import AuthSession, get_auth_session
 from sibyl.db.models import Organization, OrganizationRole, User
+from sibyl_core.errors import ValidationError
 from sibyl_core.graph.client import get_graph_client
 from sibyl_core.graph.entities import EntityManager
 from sibyl_core.graph.relationships import RelationshipManager
+from sibyl_core.models.entities import EntityType
 from sibyl_core.models.tasks import AuthorType, Note, TaskComplexity, TaskPriority, TaskStatus
 from sibyl_core.tasks.workflow import TaskWorkflowEngine
 
@@ -674,6 +677,7 @@ class NotesListResponse(BaseModel):
 
     notes: list[NoteResponse]
     count: int
+    next_cursor: str | None = None
 
 
 @router.post("/{task_id}/notes", response_model=NoteResponse)
@@ -809,10 +813,15 @@ async def create_note(
 async def list_notes(
     task_id: str,
     limit: int = 50,
+    cursor: str | None = None,
     org: Organization = Depends(get_current_organization),
     auth: AuthSession = Depends(get_auth_session),
 ) -> NotesListResponse:
-    """List all notes for a task."""
+    """List notes for a task, newest first.
+
+    Pass ``cursor`` ("" for the first page, then ``next_cursor``) to page
+    through long note histories.
+    """
     # Read access is sufficient for listing notes
     await _verify_task_access(
         task_id, org, auth.ctx, auth.session, required_role=ProjectRole.VIEWER
@@ -829,7 +838,14 @@ async def list_notes(
             raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
 
         # Get notes for task
-        notes_entities = await entity_manager.get_notes_for_task(task_id, limit=limit)
+        next_cursor = None
+        if cursor is not None:
+            page = await entity_manager.list_page(
+                [EntityType.NOTE], limit, cursor=cursor, belongs_to=task_id
+            )
+            notes_entities, next_cursor = page.entities, page.next_cursor
+        else:
+            notes_entities = await entity_manager.get_notes_for_task(task_id, limit=limit)
 
         notes = []
         for entity in notes_entities:
@@ -845,10 +861,12 @@ async def list_notes(
                 )
             )
 
-        return NotesListResponse(notes=notes, count=len(notes))
+        return NotesListResponse(notes=notes, count=len(notes), next_cursor=next_cursor)
 
     except HTTPException:
         raise
+    except ValidationError as e:
+        raise bad_request(e.message) from e
     except Exception as e:
         log.exception("list_notes_failed", task_id=task_id, error=str(e))
         raise HTTPException(
@@ -74,10 +74,11 @@ class EntityListResponse(BaseModel):
     """Paginated list of entities."""
 
     entities: list[EntityResponse]
-    total: int
+    total: int | None  # None for cursor pages, whose total is not computed
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -148,6 +149,12 @@ class SearchResponse(BaseModel):
     limit: int = Field(default=10, description="Results per page")
     offset: int = Field(default=0, description="Current offset")
     has_more: bool = Field(default=False, description="Whether more results exist")
+    partial: bool = Field(
+        default=False, description="A search branch timed out or failed; results are incomplete"
+    )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict, description="Per-branch status and timings_ms"
+    )
 
 
 # =============================================================================
@@ -188,6 +195,13 @@ class ExploreRequest(BaseModel):
     )
     limit: int = Field(default=50, ge=1, le=200)
     offset: int = Field(default=0, ge=0, description="Offset for pagination")
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Keyset pagination for list mode: empty string for the first page, "
+            "then next_cursor from the previous response. Overrides offset."
+        ),
+    )
 
 
 class RelatedEntity(BaseModel):
@@ -212,6 +226,7 @@ class ExploreResponse(BaseModel):
     offset: int = Field(default=0, description="Current offset")
     has_more: bool = Field(default=False, description="Whether more results exist")
     actual_total: int | None = Field(default=None, description="Total matching before pagination")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
 
 
 # =============================================================================
@@ -538,6 +553,25 @@ class RAGSearchRequest(BaseModel):
     include_context: bool = Field(default=True, description="Include contextual prefix in results")
 
 
+class HybridSearchRequest(RAGSearchRequest):
+    """Hybrid (vector + full-text) RAG search request.
+
+    ``similarity_threshold`` only gates the vector candidates; full-text
+    matches are fused regardless of their embedding similarity.
+    """
+
+    candidate_k: int = Field(
+        default=50, ge=1, le=1000, description="Candidates fetched from each index before fusion"
+    )
+    rrf_k: int = Field(default=60, ge=1, description="Reciprocal rank fusion constant")
+    ef_search: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="HNSW search breadth for this request (defaults to max(candidate_k, 40))",
+    )
+
+
 class RAGChunkResult(BaseModel):
     """Single chunk result from RAG search."""
 
@@ -828,3 +862,17 @@ class OrgMetricsResponse(BaseModel):
     tasks_completed_last_7d: int
     velocity_trend: list[TimeSeriesPoint]
     projects_summary: list[dict[str, Any]]  # [{id, name, total, completed, completion_rate}]
+
+
+class EmbeddingCacheMetricsResponse(BaseModel):
+    """Query-embedding cache counters for this process."""
+
+    memory_hits: int
+    redis_hits: int
+    misses: int
+    coalesced: int = Field(description="Lookups that awaited an identical in-flight request")
+    redis_errors: int
+    hit_rate: float = Field(description="Fraction of lookups served without an API call")
+    total_requests: int
+    size: int = Field(description="Vectors held in process")
+    redis_enabled: bool
@@ -14,7 +14,12 @@ For single-pod deployments, broadcasts work locally without Redis.
 """
 
 import asyncio
-from dataclasses import dataclass
+import contextlib
+import itertools
+import json
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,6 +35,87 @@ log = structlog.get_logger()
 # Flag to track if Redis pub/sub is available
 _pubsub_enabled: bool = False
 
+# High-frequency events that only tell the client "something changed". A newer
+# copy replaces a pending one with the same key, and these are shed first when
+# a client falls behind. Maps event -> payload fields that form the key.
+COALESCE_KEYS: dict[str, tuple[str, ...]] = {
+    "agent_message": ("agent_id",),
+    "agent_workspace": ("agent_id",),
+    "status_hint": ("agent_id", "tool_call_id"),
+    "crawl_progress": ("source_id",),
+    "heartbeat": (),
+}
+
+
+def _coalesce_key(event: str, data: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Key under which pending copies of this event collapse, or None if it must be delivered."""
+    fields = COALESCE_KEYS.get(event)
+    if fields is None:
+        return None
+    return (event, *(data.get(f) for f in fields))
+
+
+def _encode(event: str, data: dict[str, Any]) -> str:
+    """Serialize an event envelope once for every recipient."""
+    return json.dumps(
+        {
+            "event": event,
+            "data": data,
+            "timestamp": datetime.now(UTC).isoformat(),
+        },
+        default=str,
+    )
+
+
+class Outbox:
+    """Bounded outbound queue for one client.
+
+    Coalescable events replace a pending copy in place (keeping its position).
+    When the queue is full the oldest coalescable event is dropped to make
+    room; if every pending event must be delivered, ``put`` reports overflow
+    and the caller disconnects the client.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._seq = itertools.count()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, text: str, key: tuple[Any, ...] | None = None) -> bool:
+        """Queue a serialized message. Returns False if the client is too far behind."""
+        if key is not None and key in self._entries:
+            self._entries[key] = text
+            return True
+
+        if len(self._entries) >= self.maxsize and not self._shed():
+            return False
+
+        self._entries[key if key is not None else next(self._seq)] = text
+        self._ready.set()
+        return True
+
+    def _shed(self) -> bool:
+        """Drop the oldest coalescable entry. Returns False if there is none."""
+        for pending in self._entries:
+            if isinstance(pending, tuple):
+                del self._entries[pending]
+                self.dropped += 1
+                return True
+        return False
+
+    async def get(self) -> str:
+        """Wait for and remove the oldest pending message."""
+        while not self._entries:
+            self._ready.clear()
+            await self._ready.wait()
+        _, text = self._entries.popitem(last=False)
+        return text
+
 
 @dataclass
 class Connection:
@@ -39,145 +125,194 @@ class Connection:
     org_id: str | None = None
     last_activity: datetime | None = None
     pending_pong: bool = False
+    outbox: Outbox = field(default_factory=lambda: Outbox(ConnectionManager.OUTBOX_SIZE))
+    sender: asyncio.Task[None] | None = None
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and broadcasts events by organization."""
+    """Manages WebSocket connections and broadcasts events by organization.
+
+    Connections are indexed by org so a broadcast only touches its recipients.
+    Each event is serialized once and queued on every recipient's outbox; a
+    per-connection sender task drains the outbox, so a slow client delays only
+    itself.
+    """
 
     # Heartbeat interval in seconds
     HEARTBEAT_INTERVAL = 30
     # How long to wait for pong before considering connection dead
     PONG_TIMEOUT = 10
+    # Pending messages per client before coalescable events are shed
+    OUTBOX_SIZE = 256
+    # How long a single send may block before the client is dropped
+    SEND_TIMEOUT = 10
 
     def __init__(self) -> None:
-        self.active_connections: list[Connection] = []
-        self._lock = asyncio.Lock()
+        self._connections: dict[WebSocket, Connection] = {}
+        self._by_org: dict[str | None, dict[WebSocket, Connection]] = {}
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._closing: set[asyncio.Task[None]] = set()
+
+    @property
+    def active_connections(self) -> list[Connection]:
+        """Snapshot of all registered connections."""
+        return list(self._connections.values())
 
     async def connect(self, websocket: WebSocket, org_id: str | None = None) -> None:
         """Accept and register a new WebSocket connection with org context."""
         await websocket.accept()
         conn = Connection(websocket=websocket, org_id=org_id, last_activity=datetime.now(UTC))
-        async with self._lock:
-            self.active_connections.append(conn)
-            # Start heartbeat task if not running
-            if self._heartbeat_task is None or self._heartbeat_task.done():
-                self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self.register(conn)
         log.info(
             "websocket_connected",
-            total_connections=len(self.active_connections),
+            total_connections=len(self._connections),
             org_id=org_id,
         )
 
+    def register(self, conn: Connection) -> None:
+        """Index an accepted connection and start its sender task."""
+        self._connections[conn.websocket] = conn
+        self._by_org.setdefault(conn.org_id, {})[conn.websocket] = conn
+        conn.sender = asyncio.create_task(self._sender_loop(conn))
+        # Start heartbeat task if not running
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        async with self._lock:
-            self.active_connections = [
-                c for c in self.active_connections if c.websocket != websocket
-            ]
-        log.info("websocket_disconnected", total_connections=len(self.active_connections))
+        conn = self._connections.pop(websocket, None)
+        if conn is None:
+            return
+
+        org_conns = self._by_org.get(conn.org_id)
+        if org_conns is not None:
+            org_conns.pop(websocket, None)
+            if not org_conns:
+                del self._by_org[conn.org_id]
+
+        if conn.sender is not None and conn.sender is not asyncio.current_task():
+            conn.sender.cancel()
+        log.info("websocket_disconnected", total_connections=len(self._connections))
 
     async def broadcast(self, event: str, data: dict[str, Any], org_id: str | None = None) -> None:
         """Broadcast an event to clients in the same organization.
 
+        Queues the message and returns; delivery happens on each client's
+        sender task.
+
         Args:
             event: Event type name.
             data: Event payload.
             org_id: If provided, only broadcast to clients in this org.
                    If None, broadcast to all clients (system events).
         """
-        if not self.active_connections:
+        connections: Iterable[Connection]
+        if org_id:
+            connections = self._by_org.get(org_id, {}).values()
+        else:
+            connections = self._connections.values()
+        if not connections:
             return
 
-        message = {
-            "event": event,
-            "data": data,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
+        text = _encode(event, data)
+        key = _coalesce_key(event, data)
 
-        # Filter connections by org
-        async with self._lock:
-            if org_id:
-                connections = [c for c in self.active_connections if c.org_id == org_id]
+        recipients = 0
+        overflowed: list[Connection] = []
+        for conn in connections:
+            if conn.outbox.put(text, key):
+                recipients += 1
             else:
-                connections = list(self.active_connections)
+                overflowed.append(conn)
 
-        disconnected = []
-        for conn in connections:
-            try:
-                await conn.websocket.send_json(message)
-            except Exception:
-                disconnected.append(conn.websocket)
-
-        # Clean up disconnected clients
-        for ws in disconnected:
-            await self.disconnect(ws)
-
-        if connections:
-            log.debug(
-                "websocket_broadcast",
-                ws_event=event,
-                recipients=len(connections) - len(disconnected),
-                org_id=org_id,
-            )
+        # Clients that can't keep up with must-deliver events are dropped
+        for conn in overflowed:
+            log.warning("websocket_client_too_slow", org_id=conn.org_id, ws_event=event)
+            await self._close(conn, code=1013)
+
+        log.debug(
+            "websocket_broadcast",
+            ws_event=event,
+            recipients=recipients,
+            org_id=org_id,
+        )
 
     async def send_personal(self, websocket: WebSocket, event: str, data: dict[str, Any]) -> None:
         """Send an event to a specific client."""
-        message = {
-            "event": event,
-            "data": data,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
+        text = _encode(event, data)
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            # Queue behind pending broadcasts to keep per-client ordering
+            if not conn.outbox.put(text, _coalesce_key(event, data)):
+                await self._close(conn, code=1013)
+            return
+
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(text)
         except Exception:
             await self.disconnect(websocket)
 
     def mark_activity(self, websocket: WebSocket) -> None:
         """Mark activity for a connection (e.g., when pong received)."""
-        for conn in self.active_connections:
-            if conn.websocket == websocket:
-                conn.last_activity = datetime.now(UTC)
-                conn.pending_pong = False
-                break
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            conn.last_activity = datetime.now(UTC)
+            conn.pending_pong = False
+
+    async def _sender_loop(self, conn: Connection) -> None:
+        """Drain one client's outbox; drop the client if a send fails or stalls."""
+        try:
+            while True:
+                text = await conn.outbox.get()
+                async with asyncio.timeout(self.SEND_TIMEOUT):
+                    await conn.websocket.send_text(text)
+        except Exception as e:
+            log.debug("websocket_send_failed", org_id=conn.org_id, error=repr(e))
+            await self.disconnect(conn.websocket)
+
+    async def _close(self, conn: Connection, *, code: int) -> None:
+        """Unregister a connection and close its socket in the background.
+
+        The close handshake goes through the same stalled socket, so callers
+        (broadcast, heartbeat) must not wait on it.
+        """
+        await self.disconnect(conn.websocket)
+        task = asyncio.create_task(self._close_socket(conn, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_socket(self, conn: Connection, code: int) -> None:
+        # The socket may already be gone, or never answer the close frame
+        with contextlib.suppress(Exception):
+            async with asyncio.timeout(self.SEND_TIMEOUT):
+                await conn.websocket.close(code=code)
 
     async def _heartbeat_loop(self) -> None:
         """Background task that sends heartbeat pings and cleans up dead connections."""
         while True:
             await asyncio.sleep(self.HEARTBEAT_INTERVAL)
 
-            if not self.active_connections:
+            if not self._connections:
                 log.debug("heartbeat_stopped", reason="no_connections")
                 break
 
-            dead_connections: list[WebSocket] = []
             now = datetime.now(UTC)
-
-            async with self._lock:
-                for conn in self.active_connections:
-                    # Check if previous ping was answered
-                    if conn.pending_pong:
-                        # No pong received - connection is dead
-                        dead_connections.append(conn.websocket)
-                        continue
-
-                    # Send heartbeat ping
-                    try:
-                        await conn.websocket.send_json(
-                            {
-                                "event": "heartbeat",
-                                "data": {"server_time": now.isoformat()},
-                                "timestamp": now.isoformat(),
-                            }
-                        )
-                        conn.pending_pong = True
-                    except Exception:
-                        dead_connections.append(conn.websocket)
-
-            # Clean up dead connections
-            for ws in dead_connections:
-                log.info("heartbeat_timeout", reason="no_pong")
-                await self.disconnect(ws)
+            text = _encode("heartbeat", {"server_time": now.isoformat()})
+            key = _coalesce_key("heartbeat", {})
+
+            for conn in list(self._connections.values()):
+                # Check if previous ping was answered
+                if conn.pending_pong:
+                    # No pong received - connection is dead
+                    log.info("heartbeat_timeout", reason="no_pong")
+                    await self._close(conn, code=1001)
+                    continue
+
+                # Queue heartbeat ping
+                if conn.outbox.put(text, key):
+                    conn.pending_pong = True
+                else:
+                    await self._close(conn, code=1013)
 
 
 # Global connection manager instance
@@ -0,0 +1,190 @@
+"""Cached project access scopes for MCP principals.
+
+Every MCP tool call resolved the caller's accessible projects from Postgres:
+the user, organization and membership rows, then the project, membership and
+team grant queries of ``list_accessible_project_graph_ids``. The answer only
+changes when memberships, projects or API keys change, so it is cached per
+principal ``(user, org, api key)`` for ``access_scope_cache_ttl_seconds``.
+
+Code that changes access calls `invalidate_on_commit` with the affected org,
+user or API key. Invalidations are applied once the session commits, so a
+request racing the change cannot re-cache the old scope from uncommitted
+state. Scopes computed before an invalidation are not stored.
+
+The cache is per process. Other API processes pick up a change within the TTL.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from sibyl.config import settings
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+log = structlog.get_logger()
+
+# Principal: (user_id, org_id, api_key_id); api_key_id is None for JWTs
+ScopeKey = tuple[str, str, str | None]
+
+_PENDING_INVALIDATIONS = "sibyl_access_scope_invalidations"
+
+
+@dataclass
+class AccessScopeStats:
+    """Access scope cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations}
+
+
+class AccessScopeCache:
+    """TTL cache of accessible project graph IDs per principal."""
+
+    def __init__(self, ttl_seconds: float = 60.0, maxsize: int = 4096) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached scope (0 disables caching).
+            maxsize: Maximum principals kept.
+        """
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: OrderedDict[ScopeKey, tuple[float, frozenset[str] | None]] = OrderedDict()
+        self._generation = 0
+        self.stats = AccessScopeStats()
+
+    @property
+    def size(self) -> int:
+        """Number of cached principals."""
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every invalidation; pass it back to `set`."""
+        return self._generation
+
+    def get(self, key: ScopeKey) -> tuple[bool, set[str] | None]:
+        """Look up a principal's scope.
+
+        Returns:
+            (found, scope). The scope is a copy; None means no filtering.
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            self.stats.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        scope = entry[1]
+        return True, None if scope is None else set(scope)
+
+    def set(self, key: ScopeKey, scope: set[str] | None, generation: int) -> None:
+        """Store a scope computed when the cache was at ``generation``.
+
+        Dropped if anything was invalidated since, as the scope may be stale.
+        """
+        if self._ttl <= 0 or generation != self._generation:
+            return
+        frozen = None if scope is None else frozenset(scope)
+        self._entries[key] = (time.monotonic() + self._ttl, frozen)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        *,
+        org_id: UUID | str | None = None,
+        user_id: UUID | str | None = None,
+        api_key_id: UUID | str | None = None,
+    ) -> None:
+        """Drop scopes matching every given filter; no filters drops all."""
+        self._generation += 1
+        self.stats.invalidations += 1
+        filters = [
+            (index, str(value))
+            for index, value in enumerate((user_id, org_id, api_key_id))
+            if value is not None
+        ]
+        stale = [key for key in self._entries if all(key[i] == v for i, v in filters)]
+        for key in stale:
+            del self._entries[key]
+        log.debug(
+            "access_scope_invalidated",
+            org_id=str(org_id) if org_id else None,
+            user_id=str(user_id) if user_id else None,
+            api_key_id=str(api_key_id) if api_key_id else None,
+            dropped=len(stale),
+        )
+
+    def clear(self) -> None:
+        """Drop every cached scope."""
+        self.invalidate()
+
+
+def invalidate_on_commit(
+    session: AsyncSession | Session,
+    *,
+    org_id: UUID | str | None = None,
+    user_id: UUID | str | None = None,
+    api_key_id: UUID | str | None = None,
+) -> None:
+    """Invalidate matching access scopes once ``session`` commits.
+
+    Call this wherever memberships, projects or API keys change. Nothing is
+    invalidated if the session rolls back.
+    """
+    pending = session.info.setdefault(_PENDING_INVALIDATIONS, [])
+    pending.append({"org_id": org_id, "user_id": user_id, "api_key_id": api_key_id})
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if pending:
+        cache = get_access_scope_cache()
+        for filters in pending:
+            cache.invalidate(**filters)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_invalidations(session: Session, _previous_transaction: Any) -> None:
+    # A savepoint rolling back leaves the outer transaction's changes pending
+    if not session.in_transaction():
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+# Global cache instance
+_access_scope_cache: AccessScopeCache | None = None
+
+
+def get_access_scope_cache() -> AccessScopeCache:
+    """Get the global access scope cache, configured from settings."""
+    global _access_scope_cache  # noqa: PLW0603
+    if _access_scope_cache is None:
+        _access_scope_cache = AccessScopeCache(ttl_seconds=settings.access_scope_cache_ttl_seconds)
+    return _access_scope_cache
+
+
+def reset_access_scope_cache() -> None:
+    """Reset the global access scope cache (for testing)."""
+    global _access_scope_cache  # noqa: PLW0603
+    _access_scope_cache = None
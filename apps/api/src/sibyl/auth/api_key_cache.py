@@ -0,0 +1,442 @@
+"""Cache of verified API keys and write-behind of their last use.
+
+Every ``sk_`` request used to re-derive the key's PBKDF2 hash (210,000
+iterations, ~100 ms of CPU) on the event loop, reload its project
+restrictions and dirty ``last_used_at``. Agents send many requests with the
+same key, so verified keys are cached:
+
+- Entries are keyed by an HMAC-SHA256 of the raw key, so lookups are cheap
+  and the cache never holds raw keys.
+- The in-process tier is always on. A Redis tier (optional,
+  ``SIBYL_API_KEY_CACHE_REDIS=true``) shares verifications across API
+  processes; Redis failures fall through to verification.
+- Entries live for ``api_key_cache_ttl_seconds`` and never past the key's
+  ``expires_at``.
+- Revoking a key drops its entries from this process and from Redis. Other
+  processes drop their in-memory copy within the TTL.
+- Concurrent requests with the same uncached key share one verification.
+
+``last_used_at`` is written behind: uses are coalesced per key and written
+with one UPDATE every ``flush_interval`` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import update
+
+from sibyl.auth.api_keys import ApiKeyAuth
+from sibyl.config import settings
+from sibyl.db import get_session
+from sibyl.db.models import ApiKey
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from redis.asyncio import Redis
+
+log = structlog.get_logger()
+
+# Dedicated Redis database (4 = embeddings, 5 = communities)
+API_KEY_CACHE_DB = 6
+_REDIS_PREFIX = "sibyl:apikey:"
+# Set of cached digests per key id, for invalidation on revoke
+_REDIS_INDEX_PREFIX = "sibyl:apikey:id:"
+
+
+@dataclass
+class ApiKeyCacheStats:
+    """API key cache counters."""
+
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    redis_errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without verifying the key."""
+        hits = self.memory_hits + self.redis_hits + self.coalesced
+        total = hits + self.misses
+        return hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "redis_errors": self.redis_errors,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def _auth_to_json(auth: ApiKeyAuth) -> str:
+    return json.dumps(
+        {
+            "api_key_id": str(auth.api_key_id),
+            "user_id": str(auth.user_id),
+            "organization_id": str(auth.organization_id),
+            "scopes": auth.scopes,
+            "project_ids": (
+                None if auth.project_ids is None else [str(p) for p in auth.project_ids]
+            ),
+            "expires_at": auth.expires_at.isoformat() if auth.expires_at else None,
+        }
+    )
+
+
+def _auth_from_json(raw: str | bytes) -> ApiKeyAuth:
+    data = json.loads(raw)
+    project_ids = data.get("project_ids")
+    expires_at = data.get("expires_at")
+    return ApiKeyAuth(
+        api_key_id=UUID(data["api_key_id"]),
+        user_id=UUID(data["user_id"]),
+        organization_id=UUID(data["organization_id"]),
+        scopes=list(data.get("scopes") or []),
+        project_ids=None if project_ids is None else [UUID(p) for p in project_ids],
+        expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
+    )
+
+
+class ApiKeyCache:
+    """Two-tier cache of verified API keys with single-flight verification."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        maxsize: int = 4096,
+        secret: bytes | None = None,
+        redis: Redis | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of a verified key in both tiers (0 disables).
+            maxsize: Maximum keys kept in process.
+            secret: HMAC key for cache keys. Processes sharing the Redis tier
+                need the same secret; defaults to a random per-process one.
+            redis: Optional client for the shared tier.
+        """
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._secret = secret or secrets.token_bytes(32)
+        self._redis = redis
+        self._memory: OrderedDict[str, tuple[float, ApiKeyAuth]] = OrderedDict()
+        self._by_id: dict[UUID, set[str]] = {}
+        # Revoked key id -> when its tombstone lapses; blocks re-caching by
+        # verifications that read the key before the revoke committed
+        self._revoked: dict[UUID, float] = {}
+        self._inflight: dict[str, asyncio.Future[ApiKeyAuth | None]] = {}
+        self.stats = ApiKeyCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether verified keys are cached at all."""
+        return self._ttl > 0
+
+    @property
+    def size(self) -> int:
+        """Number of keys held in process."""
+        return len(self._memory)
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether the shared Redis tier is configured."""
+        return self._redis is not None
+
+    def digest(self, raw_key: str) -> str:
+        """Cache key for a raw API key."""
+        return hmac.new(self._secret, raw_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    async def get_or_verify(
+        self,
+        raw_key: str,
+        verify: Callable[[], Awaitable[ApiKeyAuth | None]],
+    ) -> ApiKeyAuth | None:
+        """Return the cached result for ``raw_key``, verifying it at most once.
+
+        Args:
+            raw_key: The presented API key.
+            verify: Called on a miss; returns None for invalid keys. Invalid
+                keys are not cached.
+
+        Returns:
+            The authentication result, shared between callers; do not mutate.
+        """
+        if not self.enabled:
+            return await verify()
+
+        key = self.digest(raw_key)
+        auth = self._memory_get(key)
+        if auth is not None:
+            self.stats.memory_hits += 1
+            return auth
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            # shield: a cancelled waiter must not cancel the shared verification
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[ApiKeyAuth | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            auth = await self._redis_get(key)
+            if auth is not None and not self._is_revoked(auth.api_key_id):
+                self.stats.redis_hits += 1
+                self._memory_set(key, auth)
+            else:
+                self.stats.misses += 1
+                auth = await verify()
+                if auth is None:
+                    self.stats.rejected += 1
+                elif not self._is_revoked(auth.api_key_id):
+                    self._memory_set(key, auth)
+                    await self._redis_set(key, auth)
+            future.set_result(auth)
+            return auth
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody was waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def invalidate(self, api_key_id: UUID) -> None:
+        """Drop every cached entry for a key, here and in Redis."""
+        self._revoked[api_key_id] = time.time() + self._ttl
+        for key in self._by_id.pop(api_key_id, set()):
+            self._memory.pop(key, None)
+
+        if self._redis is None:
+            return
+        index = f"{_REDIS_INDEX_PREFIX}{api_key_id}"
+        try:
+            keys = await self._redis.smembers(index)
+            await self._redis.delete(index, *(_REDIS_PREFIX + _decode(k) for k in keys))
+        except Exception as e:
+            self.stats.redis_errors += 1
+            log.warning("api_key_cache_invalidate_failed", api_key_id=str(api_key_id), error=str(e))
+
+    def clear(self) -> None:
+        """Drop the in-process tier."""
+        self._memory.clear()
+        self._by_id.clear()
+        self._revoked.clear()
+
+    def _expires_at(self, auth: ApiKeyAuth) -> float:
+        expires_at = time.time() + self._ttl
+        if auth.expires_at is not None:
+            key_expiry = auth.expires_at.replace(tzinfo=auth.expires_at.tzinfo or UTC)
+            expires_at = min(expires_at, key_expiry.timestamp())
+        return expires_at
+
+    def _is_revoked(self, api_key_id: UUID) -> bool:
+        until = self._revoked.get(api_key_id)
+        if until is None:
+            return False
+        if time.time() >= until:
+            del self._revoked[api_key_id]
+            return False
+        return True
+
+    def _memory_get(self, key: str) -> ApiKeyAuth | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, auth = entry
+        if time.time() >= expires_at:
+            self._forget(key)
+            return None
+        self._memory.move_to_end(key)
+        return auth
+
+    def _memory_set(self, key: str, auth: ApiKeyAuth) -> None:
+        self._memory[key] = (self._expires_at(auth), auth)
+        self._memory.move_to_end(key)
+        self._by_id.setdefault(auth.api_key_id, set()).add(key)
+        while len(self._memory) > self._maxsize:
+            self._forget(next(iter(self._memory)))
+
+    def _forget(self, key: str) -> None:
+        _, auth = self._memory.pop(key)
+        keys = self._by_id.get(auth.api_key_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_id[auth.api_key_id]
+
+    async def _redis_get(self, key: str) -> ApiKeyAuth | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(_REDIS_PREFIX + key)
+        except Exception as e:
+            self.stats.redis_errors += 1
+            log.debug("api_key_cache_redis_get_failed", error=str(e))
+            return None
+        return None if raw is None else _auth_from_json(raw)
+
+    async def _redis_set(self, key: str, auth: ApiKeyAuth) -> None:
+        if self._redis is None:
+            return
+        ttl_ms = int((self._expires_at(auth) - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        index = f"{_REDIS_INDEX_PREFIX}{auth.api_key_id}"
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(_REDIS_PREFIX + key, _auth_to_json(auth), px=ttl_ms)
+                pipe.sadd(index, key)
+                # No entry outlives the TTL, so neither need the index
+                pipe.pexpire(index, int(self._ttl * 1000))
+                await pipe.execute()
+        except Exception as e:
+            self.stats.redis_errors += 1
+            log.debug("api_key_cache_redis_set_failed", error=str(e))
+
+
+def _decode(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class ApiKeyUsageRecorder:
+    """Write-behind ``last_used_at`` updates for API keys.
+
+    ``touch`` records a use and returns immediately. Uses are coalesced per
+    key (the latest wins) and written in one executemany UPDATE every
+    ``flush_interval`` seconds. ``close`` writes what is pending and stops.
+    Uses still pending when the process dies are lost; ``last_used_at`` is
+    informational.
+    """
+
+    def __init__(self, flush_interval: float = 30.0) -> None:
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.flushes = 0
+
+        self._pending: dict[UUID, datetime] = {}
+        self._flush_lock = asyncio.Lock()
+        self._writer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of keys with an unwritten use."""
+        return len(self._pending)
+
+    def touch(self, api_key_id: UUID, at: datetime | None = None) -> None:
+        """Record a use of a key."""
+        self._pending[api_key_id] = at or datetime.now(UTC).replace(tzinfo=None)
+        if self._closed:
+            return
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._run_writer())
+
+    async def flush(self) -> None:
+        """Write all pending uses now."""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                async with get_session() as session:
+                    await session.execute(
+                        update(ApiKey),
+                        [{"id": key_id, "last_used_at": at} for key_id, at in pending.items()],
+                    )
+            except Exception as e:
+                log.warning("Failed to record API key usage", count=len(pending), error=str(e))
+                return
+            self.rows_written += len(pending)
+            self.flushes += 1
+
+    async def close(self) -> None:
+        """Flush remaining uses and stop the background writer."""
+        self._closed = True
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+        await self.flush()
+
+    async def _run_writer(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.flush_interval)
+            # shield: close() cancels the sleep, never a write in progress
+            await asyncio.shield(self.flush())
+
+
+# Global instances
+_api_key_cache: ApiKeyCache | None = None
+_api_key_usage: ApiKeyUsageRecorder | None = None
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Get the global API key cache, configured from settings."""
+    global _api_key_cache  # noqa: PLW0603
+    if _api_key_cache is None:
+        redis = None
+        jwt_secret = settings.jwt_secret.get_secret_value()
+        # Only a shared secret gives processes the same cache keys
+        if settings.api_key_cache_redis and jwt_secret:
+            from redis.asyncio import Redis
+
+            redis = Redis(
+                host=settings.falkordb_host,
+                port=settings.falkordb_port,
+                password=settings.falkordb_password or None,
+                db=API_KEY_CACHE_DB,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+            )
+        _api_key_cache = ApiKeyCache(
+            ttl_seconds=settings.api_key_cache_ttl_seconds,
+            secret=(
+                hashlib.sha256(b"sibyl-api-key-cache\0" + jwt_secret.encode()).digest()
+                if jwt_secret
+                else None
+            ),
+            redis=redis,
+        )
+    return _api_key_cache
+
+
+def get_api_key_usage() -> ApiKeyUsageRecorder:
+    """Get the global API key usage recorder."""
+    global _api_key_usage  # noqa: PLW0603
+    if _api_key_usage is None:
+        _api_key_usage = ApiKeyUsageRecorder()
+    return _api_key_usage
+
+
+async def shutdown_api_key_cache() -> None:
+    """Write pending key usage and drop the global cache."""
+    global _api_key_cache, _api_key_usage  # noqa: PLW0603
+    if _api_key_usage is not None:
+        await _api_key_usage.close()
+    _api_key_cache = None
+    _api_key_usage = None
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import hmac
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from hashlib import pbkdf2_hmac
@@ -13,8 +15,14 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.db.models import ApiKey, ApiKeyProjectScope
 
+# Threads deriving key hashes; bounds the CPU a burst of cold keys can take
+API_KEY_VERIFY_WORKERS = 4
+
+_verify_executor: ThreadPoolExecutor | None = None
+
 
 class ApiKeyError(ValueError):
     """API key error."""
@@ -52,6 +60,20 @@ def verify_api_key(key: str, *, salt_hex: str, hash_hex: str, iterations: int =
     return hmac.compare_digest(dk, expected)
 
 
+async def verify_api_key_async(key: str, *, salt_hex: str, hash_hex: str) -> bool:
+    """`verify_api_key` in a worker thread, keeping the key derivation off the event loop."""
+    global _verify_executor  # noqa: PLW0603
+    if _verify_executor is None:
+        _verify_executor = ThreadPoolExecutor(
+            max_workers=API_KEY_VERIFY_WORKERS, thread_name_prefix="api-key-verify"
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _verify_executor,
+        lambda: verify_api_key(key, salt_hex=salt_hex, hash_hex=hash_hex),
+    )
+
+
 @dataclass(frozen=True)
 class ApiKeyAuth:
     """Result of API key authentication."""
@@ -62,6 +84,8 @@ class ApiKeyAuth:
     scopes: list[str]
     # Project restrictions - None means all accessible projects, empty list means no access
     project_ids: list[UUID] | None = None
+    # Key expiry (naive UTC, as stored); bounds how long the result is cached
+    expires_at: datetime | None = None
 
 
 class ApiKeyManager:
@@ -104,7 +128,21 @@ class ApiKeyManager:
         return record, raw
 
     async def authenticate(self, raw_key: str) -> ApiKeyAuth | None:
-        """Authenticate an API key and load project restrictions."""
+        """Authenticate an API key and load project restrictions.
+
+        Verified keys are served from the API key cache (see
+        ``sibyl.auth.api_key_cache``) and their ``last_used_at`` is written
+        behind the request.
+        """
+        from sibyl.auth.api_key_cache import get_api_key_cache, get_api_key_usage
+
+        auth = await get_api_key_cache().get_or_verify(raw_key, lambda: self._verify(raw_key))
+        if auth is not None:
+            get_api_key_usage().touch(auth.api_key_id)
+        return auth
+
+    async def _verify(self, raw_key: str) -> ApiKeyAuth | None:
+        """Check an API key against the database."""
         prefix = api_key_prefix(raw_key)
         result = await self._session.execute(select(ApiKey).where(ApiKey.key_prefix == prefix))
         candidates = list(result.scalars().all())
@@ -114,10 +152,7 @@ class ApiKeyManager:
                 continue
             if key.expires_at is not None and key.expires_at <= now:
                 continue
-            if verify_api_key(raw_key, salt_hex=key.key_salt, hash_hex=key.key_hash):
-                key.last_used_at = datetime.now(UTC).replace(tzinfo=None)
-                self._session.add(key)
-
+            if await verify_api_key_async(raw_key, salt_hex=key.key_salt, hash_hex=key.key_hash):
                 # Load project scope restrictions
                 project_ids = await self._load_project_restrictions(key.id)
 
@@ -127,6 +162,7 @@ class ApiKeyManager:
                     organization_id=key.organization_id,
                     scopes=list(key.scopes or []),
                     project_ids=project_ids,
+                    expires_at=key.expires_at,
                 )
         return None
 
@@ -179,4 +215,9 @@ class ApiKeyManager:
             return None
         key.revoked_at = datetime.now(UTC).replace(tzinfo=None)
         self._session.add(key)
+
+        from sibyl.auth.api_key_cache import get_api_key_cache
+
+        await get_api_key_cache().invalidate(api_key_id)
+        invalidate_on_commit(self._session, api_key_id=api_key_id)
         return key
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from sqlmodel import select
 
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.db.models import OrganizationMember, OrganizationRole
 
 if TYPE_CHECKING:
@@ -49,6 +50,7 @@ class OrganizationMembershipManager:
         user_id: UUID,
         role: OrganizationRole = OrganizationRole.MEMBER,
     ) -> OrganizationMember:
+        invalidate_on_commit(self._session, org_id=organization_id, user_id=user_id)
         existing = await self.get_for_user(organization_id, user_id)
         if existing is not None:
             existing.role = role
@@ -74,6 +76,7 @@ class OrganizationMembershipManager:
                 raise ValueError("Cannot remove the last organization owner")
 
         await self._session.delete(membership)
+        invalidate_on_commit(self._session, org_id=organization_id, user_id=user_id)
 
     async def set_role(
         self,
@@ -93,6 +96,7 @@ class OrganizationMembershipManager:
 
         membership.role = role
         self._session.add(membership)
+        invalidate_on_commit(self._session, org_id=organization_id, user_id=user_id)
         return membership
 
     async def _count_owners(self, organization_id: UUID) -> int:
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Self
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.db.models import Organization, User
 
 if TYPE_CHECKING:
@@ -80,6 +81,7 @@ class OrganizationManager:
 
     async def delete(self, org: Organization) -> None:
         await self._session.delete(org)
+        invalidate_on_commit(self._session, org_id=org.id)
 
     async def create_personal_for_user(self, user: User) -> Organization:
         """Create a personal organization for a user.
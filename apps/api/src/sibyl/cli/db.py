@@ -34,14 +34,14 @@ app = typer.Typer(
 @app.command("backup")
 def backup_db(
     output: Annotated[Path, typer.Option("--output", "-o", help="Backup file path")] = Path(
-        "sibyl_backup.json"
+        "sibyl_backup.ndjson"
     ),
     org_id: Annotated[
         str,
         typer.Option("--org-id", help="Organization UUID (required for multi-tenant graph)"),
     ] = "",
 ) -> None:
-    """Backup the graph database to a JSON file."""
+    """Backup the graph database to an NDJSON file (or JSON, for a .json path)."""
     if not org_id:
         error("--org-id is required for graph operations")
         raise typer.Exit(code=1)
@@ -50,20 +50,25 @@ def backup_db(
     async def _backup() -> None:
         from dataclasses import asdict
 
-        from sibyl_core.tools.admin import create_backup
+        from sibyl_core.tools.admin import create_backup, export_backup_ndjson
 
         try:
-            result = await create_backup(organization_id=org_id)
+            if output.suffix == ".json":
+                # Legacy single-document format, built in memory
+                result = await create_backup(organization_id=org_id)
+                if result.success and result.backup_data is not None:
+                    # Write backup to file (sync I/O after async work is done)
+                    backup_dict = asdict(result.backup_data)
+                    with open(output, "w") as f:  # noqa: ASYNC230
+                        json.dump(backup_dict, f, indent=2, default=str)
+            else:
+                with open(output, "wb") as f:  # noqa: ASYNC230
+                    result = await export_backup_ndjson(f.write, organization_id=org_id)
 
-            if not result.success or result.backup_data is None:
+            if not result.success:
                 error(f"Backup failed: {result.message}")
                 return
 
-            # Write backup to file (sync I/O after async work is done)
-            backup_dict = asdict(result.backup_data)
-            with open(output, "w") as f:  # noqa: ASYNC230
-                json.dump(backup_dict, f, indent=2, default=str)
-
             success(f"Backup created: {output}")
             info(f"Entities: {result.entity_count}, Relationships: {result.relationship_count}")
             info(f"Duration: {result.duration_seconds:.2f}s")
@@ -87,8 +92,16 @@ def restore_db(
         bool,
         typer.Option("--skip-existing/--overwrite", help="Skip entities that already exist"),
     ] = True,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Records written per batch (NDJSON backups)"),
+    ] = 500,
 ) -> None:
-    """Restore the database from a backup file."""
+    """Restore the database from a backup file.
+
+    NDJSON backups are streamed in batches. Progress is saved next to the
+    backup file, so an interrupted restore resumes when run again.
+    """
     if not org_id:
         error("--org-id is required for graph operations")
         raise typer.Exit(code=1)
@@ -106,33 +119,51 @@ def restore_db(
 
     @run_async
     async def _restore() -> None:
-        from sibyl_core.tools.admin import BackupData, restore_backup
+        from sibyl_core.tools.admin import (
+            BackupData,
+            read_backup_ndjson,
+            restore_backup,
+            restore_backup_stream,
+        )
 
         try:
-            # Load backup file (sync I/O before async work)
-            with open(backup_file) as f:  # noqa: ASYNC230
-                backup_dict = json.load(f)
-
-            # Convert dict to BackupData
-            backup_data = BackupData(
-                version=backup_dict.get("version", "1.0"),
-                created_at=backup_dict.get("created_at", ""),
-                organization_id=backup_dict.get("organization_id", org_id),
-                entity_count=backup_dict.get("entity_count", 0),
-                relationship_count=backup_dict.get("relationship_count", 0),
-                entities=backup_dict.get("entities", []),
-                relationships=backup_dict.get("relationships", []),
-            )
+            if backup_file.suffix == ".ndjson":
+                checkpoint = backup_file.with_name(f"{backup_file.name}.checkpoint")
+                if checkpoint.exists():
+                    info(f"Resuming from checkpoint {checkpoint}")
+                info("Restoring backup stream...")
+                result = await restore_backup_stream(
+                    read_backup_ndjson(backup_file),
+                    organization_id=org_id,
+                    skip_existing=skip_existing,
+                    batch_size=batch_size,
+                    checkpoint_path=checkpoint,
+                )
+            else:
+                # Load backup file (sync I/O before async work)
+                with open(backup_file) as f:  # noqa: ASYNC230
+                    backup_dict = json.load(f)
+
+                # Convert dict to BackupData
+                backup_data = BackupData(
+                    version=backup_dict.get("version", "1.0"),
+                    created_at=backup_dict.get("created_at", ""),
+                    organization_id=backup_dict.get("organization_id", org_id),
+                    entity_count=backup_dict.get("entity_count", 0),
+                    relationship_count=backup_dict.get("relationship_count", 0),
+                    entities=backup_dict.get("entities", []),
+                    relationships=backup_dict.get("relationships", []),
+                )
 
-            info(
-                f"Restoring {backup_data.entity_count} entities and {backup_data.relationship_count} relationships..."
-            )
+                info(
+                    f"Restoring {backup_data.entity_count} entities and {backup_data.relationship_count} relationships..."
+                )
 
-            result = await restore_backup(
-                backup_data,
-                organization_id=org_id,
-                skip_existing=skip_existing,
-            )
+                result = await restore_backup(
+                    backup_data,
+                    organization_id=org_id,
+                    skip_existing=skip_existing,
+                )
 
             if result.success:
                 success("Restore complete!")
@@ -418,6 +449,73 @@ def backfill_project_ids(
     _backfill()
 
 
+@app.command("backfill-filter-properties")
+def backfill_filter_properties(
+    org_id: Annotated[
+        str,
+        typer.Option("--org-id", help="Organization UUID (required for multi-tenant graph)"),
+    ] = "",
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Preview what would be done without making changes"),
+    ] = False,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Nodes per page", min=1, max=5000),
+    ] = 500,
+) -> None:
+    """Promote task filter fields from metadata to indexed node properties.
+
+    Copies status, priority, complexity, feature, project_id, epic_id and tags
+    out of each node's metadata JSON into top-level properties, which entity
+    listing filters on. Run once on graphs created before filters moved into
+    the database.
+
+    Use --dry-run to preview what would be updated without making changes.
+    """
+    if not org_id:
+        error("--org-id is required for graph operations")
+        raise typer.Exit(code=1)
+
+    @run_async
+    async def _backfill() -> None:
+        from sibyl_core.tools.admin import backfill_filter_properties as run_backfill
+
+        try:
+            if dry_run:
+                warn("DRY RUN - no changes will be made")
+
+            result = await run_backfill(
+                organization_id=org_id,
+                dry_run=dry_run,
+                batch_size=batch_size,
+            )
+
+            if result.success:
+                if dry_run:
+                    info(f"Would update {result.nodes_updated} nodes")
+                else:
+                    success(f"Updated {result.nodes_updated} nodes")
+            else:
+                warn("Backfill completed with errors")
+
+            info(f"Nodes scanned: {result.nodes_scanned}")
+            info(f"Duration: {result.duration_seconds:.2f}s")
+
+            if result.errors:
+                warn(f"Errors: {len(result.errors)}")
+                for err in result.errors[:5]:
+                    console.print(f"  [dim]{err}[/dim]")
+                if len(result.errors) > 5:
+                    console.print(f"  [dim]...and {len(result.errors) - 5} more[/dim]")
+
+        except Exception as e:
+            error(f"Backfill failed: {e}")
+            print_db_hint()
+
+    _backfill()
+
+
 @app.command("backfill-episode-relationships")
 def backfill_episode_relationships(
     org_id: Annotated[
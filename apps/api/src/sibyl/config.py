@@ -132,6 +132,22 @@ class Settings(BaseSettings):
         default="auto",
         description=("Require Bearer auth for MCP endpoints. auto=enforce when JWT secret is set."),
     )
+    api_key_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        le=3600,
+        description="Seconds a verified API key is trusted before re-verifying (0 disables)",
+    )
+    api_key_cache_redis: bool = Field(
+        default=False,
+        description="Share verified API keys across API processes through Redis",
+    )
+    access_scope_cache_ttl_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        le=3600,
+        description="Seconds an MCP caller's accessible projects are cached (0 disables)",
+    )
 
     # Rate limiting configuration
     rate_limit_enabled: bool = Field(
@@ -241,6 +257,27 @@ class Settings(BaseSettings):
         default=1024,
         description="Graph (Graphiti) embedding dimensions; sets EMBEDDING_DIM for vector search",
     )
+    embedding_batch_max_tokens: int = Field(
+        default=100_000,
+        ge=1,
+        description="Estimated token budget per embedding request (inputs are packed up to it)",
+    )
+    embedding_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum embedding requests in flight per service",
+    )
+    embedding_rpm_limit: int = Field(
+        default=3000,
+        ge=0,
+        description="Embedding requests per minute budget (0 disables)",
+    )
+    embedding_tpm_limit: int = Field(
+        default=1_000_000,
+        ge=0,
+        description="Embedding tokens per minute budget (0 disables)",
+    )
     graphiti_semaphore_limit: int = Field(
         default=10,
         ge=1,
@@ -277,6 +314,36 @@ class Settings(BaseSettings):
         default=100,
         description="Token overlap between chunks",
     )
+    ingest_queue_size: int = Field(
+        default=16,
+        ge=1,
+        le=1024,
+        description="Documents buffered between ingestion pipeline stages",
+    )
+    ingest_chunk_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Documents chunked in parallel during ingestion",
+    )
+    ingest_embed_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Documents embedded in parallel during ingestion",
+    )
+    ingest_persist_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Documents written to the database in parallel during ingestion",
+    )
+    ingest_graph_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Documents integrated with the knowledge graph in parallel",
+    )
 
     # Backup configuration
     backup_dir: Path = Field(
@@ -2,16 +2,26 @@
 
 Supports multiple embedding providers with batching for efficiency.
 Uses OpenAI's text-embedding-3-small by default (1536 dimensions).
+
+Bulk embedding packs inputs into requests by estimated token count, keeps a
+bounded number of requests in flight, and paces them against per-minute
+request and token budgets. A 429 pauses every request of the service before
+retrying with exponential backoff.
 """
 
 from __future__ import annotations
 
+import asyncio
+import random
+import time
+from collections import deque
 from typing import TYPE_CHECKING
 
 import structlog
 
 from sibyl.config import settings
 from sibyl.services.settings import get_settings_service
+from sibyl_core.retrieval.embedding_cache import get_embedding_cache
 
 if TYPE_CHECKING:
     from sibyl.crawler.chunker import Chunk
@@ -21,6 +31,104 @@ log = structlog.get_logger()
 # Type alias for embeddings
 Embedding = list[float]
 
+# Backoff for rate-limited and transient failures
+_MAX_ATTEMPTS = 6
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (1 token ≈ 4 characters), matching the chunker."""
+    return len(text) // 4 + 1
+
+
+def pack_batches(texts: list[str], *, max_tokens: int, max_items: int) -> list[range]:
+    """Split texts into contiguous batches bounded by estimated tokens and count.
+
+    A single text over the token budget gets a batch of its own.
+
+    Returns:
+        Index ranges into ``texts``, in order.
+    """
+    batches: list[range] = []
+    start = 0
+    budget = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if i > start and (budget + tokens > max_tokens or i - start >= max_items):
+            batches.append(range(start, i))
+            start, budget = i, 0
+        budget += tokens
+    if start < len(texts):
+        batches.append(range(start, len(texts)))
+    return batches
+
+
+class RequestBudget:
+    """Sliding one-minute request and token budget shared by concurrent callers.
+
+    Callers are admitted in arrival order. ``pause`` holds back every caller,
+    which is how a 429 seen by one request slows down all of them.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, *, rpm: int = 0, tpm: int = 0) -> None:
+        """Initialize the budget.
+
+        Args:
+            rpm: Requests per minute (0 disables the limit)
+            tpm: Tokens per minute (0 disables the limit)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._window: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of ``tokens`` fits in the budget, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                while self._window and now - self._window[0][0] >= self.WINDOW_SECONDS:
+                    _, spent = self._window.popleft()
+                    self._tokens_in_window -= spent
+
+                rpm_ok = self.rpm <= 0 or len(self._window) < self.rpm
+                # An oversized request is admitted into an empty window
+                tpm_ok = (
+                    self.tpm <= 0 or not self._window or self._tokens_in_window + tokens <= self.tpm
+                )
+                if rpm_ok and tpm_ok:
+                    self._window.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                await asyncio.sleep(self._window[0][0] + self.WINDOW_SECONDS - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for at least ``seconds``."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Backoff for a failed request, honouring Retry-After when present."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), _BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+    delay = min(_BACKOFF_BASE_SECONDS * (2**attempt), _BACKOFF_MAX_SECONDS)
+    return delay * (0.5 + random.random() / 2)  # noqa: S311
+
 
 class EmbeddingService:
     """Service for generating embeddings from text.
@@ -35,17 +143,28 @@ class EmbeddingService:
         model: str | None = None,
         dimensions: int | None = None,
         batch_size: int = 100,
+        max_batch_tokens: int | None = None,
+        concurrency: int | None = None,
+        budget: RequestBudget | None = None,
     ) -> None:
         """Initialize the embedding service.
 
         Args:
             model: Embedding model name (default from settings)
             dimensions: Embedding dimensions (default from settings)
-            batch_size: Number of texts to embed in parallel
+            batch_size: Maximum number of texts per request
+            max_batch_tokens: Estimated token budget per request (default from settings)
+            concurrency: Maximum requests in flight (default from settings)
+            budget: Rate budget to pace requests against (default from settings)
         """
         self.model = model or settings.embedding_model
         self.dimensions = dimensions or settings.embedding_dimensions
         self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens or settings.embedding_batch_max_tokens
+        self.concurrency = concurrency or settings.embedding_concurrency
+        self.budget = budget or RequestBudget(
+            rpm=settings.embedding_rpm_limit, tpm=settings.embedding_tpm_limit
+        )
         self._client: object | None = None
 
     async def _get_client(self) -> object:
@@ -60,34 +179,38 @@ class EmbeddingService:
                     "OpenAI API key not configured (set via UI or SIBYL_OPENAI_API_KEY)"
                 )
 
-            self._client = AsyncOpenAI(api_key=api_key)
+            # Retries are handled here so a 429 can pause every request
+            self._client = AsyncOpenAI(api_key=api_key, max_retries=0)
 
         return self._client
 
     async def embed_text(self, text: str) -> Embedding:
         """Generate embedding for a single text.
 
+        Served from the shared query-embedding cache when possible;
+        concurrent requests for the same text make a single API call.
+
         Args:
             text: Text to embed
 
         Returns:
-            Embedding vector
+            Embedding vector (shared; do not mutate)
         """
-        client = await self._get_client()
-
-        # Include context in embedding if present
-        response = await client.embeddings.create(  # type: ignore[union-attr]
-            model=self.model,
-            input=text,
-            dimensions=self.dimensions,
+        return await get_embedding_cache().get_or_embed(
+            self.model, self.dimensions, text, self._embed_uncached
         )
 
-        return response.data[0].embedding
+    async def _embed_uncached(self, text: str) -> Embedding:
+        client = await self._get_client()
+        (embedding,) = await self._embed_batch(client, [text])
+        return embedding
 
     async def embed_texts(self, texts: list[str]) -> list[Embedding]:
         """Generate embeddings for multiple texts.
 
-        Batches requests for efficiency while respecting API limits.
+        Texts are packed into requests by estimated token count (at most
+        ``batch_size`` per request), up to ``concurrency`` requests run at
+        once, and each waits for room in the rate budget.
 
         Args:
             texts: List of texts to embed
@@ -99,30 +222,68 @@ class EmbeddingService:
             return []
 
         client = await self._get_client()
-        embeddings: list[Embedding] = []
-
-        # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-
-            response = await client.embeddings.create(  # type: ignore[union-attr]
-                model=self.model,
-                input=batch,
-                dimensions=self.dimensions,
-            )
-
-            # Ensure correct ordering
-            batch_embeddings = sorted(response.data, key=lambda x: x.index)
-            embeddings.extend([e.embedding for e in batch_embeddings])
-
+        batches = pack_batches(texts, max_tokens=self.max_batch_tokens, max_items=self.batch_size)
+        embeddings: list[Embedding | None] = [None] * len(texts)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = 0
+
+        async def run_batch(indices: range) -> None:
+            nonlocal done
+            batch = texts[indices.start : indices.stop]
+            async with semaphore:
+                vectors = await self._embed_batch(client, batch)
+            embeddings[indices.start : indices.stop] = vectors
+            done += len(batch)
             log.debug(
                 "Embedded batch",
                 batch_size=len(batch),
-                total_processed=len(embeddings),
-                total_remaining=len(texts) - len(embeddings),
+                total_processed=done,
+                total_remaining=len(texts) - done,
             )
 
-        return embeddings
+        tasks = [asyncio.create_task(run_batch(indices)) for indices in batches]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return embeddings  # type: ignore[return-value]
+
+    async def _embed_batch(self, client: object, batch: list[str]) -> list[Embedding]:
+        """Embed one request's worth of texts, backing off on 429s and transient errors."""
+        from openai import APIConnectionError, InternalServerError, RateLimitError
+
+        tokens = sum(estimate_tokens(text) for text in batch)
+        attempt = 0
+        while True:
+            await self.budget.acquire(tokens)
+            try:
+                response = await client.embeddings.create(  # type: ignore[attr-defined]
+                    model=self.model,
+                    input=batch,
+                    dimensions=self.dimensions,
+                )
+            except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                attempt += 1
+                if attempt >= _MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(e, attempt - 1)
+                if isinstance(e, RateLimitError):
+                    self.budget.pause(delay)
+                log.warning(
+                    "embedding_batch_retry",
+                    error=type(e).__name__,
+                    attempt=attempt,
+                    delay_seconds=round(delay, 2),
+                    batch_size=len(batch),
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            # Ensure correct ordering
+            return [e.embedding for e in sorted(response.data, key=lambda x: x.index)]
 
     async def embed_chunks(self, chunks: list[Chunk]) -> list[Embedding]:
         """Generate embeddings for document chunks.
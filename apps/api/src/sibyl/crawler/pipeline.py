@@ -2,27 +2,36 @@
 
 Orchestrates the full ingestion flow:
 1. Crawl documentation source
-2. Store raw documents
-3. Chunk documents into retrievable segments
-4. Generate embeddings
-5. Store chunks with embeddings
-6. Extract entities and link to knowledge graph (Graph-RAG integration)
+2. Chunk documents into retrievable segments
+3. Generate embeddings
+4. Store documents and bulk-insert their chunks
+5. Extract entities and link to knowledge graph (Graph-RAG integration)
+
+Source ingestion runs these steps as concurrent stages joined by bounded
+queues, so the crawler keeps fetching while earlier pages are embedded and
+written. Each stage has its own worker count; when a stage falls behind its
+inbox fills up and backpressure reaches the crawler.
 
 Supports both single-document and bulk source ingestion.
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import col
 
+from sibyl.config import settings
 from sibyl.crawler.chunker import ChunkStrategy, DocumentChunker
 from sibyl.crawler.embedder import EmbeddingService
 from sibyl.crawler.graph_integration import GraphIntegrationService
@@ -41,11 +50,52 @@ from sibyl_core.models.entities import Entity, EntityType
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sibyl.crawler.chunker import Chunk
+    from sibyl.crawler.embedder import Embedding
+
 log = structlog.get_logger()
 
 # Type alias for progress callback: receives (stats, chunks_in_last_doc)
 ProgressCallback = Callable[["IngestionStats", int], Awaitable[None]]
 
+# Pipeline stages in flow order
+STAGES = ("crawl", "chunk", "embed", "persist", "graph")
+
+# End-of-stream marker sent once per downstream worker
+_DONE: Any = object()
+
+
+@dataclass
+class StageStats:
+    """Throughput and backlog for one pipeline stage."""
+
+    name: str
+    workers: int = 1
+    processed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    backlog: int = 0  # Documents waiting in this stage's inbox
+    busy_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        """Documents per second completed since the stage started."""
+        elapsed = time.monotonic() - self.started_at
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for progress events."""
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "backlog": self.backlog,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throughput": round(self.throughput, 3),
+        }
+
 
 @dataclass
 class IngestionStats:
@@ -61,6 +111,7 @@ class IngestionStats:
     entities_linked: int = 0
     errors: int = 0
     duration_seconds: float = 0.0
+    stages: dict[str, StageStats] = field(default_factory=dict)
 
     def __str__(self) -> str:
         base = (
@@ -75,6 +126,19 @@ class IngestionStats:
         return base
 
 
+@dataclass
+class _DocumentWork:
+    """A document moving through the pipeline stages."""
+
+    document: CrawledDocument
+    chunks: list[Chunk] = field(default_factory=list)
+    embeddings: list[Embedding] | None = None
+    db_chunks: list[DocumentChunk] = field(default_factory=list)
+
+
+StageHandler = Callable[[_DocumentWork], Awaitable[_DocumentWork | None]]
+
+
 class IngestionPipeline:
     """Full document ingestion pipeline.
 
@@ -90,6 +154,11 @@ class IngestionPipeline:
         generate_embeddings: bool = True,
         embedding_batch_size: int = 50,
         integrate_with_graph: bool = True,
+        queue_size: int | None = None,
+        chunk_workers: int | None = None,
+        embed_workers: int | None = None,
+        persist_workers: int | None = None,
+        graph_workers: int | None = None,
     ) -> None:
         """Initialize the ingestion pipeline.
 
@@ -99,24 +168,43 @@ class IngestionPipeline:
             generate_embeddings: Whether to generate embeddings
             embedding_batch_size: Batch size for embedding generation
             integrate_with_graph: Whether to extract entities and link to graph
+            queue_size: Documents buffered between stages (default from settings)
+            chunk_workers: Documents chunked in parallel (default from settings)
+            embed_workers: Documents embedded in parallel (default from settings)
+            persist_workers: Documents written in parallel (default from settings)
+            graph_workers: Documents integrated with the graph in parallel (default from settings)
         """
         self.organization_id = organization_id
         self.chunk_strategy = chunk_strategy
         self.generate_embeddings = generate_embeddings
         self.embedding_batch_size = embedding_batch_size
         self.integrate_with_graph = integrate_with_graph
+        self.queue_size = queue_size or settings.ingest_queue_size
+        self.stage_workers = {
+            "crawl": 1,
+            "chunk": chunk_workers or settings.ingest_chunk_workers,
+            "embed": embed_workers or settings.ingest_embed_workers,
+            "persist": persist_workers or settings.ingest_persist_workers,
+            "graph": graph_workers or settings.ingest_graph_workers,
+        }
 
         self._crawler: CrawlerService | None = None
         self._embedder: EmbeddingService | None = None
         self._graph_integration: GraphIntegrationService | None = None
         self._entity_manager: EntityManager | None = None
         self._chunker = DocumentChunker()
+        self._chunk_executor: ThreadPoolExecutor | None = None
 
     async def start(self) -> None:
         """Start pipeline services."""
         self._crawler = CrawlerService()
         await self._crawler.start()
 
+        self._chunk_executor = ThreadPoolExecutor(
+            max_workers=self.stage_workers["chunk"],
+            thread_name_prefix="sibyl-chunk",
+        )
+
         if self.generate_embeddings:
             self._embedder = EmbeddingService(batch_size=self.embedding_batch_size)
 
@@ -150,6 +238,10 @@ class IngestionPipeline:
             await self._crawler.stop()
             self._crawler = None
 
+        if self._chunk_executor:
+            self._chunk_executor.shutdown(wait=False, cancel_futures=True)
+            self._chunk_executor = None
+
         log.info("Ingestion pipeline stopped")
 
     async def __aenter__(self) -> IngestionPipeline:
@@ -172,13 +264,16 @@ class IngestionPipeline:
         """Ingest a full documentation source.
 
         Crawls all pages, chunks content, generates embeddings,
-        and stores everything in the database.
+        and stores everything in the database. Stages run concurrently,
+        so documents may finish out of crawl order.
 
         Args:
             source: CrawlSource to ingest
             max_pages: Maximum pages to crawl
             max_depth: Maximum link depth
-            on_progress: Optional callback called after each document with (stats, chunks_created)
+            on_progress: Optional callback called after each document with
+                (stats, chunks_created); ``stats.stages`` carries per-stage
+                throughput and backlog
 
         Returns:
             IngestionStats with results
@@ -199,55 +294,13 @@ class IngestionPipeline:
             max_pages=max_pages,
         )
 
-        try:
-            # Select crawler and method based on source type
-            if source.source_type == SourceType.LOCAL:
-                # Local files don't need llms.txt discovery
-                crawler: CrawlerService | LocalFileCrawler = LocalFileCrawler()
-                doc_stream = crawler.crawl_source(
-                    source,
-                    max_pages=max_pages,
-                    max_depth=max_depth,
-                )
-            else:
-                # Web sources use discovery (probes for llms.txt first)
-                if not self._crawler:
-                    raise RuntimeError("Web crawler not started")
-                doc_stream = self._crawler.crawl_with_discovery(
-                    source,
-                    max_pages=max_pages,
-                    max_depth=max_depth,
-                )
-
-            # Crawl and process documents
-            async for doc in doc_stream:
-                stats.documents_crawled += 1
-                chunks_before = stats.chunks_created
-
-                try:
-                    # Store document and create chunks
-                    await self._process_document(doc, stats, source.source_type)
-                    stats.documents_stored += 1
-
-                    # Report progress after each successful document
-                    if on_progress:
-                        chunks_added = stats.chunks_created - chunks_before
-                        try:
-                            await on_progress(stats, chunks_added)
-                        except Exception as cb_err:
-                            log.warning("Progress callback failed", error=str(cb_err))
-
-                except Exception as e:
-                    stats.errors += 1
-                    log.error(  # noqa: TRY400
-                        "Failed to process document",
-                        url=doc.url,
-                        error=str(e),
-                    )
-
-        except Exception as e:
-            log.error("Source ingestion failed", source=source.name, error=str(e))  # noqa: TRY400
-            stats.errors += 1
+        await self._run_stages(
+            source,
+            stats,
+            max_pages=max_pages,
+            max_depth=max_depth,
+            on_progress=on_progress,
+        )
 
         # Auto-tag source based on crawled documents
         if stats.documents_stored > 0:
@@ -259,10 +312,182 @@ class IngestionPipeline:
             "Source ingestion complete",
             source=source.name,
             stats=str(stats),
+            stages={name: stage.to_dict() for name, stage in stats.stages.items()},
         )
 
         return stats
 
+    def _open_stream(
+        self,
+        source: CrawlSource,
+        *,
+        max_pages: int,
+        max_depth: int,
+    ) -> AsyncIterator[CrawledDocument]:
+        """Select crawler and method based on source type."""
+        if source.source_type == SourceType.LOCAL:
+            # Local files don't need llms.txt discovery
+            return LocalFileCrawler().crawl_source(
+                source,
+                max_pages=max_pages,
+                max_depth=max_depth,
+            )
+
+        # Web sources use discovery (probes for llms.txt first)
+        if not self._crawler:
+            raise RuntimeError("Web crawler not started")
+        return self._crawler.crawl_with_discovery(
+            source,
+            max_pages=max_pages,
+            max_depth=max_depth,
+        )
+
+    async def _run_stages(
+        self,
+        source: CrawlSource,
+        stats: IngestionStats,
+        *,
+        max_pages: int,
+        max_depth: int,
+        on_progress: ProgressCallback | None,
+    ) -> None:
+        """Run crawl -> chunk -> embed -> persist -> graph as concurrent stages.
+
+        A document that fails in any stage is counted in ``stats.errors`` and
+        dropped; the rest of the run continues.
+        """
+        stats.stages = {name: StageStats(name, workers=self.stage_workers[name]) for name in STAGES}
+        inboxes: dict[str, asyncio.Queue[_DocumentWork]] = {
+            name: asyncio.Queue(maxsize=self.queue_size) for name in STAGES[1:]
+        }
+        claimed_urls: set[str] = set()
+        progress_lock = asyncio.Lock()
+
+        async def finish(work: _DocumentWork) -> None:
+            stats.documents_stored += 1
+            if not on_progress:
+                return
+            # Serialize callbacks so progress updates land in order
+            async with progress_lock:
+                for name, inbox in inboxes.items():
+                    stats.stages[name].backlog = inbox.qsize()
+                try:
+                    await on_progress(stats, len(work.chunks))
+                except Exception as cb_err:
+                    log.warning("Progress callback failed", error=str(cb_err))
+
+        async def crawl() -> None:
+            stage = stats.stages["crawl"]
+            try:
+                doc_stream = self._open_stream(source, max_pages=max_pages, max_depth=max_depth)
+                async for doc in doc_stream:
+                    stats.documents_crawled += 1
+                    stage.processed += 1
+                    await inboxes["chunk"].put(_DocumentWork(doc))
+            except Exception as e:
+                log.error(  # noqa: TRY400
+                    "Source ingestion failed", source=source.name, error=str(e)
+                )
+                stats.errors += 1
+            for _ in range(stats.stages["chunk"].workers):
+                await inboxes["chunk"].put(_DONE)
+
+        async def chunk(work: _DocumentWork) -> _DocumentWork | None:
+            url = work.document.url
+            # Skip duplicates before spending embedding calls on them. Claim
+            # the URL first so a repeat in this run can't slip past the check.
+            duplicate = url in claimed_urls
+            claimed_urls.add(url)
+            if duplicate or await self._document_exists(url):
+                log.debug("Document already exists, skipping", url=url)
+                await finish(work)
+                return None
+
+            work.chunks = await self._chunk_document(work.document)
+            stats.chunks_created += len(work.chunks)
+            return work
+
+        async def embed(work: _DocumentWork) -> _DocumentWork:
+            await self._embed_document(work, stats)
+            return work
+
+        async def persist(work: _DocumentWork) -> _DocumentWork | None:
+            if not await self._store_document(work):
+                await finish(work)
+                return None
+            return work
+
+        async def graph(work: _DocumentWork) -> None:
+            await self._integrate_document(work, stats, source.source_type)
+            await finish(work)
+
+        handlers: dict[str, StageHandler] = {
+            "chunk": chunk,
+            "embed": embed,
+            "persist": persist,
+            "graph": graph,
+        }
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(crawl())
+            for name, downstream in zip(STAGES[1:], (*STAGES[2:], None), strict=True):
+                tg.create_task(
+                    self._run_stage(
+                        stats,
+                        stats.stages[name],
+                        handlers[name],
+                        inboxes[name],
+                        downstream=inboxes[downstream] if downstream else None,
+                        downstream_workers=stats.stages[downstream].workers if downstream else 0,
+                    )
+                )
+
+    async def _run_stage(
+        self,
+        stats: IngestionStats,
+        stage: StageStats,
+        handler: StageHandler,
+        inbox: asyncio.Queue[_DocumentWork],
+        *,
+        downstream: asyncio.Queue[_DocumentWork] | None,
+        downstream_workers: int,
+    ) -> None:
+        """Drain ``inbox`` with ``stage.workers`` workers, forwarding results downstream."""
+
+        async def worker() -> None:
+            while (work := await inbox.get()) is not _DONE:
+                stage.backlog = inbox.qsize()
+                stage.in_flight += 1
+                started = time.monotonic()
+                try:
+                    result = await handler(work)
+                except Exception as e:
+                    stage.failed += 1
+                    stats.errors += 1
+                    log.error(  # noqa: TRY400
+                        "Failed to process document",
+                        stage=stage.name,
+                        url=work.document.url,
+                        error=str(e),
+                    )
+                    continue
+                finally:
+                    stage.in_flight -= 1
+                    stage.busy_seconds += time.monotonic() - started
+
+                stage.processed += 1
+                if result is not None and downstream is not None:
+                    await downstream.put(result)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(stage.workers):
+                tg.create_task(worker())
+
+        # Every worker has exited; tell the next stage's workers to stop
+        if downstream is not None:
+            for _ in range(downstream_workers):
+                await downstream.put(_DONE)
+
     async def _create_convention_entity(
         self,
         document: CrawledDocument,
@@ -364,68 +589,66 @@ class IngestionPipeline:
         except Exception as e:
             log.warning("Failed to update source metadata", source=source.name, error=str(e))
 
-    async def _process_document(
-        self,
-        document: CrawledDocument,
-        stats: IngestionStats,
-        source_type: SourceType | None = None,
-    ) -> None:
-        """Process a single document - store, chunk, embed, integrate with graph.
+    async def _document_exists(self, url: str) -> bool:
+        """Check whether a document with this URL is already stored."""
+        async with get_session() as session:
+            existing = await session.execute(
+                select(CrawledDocument.id).where(col(CrawledDocument.url) == url).limit(1)
+            )
+            return existing.first() is not None
+
+    async def _chunk_document(self, document: CrawledDocument) -> list[Chunk]:
+        """Chunk a document on the chunking worker pool, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._chunk_executor,
+            partial(self._chunker.chunk_document, document, strategy=self.chunk_strategy),
+        )
 
-        Args:
-            document: Document to process
-            stats: Stats to update
-            source_type: Type of source (LOCAL for convention entities)
+    async def _embed_document(self, work: _DocumentWork, stats: IngestionStats) -> None:
+        """Generate embeddings for a document's chunks, if enabled.
+
+        Failures are logged and the chunks are stored without embeddings.
         """
-        db_chunks: list[DocumentChunk] = []
+        if not work.chunks or not (self.generate_embeddings and self._embedder):
+            return
 
-        async with get_session() as session:
-            # Check for existing document (deduplication)
-            existing = await session.execute(
-                select(CrawledDocument).where(col(CrawledDocument.url) == document.url)
+        try:
+            work.embeddings = await self._embedder.embed_chunks(work.chunks)
+            stats.embeddings_generated += len(work.embeddings)
+        except Exception as e:
+            log.warning(
+                "Failed to generate embeddings",
+                url=work.document.url,
+                error=str(e),
             )
-            if existing.scalar_one_or_none():
-                log.debug("Document already exists, skipping", url=document.url)
-                return
 
+    async def _store_document(self, work: _DocumentWork) -> bool:
+        """Store a document and bulk-insert its chunks in one transaction.
+
+        Returns:
+            False if another crawl stored the same URL first (nothing is written)
+        """
+        document = work.document
+        embeddings = work.embeddings
+
+        async with get_session() as session:
             # Store document - handle race condition with concurrent crawls
             try:
                 session.add(document)
                 await session.flush()
                 await session.refresh(document)
             except IntegrityError:
-                # Another concurrent crawl already inserted this URL
                 log.debug("Document inserted by concurrent crawl, skipping", url=document.url)
                 await session.rollback()
-                return
-
-            # Chunk document
-            chunks = self._chunker.chunk_document(
-                document,
-                strategy=self.chunk_strategy,
-            )
-            stats.chunks_created += len(chunks)
+                return False
 
-            if not chunks:
+            if not work.chunks:
                 log.debug("No chunks created for document", url=document.url)
-                return
-
-            # Generate embeddings if enabled
-            embeddings = None
-            if self.generate_embeddings and self._embedder:
-                try:
-                    embeddings = await self._embedder.embed_chunks(chunks)
-                    stats.embeddings_generated += len(embeddings)
-                except Exception as e:
-                    log.warning(
-                        "Failed to generate embeddings",
-                        url=document.url,
-                        error=str(e),
-                    )
+                return True
 
-            # Store chunks
-            for i, chunk in enumerate(chunks):
-                db_chunk = DocumentChunk(
+            work.db_chunks = [
+                DocumentChunk(
                     document_id=document.id,
                     chunk_index=chunk.chunk_index,
                     chunk_type=chunk.chunk_type,
@@ -441,13 +664,32 @@ class IngestionPipeline:
                     has_entities=False,
                     entity_ids=[],
                 )
-                session.add(db_chunk)
-                db_chunks.append(db_chunk)
+                for i, chunk in enumerate(work.chunks)
+            ]
+            # One multi-row INSERT; chunk IDs are generated client-side
+            await session.execute(
+                insert(DocumentChunk),
+                [db_chunk.model_dump() for db_chunk in work.db_chunks],
+            )
 
-            # Flush to get chunk IDs for graph integration
-            await session.flush()
+        return True
+
+    async def _integrate_document(
+        self,
+        work: _DocumentWork,
+        stats: IngestionStats,
+        source_type: SourceType | None = None,
+    ) -> None:
+        """Extract entities from stored chunks and link them to the knowledge graph.
+
+        Args:
+            work: Document with stored chunks
+            stats: Stats to update
+            source_type: Type of source (LOCAL for convention entities)
+        """
+        document = work.document
+        db_chunks = work.db_chunks
 
-        # Graph integration: extract entities and link to knowledge graph
         if self._graph_integration and db_chunks:
             try:
                 integration_stats = await self._graph_integration.process_chunks(
@@ -483,11 +725,39 @@ class IngestionPipeline:
         log.debug(
             "Processed document",
             url=document.url,
-            chunks=len(chunks),
-            embeddings=len(embeddings) if embeddings else 0,
+            chunks=len(work.chunks),
+            embeddings=len(work.embeddings) if work.embeddings else 0,
             entities=stats.entities_extracted,
         )
 
+    async def _process_document(
+        self,
+        document: CrawledDocument,
+        stats: IngestionStats,
+        source_type: SourceType | None = None,
+    ) -> None:
+        """Process a single document - store, chunk, embed, integrate with graph.
+
+        Runs the same steps as the source pipeline, one after another.
+
+        Args:
+            document: Document to process
+            stats: Stats to update
+            source_type: Type of source (LOCAL for convention entities)
+        """
+        if await self._document_exists(document.url):
+            log.debug("Document already exists, skipping", url=document.url)
+            return
+
+        work = _DocumentWork(document)
+        work.chunks = await self._chunk_document(document)
+        stats.chunks_created += len(work.chunks)
+
+        await self._embed_document(work, stats)
+        if not await self._store_document(work):
+            return
+        await self._integrate_document(work, stats, source_type)
+
     async def ingest_url(
         self,
         url: str,
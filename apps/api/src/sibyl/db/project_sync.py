@@ -15,6 +15,7 @@ import structlog
 from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.db.models import Project, ProjectVisibility
 
 log = structlog.get_logger()
@@ -106,6 +107,8 @@ async def sync_project_create(
     )
     session.add(project)
     await session.flush()
+    # Org-visible: every member's scope gains it
+    invalidate_on_commit(session, org_id=organization_id)
 
     log.info(
         "project_synced_create",
@@ -195,6 +198,7 @@ async def sync_project_delete(
     )
 
     if result.rowcount > 0:  # type: ignore[union-attr]
+        invalidate_on_commit(session, org_id=organization_id)
         log.info("project_synced_delete", graph_id=graph_project_id)
         return True
 
@@ -287,6 +291,7 @@ async def ensure_shared_project_postgres(
     )
     session.add(project)
     await session.flush()
+    invalidate_on_commit(session, org_id=organization_id)
 
     log.info(
         "shared_project_created",
@@ -12,6 +12,7 @@ import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sibyl.auth.access_scope import invalidate_on_commit
 from sibyl.db.models import Project, ProjectVisibility
 
 log = structlog.get_logger()
@@ -149,6 +150,8 @@ async def sync_projects_from_graph(
             result["errors"] += 1
             result["details"].append({"graph_id": graph_id, "name": name, "error": str(e)})
 
+    if result["created"] and not dry_run:
+        invalidate_on_commit(session, org_id=organization_id)
     return result
 
 
@@ -236,13 +236,11 @@ async def store_relationships(
     Returns:
         Tuple of (stored_count, skipped_count, errors).
     """
-    client = await get_graph_client()
-    relationship_manager = RelationshipManager(client, group_id=group_id)
-
     stored = 0
     skipped = 0
     errors: list[str] = []
     seen_rels: set[str] = set()
+    to_create: list[Relationship] = []
 
     for extracted in relationships:
         try:
@@ -257,15 +255,22 @@ async def store_relationships(
                 skipped += 1
                 continue
             seen_rels.add(rel_key)
-
-            await relationship_manager.create(rel)
-            stored += 1
+            to_create.append(rel)
 
         except Exception as e:
             error_msg = f"Failed to store relationship {extracted.source_name}->{extracted.target_name}: {e}"
             log.warning(error_msg)
             errors.append(error_msg)
 
+    if to_create:
+        client = await get_graph_client()
+        relationship_manager = RelationshipManager(client, group_id=group_id)
+        result = await relationship_manager.create_bulk(to_create)
+        stored = result.created
+        skipped += result.existing
+        if result.failed:
+            errors.append(f"Failed to store {result.failed} relationships")
+
     log.info("Stored relationships", stored=stored, skipped=skipped, errors=len(errors))
     return stored, skipped, errors
 
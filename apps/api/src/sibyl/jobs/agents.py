@@ -6,15 +6,20 @@ while agents work autonomously.
 
 import asyncio
 import contextlib
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import structlog
+from sqlalchemy import insert
 
 from sibyl.agents.messages import format_agent_message, generate_workflow_reminder
 from sibyl.db import AgentMessage, AgentMessageRole, AgentMessageType, get_session
 
+if TYPE_CHECKING:
+    from sibyl.agents.control import AgentControl
+
 log = structlog.get_logger()
 
 
@@ -58,23 +63,6 @@ async def _safe_broadcast(event: str, data: dict[str, Any], *, org_id: str | Non
         log.debug("Broadcast failed (Redis unavailable)", event=event)
 
 
-async def _check_stop_signal(agent_id: str) -> bool:
-    """Check if agent should stop execution.
-
-    Called between message iterations to allow graceful termination.
-
-    Returns:
-        True if agent should stop
-    """
-    try:
-        from sibyl.api.pubsub import check_agent_stop
-
-        return await check_agent_stop(agent_id)
-    except Exception:
-        log.debug("Stop signal check failed", agent_id=agent_id)
-        return False
-
-
 async def _clear_stop_signal(agent_id: str) -> None:
     """Clear stop signal after agent has stopped."""
     try:
@@ -85,13 +73,109 @@ async def _clear_stop_signal(agent_id: str) -> None:
         log.debug("Stop signal clear failed", agent_id=agent_id)
 
 
-async def _store_agent_message(
+async def _until_interrupted(
+    stream: AsyncIterator[Any], control: "AgentControl"
+) -> AsyncIterator[Any]:
+    """Yield messages from an agent stream until it is asked to stop or pause.
+
+    The signal also wins while the stream is waiting on the model, so the
+    agent does not run on until its next message.
+    """
+    interrupted = asyncio.create_task(control.interrupt.wait())
+    try:
+        while not control.interrupted:
+            step = asyncio.ensure_future(anext(stream))
+            await asyncio.wait({step, interrupted}, return_when=asyncio.FIRST_COMPLETED)
+            if not step.done():
+                step.cancel()
+                with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await step
+                return
+            try:
+                message = step.result()
+            except StopAsyncIteration:
+                return
+            yield message
+    finally:
+        interrupted.cancel()
+
+
+async def _stream_reply(
+    instance: Any,
+    prompt: str,
+    control: "AgentControl",
+    messages: "AgentMessageBuffer",
+    *,
+    agent_id: str,
+    org_id: str,
+    message_count: int,
+) -> AsyncIterator[tuple[int, Any, dict[str, Any]]]:
+    """Send a follow-up prompt and stream the reply to the UI and message buffer.
+
+    Yields:
+        (message_num, SDK message, formatted message) for each visible message
+    """
+    async for message in _until_interrupted(instance.send_message(prompt), control):
+        formatted = format_agent_message(message)
+        if formatted is None:
+            continue
+
+        message_count += 1
+        await _safe_broadcast(
+            "agent_message",
+            {"agent_id": agent_id, "message_num": message_count, **formatted},
+            org_id=org_id,
+        )
+        messages.add(message_count, formatted)
+        yield message_count, message, formatted
+
+
+async def _finish_interrupted(
+    instance: Any,
+    control: "AgentControl",
+    messages: "AgentMessageBuffer",
+    *,
+    agent_id: str,
+    org_id: str,
+    message_count: int,
+    session_id: str | None,
+) -> dict[str, Any]:
+    """Terminate or pause an agent after a control signal.
+
+    A paused agent keeps its session ID so it can be resumed later.
+    """
+    await messages.close()
+    if control.stop.is_set():
+        status, reason = "terminated", "user_terminated"
+        await instance.stop(reason)
+    else:
+        status, reason = "paused", control.reason or "user_request"
+        if session_id:
+            instance.set_session_id(session_id)
+        await instance.pause(reason)
+
+    log.info("agent_execution_interrupted", agent_id=agent_id, status=status)
+    await _clear_stop_signal(agent_id)
+    await _safe_broadcast(
+        "agent_status",
+        {"agent_id": agent_id, "status": status},
+        org_id=org_id,
+    )
+    return {
+        "agent_id": agent_id,
+        "status": status,
+        "turns": message_count,
+        "reason": reason,
+    }
+
+
+def _build_agent_message(
     agent_id: str,
     org_id: str,
     message_num: int,
     formatted: dict[str, Any],
-) -> None:
-    """Store agent message summary to Postgres for reload persistence.
+) -> AgentMessage:
+    """Build the persisted row for a formatted agent message.
 
     Only stores summarized content - full tool outputs are NOT saved.
     Real-time streaming via WebSocket shows full content during execution.
@@ -159,23 +243,116 @@ async def _store_agent_message(
     # Remove None values
     extra = {k: v for k, v in extra.items() if v is not None}
 
-    try:
-        async with get_session() as session:
-            msg = AgentMessage(
-                agent_id=agent_id,
-                organization_id=UUID(org_id),
-                message_num=message_num,
-                role=role,
-                type=msg_type,
-                content=content,
-                tool_id=tool_id,
-                parent_tool_use_id=parent_tool_use_id,
-                extra=extra,
+    return AgentMessage(
+        agent_id=agent_id,
+        organization_id=UUID(org_id),
+        message_num=message_num,
+        role=role,
+        type=msg_type,
+        content=content,
+        tool_id=tool_id,
+        parent_tool_use_id=parent_tool_use_id,
+        extra=extra,
+    )
+
+
+class AgentMessageBuffer:
+    """Write-behind buffer for one agent's persisted chat messages.
+
+    ``add`` queues a row and returns immediately, so the message loop never
+    waits on Postgres. Rows are written with one multi-row INSERT per batch,
+    once ``max_batch`` rows are pending or ``max_delay`` seconds after the
+    first pending row, whichever comes first. Batches are written one at a
+    time in the order rows were added, so ``message_num`` order is kept.
+    ``flush`` writes everything pending now; ``close`` flushes and stops.
+
+    Rows still pending when the worker process dies are lost, as were rows
+    whose single-row commit failed before.
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        org_id: str,
+        *,
+        max_batch: int = 50,
+        max_delay: float = 0.5,
+    ) -> None:
+        self.agent_id = agent_id
+        self.org_id = org_id
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.rows_written = 0
+        self.batches_written = 0
+
+        self._pending: list[AgentMessage] = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._writer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def add(self, message_num: int, formatted: dict[str, Any]) -> None:
+        """Queue a formatted message for persistence."""
+        if self._closed:
+            raise RuntimeError("AgentMessageBuffer is closed")
+
+        self._pending.append(
+            _build_agent_message(self.agent_id, self.org_id, message_num, formatted)
+        )
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run_writer())
+        self._has_pending.set()
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+
+    async def flush(self) -> None:
+        """Write all pending messages now."""
+        async with self._write_lock:
+            pending, self._pending = self._pending, []
+            self._batch_full.clear()
+            for start in range(0, len(pending), self.max_batch):
+                await self._write(pending[start : start + self.max_batch])
+
+    async def close(self) -> None:
+        """Flush remaining messages and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._has_pending.set()
+        self._batch_full.set()
+        if self._writer is not None:
+            await self._writer
+        await self.flush()
+
+    async def _run_writer(self) -> None:
+        """Flush on size or time thresholds until closed."""
+        while not self._closed:
+            await self._has_pending.wait()
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.max_delay):
+                    await self._batch_full.wait()
+            self._has_pending.clear()
+            await self.flush()
+
+    async def _write(self, batch: list[AgentMessage]) -> None:
+        try:
+            async with get_session() as session:
+                await session.execute(
+                    insert(AgentMessage), [message.model_dump() for message in batch]
+                )
+        except Exception as e:
+            log.warning(
+                "Failed to store agent messages",
+                agent_id=self.agent_id,
+                count=len(batch),
+                first_message_num=batch[0].message_num,
+                error=str(e),
             )
-            session.add(msg)
-            await session.commit()
-    except Exception as e:
-        log.warning("Failed to store agent message", agent_id=agent_id, error=str(e))
+            return
+
+        self.rows_written += len(batch)
+        self.batches_written += 1
 
 
 async def _generate_and_broadcast_status_hint(
@@ -263,6 +440,7 @@ async def run_agent_execution(  # noqa: PLR0915
         Dict with execution results
     """
     from sibyl.agents import AgentRunner, WorktreeManager
+    from sibyl.agents.control import get_control_bus
     from sibyl_core.graph.client import get_graph_client
     from sibyl_core.graph.entities import EntityManager
     from sibyl_core.models import AgentCheckpoint, AgentSpawnSource, AgentStatus, AgentType
@@ -274,6 +452,11 @@ async def run_agent_execution(  # noqa: PLR0915
         task_id=task_id,
     )
 
+    # Persist chat messages off the message loop, in batches
+    messages = AgentMessageBuffer(agent_id, org_id)
+    # Stop, pause and message signals pushed by the API
+    control = get_control_bus().register(agent_id)
+
     try:
         client = await get_graph_client()
         manager = EntityManager(client, group_id=org_id)
@@ -345,168 +528,144 @@ async def run_agent_execution(  # noqa: PLR0915
             {"agent_id": agent_id, "message_num": message_count, **initial_message},
             org_id=org_id,
         )
-        await _store_agent_message(agent_id, org_id, message_count, initial_message)
+        messages.add(message_count, initial_message)
 
-        # Execute agent with immediate stop support
-        # Background task watches for stop signal and sets event
+        # Execute agent; stop and pause signals end the stream immediately
         log.info("run_agent_execution_starting", agent_id=agent_id)
-        stop_event = asyncio.Event()
-        was_terminated = False
+        async for message in _until_interrupted(instance.execute(), control):
+            msg_class = type(message).__name__
 
-        async def watch_stop_signal() -> None:
-            """Background task to watch for stop signal."""
-            while not stop_event.is_set():
-                if await _check_stop_signal(agent_id):
-                    stop_event.set()
-                    return
-                await asyncio.sleep(0.2)  # Check every 200ms
+            # Format message for UI (returns None for internal SDK messages)
+            formatted = format_agent_message(message)
+            if formatted is None:
+                continue  # Skip internal messages
 
-        stop_watcher = asyncio.create_task(watch_stop_signal())
+            message_count += 1
 
-        try:
-            async for message in instance.execute():
-                # Check for immediate stop
-                if stop_event.is_set():
-                    log.info("agent_stop_signal_immediate", agent_id=agent_id)
-                    was_terminated = True
-                    break
-
-                msg_class = type(message).__name__
-
-                # Format message for UI (returns None for internal SDK messages)
-                formatted = format_agent_message(message)
-                if formatted is None:
-                    continue  # Skip internal messages
-
-                message_count += 1
-
-                log.debug(
-                    "run_agent_message",
-                    agent_id=agent_id,
-                    message_num=message_count,
-                    message_type=msg_class,
-                    content_preview=formatted.get("preview", "")[:100],
-                )
-
-                # Broadcast message to UI in real-time
-                await _safe_broadcast(
-                    "agent_message",
-                    {
-                        "agent_id": agent_id,
-                        "message_num": message_count,
-                        **formatted,
-                    },
-                    org_id=org_id,
-                )
-
-                # Store summarized message to Postgres for reload persistence
-                await _store_agent_message(agent_id, org_id, message_count, formatted)
-
-                # Broadcast injected Sibyl context (once, after first response)
-                if not context_broadcasted and instance.workflow_tracker:
-                    injected = instance.workflow_tracker.injected_context
-                    if injected:
-                        context_broadcasted = True
-                        message_count += 1
-                        context_message = {
-                            "role": "system",
-                            "type": "sibyl_context",
-                            "content": injected,
-                            "timestamp": datetime.now(UTC).isoformat(),
-                            "preview": "Sibyl context injected",
-                            "icon": "Sparkles",
-                        }
-                        await _safe_broadcast(
-                            "agent_message",
-                            {"agent_id": agent_id, "message_num": message_count, **context_message},
-                            org_id=org_id,
-                        )
-                        await _store_agent_message(agent_id, org_id, message_count, context_message)
-
-                # Track session ID
-                if sid := getattr(message, "session_id", None):
-                    session_id = sid
-
-                # Track tool calls for summary
-                if "ToolUse" in msg_class or formatted.get("type") == "tool_use":
-                    tool_name = formatted.get("tool_name", "unknown")
-                    tool_calls.append(tool_name)
-
-                    # Generate and broadcast Tier 3 status hint (fire-and-forget)
-                    tool_id = formatted.get("tool_id")
-                    tool_input = formatted.get("input")
-                    _fire_and_forget(
-                        _generate_and_broadcast_status_hint(
-                            agent_id=agent_id,
-                            tool_call_id=tool_id,
-                            tool_name=tool_name,
-                            tool_input=tool_input,
-                            task_id=task_id,
-                            agent_type=agent_type,
-                            org_id=org_id,
-                        ),
-                        name="status_hint",
-                    )
-
-                # Keep last meaningful content for summary
-                if formatted.get("content") and formatted.get("type") != "tool_result":
-                    last_content = formatted.get("content", "")[:500]
-
-        finally:
-            # Clean up stop watcher
-            stop_watcher.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await stop_watcher
+            log.debug(
+                "run_agent_message",
+                agent_id=agent_id,
+                message_num=message_count,
+                message_type=msg_class,
+                content_preview=formatted.get("preview", "")[:100],
+            )
 
-        # Handle termination
-        if was_terminated:
-            await instance.stop("user_terminated")
-            await _clear_stop_signal(agent_id)
+            # Broadcast message to UI in real-time
             await _safe_broadcast(
-                "agent_status",
-                {"agent_id": agent_id, "status": "terminated"},
+                "agent_message",
+                {
+                    "agent_id": agent_id,
+                    "message_num": message_count,
+                    **formatted,
+                },
                 org_id=org_id,
             )
-            return {
-                "agent_id": agent_id,
-                "status": "terminated",
-                "turns": message_count,
-                "reason": "user_terminated",
-            }
-
-        # Check workflow completion and send follow-up if needed
-        # Only for substantive work (5+ tool calls with code changes)
-        if instance.workflow_tracker and instance.workflow_tracker.should_remind():
-            workflow_summary = instance.workflow_tracker.get_workflow_summary()
-            log.info("run_agent_workflow_reminder", agent_id=agent_id, **workflow_summary)
-
-            # Send follow-up to remind about Sibyl workflow
-            follow_up_prompt = generate_workflow_reminder(workflow_summary)
-
-            # Stream follow-up responses
-            async for message in instance.send_message(follow_up_prompt):
-                formatted = format_agent_message(message)
-                if formatted is None:
-                    continue
-
-                message_count += 1
-
-                await _safe_broadcast(
-                    "agent_message",
-                    {"agent_id": agent_id, "message_num": message_count, **formatted},
-                    org_id=org_id,
+
+            # Store summarized message to Postgres for reload persistence
+            messages.add(message_count, formatted)
+
+            # Broadcast injected Sibyl context (once, after first response)
+            if not context_broadcasted and instance.workflow_tracker:
+                injected = instance.workflow_tracker.injected_context
+                if injected:
+                    context_broadcasted = True
+                    message_count += 1
+                    context_message = {
+                        "role": "system",
+                        "type": "sibyl_context",
+                        "content": injected,
+                        "timestamp": datetime.now(UTC).isoformat(),
+                        "preview": "Sibyl context injected",
+                        "icon": "Sparkles",
+                    }
+                    await _safe_broadcast(
+                        "agent_message",
+                        {"agent_id": agent_id, "message_num": message_count, **context_message},
+                        org_id=org_id,
+                    )
+                    messages.add(message_count, context_message)
+
+            # Track session ID
+            if sid := getattr(message, "session_id", None):
+                session_id = sid
+
+            # Track tool calls for summary
+            if "ToolUse" in msg_class or formatted.get("type") == "tool_use":
+                tool_name = formatted.get("tool_name", "unknown")
+                tool_calls.append(tool_name)
+
+                # Generate and broadcast Tier 3 status hint (fire-and-forget)
+                tool_id = formatted.get("tool_id")
+                tool_input = formatted.get("input")
+                _fire_and_forget(
+                    _generate_and_broadcast_status_hint(
+                        agent_id=agent_id,
+                        tool_call_id=tool_id,
+                        tool_name=tool_name,
+                        tool_input=tool_input,
+                        task_id=task_id,
+                        agent_type=agent_type,
+                        org_id=org_id,
+                    ),
+                    name="status_hint",
                 )
-                await _store_agent_message(agent_id, org_id, message_count, formatted)
 
+            # Keep last meaningful content for summary
+            if formatted.get("content") and formatted.get("type") != "tool_result":
+                last_content = formatted.get("content", "")[:500]
+
+        # Reply to messages the user sent while the agent was working, then
+        # remind about the Sibyl workflow after substantive work (5+ tool calls
+        # with code changes)
+        reminded = False
+        while not control.interrupted:
+            if pending := control.drain_messages():
+                follow_up_prompt = "\n\n".join(pending)
+            elif (
+                not reminded
+                and instance.workflow_tracker
+                and instance.workflow_tracker.should_remind()
+            ):
+                reminded = True
+                workflow_summary = instance.workflow_tracker.get_workflow_summary()
+                log.info("run_agent_workflow_reminder", agent_id=agent_id, **workflow_summary)
+                follow_up_prompt = generate_workflow_reminder(workflow_summary)
+            else:
+                break
+
+            # The reply continues the running count; rebinding it is intended
+            async for message_count, message, formatted in _stream_reply(  # noqa: B020
+                instance,
+                follow_up_prompt,
+                control,
+                messages,
+                agent_id=agent_id,
+                org_id=org_id,
+                message_count=message_count,
+            ):
                 # Track tool calls
                 if "ToolUse" in type(message).__name__ or formatted.get("type") == "tool_use":
-                    tool_name = formatted.get("tool_name", "unknown")
-                    tool_calls.append(tool_name)
+                    tool_calls.append(formatted.get("tool_name", "unknown"))
 
                 # Update last content
                 if formatted.get("content") and formatted.get("type") != "tool_result":
                     last_content = formatted.get("content", "")[:500]
 
+        # Handle termination or pause
+        if control.interrupted:
+            return await _finish_interrupted(
+                instance,
+                control,
+                messages,
+                agent_id=agent_id,
+                org_id=org_id,
+                message_count=message_count,
+                session_id=session_id,
+            )
+
+        # Everything streamed is stored before the agent is marked complete
+        await messages.close()
+
         # Create checkpoint only on completion (summary, not full history)
         from uuid import uuid4
 
@@ -564,6 +723,7 @@ async def run_agent_execution(  # noqa: PLR0915
 
     except Exception as e:
         log.exception("run_agent_execution_failed", agent_id=agent_id, error=str(e))
+        await messages.close()
 
         # Update agent status to failed
         try:
@@ -588,6 +748,11 @@ async def run_agent_execution(  # noqa: PLR0915
 
         raise
 
+    finally:
+        # Cancelled jobs still persist what they streamed
+        await messages.close()
+        get_control_bus().unregister(agent_id)
+
 
 async def resume_agent_execution(  # noqa: PLR0915
     ctx: dict[str, Any],  # noqa: ARG001
@@ -610,12 +775,18 @@ async def resume_agent_execution(  # noqa: PLR0915
         Dict with execution results
     """
     from sibyl.agents import AgentRunner, WorktreeManager
+    from sibyl.agents.control import get_control_bus
     from sibyl_core.graph.client import get_graph_client
     from sibyl_core.graph.entities import EntityManager
     from sibyl_core.models import AgentStatus, EntityType
 
     log.info("resume_agent_execution_started", agent_id=agent_id, prompt_preview=prompt[:100])
 
+    # Persist chat messages off the message loop, in batches
+    messages = AgentMessageBuffer(agent_id, org_id)
+    # Stop, pause and message signals pushed by the API
+    control = get_control_bus().register(agent_id)
+
     try:
         client = await get_graph_client()
         manager = EntityManager(client, group_id=org_id)
@@ -696,102 +867,92 @@ async def resume_agent_execution(  # noqa: PLR0915
         tool_calls: list[str] = []
         context_broadcasted = False
 
-        # Execute resumed agent with immediate stop support
+        # Execute resumed agent; stop and pause signals end the stream immediately
         log.info("resume_agent_execution_streaming", agent_id=agent_id)
-        stop_event = asyncio.Event()
-        was_terminated = False
+        async for message in _until_interrupted(instance.execute(), control):
+            msg_class = type(message).__name__
+            formatted = format_agent_message(message)
+            if formatted is None:
+                continue
 
-        async def watch_stop_signal() -> None:
-            """Background task to watch for stop signal."""
-            while not stop_event.is_set():
-                if await _check_stop_signal(agent_id):
-                    stop_event.set()
-                    return
-                await asyncio.sleep(0.2)  # Check every 200ms
+            message_count += 1
 
-        stop_watcher = asyncio.create_task(watch_stop_signal())
-
-        try:
-            async for message in instance.execute():
-                # Check for immediate stop
-                if stop_event.is_set():
-                    log.info("agent_stop_signal_immediate", agent_id=agent_id)
-                    was_terminated = True
-                    break
-
-                msg_class = type(message).__name__
-                formatted = format_agent_message(message)
-                if formatted is None:
-                    continue
-
-                message_count += 1
-
-                log.debug(
-                    "resume_agent_message",
-                    agent_id=agent_id,
-                    message_num=message_count,
-                    message_type=msg_class,
-                )
+            log.debug(
+                "resume_agent_message",
+                agent_id=agent_id,
+                message_num=message_count,
+                message_type=msg_class,
+            )
 
-                # Broadcast to UI
-                await _safe_broadcast(
-                    "agent_message",
-                    {"agent_id": agent_id, "message_num": message_count, **formatted},
-                    org_id=org_id,
-                )
-                await _store_agent_message(agent_id, org_id, message_count, formatted)
-
-                # Broadcast Sibyl context if available
-                if not context_broadcasted and instance.workflow_tracker:
-                    injected = instance.workflow_tracker.injected_context
-                    if injected:
-                        context_broadcasted = True
-                        message_count += 1
-                        context_message = {
-                            "role": "system",
-                            "type": "sibyl_context",
-                            "content": injected,
-                            "timestamp": datetime.now(UTC).isoformat(),
-                            "preview": "Sibyl context injected",
-                            "icon": "Sparkles",
-                        }
-                        await _safe_broadcast(
-                            "agent_message",
-                            {"agent_id": agent_id, "message_num": message_count, **context_message},
-                            org_id=org_id,
-                        )
-                        await _store_agent_message(agent_id, org_id, message_count, context_message)
-
-                # Track session ID (may update if forked)
+            # Broadcast to UI
+            await _safe_broadcast(
+                "agent_message",
+                {"agent_id": agent_id, "message_num": message_count, **formatted},
+                org_id=org_id,
+            )
+            messages.add(message_count, formatted)
+
+            # Broadcast Sibyl context if available
+            if not context_broadcasted and instance.workflow_tracker:
+                injected = instance.workflow_tracker.injected_context
+                if injected:
+                    context_broadcasted = True
+                    message_count += 1
+                    context_message = {
+                        "role": "system",
+                        "type": "sibyl_context",
+                        "content": injected,
+                        "timestamp": datetime.now(UTC).isoformat(),
+                        "preview": "Sibyl context injected",
+                        "icon": "Sparkles",
+                    }
+                    await _safe_broadcast(
+                        "agent_message",
+                        {"agent_id": agent_id, "message_num": message_count, **context_message},
+                        org_id=org_id,
+                    )
+                    messages.add(message_count, context_message)
+
+            # Track session ID (may update if forked)
+            if sid := getattr(message, "session_id", None):
+                new_session_id = sid
+
+            # Track tool calls
+            if "ToolUse" in msg_class or formatted.get("type") == "tool_use":
+                tool_name = formatted.get("tool_name", "unknown")
+                tool_calls.append(tool_name)
+
+        # Reply to messages the user sent while the agent was working
+        while not control.interrupted and (pending := control.drain_messages()):
+            # The reply continues the running count; rebinding it is intended
+            async for message_count, message, formatted in _stream_reply(  # noqa: B020
+                instance,
+                "\n\n".join(pending),
+                control,
+                messages,
+                agent_id=agent_id,
+                org_id=org_id,
+                message_count=message_count,
+            ):
                 if sid := getattr(message, "session_id", None):
                     new_session_id = sid
-
-                # Track tool calls
-                if "ToolUse" in msg_class or formatted.get("type") == "tool_use":
-                    tool_name = formatted.get("tool_name", "unknown")
-                    tool_calls.append(tool_name)
-
-        finally:
-            # Clean up stop watcher
-            stop_watcher.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await stop_watcher
-
-        # Handle termination
-        if was_terminated:
-            await instance.stop("user_terminated")
-            await _clear_stop_signal(agent_id)
-            await _safe_broadcast(
-                "agent_status",
-                {"agent_id": agent_id, "status": "terminated"},
+                if "ToolUse" in type(message).__name__ or formatted.get("type") == "tool_use":
+                    tool_calls.append(formatted.get("tool_name", "unknown"))
+
+        # Handle termination or pause
+        if control.interrupted:
+            return await _finish_interrupted(
+                instance,
+                control,
+                messages,
+                agent_id=agent_id,
                 org_id=org_id,
+                message_count=message_count,
+                session_id=new_session_id,
             )
-            return {
-                "agent_id": agent_id,
-                "status": "terminated",
-                "turns": message_count,
-                "reason": "user_terminated",
-            }
+
+        # Everything streamed is stored before the agent is marked complete
+        await messages.close()
 
         # Update agent with new session_id and completion status
         await manager.update(
@@ -821,6 +982,7 @@ async def resume_agent_execution(  # noqa: PLR0915
 
     except Exception as e:
         log.exception("resume_agent_execution_failed", agent_id=agent_id, error=str(e))
+        await messages.close()
 
         try:
             client = await get_graph_client()
@@ -839,6 +1001,11 @@ async def resume_agent_execution(  # noqa: PLR0915
 
         raise
 
+    finally:
+        # Cancelled jobs still persist what they streamed
+        await messages.close()
+        get_control_bus().unregister(agent_id)
+
 
 async def generate_status_hint(
     ctx: dict[str, Any],  # noqa: ARG001
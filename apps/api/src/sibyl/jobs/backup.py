@@ -1,32 +1,53 @@
 """Backup jobs for PostgreSQL and FalkorDB graph data.
 
 Creates timestamped, compressed backup archives containing:
-- PostgreSQL dump (schema + data)
+- PostgreSQL dump (schema + the organization's rows)
 - FalkorDB graph export (entities + relationships)
 - Metadata JSON (checksums, counts, version info)
+
+Exports are streamed to disk in fixed-size chunks with their checksums
+computed as they are written, so memory use does not grow with the size of
+the organization.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import shutil
-import subprocess
 import tarfile
 import tempfile
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 import structlog
 
 from sibyl.config import settings
 
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+
 log = structlog.get_logger()
 
 # Backup archive version for compatibility tracking
-BACKUP_VERSION = "2.0"
+# 2.1: postgres.sql holds the schema plus only the organization's rows
+# 2.2: graph.ndjson (streamed, one record per line) replaces graph.json
+BACKUP_VERSION = "2.2"
+
+# Read size for streamed exports
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# pg_dump timeout in seconds
+PG_DUMP_TIMEOUT = 600
+
+# Tables holding per-user credentials, not organization data
+_EXCLUDED_TABLES = frozenset(
+    {"login_history", "password_reset_tokens", "oauth_connections", "system_settings"}
+)
 
 
 @dataclass
@@ -106,13 +127,191 @@ def _find_pg_tool(tool: str) -> str:
     return tool  # Return bare name, will fail with FileNotFoundError
 
 
-def _sha256_file(path: Path) -> str:
-    """Calculate SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+class _ChecksumWriter:
+    """Binary file writer that tracks size and SHA256 as data is written."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._file = open(path, "wb")  # noqa: SIM115
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._sha256.update(data)
+        self.size += len(data)
+
+    def close(self) -> None:
+        self._file.close()
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def __enter__(self) -> _ChecksumWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def _org_table_scopes() -> list[tuple[Table, str]]:
+    """Build a row filter for every table that holds organization data.
+
+    Tables are returned in dependency order. Each filter is a WHERE clause
+    with the organization ID as ``$1``. Tables without an organization_id
+    column are scoped through their foreign key to a scoped table; users
+    are limited to the organization's members.
+    """
+    from sqlmodel import SQLModel
+
+    import sibyl.db.models  # noqa: F401 - registers the tables
+
+    scopes: dict[str, str] = {}
+    ordered: list[tuple[Table, str]] = []
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name in _EXCLUDED_TABLES:
+            continue
+
+        clause: str | None = None
+        if table.name == "organizations":
+            clause = "id = $1"
+        elif table.name == "users":
+            clause = "id IN (SELECT user_id FROM organization_members WHERE organization_id = $1)"
+        elif "organization_id" in table.c:
+            clause = "organization_id = $1"
+        else:
+            for fk in table.foreign_keys:
+                parent = fk.column.table
+                if parent.name != "users" and parent.name in scopes:
+                    clause = (
+                        f'"{fk.parent.name}" IN (SELECT "{fk.column.name}" '  # noqa: S608
+                        f'FROM "{parent.name}" WHERE {scopes[parent.name]})'
+                    )
+                    break
+
+        if clause is not None:
+            scopes[table.name] = clause
+            ordered.append((table, clause))
+    return ordered
+
+
+async def _dump_schema(writer: _ChecksumWriter) -> None:
+    """Stream ``pg_dump --schema-only`` output into the writer."""
+    cmd = [
+        _find_pg_tool("pg_dump"),
+        *_get_pg_connection_args(),
+        "--schema-only",
+        "--format=plain",
+        "--no-owner",
+        "--no-acl",
+    ]
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            env=_get_pg_env(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        log.warning("backup_pg_not_found", error=str(e))
+        raise RuntimeError("pg_dump not found. Install PostgreSQL client tools.") from e
+
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+
+    async def pump() -> None:
+        while chunk := await proc.stdout.read(STREAM_CHUNK_BYTES):  # type: ignore[union-attr]
+            writer.write(chunk)
+
+    try:
+        async with asyncio.timeout(PG_DUMP_TIMEOUT):
+            # Drain stderr alongside stdout so neither pipe can fill up
+            _, stderr, returncode = await asyncio.gather(pump(), proc.stderr.read(), proc.wait())
+    except TimeoutError as e:
+        proc.kill()
+        await proc.wait()
+        log.warning("backup_pg_timeout", timeout=PG_DUMP_TIMEOUT)
+        raise RuntimeError(f"pg_dump timed out after {PG_DUMP_TIMEOUT // 60} minutes") from e
+
+    if returncode != 0:
+        raise RuntimeError(f"pg_dump failed: {stderr.decode(errors='replace')}")
+
+
+async def _dump_org_rows(writer: _ChecksumWriter, organization_id: str) -> int:
+    """Stream the organization's rows as COPY blocks into the writer.
+
+    All tables are read in one repeatable-read transaction, so the export is
+    a consistent snapshot.
+
+    Returns:
+        Number of rows exported
+    """
+    from sqlalchemy import text
+
+    from sibyl.db.connection import get_session
+
+    async def sink(data: bytes) -> None:
+        writer.write(data)
+
+    org_uuid = UUID(organization_id)
+    total_rows = 0
+    writer.write(b"\n-- Organization data\nSET client_encoding = 'UTF8';\n\n")
+
+    async with get_session() as session:
+        conn = await session.connection()
+        await conn.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection
+
+        for table, clause in _org_table_scopes():
+            columns = ", ".join(f'"{column.name}"' for column in table.columns)
+            writer.write(f'COPY public."{table.name}" ({columns}) FROM stdin;\n'.encode())
+            # Identifiers and clauses come from table metadata; the org is a bind param
+            status = await pg.copy_from_query(  # type: ignore[union-attr]
+                f'SELECT {columns} FROM "{table.name}" WHERE {clause}',  # noqa: S608
+                org_uuid,
+                output=sink,
+            )
+            writer.write(b"\\.\n\n")
+            # Status is "COPY <rows>"
+            total_rows += int(status.split()[-1])
+
+    return total_rows
+
+
+async def _export_postgres(path: Path, organization_id: str) -> tuple[_ChecksumWriter, int]:
+    """Write the schema and the organization's rows to ``path``.
+
+    Returns:
+        The closed writer (size and checksum) and the number of rows exported
+    """
+    with _ChecksumWriter(path) as writer:
+        await _dump_schema(writer)
+        rows = await _dump_org_rows(writer, organization_id)
+    return writer, rows
+
+
+async def _export_graph(path: Path, organization_id: str) -> tuple[_ChecksumWriter, int, int]:
+    """Stream the organization's graph export to ``path`` as NDJSON.
+
+    Returns:
+        The closed writer (size and checksum), entity count and relationship count
+    """
+    from sibyl_core.tools.admin import export_backup_ndjson
+
+    with _ChecksumWriter(path) as writer:
+        graph_result = await export_backup_ndjson(writer.write, organization_id=organization_id)
+    if not graph_result.success:
+        raise RuntimeError(f"Graph backup failed: {graph_result.message}")
+    return writer, graph_result.entity_count, graph_result.relationship_count
+
+
+def _write_archive(archive_path: Path, members: dict[str, Path]) -> None:
+    """Pack spooled exports into a tar.gz archive (runs in a thread)."""
+    with tarfile.open(archive_path, "w:gz", compresslevel=6) as tar:
+        for arcname, path in members.items():
+            tar.add(path, arcname=arcname)
 
 
 def _generate_backup_id() -> str:
@@ -219,8 +418,8 @@ async def run_backup(  # noqa: PLR0915
     """Create a complete backup archive.
 
     This job creates a timestamped .tar.gz archive containing:
-    - postgres.sql: Full PostgreSQL dump
-    - graph.json: FalkorDB graph export
+    - postgres.sql: Database schema plus the organization's rows (COPY blocks)
+    - graph.ndjson: FalkorDB graph export, one record per line
     - metadata.json: Archive metadata with checksums
 
     Args:
@@ -266,88 +465,59 @@ async def run_backup(  # noqa: PLR0915
         with tempfile.TemporaryDirectory(prefix="sibyl_backup_") as tmpdir:
             tmp_path = Path(tmpdir)
             pg_file = tmp_path / "postgres.sql"
-            graph_file = tmp_path / "graph.json"
+            graph_file = tmp_path / "graph.ndjson"
             metadata_file = tmp_path / "metadata.json"
 
             pg_size = 0
             graph_size = 0
+            pg_rows = 0
             entity_count = 0
             relationship_count = 0
             file_checksums: dict[str, str] = {}
+            members: dict[str, Path] = {"metadata.json": metadata_file}
 
-            # Step 1: PostgreSQL backup
-            if include_postgres:
+            # Steps 1 and 2: PostgreSQL and graph exports, streamed side by side
+            async def backup_postgres() -> None:
+                nonlocal pg_size, pg_rows
                 log.info("backup_pg_start", backup_id=backup_id)
-                try:
-                    cmd = [
-                        _find_pg_tool("pg_dump"),
-                        *_get_pg_connection_args(),
-                        "--format=plain",
-                        "--no-owner",
-                        "--no-acl",
-                    ]
-
-                    result = subprocess.run(  # noqa: S603, ASYNC221
-                        cmd,
-                        env=_get_pg_env(),
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                        timeout=600,  # 10 minute timeout
-                    )
-
-                    if result.returncode != 0:
-                        raise RuntimeError(f"pg_dump failed: {result.stderr}")
-
-                    pg_file.write_text(result.stdout, encoding="utf-8")
-                    pg_size = pg_file.stat().st_size
-                    file_checksums["postgres.sql"] = _sha256_file(pg_file)
-
-                    log.info("backup_pg_complete", backup_id=backup_id, size_bytes=pg_size)
-
-                except FileNotFoundError as e:
-                    log.warning("backup_pg_not_found", error=str(e))
-                    raise RuntimeError("pg_dump not found. Install PostgreSQL client tools.") from e
-                except subprocess.TimeoutExpired as e:
-                    log.warning("backup_pg_timeout", error=str(e))
-                    raise RuntimeError("pg_dump timed out after 10 minutes") from e
+                writer, pg_rows = await _export_postgres(pg_file, organization_id)
+                pg_size = writer.size
+                file_checksums["postgres.sql"] = writer.sha256
+                members["postgres.sql"] = pg_file
+                log.info(
+                    "backup_pg_complete", backup_id=backup_id, size_bytes=pg_size, rows=pg_rows
+                )
 
-            # Step 2: Graph backup
-            if include_graph:
+            async def backup_graph() -> None:
+                nonlocal graph_size, entity_count, relationship_count
                 log.info("backup_graph_start", backup_id=backup_id, organization_id=organization_id)
                 try:
-                    from dataclasses import asdict as dc_asdict
-
-                    from sibyl_core.tools.admin import create_backup
-
-                    graph_result = await create_backup(organization_id=organization_id)
-
-                    if not graph_result.success or graph_result.backup_data is None:
-                        raise RuntimeError(f"Graph backup failed: {graph_result.message}")
-
-                    entity_count = graph_result.entity_count
-                    relationship_count = graph_result.relationship_count
-
-                    # Write graph backup
-                    backup_dict = dc_asdict(graph_result.backup_data)
-                    graph_file.write_text(
-                        json.dumps(backup_dict, indent=2, default=str),
-                        encoding="utf-8",
+                    writer, entity_count, relationship_count = await _export_graph(
+                        graph_file, organization_id
                     )
-                    graph_size = graph_file.stat().st_size
-                    file_checksums["graph.json"] = _sha256_file(graph_file)
-
-                    log.info(
-                        "backup_graph_complete",
-                        backup_id=backup_id,
-                        entities=entity_count,
-                        relationships=relationship_count,
-                        size_bytes=graph_size,
-                    )
-
                 except Exception as e:
                     log.exception("backup_graph_failed", backup_id=backup_id, error=str(e))
                     raise
+                graph_size = writer.size
+                file_checksums["graph.ndjson"] = writer.sha256
+                members["graph.ndjson"] = graph_file
+                log.info(
+                    "backup_graph_complete",
+                    backup_id=backup_id,
+                    entities=entity_count,
+                    relationships=relationship_count,
+                    size_bytes=graph_size,
+                )
+
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    if include_postgres:
+                        tg.create_task(backup_postgres())
+                    if include_graph:
+                        tg.create_task(backup_graph())
+            except ExceptionGroup as eg:
+                # Surface the first failure, as if the steps had run in sequence
+                raise eg.exceptions[0] from None
 
             # Step 3: Create metadata
             metadata = BackupMetadata(
@@ -355,7 +525,7 @@ async def run_backup(  # noqa: PLR0915
                 created_at=datetime.now(UTC).isoformat(),
                 organization_id=organization_id,
                 hostname=socket.gethostname(),
-                pg_entities=0,  # Could count tables if needed
+                pg_entities=pg_rows,
                 graph_entities=entity_count,
                 graph_relationships=relationship_count,
                 files=file_checksums,
@@ -370,13 +540,7 @@ async def run_backup(  # noqa: PLR0915
             archive_path = backup_dir / archive_name
 
             log.info("backup_archive_start", backup_id=backup_id, archive_path=str(archive_path))
-
-            with tarfile.open(archive_path, "w:gz", compresslevel=6) as tar:
-                tar.add(metadata_file, arcname="metadata.json")
-                if include_postgres and pg_file.exists():
-                    tar.add(pg_file, arcname="postgres.sql")
-                if include_graph and graph_file.exists():
-                    tar.add(graph_file, arcname="graph.json")
+            await asyncio.to_thread(_write_archive, archive_path, members)
 
             archive_size = archive_path.stat().st_size
             duration = time.time() - start_time
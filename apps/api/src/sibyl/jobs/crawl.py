@@ -107,6 +107,7 @@ async def crawl_source(
                 "chunks_created": stats.chunks_created,
                 "chunks_added": chunks_added,
                 "errors": stats.errors,
+                "stages": {name: stage.to_dict() for name, stage in stats.stages.items()},
             },
             org_id=organization_id,
         )
@@ -28,6 +28,7 @@ async def create_entity(  # noqa: PLR0915
     group_id: str,
     relationships: list[dict[str, Any]] | None = None,
     auto_link_params: dict[str, Any] | None = None,
+    embedding: list[float] | None = None,
 ) -> dict[str, Any]:
     """Create entity asynchronously via Graphiti.
 
@@ -41,6 +42,7 @@ async def create_entity(  # noqa: PLR0915
         group_id: Organization ID
         relationships: Optional list of explicit relationships to create
         auto_link_params: Parameters for auto-link discovery (always runs if provided)
+        embedding: Entity embedding computed by add(); embedded here if missing
 
     Returns:
         Dict with creation results
@@ -83,10 +85,18 @@ async def create_entity(  # noqa: PLR0915
         else:
             entity = Episode.model_validate(entity_data)
 
-        # Use create_direct() for structured entities (faster, generates embeddings)
+        # One embedding serves the node write and auto-link discovery
+        direct = entity_type in ("task", "project", "epic", "pattern")
+        if embedding is None and (direct or auto_link_params):
+            try:
+                embedding = await entity_manager.embed(entity)
+            except Exception as e:
+                log.warning("create_entity_embedding_failed", error=str(e))
+
+        # Use create_direct() for structured entities (faster, stores the embedding)
         # Use create() for episodes (LLM extraction may add value)
-        if entity_type in ("task", "project", "epic", "pattern"):
-            created_id = await entity_manager.create_direct(entity)
+        if direct:
+            created_id = await entity_manager.create_direct(entity, embedding=embedding)
         else:
             created_id = await entity_manager.create(entity)
 
@@ -152,6 +162,7 @@ async def create_entity(  # noqa: PLR0915
                     exclude_id=created_id,
                     threshold=0.75,
                     limit=5,
+                    embedding=embedding,
                 )
 
                 for linked_id, score in auto_link_results:
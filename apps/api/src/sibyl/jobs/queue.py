@@ -175,6 +175,7 @@ async def enqueue_create_entity(
     group_id: str,
     relationships: list[dict[str, Any]] | None = None,
     auto_link_params: dict[str, Any] | None = None,
+    embedding: list[float] | None = None,
 ) -> str:
     """Enqueue an entity creation job.
 
@@ -189,6 +190,7 @@ async def enqueue_create_entity(
         group_id: Organization ID
         relationships: Optional explicit relationships to create
         auto_link_params: Parameters for auto-link discovery (always runs if provided)
+        embedding: Entity embedding already computed by add(), reused by the job
 
     Returns:
         Job ID for tracking
@@ -207,6 +209,7 @@ async def enqueue_create_entity(
         group_id,
         relationships=relationships,
         auto_link_params=auto_link_params,
+        embedding=embedding,
         _job_id=job_id,
     )
 
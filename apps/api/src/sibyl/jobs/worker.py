@@ -56,7 +56,12 @@ async def startup(ctx: dict[str, Any]) -> None:
 
 async def shutdown(ctx: dict[str, Any]) -> None:  # noqa: ARG001
     """Worker shutdown - cleanup resources."""
+    from sibyl.agents.control import shutdown_control_bus
+    from sibyl.agents.subscriber import shutdown_subscriber
+
     log.info("Job worker shutting down")
+    await shutdown_control_bus()
+    await shutdown_subscriber()
 
 
 def _parse_cron_schedule(schedule: str) -> dict[str, int | set[int] | None]:
@@ -183,6 +183,16 @@ def create_combined_app(  # noqa: PLR0915
             except Exception as e:
                 log.warning("Error shutting down locks", error=str(e))
 
+        # Write API key usage still pending
+        from sibyl.auth.api_key_cache import shutdown_api_key_cache
+
+        await shutdown_api_key_cache()
+
+        # Stop the community detection worker process
+        from sibyl_core.graph.communities import shutdown_detection_executor
+
+        shutdown_detection_executor()
+
         # Shutdown embedded worker if running
         if worker_task:
             worker_task.cancel()
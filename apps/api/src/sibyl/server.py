@@ -27,6 +27,8 @@ class McpContext:
     scopes: list[str] | None = None
     # API key project restrictions (None = all, list = only these)
     api_key_project_ids: list[str] | None = None
+    # Authenticating API key, if any
+    api_key_id: str | None = None
 
 
 async def _get_mcp_context() -> McpContext | None:
@@ -60,6 +62,7 @@ async def _get_mcp_context() -> McpContext | None:
                 user_id=str(auth.user_id),
                 scopes=auth.scopes,
                 api_key_project_ids=project_ids,
+                api_key_id=str(auth.api_key_id),
             )
         return None
 
@@ -113,6 +116,8 @@ async def _get_accessible_projects(ctx: McpContext) -> set[str] | None:
     """Get project IDs the user can access based on their permissions.
 
     Combines user permissions with API key project restrictions (if any).
+    Results are cached per (user, org, API key) until a membership, project
+    or API key change invalidates them; see ``sibyl.auth.access_scope``.
 
     Returns:
         Set of accessible project graph IDs, or None if no filtering needed (admin).
@@ -124,6 +129,22 @@ async def _get_accessible_projects(ctx: McpContext) -> set[str] | None:
             return set(ctx.api_key_project_ids)
         return None
 
+    from sibyl.auth.access_scope import get_access_scope_cache
+
+    cache = get_access_scope_cache()
+    key = (ctx.user_id, ctx.org_id, ctx.api_key_id)
+    found, scope = cache.get(key)
+    if found:
+        return scope
+
+    generation = cache.generation
+    scope = await _load_accessible_projects(ctx)
+    cache.set(key, scope, generation)
+    return scope
+
+
+async def _load_accessible_projects(ctx: McpContext) -> set[str] | None:
+    """Resolve a user's accessible projects from Postgres."""
     from sibyl.auth.context import AuthContext
     from sibyl.db.connection import get_session
 
@@ -423,6 +444,8 @@ def _register_tools(mcp: FastMCP) -> None:
         project: str | None = None,
         status: str | None = None,
         limit: int = 50,
+        *,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Explore and browse the knowledge graph.
 
@@ -446,6 +469,8 @@ def _register_tools(mcp: FastMCP) -> None:
             project: Filter tasks by project ID (for list mode with tasks)
             status: Filter tasks by status (for list mode with tasks)
             limit: Maximum results (1-200, default: 50)
+            cursor: Page through list mode - pass "" for the first page, then the
+                    next_cursor from the previous result
 
         Returns:
             Exploration results with entities and/or relationships
@@ -475,6 +500,7 @@ def _register_tools(mcp: FastMCP) -> None:
             accessible_projects=accessible_projects,
             status=status,
             limit=limit,
+            cursor=cursor,
             organization_id=ctx.org_id,
         )
         return _to_dict(result)
@@ -55,6 +55,8 @@ from tests.harness.helpers import (
 from tests.harness.mocks import (
     MockEntityManager,
     MockGraphClient,
+    MockPubSub,
+    MockRedis,
     MockRelationshipManager,
     create_test_entity,
     create_test_relationship,
@@ -65,6 +67,8 @@ __all__ = [
     "MockGraphClient",
     "MockEntityManager",
     "MockRelationshipManager",
+    "MockRedis",
+    "MockPubSub",
     "create_test_entity",
     "create_test_relationship",
     # Context
@@ -86,7 +86,6 @@ class ToolTestContext:
             patch("sibyl_core.tools.manage.RelationshipManager", make_relationship_manager),
             # Health tool
             patch("sibyl_core.tools.health.get_graph_client", async_get_graph_client),
-            patch("sibyl_core.tools.health.EntityManager", make_entity_manager),
         ]
 
         for p in patches:
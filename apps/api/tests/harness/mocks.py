@@ -1,11 +1,15 @@
 """Mock implementations for testing MCP tools.
 
 Provides mock versions of GraphClient, EntityManager, and RelationshipManager
-that can be used to test tools without requiring a real FalkorDB connection.
+that can be used to test tools without requiring a real FalkorDB connection,
+and a MockRedis for the worker-side pub/sub code.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from fnmatch import fnmatchcase
 from typing import Any
 from uuid import uuid4
 
@@ -66,6 +70,12 @@ class MockGraphClient:
         result = await self.client.driver.execute_query(query, **params)
         return self.normalize_result(result)
 
+    async def execute_read_org(
+        self, query: str, organization_id: str, **params: object
+    ) -> list[dict[str, Any]]:
+        """Execute an org-scoped read query and normalize results."""
+        return await self.execute_read(query, **params)
+
 
 @dataclass
 class MockGraphitiClient:
@@ -112,10 +122,14 @@ class MockEntityManager:
         self._entities[entity_id] = entity
         return entity_id
 
-    async def create_direct(self, entity: Entity) -> str:
+    async def create_direct(self, entity: Entity, **kwargs: Any) -> str:
         """Create entity directly (same as create for mock)."""
         return await self.create(entity)
 
+    async def embed(self, entity: Entity) -> list[float]:
+        """Embed an entity (fixed vector)."""
+        return [0.0] * 8
+
     async def get(self, entity_id: str) -> Entity:
         """Get entity by ID."""
         if entity_id not in self._entities:
@@ -140,6 +154,16 @@ class MockEntityManager:
 
         return results
 
+    async def search_by_embedding(
+        self,
+        embedding: list[float],
+        entity_types: list[EntityType] | None = None,
+        limit: int = 10,
+        **kwargs: Any,
+    ) -> list[tuple[Entity, float]]:
+        """Vector search - returns the same pre-configured results as search."""
+        return await self.search("", entity_types=entity_types, limit=limit)
+
     async def update(self, entity_id: str, updates: dict[str, Any]) -> Entity | None:
         """Update entity fields."""
         if entity_id not in self._entities:
@@ -299,3 +323,58 @@ def create_test_relationship(
         properties=kwargs.get("properties", {}),
         created_at=kwargs.get("created_at", datetime.now(UTC)),
     )
+
+
+class MockPubSub:
+    """Pattern subscription on a MockRedis; fed by MockRedis.publish."""
+
+    def __init__(self, redis: "MockRedis") -> None:
+        self._redis = redis
+        self.patterns: set[str] = set()
+        self.messages: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+
+    async def psubscribe(self, *patterns: str) -> None:
+        self.patterns.update(patterns)
+
+    async def listen(self) -> AsyncIterator[dict[str, str]]:
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self) -> None:
+        self._redis.pubsubs.remove(self)
+
+
+class MockRedis:
+    """Dict-backed Redis client with MGET, SETEX and pattern pub/sub."""
+
+    def __init__(self, values: dict[str, str] | None = None) -> None:
+        self.values = dict(values or {})
+        self.mget_calls: list[list[str]] = []
+        self.pubsubs: list[MockPubSub] = []
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.mget_calls.append(keys)
+        return [self.values.get(key) for key in keys]
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+
+    async def publish(self, channel: str, data: str) -> int:
+        """Deliver to every subscription with a matching pattern."""
+        delivered = 0
+        for pubsub in self.pubsubs:
+            for pattern in pubsub.patterns:
+                if fnmatchcase(channel, pattern):
+                    pubsub.messages.put_nowait(
+                        {"type": "pmessage", "pattern": pattern, "channel": channel, "data": data}
+                    )
+                    delivered += 1
+        return delivered
+
+    def pubsub(self) -> MockPubSub:
+        pubsub = MockPubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,275 @@
+"""Tests for push-based agent control signals: dispatch, fallback poll and stats."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from sibyl.agents.control import (
+    CONTROL_CHANNEL_PREFIX,
+    AgentControlBus,
+    ControlAction,
+    ControlStats,
+)
+from sibyl.agents.subscriber import PatternSubscriber
+from sibyl.jobs.agents import _until_interrupted
+from tests.harness import MockRedis
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def redis() -> MockRedis:
+    return MockRedis()
+
+
+@pytest.fixture
+async def bus(redis: MockRedis) -> AsyncIterator[AgentControlBus]:
+    subscriber = PatternSubscriber(redis)  # type: ignore[arg-type]
+    bus = AgentControlBus(subscriber)
+    yield bus
+    await bus.close()
+    await subscriber.close()
+
+
+async def settle() -> None:
+    """Let the subscriber connect and run its post-subscribe sweep."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# =============================================================================
+# Dispatch
+# =============================================================================
+
+
+class TestDispatch:
+    async def test_stop_sets_events_for_local_agent(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+
+        delivered = bus.dispatch("agent_1", {"action": ControlAction.STOP, "sent_at": time.time()})
+
+        assert delivered
+        assert control.stop.is_set()
+        assert control.interrupted
+        assert bus.stats.pushed == 1
+        assert len(bus.stats.latencies_ms) == 1
+
+    async def test_pause_keeps_reason(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+
+        bus.dispatch("agent_1", {"action": "pause", "reason": "lunch"})
+
+        assert control.pause.is_set()
+        assert not control.stop.is_set()
+        assert control.reason == "lunch"
+
+    async def test_messages_queue_until_drained(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+
+        bus.dispatch("agent_1", {"action": "message", "content": "first"})
+        bus.dispatch("agent_1", {"action": "message", "content": "second"})
+
+        assert control.message.is_set()
+        assert not control.interrupted
+        assert control.drain_messages() == ["first", "second"]
+        assert control.drain_messages() == []
+        assert not control.message.is_set()
+
+    async def test_ignores_agents_on_other_workers(self, bus: AgentControlBus) -> None:
+        bus.register("agent_1")
+
+        assert not bus.dispatch("agent_2", {"action": "stop"})
+        assert bus.stats.ignored == 1
+        assert bus.stats.pushed == 0
+
+    async def test_repeated_stop_is_counted_once(self, bus: AgentControlBus) -> None:
+        bus.register("agent_1")
+
+        bus.dispatch("agent_1", {"action": "stop"})
+        bus.dispatch("agent_1", {"action": "stop"}, polled=True)
+
+        assert bus.stats.pushed == 1
+        assert bus.stats.polled == 0
+
+    async def test_unregistered_agent_no_longer_receives(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+        bus.unregister("agent_1")
+
+        bus.dispatch("agent_1", {"action": "stop"})
+
+        assert not control.stop.is_set()
+
+
+# =============================================================================
+# Fallback poll
+# =============================================================================
+
+
+class TestFallbackPoll:
+    async def test_sweep_reads_all_agents_in_one_round_trip(
+        self, bus: AgentControlBus, redis: MockRedis
+    ) -> None:
+        first = bus.register("agent_1")
+        second = bus.register("agent_2")
+        await settle()
+        redis.values["sibyl:agent:pause:agent_2"] = str(time.time())
+        redis.mget_calls.clear()
+
+        await bus._sweep_keys()
+
+        assert len(redis.mget_calls) == 1
+        assert len(redis.mget_calls[0]) == 4
+        assert not first.interrupted
+        assert second.pause.is_set()
+        assert bus.stats.polled == 1
+
+    async def test_sweep_skips_agents_already_interrupted(
+        self, bus: AgentControlBus, redis: MockRedis
+    ) -> None:
+        redis.values["sibyl:agent:stop:agent_1"] = str(time.time())
+        bus.register("agent_1")
+        bus.dispatch("agent_1", {"action": "stop"})
+        await settle()
+
+        await bus._sweep_keys()
+
+        assert redis.mget_calls == []
+        assert bus.stats.polled == 0
+
+    async def test_subscribing_recovers_stop_sent_while_away(
+        self, bus: AgentControlBus, redis: MockRedis
+    ) -> None:
+        redis.values["sibyl:agent:stop:agent_1"] = str(time.time())
+        control = bus.register("agent_1")
+
+        await settle()
+
+        assert control.stop.is_set()
+        assert bus.stats.polled == 1
+
+
+# =============================================================================
+# Subscription
+# =============================================================================
+
+
+class TestSubscription:
+    async def test_published_signal_reaches_local_agent(
+        self, bus: AgentControlBus, redis: MockRedis
+    ) -> None:
+        control = bus.register("agent_1")
+        await settle()
+
+        payload = json.dumps({"action": "pause", "reason": "review"})
+        assert await redis.publish(f"{CONTROL_CHANNEL_PREFIX}agent_1", payload) == 1
+        await settle()
+
+        assert control.pause.is_set()
+        assert control.reason == "review"
+        assert bus.stats.pushed == 1
+
+    async def test_invalid_json_is_skipped(self, bus: AgentControlBus, redis: MockRedis) -> None:
+        control = bus.register("agent_1")
+        await settle()
+
+        await redis.publish(f"{CONTROL_CHANNEL_PREFIX}agent_1", "not json")
+        await redis.publish(f"{CONTROL_CHANNEL_PREFIX}agent_1", json.dumps({"action": "stop"}))
+        await settle()
+
+        assert control.stop.is_set()
+
+    async def test_agents_share_one_subscription(
+        self, bus: AgentControlBus, redis: MockRedis
+    ) -> None:
+        for i in range(50):
+            bus.register(f"agent_{i}")
+        await settle()
+
+        assert len(redis.pubsubs) == 1
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+
+class TestControlStats:
+    def test_reports_latency_percentiles(self) -> None:
+        stats = ControlStats()
+        for latency in range(1, 101):
+            stats.record(float(latency), polled=latency > 90)
+
+        data = stats.to_dict()
+
+        assert data["pushed"] == 90
+        assert data["polled"] == 10
+        assert data["latency_ms_p50"] == 51.0
+        assert data["latency_ms_p95"] == 96.0
+        assert data["latency_ms_max"] == 100.0
+
+    def test_empty_stats(self) -> None:
+        data = ControlStats().to_dict()
+        assert data["latency_ms_p50"] is None
+        assert data["latency_ms_max"] is None
+
+
+# =============================================================================
+# Interrupting a stream
+# =============================================================================
+
+
+class TestUntilInterrupted:
+    async def test_stop_interrupts_a_stream_waiting_on_the_model(
+        self, bus: AgentControlBus
+    ) -> None:
+        control = bus.register("agent_1")
+        cancelled = asyncio.Event()
+
+        async def stream() -> AsyncIterator[str]:
+            yield "first"
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            yield "never"
+
+        received: list[Any] = []
+
+        async def consume() -> None:
+            async for message in _until_interrupted(stream(), control):
+                received.append(message)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        bus.dispatch("agent_1", {"action": "stop"})
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert received == ["first"]
+        assert cancelled.is_set()
+
+    async def test_stream_runs_to_completion_without_signals(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+
+        async def stream() -> AsyncIterator[int]:
+            for i in range(3):
+                yield i
+
+        assert [m async for m in _until_interrupted(stream(), control)] == [0, 1, 2]
+
+    async def test_stream_errors_propagate(self, bus: AgentControlBus) -> None:
+        control = bus.register("agent_1")
+
+        async def stream() -> AsyncIterator[int]:
+            yield 1
+            raise RuntimeError("sdk failure")
+
+        with pytest.raises(RuntimeError, match="sdk failure"):
+            async for _ in _until_interrupted(stream(), control):
+                pass
@@ -5,6 +5,7 @@ connection. Uses mocks to simulate the SDK behavior.
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -260,6 +261,139 @@ class TestFireAndForget:
             mock_log.error.assert_not_called()
 
 
+# =============================================================================
+# Agent Message Buffer Tests
+# =============================================================================
+
+
+class FakeMessageStore:
+    """Captures multi-row inserts made through ``get_session``."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[int]] = []
+
+    @asynccontextmanager
+    async def session(self) -> Any:
+        store = self
+
+        class Session:
+            async def execute(self, _statement: Any, rows: list[dict[str, Any]]) -> None:
+                if store.fail:
+                    raise RuntimeError("database unavailable")
+                store.batches.append([row["message_num"] for row in rows])
+
+        yield Session()
+
+
+ORG_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def text_message(content: str = "hi") -> dict[str, Any]:
+    return {"role": "assistant", "type": "text", "content": content}
+
+
+class TestAgentMessageBuffer:
+    """Tests for batched, ordered agent message persistence."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self) -> None:
+        from sibyl.jobs.agents import AgentMessageBuffer
+
+        store = FakeMessageStore()
+        with patch("sibyl.jobs.agents.get_session", store.session):
+            buffer = AgentMessageBuffer("agent_1", ORG_ID, max_batch=3, max_delay=60)
+            for num in range(1, 8):
+                buffer.add(num, text_message())
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.01)
+
+            assert store.batches == [[1, 2, 3], [4, 5, 6]]
+
+            await buffer.close()
+
+        assert store.batches[-1] == [7]
+        assert buffer.rows_written == 7
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_delay(self) -> None:
+        from sibyl.jobs.agents import AgentMessageBuffer
+
+        store = FakeMessageStore()
+        with patch("sibyl.jobs.agents.get_session", store.session):
+            buffer = AgentMessageBuffer("agent_1", ORG_ID, max_batch=100, max_delay=0.02)
+            buffer.add(1, text_message())
+            buffer.add(2, text_message())
+            await asyncio.sleep(0.1)
+
+            assert store.batches == [[1, 2]]
+            await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_in_bounded_batches(self) -> None:
+        from sibyl.jobs.agents import AgentMessageBuffer
+
+        store = FakeMessageStore()
+        with patch("sibyl.jobs.agents.get_session", store.session):
+            buffer = AgentMessageBuffer("agent_1", ORG_ID, max_batch=4, max_delay=60)
+            for num in range(1, 11):
+                buffer.add(num, text_message())
+            await buffer.close()
+
+        assert store.batches == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_logged_not_raised(self) -> None:
+        from sibyl.jobs.agents import AgentMessageBuffer
+
+        store = FakeMessageStore(fail=True)
+        with (
+            patch("sibyl.jobs.agents.get_session", store.session),
+            patch("sibyl.jobs.agents.log") as mock_log,
+        ):
+            buffer = AgentMessageBuffer("agent_1", ORG_ID)
+            buffer.add(1, text_message())
+            await buffer.close()
+
+        mock_log.warning.assert_called_once()
+        assert buffer.rows_written == 0
+
+    @pytest.mark.asyncio
+    async def test_add_after_close_is_rejected(self) -> None:
+        from sibyl.jobs.agents import AgentMessageBuffer
+
+        buffer = AgentMessageBuffer("agent_1", ORG_ID)
+        await buffer.close()
+
+        with pytest.raises(RuntimeError):
+            buffer.add(1, text_message())
+
+    def test_builds_tool_call_row(self) -> None:
+        from sibyl.db import AgentMessageRole, AgentMessageType
+        from sibyl.jobs.agents import _build_agent_message
+
+        row = _build_agent_message(
+            "agent_1",
+            ORG_ID,
+            5,
+            {
+                "role": "assistant",
+                "type": "tool_use",
+                "tool_name": "Read",
+                "tool_id": "toolu_1",
+                "preview": "Read main.py",
+                "input": {"file_path": "main.py"},
+            },
+        )
+
+        assert row.message_num == 5
+        assert row.role == AgentMessageRole.agent
+        assert row.type == AgentMessageType.tool_call
+        assert row.content == "Read main.py"
+        assert row.tool_id == "toolu_1"
+        assert row.extra == {"tool_name": "Read", "input": {"file_path": "main.py"}}
+
+
 # =============================================================================
 # AgentRunner Tests
 # =============================================================================
@@ -0,0 +1,124 @@
+"""Tests for the shared approval/question response broker."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from sibyl.agents.redis_sub import (
+    APPROVAL_CHANNEL_PREFIX,
+    QUESTION_CHANNEL_PREFIX,
+    RESPONSE_KEY_SUFFIX,
+    ResponseBroker,
+)
+from sibyl.agents.subscriber import PatternSubscriber
+from tests.harness import MockRedis
+
+
+@pytest.fixture
+def redis() -> MockRedis:
+    return MockRedis()
+
+
+@pytest.fixture
+async def broker(redis: MockRedis) -> AsyncIterator[ResponseBroker]:
+    subscriber = PatternSubscriber(redis)  # type: ignore[arg-type]
+    yield ResponseBroker(subscriber)
+    await subscriber.close()
+
+
+async def settle() -> None:
+    """Let the subscriber connect and run its post-subscribe recovery."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def started(waiter: asyncio.Task[object]) -> None:
+    """Let a waiter task register its future."""
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+
+class TestResponseBroker:
+    async def test_dispatch_resolves_the_matching_waiter(self, broker: ResponseBroker) -> None:
+        channel = f"{APPROVAL_CHANNEL_PREFIX}approval_1"
+        other = f"{APPROVAL_CHANNEL_PREFIX}approval_2"
+        waiter = asyncio.create_task(broker.wait(channel, 5))
+        bystander = asyncio.create_task(broker.wait(other, 5))
+        await started(waiter)
+
+        assert broker.dispatch(channel, {"approved": True})
+
+        assert await waiter == {"approved": True}
+        assert not bystander.done()
+        assert broker.pending == 1
+        bystander.cancel()
+
+    async def test_timeout_returns_none_and_forgets_waiter(self, broker: ResponseBroker) -> None:
+
+        assert await broker.wait(f"{QUESTION_CHANNEL_PREFIX}q_1", 0.01) is None
+        assert broker.pending == 0
+
+    async def test_cancelled_waiter_is_removed(self, broker: ResponseBroker) -> None:
+        waiter = asyncio.create_task(broker.wait(f"{APPROVAL_CHANNEL_PREFIX}a", 5))
+        await started(waiter)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert broker.pending == 0
+
+    async def test_unknown_channel_is_ignored(self, broker: ResponseBroker) -> None:
+        assert not broker.dispatch(f"{APPROVAL_CHANNEL_PREFIX}nobody", {"approved": True})
+
+    async def test_thousands_of_waiters_share_one_listener(
+        self, broker: ResponseBroker, redis: MockRedis
+    ) -> None:
+        channels = [f"{APPROVAL_CHANNEL_PREFIX}approval_{i}" for i in range(5000)]
+        waiters = [asyncio.create_task(broker.wait(c, 5)) for c in channels]
+        await settle()
+
+        assert broker.pending == 5000
+        assert len(redis.pubsubs) == 1
+        for i, channel in enumerate(channels):
+            broker.dispatch(channel, {"approved": True, "n": i})
+
+        results = await asyncio.gather(*waiters)
+        assert [r["n"] for r in results] == list(range(5000))  # type: ignore[index]
+        assert broker.pending == 0
+
+    async def test_recover_reads_stored_responses(
+        self, broker: ResponseBroker, redis: MockRedis
+    ) -> None:
+        answered = f"{QUESTION_CHANNEL_PREFIX}q_answered"
+        waiting = f"{QUESTION_CHANNEL_PREFIX}q_waiting"
+        recovered = asyncio.create_task(broker.wait(answered, 5))
+        still_waiting = asyncio.create_task(broker.wait(waiting, 5))
+        await started(recovered)
+        redis.values[f"{answered}{RESPONSE_KEY_SUFFIX}"] = json.dumps({"answers": {"a": "b"}})
+
+        await broker._recover()
+
+        assert await recovered == {"answers": {"a": "b"}}
+        assert not still_waiting.done()
+        still_waiting.cancel()
+
+    async def test_published_response_resolves_waiter(
+        self, broker: ResponseBroker, redis: MockRedis
+    ) -> None:
+        channel = f"{APPROVAL_CHANNEL_PREFIX}approval_1"
+        waiter = asyncio.create_task(broker.wait(channel, 5))
+        question = asyncio.create_task(broker.wait(f"{QUESTION_CHANNEL_PREFIX}q_1", 5))
+        await settle()
+
+        await redis.publish(channel, "not json")
+        await redis.publish(channel, json.dumps({"approved": False}))
+
+        assert await asyncio.wait_for(waiter, 1) == {"approved": False}
+        assert len(redis.pubsubs) == 1
+        assert redis.pubsubs[0].patterns == {
+            f"{APPROVAL_CHANNEL_PREFIX}*",
+            f"{QUESTION_CHANNEL_PREFIX}*",
+        }
+        question.cancel()
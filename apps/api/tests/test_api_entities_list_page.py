@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sibyl.api.routes.entities import SortField, SortOrder, _list_entities_page
+from sibyl_core.graph.entities import EntityPage
+from sibyl_core.models.entities import Entity, EntityType
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_omits_total_and_scopes_projects() -> None:
+    entity_manager = MagicMock()
+    entity_manager.list_page = AsyncMock(
+        return_value=EntityPage(
+            entities=[
+                Entity(id="p1", entity_type=EntityType.PATTERN, name="Retry with backoff"),
+                Entity(id="p2", entity_type=EntityType.PATTERN, name="Circuit breaker"),
+            ],
+            next_cursor="next",
+        )
+    )
+
+    resp = await _list_entities_page(
+        entity_manager,
+        entity_type=EntityType.PATTERN,
+        language=None,
+        category=None,
+        search="retry",
+        project_ids=["proj_a", "__unassigned__"],
+        page_size=2,
+        sort_by=SortField.CREATED_AT,
+        sort_order=SortOrder.DESC,
+        cursor="",
+    )
+
+    assert [e.id for e in resp.entities] == ["p1"]
+    assert resp.total is None
+    assert resp.has_more is True
+    assert resp.next_cursor == "next"
+    _, kwargs = entity_manager.list_page.call_args
+    assert kwargs["project_ids"] == ["proj_a"]
+    assert kwargs["include_unassigned"] is True
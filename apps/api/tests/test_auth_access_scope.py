@@ -0,0 +1,148 @@
+"""Tests for the cached MCP access scope and its invalidation."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from sibyl.auth import access_scope
+from sibyl.auth.access_scope import AccessScopeCache, get_access_scope_cache, invalidate_on_commit
+from sibyl.auth.memberships import OrganizationMembershipManager
+from sibyl.db.models import OrganizationMember, OrganizationRole
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Iterator[AccessScopeCache]:
+    access_scope._access_scope_cache = AccessScopeCache(ttl_seconds=60)
+    yield access_scope._access_scope_cache
+    access_scope.reset_access_scope_cache()
+
+
+class TestAccessScopeCache:
+    """Tests for AccessScopeCache."""
+
+    def test_hit_returns_copy(self, fresh_cache: AccessScopeCache) -> None:
+        fresh_cache.set(("u1", "o1", None), {"project_a"}, fresh_cache.generation)
+
+        found, scope = fresh_cache.get(("u1", "o1", None))
+        assert found is True
+        assert scope == {"project_a"}
+        scope.add("project_b")  # type: ignore[union-attr]
+
+        assert fresh_cache.get(("u1", "o1", None)) == (True, {"project_a"})
+
+    def test_unfiltered_scope_cached(self, fresh_cache: AccessScopeCache) -> None:
+        fresh_cache.set(("u1", "o1", None), None, fresh_cache.generation)
+
+        assert fresh_cache.get(("u1", "o1", None)) == (True, None)
+        assert fresh_cache.get(("u2", "o1", None)) == (False, None)
+
+    def test_stale_generation_not_stored(self, fresh_cache: AccessScopeCache) -> None:
+        generation = fresh_cache.generation
+        fresh_cache.invalidate(org_id="o1")
+
+        fresh_cache.set(("u1", "o1", None), {"project_a"}, generation)
+
+        assert fresh_cache.size == 0
+
+    def test_invalidate_filters(self, fresh_cache: AccessScopeCache) -> None:
+        keys = [("u1", "o1", None), ("u1", "o1", "k1"), ("u2", "o1", None), ("u1", "o2", None)]
+        for key in keys:
+            fresh_cache.set(key, set(), fresh_cache.generation)
+
+        fresh_cache.invalidate(api_key_id="k1")
+        assert fresh_cache.get(("u1", "o1", "k1"))[0] is False
+
+        fresh_cache.invalidate(org_id="o1", user_id="u1")
+        assert fresh_cache.get(("u1", "o1", None))[0] is False
+        assert fresh_cache.get(("u2", "o1", None))[0] is True
+
+        fresh_cache.invalidate(org_id="o1")
+        assert fresh_cache.get(("u2", "o1", None))[0] is False
+        assert fresh_cache.get(("u1", "o2", None))[0] is True
+
+    def test_zero_ttl_disables(self) -> None:
+        cache = AccessScopeCache(ttl_seconds=0)
+        cache.set(("u1", "o1", None), set(), cache.generation)
+
+        assert cache.size == 0
+
+
+class TestInvalidateOnCommit:
+    """Invalidations wait for the session to commit."""
+
+    def test_applied_on_commit(self, fresh_cache: AccessScopeCache) -> None:
+        fresh_cache.set(("u1", "o1", None), set(), fresh_cache.generation)
+        session = Session()
+
+        invalidate_on_commit(session, org_id="o1")
+        assert fresh_cache.size == 1
+        session.commit()
+
+        assert fresh_cache.size == 0
+
+    def test_dropped_on_rollback(self, fresh_cache: AccessScopeCache) -> None:
+        fresh_cache.set(("u1", "o1", None), set(), fresh_cache.generation)
+        session = Session()
+        session.begin()
+
+        invalidate_on_commit(session, org_id="o1")
+        session.rollback()
+        session.commit()
+
+        assert fresh_cache.size == 1
+
+    async def test_async_session(self, fresh_cache: AccessScopeCache) -> None:
+        fresh_cache.set(("u1", "o1", None), set(), fresh_cache.generation)
+        session = AsyncSession()
+
+        invalidate_on_commit(session, user_id="u1")
+        await session.commit()
+
+        assert fresh_cache.size == 0
+
+
+class TestMembershipInvalidation:
+    """Membership changes invalidate the member's scope."""
+
+    async def test_set_role_invalidates_member(self, fresh_cache: AccessScopeCache) -> None:
+        org_id, user_id, other_id = uuid4(), uuid4(), uuid4()
+        for uid in (user_id, other_id):
+            fresh_cache.set((str(uid), str(org_id), None), set(), fresh_cache.generation)
+        session = AsyncSession()
+        manager = OrganizationMembershipManager(session)
+        member = OrganizationMember(
+            organization_id=org_id, user_id=user_id, role=OrganizationRole.MEMBER
+        )
+
+        with patch.object(manager, "get_for_user", AsyncMock(return_value=member)):
+            await manager.set_role(
+                organization_id=org_id, user_id=user_id, role=OrganizationRole.ADMIN
+            )
+        session.expunge_all()
+        await session.commit()
+
+        assert fresh_cache.get((str(user_id), str(org_id), None))[0] is False
+        assert fresh_cache.get((str(other_id), str(org_id), None))[0] is True
+
+
+class TestMcpAccessibleProjects:
+    """The MCP server serves repeat calls from the cache."""
+
+    async def test_steady_state_skips_database(self) -> None:
+        from sibyl import server
+
+        ctx = server.McpContext(org_id="o1", user_id="u1", api_key_id="k1")
+        load = AsyncMock(return_value={"project_a"})
+
+        with patch.object(server, "_load_accessible_projects", load):
+            first = await server._get_accessible_projects(ctx)
+            second = await server._get_accessible_projects(ctx)
+            get_access_scope_cache().invalidate(api_key_id="k1")
+            third = await server._get_accessible_projects(ctx)
+
+        assert first == second == third == {"project_a"}
+        assert load.await_count == 2
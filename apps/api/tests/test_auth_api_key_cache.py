@@ -0,0 +1,297 @@
+"""Tests for the verified API key cache and last-used write-behind."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import ANY, AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from sibyl.auth import api_key_cache
+from sibyl.auth.api_key_cache import (
+    ApiKeyCache,
+    ApiKeyUsageRecorder,
+    _auth_from_json,
+    _auth_to_json,
+)
+from sibyl.auth.api_keys import ApiKeyAuth, ApiKeyManager, hash_api_key
+
+
+def make_auth(**overrides: Any) -> ApiKeyAuth:
+    fields: dict[str, Any] = {
+        "api_key_id": uuid4(),
+        "user_id": uuid4(),
+        "organization_id": uuid4(),
+        "scopes": ["mcp"],
+    }
+    return ApiKeyAuth(**(fields | overrides))
+
+
+class CountingVerifier:
+    """Verification callback that counts calls."""
+
+    def __init__(self, result: ApiKeyAuth | None, delay: float = 0.0) -> None:
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> ApiKeyAuth | None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+class FakeSession:
+    """Records executed statements."""
+
+    def __init__(self) -> None:
+        self.executed: list[tuple[Any, Any]] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> None:
+        self.executed.append((statement, params))
+
+
+@pytest.fixture
+async def fresh_globals(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[FakeSession]:
+    """Fresh global cache and usage recorder writing to a fake session."""
+    session = FakeSession()
+
+    @asynccontextmanager
+    async def fake_get_session() -> AsyncIterator[FakeSession]:
+        yield session
+
+    monkeypatch.setattr(api_key_cache, "get_session", fake_get_session)
+    api_key_cache._api_key_cache = ApiKeyCache(ttl_seconds=30)
+    api_key_cache._api_key_usage = ApiKeyUsageRecorder(flush_interval=3600)
+    yield session
+    await api_key_cache.shutdown_api_key_cache()
+
+
+class TestApiKeyCache:
+    """Tests for ApiKeyCache."""
+
+    async def test_verified_key_cached(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=30)
+        verify = CountingVerifier(make_auth())
+
+        first = await cache.get_or_verify("sk_live_a", verify)
+        second = await cache.get_or_verify("sk_live_a", verify)
+
+        assert first is second is verify.result
+        assert verify.calls == 1
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_concurrent_misses_share_one_verification(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=30)
+        verify = CountingVerifier(make_auth(), delay=0.05)
+
+        results = await asyncio.gather(
+            *(cache.get_or_verify("sk_live_a", verify) for _ in range(8))
+        )
+
+        assert verify.calls == 1
+        assert all(r is verify.result for r in results)
+        assert cache.stats.coalesced == 7
+
+    async def test_invalid_key_not_cached(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=30)
+        verify = CountingVerifier(None)
+
+        assert await cache.get_or_verify("sk_live_bad", verify) is None
+        assert await cache.get_or_verify("sk_live_bad", verify) is None
+
+        assert verify.calls == 2
+        assert cache.stats.rejected == 2
+        assert cache.size == 0
+
+    async def test_entry_never_outlives_key_expiry(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=30)
+        expired = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+        verify = CountingVerifier(make_auth(expires_at=expired))
+
+        await cache.get_or_verify("sk_live_a", verify)
+        await cache.get_or_verify("sk_live_a", verify)
+
+        assert verify.calls == 2
+
+    async def test_invalidate_drops_entries_and_blocks_recaching(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=30)
+        auth = make_auth()
+        verify = CountingVerifier(auth)
+        await cache.get_or_verify("sk_live_a", verify)
+
+        await cache.invalidate(auth.api_key_id)
+        # A verification that raced the revoke still answers, but is not cached
+        await cache.get_or_verify("sk_live_a", verify)
+        await cache.get_or_verify("sk_live_a", verify)
+
+        assert verify.calls == 3
+        assert cache.size == 0
+
+    async def test_zero_ttl_disables(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=0)
+        verify = CountingVerifier(make_auth())
+
+        await cache.get_or_verify("sk_live_a", verify)
+        await cache.get_or_verify("sk_live_a", verify)
+
+        assert verify.calls == 2
+
+    async def test_digest_is_keyed(self) -> None:
+        a = ApiKeyCache(secret=b"a" * 32)
+        b = ApiKeyCache(secret=b"b" * 32)
+
+        assert a.digest("sk_live_a") == ApiKeyCache(secret=b"a" * 32).digest("sk_live_a")
+        assert a.digest("sk_live_a") != b.digest("sk_live_a")
+        assert "sk_live_a" not in a.digest("sk_live_a")
+
+    async def test_redis_hit_skips_verification(self) -> None:
+        auth = make_auth(project_ids=[uuid4()])
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=_auth_to_json(auth).encode())
+        cache = ApiKeyCache(ttl_seconds=30, redis=redis)
+        verify = CountingVerifier(None)
+
+        result = await cache.get_or_verify("sk_live_a", verify)
+
+        assert result == auth
+        assert verify.calls == 0
+        assert cache.stats.redis_hits == 1
+
+    async def test_redis_errors_fall_through(self) -> None:
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        cache = ApiKeyCache(ttl_seconds=30, redis=redis)
+        verify = CountingVerifier(make_auth())
+
+        assert await cache.get_or_verify("sk_live_a", verify) is verify.result
+        assert cache.stats.redis_errors == 2
+
+    def test_json_roundtrip(self) -> None:
+        auth = make_auth(
+            project_ids=[], expires_at=datetime(2030, 1, 1, tzinfo=UTC).replace(tzinfo=None)
+        )
+        assert _auth_from_json(_auth_to_json(auth)) == auth
+        unrestricted = make_auth()
+        assert _auth_from_json(_auth_to_json(unrestricted)) == unrestricted
+
+
+class TestApiKeyUsageRecorder:
+    """Tests for ApiKeyUsageRecorder."""
+
+    async def test_uses_coalesced_into_one_write(self, fresh_globals: FakeSession) -> None:
+        session = fresh_globals
+        recorder = ApiKeyUsageRecorder(flush_interval=3600)
+        key_a, key_b = uuid4(), uuid4()
+        later = datetime(2030, 1, 1, tzinfo=UTC).replace(tzinfo=None)
+
+        recorder.touch(key_a)
+        recorder.touch(key_b)
+        recorder.touch(key_a, at=later)
+        await recorder.close()
+
+        assert len(session.executed) == 1
+        rows = {row["id"]: row["last_used_at"] for row in session.executed[0][1]}
+        assert rows.keys() == {key_a, key_b}
+        assert rows[key_a] == later
+        assert recorder.rows_written == 2
+        assert recorder.pending == 0
+
+    async def test_write_failure_is_logged(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        @asynccontextmanager
+        async def broken_get_session() -> AsyncIterator[FakeSession]:
+            raise ConnectionError("db down")
+            yield FakeSession()
+
+        monkeypatch.setattr(api_key_cache, "get_session", broken_get_session)
+        recorder = ApiKeyUsageRecorder(flush_interval=3600)
+        recorder.touch(uuid4())
+
+        await recorder.close()
+
+        assert recorder.rows_written == 0
+
+
+class KeySession:
+    """Serves one stored API key to ApiKeyManager."""
+
+    def __init__(self, key: SimpleNamespace) -> None:
+        self.key = key
+        self.queries = 0
+        self.info: dict[str, Any] = {}
+
+    async def execute(self, _statement: Any) -> Any:
+        self.queries += 1
+        result = MagicMock()
+        rows = [self.key] if self.queries % 2 else []
+        result.scalars.return_value.all.return_value = rows
+        return result
+
+    def add(self, _obj: Any) -> None:
+        pass
+
+    async def get(self, _model: Any, _id: UUID) -> SimpleNamespace:
+        return self.key
+
+
+@pytest.mark.usefixtures("fresh_globals")
+class TestApiKeyManagerCaching:
+    """ApiKeyManager serves repeat authentications from the cache."""
+
+    @pytest.fixture
+    def stored(self) -> tuple[str, SimpleNamespace]:
+        raw = "sk_live_" + "x" * 43
+        salt, digest = hash_api_key(raw)
+        key = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            organization_id=uuid4(),
+            key_salt=salt,
+            key_hash=digest,
+            scopes=["mcp"],
+            revoked_at=None,
+            expires_at=None,
+        )
+        return raw, key
+
+    async def test_repeat_authentication_skips_database(
+        self, stored: tuple[str, SimpleNamespace], fresh_globals: FakeSession
+    ) -> None:
+        raw, key = stored
+        session = KeySession(key)
+        manager = ApiKeyManager(session)  # type: ignore[arg-type]
+
+        first = await manager.authenticate(raw)
+        second = await manager.authenticate(raw)
+
+        assert first is not None
+        assert first.api_key_id == key.id
+        assert second is first
+        assert session.queries == 2  # Key lookup and project restrictions, once
+        assert api_key_cache.get_api_key_usage().pending == 1
+        await api_key_cache.get_api_key_usage().flush()
+        assert fresh_globals.executed[0][1] == [{"id": key.id, "last_used_at": ANY}]
+
+    async def test_wrong_key_rejected(self, stored: tuple[str, SimpleNamespace]) -> None:
+        raw, key = stored
+        manager = ApiKeyManager(KeySession(key))  # type: ignore[arg-type]
+
+        assert await manager.authenticate(raw[:-1] + "y") is None
+        assert api_key_cache.get_api_key_usage().pending == 0
+
+    async def test_revoke_invalidates(self, stored: tuple[str, SimpleNamespace]) -> None:
+        raw, key = stored
+        session = KeySession(key)
+        manager = ApiKeyManager(session)  # type: ignore[arg-type]
+        await manager.authenticate(raw)
+
+        await manager.revoke(key.id)
+
+        assert key.revoked_at is not None
+        assert await manager.authenticate(raw) is None
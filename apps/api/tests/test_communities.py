@@ -1,18 +1,28 @@
 """Tests for community detection module."""
 
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from sibyl_core.graph.communities import (
     CommunityConfig,
+    CommunityGraph,
+    CommunityResult,
     DetectedCommunity,
+    _detect_with_partitions,
+    _seed_partition,
     detect_communities,
+    export_community_graph,
     export_to_networkx,
     get_community_members,
     get_entity_communities,
+    get_visualization_communities,
+    invalidate_cluster_cache,
     link_hierarchy,
     partition_to_communities,
+    reset_community_results,
     store_communities,
 )
 
@@ -338,12 +348,163 @@ class TestDetectCommunities:
         with patch("sibyl_core.graph.communities.detect_communities_louvain") as mock_louvain:
             mock_louvain.return_value = (mock_partition, mock_modularity)
 
-            config = CommunityConfig(resolutions=[1.0], max_levels=1)
+            config = CommunityConfig(resolutions=[1.0], max_levels=1, use_process_pool=False)
             communities = await detect_communities(mock_client, TEST_ORG_ID, config=config)
 
             assert len(communities) == 2
             mock_louvain.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_seeds_passed_to_algorithm(self, mock_client: MagicMock) -> None:
+        """Previous partitions seed the next run, with new nodes as singletons."""
+        mock_client.execute_read_org = AsyncMock(
+            side_effect=[
+                [("e1", "One", "pattern"), ("e2", "Two", "pattern"), ("e3", "Three", "rule")],
+                [("e1", "e2", "RELATES_TO")],
+            ]
+        )
+        config = CommunityConfig(resolutions=[1.0], max_levels=1, use_process_pool=False)
+
+        with patch("sibyl_core.graph.communities.detect_communities_louvain") as mock_louvain:
+            mock_louvain.return_value = ({"e1": 0, "e2": 0, "e3": 1}, 0.4)
+            _, partitions = await _detect_with_partitions(
+                mock_client, TEST_ORG_ID, config, "louvain", seeds=[{"e1": 7, "e2": 7}]
+            )
+
+        assert mock_louvain.call_args.kwargs["seed"] == {"e1": 0, "e2": 0, "e3": 1}
+        assert partitions == [{"e1": 0, "e2": 0, "e3": 1}]
+
+
+class TestCommunityGraph:
+    """Tests for the CSR community graph export."""
+
+    @pytest.mark.asyncio
+    async def test_export_accumulates_weights(self) -> None:
+        """Edges are stored once per node pair with type affinity and multi-edge weights."""
+        client = MagicMock()
+        client.execute_read_org = AsyncMock(
+            side_effect=[
+                [("e1", "One", "pattern"), ("e2", "Two", "pattern"), ("e3", "Three", "rule")],
+                [
+                    ("e1", "e2", "RELATES_TO"),
+                    ("e2", "e1", "DEPENDS_ON"),
+                    ("e3", "e1", "RELATES_TO"),
+                    ("e1", "missing", "RELATES_TO"),
+                ],
+            ]
+        )
+
+        graph = await export_community_graph(client, TEST_ORG_ID, type_affinity_weight=2.0)
+
+        assert graph.node_ids == ["e1", "e2", "e3"]
+        assert list(graph.indptr) == [0, 2, 2, 2]
+        assert list(graph.edges()) == [(0, 1, 6.0), (0, 2, 1.0)]
+
+    def test_from_pair_weights_orders_rows(self) -> None:
+        """Pair keys are split into sorted CSR rows."""
+        graph = CommunityGraph.from_pair_weights(
+            ["a", "b", "c", "d"], {2 * 4 + 3: 1.0, 0 * 4 + 3: 2.0, 0 * 4 + 1: 3.0}
+        )
+
+        assert list(graph.indptr) == [0, 2, 2, 3, 3]
+        assert list(graph.indices) == [1, 3, 3]
+        assert list(graph.weights) == [3.0, 2.0, 1.0]
+        assert graph.edge_count == 3
+
+    def test_empty_graph(self) -> None:
+        """An empty graph has one row offset and no edges."""
+        graph = CommunityGraph.from_pair_weights([], {})
+
+        assert graph.node_count == 0
+        assert list(graph.indptr) == [0]
+        assert list(graph.edges()) == []
+
+
+class TestSeedPartition:
+    """Tests for seeding incremental re-clustering."""
+
+    def test_renumbers_consecutively(self) -> None:
+        """Known communities are renumbered and new nodes get their own."""
+        seed = _seed_partition({"a": 12, "b": 12, "c": 40}, ["a", "new", "b", "c"])
+
+        assert seed == {"a": 0, "new": 1, "b": 0, "c": 2}
+
+    def test_removed_nodes_dropped(self) -> None:
+        """Nodes no longer in the graph are left out of the seed."""
+        seed = _seed_partition({"a": 1, "gone": 1}, ["a"])
+
+        assert seed == {"a": 0}
+
+
+class TestVisualizationCommunities:
+    """Tests for cached visualization community results."""
+
+    @pytest.fixture(autouse=True)
+    def clean_results(self) -> Iterator[None]:
+        reset_community_results()
+        yield
+        reset_community_results()
+
+    @pytest.fixture
+    def detect(self) -> Iterator[AsyncMock]:
+        communities = [DetectedCommunity(id="c1", member_ids=["e1", "e2"], level=0, resolution=1.0)]
+        partitions = [{"e1": 0, "e2": 0}]
+        with patch(
+            "sibyl_core.graph.communities._detect_with_partitions",
+            new=AsyncMock(return_value=(communities, partitions)),
+        ) as detect:
+            yield detect
+
+    @pytest.mark.asyncio
+    async def test_reused_while_graph_unchanged(self, detect: AsyncMock) -> None:
+        """Unchanged node and edge counts reuse the previous result."""
+        client = MagicMock()
+        first = await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1))
+        second = await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1))
+
+        assert first is second
+        detect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_graph_change_reclusters_with_seed(self, detect: AsyncMock) -> None:
+        """A changed graph re-clusters, seeded with the previous partition."""
+        client = MagicMock()
+        first = await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1))
+        second = await get_visualization_communities(client, TEST_ORG_ID, totals=(3, 2))
+
+        assert second.version != first.version
+        assert detect.await_args_list[0].args[4] is None
+        assert detect.await_args_list[1].args[4] == [{"e1": 0, "e2": 0}]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_force_refresh(self, detect: AsyncMock) -> None:
+        """Invalidation re-clusters incrementally; force_refresh starts from scratch."""
+        client = MagicMock()
+        await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1))
+        invalidate_cluster_cache(TEST_ORG_ID)
+        await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1))
+        await get_visualization_communities(client, TEST_ORG_ID, totals=(2, 1), force_refresh=True)
+
+        assert detect.await_count == 3
+        assert detect.await_args_list[1].args[4] == [{"e1": 0, "e2": 0}]
+        assert detect.await_args_list[2].args[4] is None
+
+    def test_result_json_round_trip(self) -> None:
+        """Results survive serialization for the shared Redis cache."""
+        result = CommunityResult(
+            version="v1",
+            fingerprint=(2, 1),
+            computed_at=datetime.now(UTC),
+            communities=[
+                DetectedCommunity(id="c1", member_ids=["e1", "e2"], level=0, resolution=1.0)
+            ],
+            partitions=[{"e1": 0, "e2": 0}],
+        )
+
+        restored = CommunityResult.from_json(result.to_json())
+
+        assert restored == result
+
 
 class TestStoreCommunities:
     """Tests for store_communities function."""
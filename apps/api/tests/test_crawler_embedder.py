@@ -0,0 +1,163 @@
+"""Tests for bulk embedding: token-budget batching, concurrency and rate limits."""
+
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from sibyl.crawler.embedder import (
+    EmbeddingService,
+    RequestBudget,
+    estimate_tokens,
+    pack_batches,
+)
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class FakeEmbeddingsAPI:
+    """Stand-in for ``client.embeddings`` that echoes the input index."""
+
+    def __init__(self, *, delay: float = 0.0, fail_first: int = 0) -> None:
+        self.delay = delay
+        self.fail_first = fail_first
+        self.calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, *, model: str, input: list[str], dimensions: int) -> SimpleNamespace:  # noqa: A002
+        self.calls.append(input)
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+            response = httpx.Response(429, request=request, headers={"retry-after": "0.01"})
+            raise RateLimitError("rate limited", response=response, body=None)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay * random.random())  # noqa: S311
+        finally:
+            self.in_flight -= 1
+        # Return data shuffled; the service must reorder by index
+        data = [SimpleNamespace(index=i, embedding=[float(text)]) for i, text in enumerate(input)]
+        random.shuffle(data)
+        return SimpleNamespace(data=data)
+
+
+def make_service(api: FakeEmbeddingsAPI, **kwargs: object) -> EmbeddingService:
+    service = EmbeddingService(model="test-model", dimensions=1, **kwargs)  # type: ignore[arg-type]
+    service._client = SimpleNamespace(embeddings=api)
+    return service
+
+
+# =============================================================================
+# Batch packing
+# =============================================================================
+
+
+class TestPackBatches:
+    def test_packs_by_token_budget(self) -> None:
+        texts = ["x" * 396] * 10  # 100 estimated tokens each
+        batches = pack_batches(texts, max_tokens=250, max_items=100)
+        assert [len(b) for b in batches] == [2, 2, 2, 2, 2]
+
+    def test_respects_item_cap(self) -> None:
+        batches = pack_batches(["a"] * 7, max_tokens=10_000, max_items=3)
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_oversized_text_gets_own_batch(self) -> None:
+        texts = ["a", "b" * 4000, "c"]
+        batches = pack_batches(texts, max_tokens=100, max_items=100)
+        assert batches == [range(1), range(1, 2), range(2, 3)]
+
+    def test_batches_cover_input_in_order(self) -> None:
+        texts = ["y" * random.randint(0, 800) for _ in range(200)]  # noqa: S311
+        batches = pack_batches(texts, max_tokens=1000, max_items=16)
+        assert [i for b in batches for i in b] == list(range(200))
+        for b in batches:
+            assert len(b) <= 16
+            assert len(b) == 1 or sum(estimate_tokens(texts[i]) for i in b) <= 1000
+
+
+# =============================================================================
+# embed_texts
+# =============================================================================
+
+
+class TestEmbedTexts:
+    async def test_preserves_order_across_concurrent_batches(self) -> None:
+        api = FakeEmbeddingsAPI(delay=0.01)
+        service = make_service(api, batch_size=7, concurrency=4)
+        texts = [str(i) for i in range(100)]
+
+        embeddings = await service.embed_texts(texts)
+
+        assert embeddings == [[float(i)] for i in range(100)]
+        assert len(api.calls) == 15
+
+    async def test_bounds_requests_in_flight(self) -> None:
+        api = FakeEmbeddingsAPI(delay=0.02)
+        service = make_service(api, batch_size=1, concurrency=3)
+
+        await service.embed_texts([str(i) for i in range(20)])
+
+        assert api.max_in_flight <= 3
+        assert api.max_in_flight > 1
+
+    async def test_retries_after_rate_limit(self) -> None:
+        api = FakeEmbeddingsAPI(fail_first=2)
+        service = make_service(api, batch_size=10)
+
+        embeddings = await service.embed_texts([str(i) for i in range(5)])
+
+        assert embeddings == [[float(i)] for i in range(5)]
+        assert len(api.calls) == 3
+
+    async def test_gives_up_after_max_attempts(self) -> None:
+        api = FakeEmbeddingsAPI(fail_first=100)
+        service = make_service(api)
+
+        with pytest.raises(RateLimitError):
+            await service.embed_texts(["1"])
+
+    async def test_empty_input(self) -> None:
+        api = FakeEmbeddingsAPI()
+        assert await make_service(api).embed_texts([]) == []
+        assert api.calls == []
+
+
+# =============================================================================
+# Rate budget
+# =============================================================================
+
+
+class TestRequestBudget:
+    async def test_rpm_limit_delays_excess_requests(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RequestBudget, "WINDOW_SECONDS", 0.1)
+        budget = RequestBudget(rpm=2)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await budget.acquire(1)
+
+        assert time.monotonic() - start >= 0.09
+
+    async def test_tpm_limit_admits_oversized_request_alone(self) -> None:
+        budget = RequestBudget(tpm=10)
+        await asyncio.wait_for(budget.acquire(50), timeout=0.5)
+
+    async def test_pause_holds_back_callers(self) -> None:
+        budget = RequestBudget()
+        budget.pause(0.05)
+
+        start = time.monotonic()
+        await budget.acquire(1)
+
+        assert time.monotonic() - start >= 0.04
@@ -0,0 +1,195 @@
+"""Tests for the staged ingestion pipeline: concurrency, bulk inserts and progress."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from sibyl.crawler import pipeline as pipeline_module
+from sibyl.crawler.chunker import Chunk
+from sibyl.crawler.pipeline import STAGES, IngestionPipeline, IngestionStats
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class FakeDatabase:
+    """Records document and chunk writes made through ``get_session``."""
+
+    def __init__(self, existing_urls: set[str] | None = None) -> None:
+        self.existing_urls = existing_urls or set()
+        self.documents: list[Any] = []
+        self.chunk_inserts: list[list[dict[str, Any]]] = []
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Any]:
+        db = self
+
+        class Session:
+            def add(self, document: Any) -> None:
+                db.documents.append(document)
+
+            async def flush(self) -> None:
+                pass
+
+            async def refresh(self, document: Any) -> None:
+                pass
+
+            async def rollback(self) -> None:
+                pass
+
+            async def execute(self, statement: Any, params: list[dict[str, Any]]) -> None:
+                db.chunk_inserts.append(params)
+
+        yield Session()
+
+
+class FakeChunker:
+    def __init__(self, fail_urls: set[str] | None = None) -> None:
+        self.fail_urls = fail_urls or set()
+
+    def chunk_document(self, document: Any, *, strategy: Any) -> list[Chunk]:
+        if document.url in self.fail_urls:
+            raise ValueError("unparseable")
+        return [Chunk(content=f"{document.url} part {i}", chunk_index=i) for i in range(3)]
+
+
+class FakeEmbedder:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def embed_chunks(self, chunks: list[Chunk]) -> list[list[float]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return [[0.0] for _ in chunks]
+
+
+def make_document(url: str) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), url=url)
+
+
+def make_pipeline(
+    monkeypatch: pytest.MonkeyPatch,
+    db: FakeDatabase,
+    urls: list[str],
+    *,
+    chunker: FakeChunker | None = None,
+    embedder: FakeEmbedder | None = None,
+    **kwargs: Any,
+) -> IngestionPipeline:
+    monkeypatch.setattr(pipeline_module, "get_session", db.session)
+
+    pipeline = IngestionPipeline("org-1", integrate_with_graph=False, **kwargs)
+    pipeline._crawler = SimpleNamespace()  # type: ignore[assignment]
+    pipeline._chunker = chunker or FakeChunker()  # type: ignore[assignment]
+    pipeline._embedder = embedder or FakeEmbedder()  # type: ignore[assignment]
+
+    async def stream() -> AsyncIterator[SimpleNamespace]:
+        for url in urls:
+            yield make_document(url)
+
+    async def document_exists(url: str) -> bool:
+        return url in db.existing_urls
+
+    monkeypatch.setattr(pipeline, "_open_stream", lambda *_a, **_kw: stream())
+    monkeypatch.setattr(pipeline, "_document_exists", document_exists)
+    monkeypatch.setattr(pipeline, "_update_source_tags", lambda _source: asyncio.sleep(0))
+    return pipeline
+
+
+def make_source() -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), name="docs", url="https://docs.example", source_type=None)
+
+
+# =============================================================================
+# Staged ingestion
+# =============================================================================
+
+
+class TestIngestSource:
+    async def test_stores_every_document_with_bulk_chunk_inserts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = FakeDatabase()
+        urls = [f"https://docs.example/{i}" for i in range(10)]
+        pipeline = make_pipeline(monkeypatch, db, urls)
+
+        stats = await pipeline.ingest_source(make_source())  # type: ignore[arg-type]
+
+        assert stats.documents_crawled == 10
+        assert stats.documents_stored == 10
+        assert stats.chunks_created == 30
+        assert stats.embeddings_generated == 30
+        assert stats.errors == 0
+        assert sorted(d.url for d in db.documents) == sorted(urls)
+        # One multi-row insert per document
+        assert [len(rows) for rows in db.chunk_inserts] == [3] * 10
+        assert all(row["embedding"] == [0.0] for rows in db.chunk_inserts for row in rows)
+
+    async def test_embeds_documents_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        db = FakeDatabase()
+        embedder = FakeEmbedder(delay=0.02)
+        urls = [f"https://docs.example/{i}" for i in range(8)]
+        pipeline = make_pipeline(monkeypatch, db, urls, embedder=embedder, embed_workers=3)
+
+        stats = await pipeline.ingest_source(make_source())  # type: ignore[arg-type]
+
+        assert stats.documents_stored == 8
+        assert embedder.max_in_flight == 3
+
+    async def test_failed_document_does_not_stop_the_run(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = FakeDatabase()
+        urls = [f"https://docs.example/{i}" for i in range(5)]
+        chunker = FakeChunker(fail_urls={urls[2]})
+        pipeline = make_pipeline(monkeypatch, db, urls, chunker=chunker)
+
+        stats = await pipeline.ingest_source(make_source())  # type: ignore[arg-type]
+
+        assert stats.errors == 1
+        assert stats.documents_stored == 4
+        assert stats.stages["chunk"].failed == 1
+        assert urls[2] not in {d.url for d in db.documents}
+
+    async def test_skips_duplicates_before_embedding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        db = FakeDatabase(existing_urls={"https://docs.example/old"})
+        urls = ["https://docs.example/old", "https://docs.example/new", "https://docs.example/new"]
+        pipeline = make_pipeline(monkeypatch, db, urls)
+
+        stats = await pipeline.ingest_source(make_source())  # type: ignore[arg-type]
+
+        assert [d.url for d in db.documents] == ["https://docs.example/new"]
+        assert stats.embeddings_generated == 3
+        assert stats.documents_stored == 3
+
+    async def test_reports_stage_progress(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        db = FakeDatabase()
+        urls = [f"https://docs.example/{i}" for i in range(4)]
+        pipeline = make_pipeline(monkeypatch, db, urls, queue_size=1)
+        reports: list[tuple[int, int, dict[str, Any]]] = []
+
+        async def on_progress(stats: IngestionStats, chunks_added: int) -> None:
+            stages = {name: stage.to_dict() for name, stage in stats.stages.items()}
+            reports.append((stats.documents_stored, chunks_added, stages))
+
+        source = make_source()
+        await pipeline.ingest_source(source, on_progress=on_progress)  # type: ignore[arg-type]
+
+        assert [stored for stored, _, _ in reports] == [1, 2, 3, 4]
+        assert all(chunks == 3 for _, chunks, _ in reports)
+        final = reports[-1][2]
+        assert set(final) == set(STAGES)
+        assert final["crawl"]["processed"] == 4
+        assert all(set(s) >= {"throughput", "backlog", "in_flight"} for s in final.values())
@@ -264,51 +264,54 @@ class TestCreateBulk:
     async def test_creates_all_relationships(
         self,
         relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
     ) -> None:
-        """Should create all relationships and return counts."""
+        """Should write the edges in one UNWIND batch and return counts."""
         rels = [
             Relationship(
                 id=f"rel_{i}",
                 source_id="src",
-                target_id="tgt",
+                target_id=f"tgt_{i}",
                 relationship_type=RelationshipType.RELATED_TO,
             )
             for i in range(3)
         ]
+        ids = [{"uuid": "src"}] + [{"uuid": f"tgt_{i}"} for i in range(3)]
+        mock_graph_client.execute_read_org = AsyncMock(side_effect=[ids, []])
+        mock_graph_client.execute_write_org = AsyncMock(return_value=[{"created": 3}])
 
-        with patch.object(relationship_manager, "create", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = "created_id"
+        result = await relationship_manager.create_bulk(rels)
 
-            created, failed = await relationship_manager.create_bulk(rels)
-
-            assert created == 3
-            assert failed == 0
-            assert mock_create.call_count == 3
+        assert (result.created, result.existing, result.failed) == (3, 0, 0)
+        mock_graph_client.execute_write_org.assert_called_once()
+        assert len(mock_graph_client.execute_write_org.call_args.kwargs["rels"]) == 3
 
     @pytest.mark.asyncio
     async def test_counts_failures(
         self,
         relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
     ) -> None:
-        """Should count failed creates."""
+        """Should count edges in failed batches."""
         rels = [
             Relationship(
                 id=f"rel_{i}",
                 source_id="src",
                 target_id="tgt",
-                relationship_type=RelationshipType.RELATED_TO,
+                relationship_type=rel_type,
             )
-            for i in range(3)
+            for i, rel_type in enumerate([RelationshipType.RELATED_TO, RelationshipType.REQUIRES])
         ]
+        ids = [{"uuid": "src"}, {"uuid": "tgt"}]
+        mock_graph_client.execute_read_org = AsyncMock(side_effect=[ids, []])
+        mock_graph_client.execute_write_org = AsyncMock(
+            side_effect=[[{"created": 1}], RuntimeError("Failed")]
+        )
 
-        with patch.object(relationship_manager, "create", new_callable=AsyncMock) as mock_create:
-            # First succeeds, second fails, third succeeds
-            mock_create.side_effect = ["id_1", RuntimeError("Failed"), "id_3"]
-
-            created, failed = await relationship_manager.create_bulk(rels)
+        result = await relationship_manager.create_bulk(rels)
 
-            assert created == 2
-            assert failed == 1
+        assert result.created == 1
+        assert result.failed == 1
 
 
 class TestGetForEntity:
@@ -0,0 +1,135 @@
+"""Tests for streamed backup exports: org scoping, pg_dump streaming and checksums."""
+
+import hashlib
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from sibyl.jobs import backup
+from sibyl.jobs.backup import _ChecksumWriter, _dump_schema, _export_graph, _org_table_scopes
+
+
+class TestOrgTableScopes:
+    def test_scopes_tables_to_the_organization(self) -> None:
+        scopes = {table.name: clause for table, clause in _org_table_scopes()}
+
+        assert scopes["organizations"] == "id = $1"
+        assert scopes["agent_messages"] == "organization_id = $1"
+        assert "organization_members" in scopes["users"]
+        # Indirect tables are scoped through their parent
+        assert "crawl_sources" in scopes["crawled_documents"]
+        assert "crawled_documents" in scopes["document_chunks"]
+        assert "teams" in scopes["team_members"]
+
+    def test_skips_personal_credentials(self) -> None:
+        names = {table.name for table, _ in _org_table_scopes()}
+
+        assert not names & {"login_history", "password_reset_tokens", "oauth_connections"}
+
+    def test_parents_come_before_children(self) -> None:
+        names = [table.name for table, _ in _org_table_scopes()]
+
+        assert names.index("organizations") < names.index("crawl_sources")
+        assert names.index("crawl_sources") < names.index("crawled_documents")
+        assert names.index("crawled_documents") < names.index("document_chunks")
+
+
+class TestChecksumWriter:
+    def test_tracks_size_and_checksum(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.bin"
+        with _ChecksumWriter(path) as writer:
+            writer.write(b"hello ")
+            writer.write(b"world")
+
+        assert writer.size == 11
+        assert writer.sha256 == hashlib.sha256(b"hello world").hexdigest()
+        assert path.read_bytes() == b"hello world"
+
+
+class TestExportGraph:
+    async def test_streams_ndjson_through_the_checksum_writer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from sibyl_core.tools import admin
+
+        async def fake_export(
+            write: Callable[[bytes], object], *, organization_id: str
+        ) -> admin.BackupResult:
+            write(b'{"kind": "header"}\n')
+            write(b'{"kind": "entity", "data": {"id": "e1"}}\n')
+            return admin.BackupResult(True, 1, 0, None, "ok", 0.0)
+
+        monkeypatch.setattr(admin, "export_backup_ndjson", fake_export)
+        path = tmp_path / "graph.ndjson"
+
+        writer, entities, relationships = await _export_graph(path, "org_1")
+
+        assert (entities, relationships) == (1, 0)
+        assert len(path.read_text().splitlines()) == 2
+        assert writer.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    async def test_failed_export_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from sibyl_core.tools import admin
+
+        async def fake_export(
+            write: Callable[[bytes], object], *, organization_id: str
+        ) -> admin.BackupResult:
+            return admin.BackupResult(False, 0, 0, None, "Backup failed: boom", 0.0)
+
+        monkeypatch.setattr(admin, "export_backup_ndjson", fake_export)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await _export_graph(tmp_path / "graph.ndjson", "org_1")
+
+
+class TestDumpSchema:
+    @pytest.fixture
+    def fake_pg_dump(self, monkeypatch: pytest.MonkeyPatch) -> Callable[[str], None]:
+        def install(script: str) -> None:
+            monkeypatch.setattr(backup, "_find_pg_tool", lambda _tool: sys.executable)
+            monkeypatch.setattr(backup, "_get_pg_connection_args", lambda: ["-c", script])
+
+        return install
+
+    async def test_streams_output_in_chunks(
+        self, tmp_path: Path, fake_pg_dump: Callable[[str], None]
+    ) -> None:
+        # Larger than the pipe buffer and the read size
+        fake_pg_dump("import sys; sys.stdout.write('x' * 1_000_000)")
+        path = tmp_path / "postgres.sql"
+
+        with _ChecksumWriter(path) as writer:
+            await _dump_schema(writer)
+
+        assert writer.size == 1_000_000
+        assert writer.sha256 == hashlib.sha256(b"x" * 1_000_000).hexdigest()
+
+    async def test_failure_reports_stderr(
+        self, tmp_path: Path, fake_pg_dump: Callable[[str], None]
+    ) -> None:
+        fake_pg_dump("import sys; sys.stderr.write('role does not exist'); sys.exit(1)")
+
+        with (
+            _ChecksumWriter(tmp_path / "postgres.sql") as writer,
+            pytest.raises(RuntimeError, match="role does not exist"),
+        ):
+            await _dump_schema(writer)
+
+    async def test_timeout_kills_pg_dump(
+        self,
+        tmp_path: Path,
+        fake_pg_dump: Callable[[str], None],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        fake_pg_dump("import time; time.sleep(30)")
+        monkeypatch.setattr(backup, "PG_DUMP_TIMEOUT", 0.2)
+
+        with (
+            _ChecksumWriter(tmp_path / "postgres.sql") as writer,
+            pytest.raises(RuntimeError, match="timed out"),
+        ):
+            await _dump_schema(writer)
@@ -624,6 +624,33 @@ class TestGetOrgMetrics:
             assert result.projects_summary[0]["total"] == 2
 
 
+class TestEmbeddingCacheMetrics:
+    """Tests for the query-embedding cache metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_reports_hit_rate(self) -> None:
+        """Counters reflect hits and misses of the process-wide cache."""
+        from sibyl.api.routes.metrics import get_embedding_cache_metrics
+        from sibyl_core.retrieval.embedding_cache import EmbeddingCache
+
+        cache = EmbeddingCache()
+
+        async def embed(text: str) -> list[float]:
+            return [0.1, 0.2]
+
+        for _ in range(4):
+            await cache.get_or_embed("m", 2, "query", embed)
+
+        with patch("sibyl.api.routes.metrics.get_embedding_cache", return_value=cache):
+            response = await get_embedding_cache_metrics()
+
+        assert response.misses == 1
+        assert response.memory_hits == 3
+        assert response.hit_rate == 0.75
+        assert response.size == 1
+        assert response.redis_enabled is False
+
+
 class TestMetricsErrorHandling:
     """Tests for error handling in metrics endpoints."""
 
@@ -58,6 +58,7 @@ class TestSyncProjectCreate:
     async def test_creates_postgres_row(self) -> None:
         """Creates Postgres project when graph project created."""
         session = AsyncMock()
+        session.info = {}
         org_id = uuid4()
         user_id = uuid4()
         graph_id = "project_abc123"
@@ -122,6 +123,7 @@ class TestSyncProjectCreate:
     async def test_truncates_description(self) -> None:
         """Truncates description to 2000 chars."""
         session = AsyncMock()
+        session.info = {}
         org_id = uuid4()
 
         mock_result = MagicMock()
@@ -214,6 +216,7 @@ class TestSyncProjectDelete:
     async def test_deletes_postgres_row(self) -> None:
         """Deletes Postgres project when graph project deleted."""
         session = AsyncMock()
+        session.info = {}
         org_id = uuid4()
         graph_id = "project_abc123"
 
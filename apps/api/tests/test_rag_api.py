@@ -4,6 +4,8 @@ Tests the RAG search, code example search, and page retrieval endpoints.
 Uses mocked database and embedding service.
 """
 
+import json
+import os
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -472,9 +474,9 @@ class TestHybridSearch:
             mock_get_session.return_value = mock_session
 
             from sibyl.api.routes.rag import hybrid_search
-            from sibyl.api.schemas import RAGSearchRequest
+            from sibyl.api.schemas import HybridSearchRequest
 
-            request = RAGSearchRequest(
+            request = HybridSearchRequest(
                 query="authentication patterns best practices",
                 match_count=10,
             )
@@ -484,6 +486,146 @@ class TestHybridSearch:
             assert response.query == "authentication patterns best practices"
             # Hybrid search always returns chunks
             assert response.return_mode == "chunks"
+            assert response.results[0].similarity == 0.85
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_sets_ef_search(
+        self, mock_embed_text, mock_session, mock_auth_context
+    ):
+        """ef_search is raised for the transaction to cover the candidate pool."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch("sibyl.api.routes.rag.get_session") as mock_get_session:
+            mock_get_session.return_value = mock_session
+
+            from sibyl.api.routes.rag import hybrid_search
+            from sibyl.api.schemas import HybridSearchRequest
+
+            await hybrid_search(
+                HybridSearchRequest(query="auth", candidate_k=200), auth=mock_auth_context
+            )
+
+        setting = mock_session.execute.call_args_list[0].args[0].compile()
+        assert "set_config" in str(setting)
+        assert "200" in setting.params.values()
+        assert True in setting.params.values()
+        # Filtered HNSW scans keep going until the LIMIT is met
+        assert "hnsw.iterative_scan" in setting.params.values()
+        assert "relaxed_order" in setting.params.values()
+        assert "hnsw.max_scan_tuples" in setting.params.values()
+
+    def test_statement_uses_index_shapes(self):
+        """Both candidate CTEs keep the shapes their indexes can serve."""
+        from sqlalchemy.dialects import postgresql
+
+        from sibyl.api.routes.rag import _hybrid_search_statement
+        from sibyl.api.schemas import HybridSearchRequest
+
+        request = HybridSearchRequest(query="auth tokens", candidate_k=30, rrf_k=10)
+        statement = _hybrid_search_statement(request, [0.1] * 3, str(uuid4()))
+        sql = " ".join(
+            str(
+                statement.compile(
+                    dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+                )
+            ).split()
+        )
+
+        # Top-k straight off the HNSW index
+        assert "ORDER BY document_chunks.embedding <=> '[0.1,0.1,0.1]' LIMIT 30" in sql
+        # The exact expression of ix_chunks_content_fts, matched with @@
+        assert "to_tsvector('english', document_chunks.content) @@" in sql
+        assert "FULL OUTER JOIN" in sql
+        assert "10 + vector_ranked.rank" in sql
+        assert "10 + text_ranked.rank" in sql
+
+
+@pytest.mark.skipif(
+    os.getenv("RAG_INTEGRATION_TESTS") != "true",
+    reason="Requires a migrated PostgreSQL database (set RAG_INTEGRATION_TESTS=true)",
+)
+class TestHybridSearchPlan:
+    """EXPLAIN regression tests for the hybrid search query plan."""
+
+    @pytest.mark.asyncio
+    async def test_plan_uses_hnsw_and_gin_indexes(self):
+        """Both candidate stages are served by their indexes."""
+        from sqlalchemy.dialects import postgresql
+
+        from sibyl.api.routes.rag import _hybrid_search_statement
+        from sibyl.api.schemas import HybridSearchRequest
+        from sibyl.db import get_session
+
+        request = HybridSearchRequest(query="authentication tokens")
+        statement = _hybrid_search_statement(request, [0.01] * 1536, str(uuid4()))
+        sql = str(
+            statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        )
+
+        async with get_session() as session:
+            conn = await session.connection()
+            # A test database is too small for the planner to prefer indexes on cost
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = json.dumps(result.scalar())
+            await session.rollback()
+
+        assert "ix_chunks_embedding_hnsw" in plan
+        assert "ix_chunks_content_fts" in plan
+
+    @pytest.mark.asyncio
+    async def test_small_org_gets_vector_hits_in_shared_index(self):
+        """A tenant with a few chunks still gets them when others fill the HNSW neighborhood."""
+        from sibyl.api.routes.rag import _hnsw_settings, _hybrid_search_statement
+        from sibyl.api.schemas import HybridSearchRequest
+        from sibyl.db import CrawledDocument, CrawlSource, DocumentChunk, get_session
+        from sibyl.db.models import Organization
+
+        dims = 1536
+        query = [1.0] + [0.0] * (dims - 1)
+
+        def near(i: int) -> list[float]:
+            # Closer to the query than any of the small org's chunks
+            vec = list(query)
+            vec[1 + i % (dims - 1)] = 0.05
+            return vec
+
+        far = [1.0, 1.0] + [0.0] * (dims - 2)  # similarity ~0.71
+
+        async with get_session() as session:
+            chunks: dict[str, list[DocumentChunk]] = {}
+            for name, count, embedding in (("large", 2000, None), ("small", 3, far)):
+                org = Organization(id=uuid4(), name=name, slug=f"rag-{uuid4().hex[:12]}")
+                source = CrawlSource(
+                    organization_id=org.id, name=name, url=f"https://{uuid4().hex}.test"
+                )
+                doc = CrawledDocument(source_id=source.id, url=f"{source.url}/page")
+                chunks[name] = [
+                    DocumentChunk(
+                        document_id=doc.id,
+                        chunk_index=i,
+                        content="lorem ipsum",
+                        embedding=embedding or near(i),
+                    )
+                    for i in range(count)
+                ]
+                session.add_all([org, source, doc, *chunks[name]])
+                await session.flush()
+            small_org_id = str(org.id)
+            expected = {chunk.id for chunk in chunks["small"]}
+
+            conn = await session.connection()
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            # ef_search well below the large org's 2000 nearer neighbors
+            await session.execute(_hnsw_settings(40))
+            request = HybridSearchRequest(query="zzqx", candidate_k=10)
+            result = await session.execute(_hybrid_search_statement(request, query, small_org_id))
+            found = {row[0].id for row in result.all()}
+            await session.rollback()
+
+        assert found == expected
 
 
 # =============================================================================
@@ -575,6 +575,7 @@ class TestRemoveMember:
         member_result.scalar_one_or_none.return_value = membership
 
         session = AsyncMock()
+        session.info = {}
         session.get.return_value = project
         session.execute.side_effect = [role_result, member_result]
 
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from sibyl_core.graph.counts import reset_entity_counts
 from sibyl_core.models.entities import EntityType
 from sibyl_core.tools.core import (
     VALID_ENTITY_TYPES,
@@ -552,33 +553,44 @@ class TestGetStats:
 
     @pytest.mark.asyncio
     async def test_stats_returns_entity_counts(self) -> None:
-        """Stats should return entity counts per type."""
+        """Stats should return entity counts per type and status."""
+        reset_entity_counts()
         mock_client = MagicMock()
-        mock_driver = MagicMock()
-        mock_client.client.driver.clone = MagicMock(return_value=mock_driver)
-
-        mock_driver.execute_query = AsyncMock(
-            return_value=[
-                {"type": "pattern", "count": 10},
-                {"type": "rule", "count": 5},
+        # One aggregate query per node label (Entity, Episodic)
+        mock_client.execute_read_org = AsyncMock(
+            side_effect=[
+                [
+                    {"entity_type": "pattern", "status": None, "count": 10},
+                    {"entity_type": "task", "status": "todo", "count": 3},
+                ],
+                [{"entity_type": "rule", "status": None, "count": 5}],
             ]
         )
 
-        with (
-            patch("sibyl_core.tools.health.get_graph_client", AsyncMock(return_value=mock_client)),
-            patch(
-                "sibyl_core.tools.health.GraphClient.normalize_result",
-                return_value=[
-                    {"type": "pattern", "count": 10},
-                    {"type": "rule", "count": 5},
-                ],
-            ),
-        ):
+        with patch("sibyl_core.tools.health.get_graph_client", AsyncMock(return_value=mock_client)):
             result = await get_stats(organization_id=TEST_ORG_ID)
 
-            assert "entity_counts" in result
-            assert result["entity_counts"]["pattern"] == 10
-            assert result["entity_counts"]["rule"] == 5
+        assert result["entity_counts"]["pattern"] == 10
+        assert result["entity_counts"]["rule"] == 5
+        assert result["entity_counts"]["epic"] == 0
+        assert result["status_counts"] == {"task": {"todo": 3}}
+        assert result["total_entities"] == 18
+
+    @pytest.mark.asyncio
+    async def test_stats_are_served_from_the_count_cache(self) -> None:
+        """Repeated stats calls should not recount the graph."""
+        reset_entity_counts()
+        mock_client = MagicMock()
+        mock_client.execute_read_org = AsyncMock(
+            return_value=[{"entity_type": "pattern", "status": None, "count": 2}]
+        )
+
+        with patch("sibyl_core.tools.health.get_graph_client", AsyncMock(return_value=mock_client)):
+            await get_stats(organization_id=TEST_ORG_ID)
+            result = await get_stats(organization_id=TEST_ORG_ID)
+
+        assert mock_client.execute_read_org.await_count == 2  # one per label, once
+        assert result["entity_counts"]["pattern"] == 4
 
 
 class TestAutoTagTask:
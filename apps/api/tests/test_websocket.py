@@ -1,5 +1,8 @@
 """Tests for WebSocket org scoping and auth integration."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -8,6 +11,8 @@ import pytest
 from sibyl.api.websocket import (
     Connection,
     ConnectionManager,
+    Outbox,
+    _coalesce_key,
     _extract_org_from_token,
 )
 from sibyl.auth.jwt import create_access_token
@@ -31,78 +36,206 @@ class TestConnection:
         assert conn.org_id is None
 
 
+def make_websocket(delay: float = 0.0) -> MagicMock:
+    ws = MagicMock()
+    ws.sent = []
+
+    async def send_text(text: str) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        ws.sent.append(json.loads(text))
+
+    ws.send_text = AsyncMock(side_effect=send_text)
+    ws.close = AsyncMock()
+    return ws
+
+
+async def settle() -> None:
+    """Let sender tasks drain their outboxes."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
 class TestConnectionManagerOrgScoping:
     """Tests for org-scoped broadcasting."""
 
     @pytest.fixture
-    def manager(self) -> ConnectionManager:
-        return ConnectionManager()
-
-    @pytest.fixture
-    def mock_websocket(self) -> MagicMock:
-        ws = MagicMock()
-        ws.send_json = AsyncMock()
-        return ws
+    async def manager(self) -> AsyncIterator[ConnectionManager]:
+        manager = ConnectionManager()
+        yield manager
+        for conn in manager.active_connections:
+            await manager.disconnect(conn.websocket)
+        if manager._heartbeat_task:
+            manager._heartbeat_task.cancel()
 
     @pytest.mark.asyncio
     async def test_broadcast_to_specific_org(self, manager: ConnectionManager) -> None:
         """Broadcast with org_id should only reach that org's connections."""
-        ws1 = MagicMock()
-        ws1.send_json = AsyncMock()
-        ws2 = MagicMock()
-        ws2.send_json = AsyncMock()
-        ws3 = MagicMock()
-        ws3.send_json = AsyncMock()
+        ws1, ws2, ws3 = make_websocket(), make_websocket(), make_websocket()
 
         # Add connections for different orgs
-        manager.active_connections = [
-            Connection(websocket=ws1, org_id="org_a"),
-            Connection(websocket=ws2, org_id="org_b"),
-            Connection(websocket=ws3, org_id="org_a"),
-        ]
+        manager.register(Connection(websocket=ws1, org_id="org_a"))
+        manager.register(Connection(websocket=ws2, org_id="org_b"))
+        manager.register(Connection(websocket=ws3, org_id="org_a"))
 
         # Broadcast to org_a only
         await manager.broadcast("test_event", {"key": "value"}, org_id="org_a")
+        await settle()
 
         # Only org_a connections should receive
-        assert ws1.send_json.called
-        assert ws3.send_json.called
-        assert not ws2.send_json.called
+        assert ws1.send_text.called
+        assert ws3.send_text.called
+        assert not ws2.send_text.called
+        assert ws1.sent[0]["event"] == "test_event"
+        assert ws1.sent[0]["data"] == {"key": "value"}
 
     @pytest.mark.asyncio
     async def test_broadcast_without_org_reaches_all(self, manager: ConnectionManager) -> None:
         """Broadcast without org_id should reach all connections."""
-        ws1 = MagicMock()
-        ws1.send_json = AsyncMock()
-        ws2 = MagicMock()
-        ws2.send_json = AsyncMock()
+        ws1, ws2 = make_websocket(), make_websocket()
 
-        manager.active_connections = [
-            Connection(websocket=ws1, org_id="org_a"),
-            Connection(websocket=ws2, org_id="org_b"),
-        ]
+        manager.register(Connection(websocket=ws1, org_id="org_a"))
+        manager.register(Connection(websocket=ws2, org_id="org_b"))
 
         # Broadcast to all (system event)
         await manager.broadcast("health_update", {"status": "ok"}, org_id=None)
+        await settle()
 
-        assert ws1.send_json.called
-        assert ws2.send_json.called
+        assert ws1.send_text.called
+        assert ws2.send_text.called
 
     @pytest.mark.asyncio
     async def test_broadcast_to_empty_org(self, manager: ConnectionManager) -> None:
         """Broadcast to org with no connections should succeed without error."""
-        ws1 = MagicMock()
-        ws1.send_json = AsyncMock()
+        ws1 = make_websocket()
 
-        manager.active_connections = [
-            Connection(websocket=ws1, org_id="org_a"),
-        ]
+        manager.register(Connection(websocket=ws1, org_id="org_a"))
 
         # Broadcast to org with no connections
         await manager.broadcast("test_event", {"key": "value"}, org_id="org_nonexistent")
+        await settle()
 
         # Should not error, just not send anything
-        assert not ws1.send_json.called
+        assert not ws1.send_text.called
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self, manager: ConnectionManager) -> None:
+        """A stalled socket should not hold up delivery to the rest of the org."""
+        slow, fast = make_websocket(delay=10), make_websocket()
+        manager.register(Connection(websocket=slow, org_id="org_a"))
+        manager.register(Connection(websocket=fast, org_id="org_a"))
+
+        await manager.broadcast("entity_created", {"id": "e1"}, org_id="org_a")
+        await manager.broadcast("entity_created", {"id": "e2"}, org_id="org_a")
+        await settle()
+
+        assert [m["data"]["id"] for m in fast.sent] == ["e1", "e2"]
+        assert slow.sent == []
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_from_org_index(self, manager: ConnectionManager) -> None:
+        ws = make_websocket()
+        manager.register(Connection(websocket=ws, org_id="org_a"))
+
+        await manager.disconnect(ws)
+        await manager.broadcast("test_event", {}, org_id="org_a")
+        await settle()
+
+        assert manager.active_connections == []
+        assert not ws.send_text.called
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects_client(self, manager: ConnectionManager) -> None:
+        ws = make_websocket()
+        ws.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        manager.register(Connection(websocket=ws, org_id="org_a"))
+
+        await manager.broadcast("test_event", {}, org_id="org_a")
+        await settle()
+
+        assert manager.active_connections == []
+
+    @pytest.mark.asyncio
+    async def test_overflow_of_required_events_drops_client(
+        self, manager: ConnectionManager
+    ) -> None:
+        slow = make_websocket(delay=10)
+        manager.register(Connection(websocket=slow, org_id="org_a"))
+        await settle()
+
+        for i in range(ConnectionManager.OUTBOX_SIZE + 2):
+            await manager.broadcast("entity_created", {"id": i}, org_id="org_a")
+        await settle()
+
+        assert manager.active_connections == []
+        slow.close.assert_awaited_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_hanging_close_does_not_block_broadcast(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Dropping a stalled client must not wait on its close handshake."""
+        monkeypatch.setattr(ConnectionManager, "SEND_TIMEOUT", 0.2)
+        closed = asyncio.Event()
+
+        async def hang_close(code: int) -> None:
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                closed.set()
+
+        stuck, healthy = make_websocket(delay=3600), make_websocket()
+        stuck.close = AsyncMock(side_effect=hang_close)
+        manager.register(Connection(websocket=stuck, org_id="org_a"))
+        manager.register(Connection(websocket=healthy, org_id="org_a"))
+        await settle()
+
+        async with asyncio.timeout(1):
+            for i in range(ConnectionManager.OUTBOX_SIZE + 2):
+                await manager.broadcast("entity_created", {"id": i}, org_id="org_a")
+                await settle()
+
+        assert [c.websocket for c in manager.active_connections] == [healthy]
+        # The close attempt is abandoned after SEND_TIMEOUT
+        async with asyncio.timeout(1):
+            await closed.wait()
+
+
+class TestOutbox:
+    """Tests for per-client queueing, coalescing and shedding."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_pending_copies_in_place(self) -> None:
+        outbox = Outbox(maxsize=10)
+        outbox.put("first")
+        outbox.put("msg-1", ("agent_message", "agent_1"))
+        outbox.put("other")
+        outbox.put("msg-2", ("agent_message", "agent_1"))
+
+        assert len(outbox) == 3
+        assert [await outbox.get() for _ in range(3)] == ["first", "msg-2", "other"]
+
+    @pytest.mark.asyncio
+    async def test_sheds_oldest_coalescable_when_full(self) -> None:
+        outbox = Outbox(maxsize=3)
+        outbox.put("required-1")
+        outbox.put("hint", ("status_hint", "a", "t1"))
+        outbox.put("progress", ("crawl_progress", "s1"))
+
+        assert outbox.put("required-2")
+        assert outbox.dropped == 1
+        assert [await outbox.get() for _ in range(3)] == ["required-1", "progress", "required-2"]
+
+    def test_reports_overflow_when_nothing_can_be_shed(self) -> None:
+        outbox = Outbox(maxsize=2)
+        assert outbox.put("a")
+        assert outbox.put("b")
+        assert not outbox.put("c")
+
+    def test_coalesce_keys(self) -> None:
+        data = {"agent_id": "a1", "tool_call_id": "t1", "hint": "Reading files"}
+        assert _coalesce_key("status_hint", data) == ("status_hint", "a1", "t1")
+        assert _coalesce_key("entity_created", {"id": "e1"}) is None
 
 
 class TestExtractOrgFromToken:
@@ -0,0 +1,60 @@
+"""Benchmark CLI cold-start import time.
+
+Imports ``sibyl_cli`` ``--runs`` times, each in a fresh interpreter under
+``python -X importtime``. Reports the cumulative time of ``sibyl_cli``
+(best and median) and the slowest modules it pulled in during the best run.
+Timings depend on the machine and its load, so this is a benchmark rather
+than a test; ``tests/test_startup.py`` checks which modules get imported.
+
+Usage:
+    uv run python benchmarks/bench_startup.py
+    uv run python benchmarks/bench_startup.py --runs 20 --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Import ``module`` in a fresh interpreter; cumulative ms per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="sibyl_cli")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    totals = [run[args.module] for run in runs]
+    best = runs[totals.index(min(totals))]
+
+    print(
+        f"import {args.module}: best {min(totals):.1f} ms, "
+        f"median {statistics.median(totals):.1f} ms over {args.runs} runs"
+    )
+    slowest = sorted(best.items(), key=lambda item: item[1], reverse=True)
+    for name, ms in slowest[1 : args.top + 1]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ Subcommand groups:
 - org: Organization management
 - config: Configuration
 - context: Project context
+- hook: Search daemon for the Claude Code prompt hook
 
 Server commands (serve, db, generate, etc.) are in the sibyl-server package.
 """
@@ -4,10 +4,10 @@ The CLI is a thin client - all operations go through the REST API,
 ensuring consistent event broadcasting and state management.
 """
 
-import os
-from typing import Any
+from __future__ import annotations
 
-import httpx
+import os
+from typing import TYPE_CHECKING, Any
 
 from sibyl_cli.auth_store import (
     get_access_token,
@@ -17,6 +17,9 @@ from sibyl_cli.auth_store import (
     set_tokens,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 # Default server port (matches sibyl-server default)
 DEFAULT_SERVER_PORT = 3334
 
@@ -139,6 +142,9 @@ class SibylClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
+        # Deferred: httpx is a large share of CLI startup
+        import httpx
+
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
@@ -154,7 +160,7 @@ class SibylClient:
             await self._client.aclose()
             self._client = None
 
-    async def __aenter__(self) -> "SibylClient":
+    async def __aenter__(self) -> SibylClient:
         """Async context manager entry."""
         return self
 
@@ -168,6 +174,8 @@ class SibylClient:
         Returns:
             True if refresh succeeded, False otherwise
         """
+        import httpx
+
         refresh_token = get_refresh_token(self.base_url)
         if not refresh_token:
             return False
@@ -240,6 +248,8 @@ class SibylClient:
         Raises:
             SibylClientError: On API errors or connection issues
         """
+        import httpx
+
         # Proactively refresh if token is about to expire
         if self.auth_token and is_access_token_expired(self.base_url):
             await self._refresh_token()
@@ -332,9 +342,16 @@ class SibylClient:
         category: str | None = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
-        """List entities with optional filters."""
+        """List entities with optional filters.
+
+        Pass ``cursor=""`` for keyset pagination, then each response's
+        ``next_cursor`` to fetch the following page.
+        """
         params: dict[str, Any] = {"page": page, "page_size": page_size}
+        if cursor is not None:
+            params["cursor"] = cursor
         if entity_type:
             params["entity_type"] = entity_type
         if language:
@@ -593,9 +610,12 @@ class SibylClient:
         self,
         task_id: str,
         limit: int = 50,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """List notes for a task."""
-        params = {"limit": limit}
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
         return await self._request("GET", f"/tasks/{task_id}/notes", params=params)
 
     # =========================================================================
@@ -650,9 +670,16 @@ class SibylClient:
         tags: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
-        """Explore and traverse the knowledge graph."""
+        """Explore and traverse the knowledge graph.
+
+        In list mode, ``cursor`` switches to keyset pagination: ``""`` fetches
+        the first page and each response's ``next_cursor`` the next one.
+        """
         data: dict[str, Any] = {"mode": mode, "limit": limit, "offset": offset, "depth": depth}
+        if cursor is not None:
+            data["cursor"] = cursor
         if types:
             data["types"] = types
         if entity_id:
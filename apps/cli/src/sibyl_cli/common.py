@@ -11,13 +11,7 @@ from functools import wraps
 from typing import TYPE_CHECKING
 
 import typer
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-from rich.text import Text
-from rich.tree import Tree
 
 from sibyl_core.logging.colors import (
     CORAL,
@@ -29,6 +23,12 @@ from sibyl_core.logging.colors import (
 )
 
 if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.progress import Progress
+    from rich.table import Table
+    from rich.text import Text
+    from rich.tree import Tree
+
     from sibyl_cli.client import SibylClientError
 
 # Shared console instance (for styled output only, NOT for JSON)
@@ -61,12 +61,19 @@ def print_json(data: object) -> None:
 
 
 def pagination_hint(
-    offset: int, count: int, total: int, has_more: bool, limit: int, entity_type: str = "result"
+    offset: int,
+    count: int,
+    total: int,
+    has_more: bool,
+    limit: int,
+    entity_type: str = "result",
+    next_cursor: str | None = None,
 ) -> None:
     """Print pagination info to stderr (doesn't break JSON output).
 
     Shows something like:
         Showing 1-50 of 81 results (--page 2 for more)
+        Showing 50 results (--cursor <token> for more)
     """
     import sys
 
@@ -74,7 +81,9 @@ def pagination_hint(
     end = offset + count
     plural = "s" if count != 1 else ""
 
-    if has_more:
+    if next_cursor:
+        msg = f"Showing {count} {entity_type}{plural} (--cursor {next_cursor} for more)"
+    elif has_more:
         next_page = (offset // limit) + 2
         msg = (
             f"Showing {start}-{end} of {total}+ {entity_type}{plural} (--page {next_page} for more)"
@@ -87,6 +96,8 @@ def pagination_hint(
 
 def styled_header(text: str) -> Text:
     """Create a styled header with SilkCircuit colors."""
+    from rich.text import Text
+
     return Text(text, style=f"bold {NEON_CYAN}")
 
 
@@ -127,6 +138,9 @@ def create_table(title: str | None = None, *columns: str, expand: bool = True) -
     Uses SIMPLE_HEAD box style - just a header underline, no heavy frames.
     Set expand=True (default) to use full terminal width.
     """
+    from rich import box
+    from rich.table import Table
+
     table = Table(title=title, box=box.SIMPLE_HEAD, header_style=f"bold {NEON_CYAN}", expand=expand)
     for i, col in enumerate(columns):
         style = ELECTRIC_PURPLE if i == 0 else None
@@ -139,6 +153,8 @@ def create_table(title: str | None = None, *columns: str, expand: bool = True) -
 
 def create_panel(content: str, title: str | None = None, subtitle: str | None = None) -> Panel:
     """Create a styled panel with SilkCircuit colors."""
+    from rich.panel import Panel
+
     return Panel(
         content,
         title=f"[{ELECTRIC_PURPLE}]{title}[/{ELECTRIC_PURPLE}]" if title else None,
@@ -149,6 +165,8 @@ def create_panel(content: str, title: str | None = None, subtitle: str | None =
 
 def create_tree(label: str) -> Tree:
     """Create a styled tree with SilkCircuit colors."""
+    from rich.tree import Tree
+
     return Tree(f"[{ELECTRIC_PURPLE}]{label}[/{ELECTRIC_PURPLE}]")
 
 
@@ -158,6 +176,8 @@ def spinner(_description: str = "") -> Progress:
     Args:
         _description: Unused - callers add their own task descriptions.
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(style=NEON_CYAN),
         TextColumn("[progress.description]{task.description}"),
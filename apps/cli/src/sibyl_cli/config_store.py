@@ -288,18 +288,21 @@ def _find_project_in_mappings(
     return best_match, best_length
 
 
-def resolve_project_from_cwd() -> str | None:
+def resolve_project_from_cwd(cwd: str | Path | None = None) -> str | None:
     """Resolve project ID from current working directory.
 
     Walks up from cwd looking for longest matching path prefix.
     If in a git worktree, also checks the main repo's path.
 
+    Args:
+        cwd: Directory to resolve from instead of the process's cwd.
+
     Returns:
         Project ID if found, None otherwise
     """
     import os
 
-    cwd = Path(os.getcwd()).resolve()
+    cwd = Path(cwd or os.getcwd()).resolve()
     mappings = get_path_mappings()
 
     if not mappings:
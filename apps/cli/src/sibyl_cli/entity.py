@@ -18,6 +18,7 @@ from sibyl_cli.common import (
     create_table,
     error,
     info,
+    pagination_hint,
     print_json,
     run_async,
     success,
@@ -60,6 +61,12 @@ def list_entities(
         str | None, typer.Option("--category", "-c", help="Filter by category")
     ] = None,
     limit: Annotated[int, typer.Option("--limit", "-n", help="Max results")] = 50,
+    cursor: Annotated[
+        str | None,
+        typer.Option(
+            "--cursor", help="Keyset page cursor ('' for the first page, then the printed token)"
+        ),
+    ] = None,
     json_out: Annotated[
         bool, typer.Option("--json", "-j", help="JSON output (for scripting)")
     ] = False,
@@ -83,11 +90,17 @@ def list_entities(
                 language=language,
                 category=category,
                 limit=limit,
+                cursor=cursor,
             )
             entities = response.get("entities", [])
+            next_cursor = response.get("next_cursor")
 
             if format_ == "json":
                 print_json(entities)
+                if next_cursor:
+                    pagination_hint(
+                        0, len(entities), len(entities), True, limit, entity_type, next_cursor
+                    )
                 return
 
             if format_ == "csv":
@@ -120,7 +133,13 @@ def list_entities(
                 )
 
             console.print(table)
-            console.print(f"\n[dim]Showing {len(entities)} {entity_type}(s)[/dim]")
+            if next_cursor:
+                console.print(
+                    f"\n[dim]Showing {len(entities)} {entity_type}(s) "
+                    f"(--cursor {next_cursor} for more)[/dim]"
+                )
+            else:
+                console.print(f"\n[dim]Showing {len(entities)} {entity_type}(s)[/dim]")
 
         except SibylClientError as e:
             _handle_client_error(e)
@@ -0,0 +1,204 @@
+"""Search daemon for the Claude Code prompt hook.
+
+The UserPromptSubmit hook has a ~500ms budget, and starting the full CLI for
+every prompt spends most of it on interpreter startup, imports, config and
+auth loading, and a fresh TLS handshake. `sibyl hook serve` does that once:
+it keeps an authenticated API client with a warm connection and answers
+searches over a Unix socket (~/.sibyl/hook.sock, owner-only). The hook talks
+to it with the standard library and starts it on first use.
+
+Protocol - one JSON object per line each way:
+    {"op": "search", "query": "...", "limit": 3, "cwd": "/path"}  -> search response
+    {"op": "ping"}                                                -> {"ok": true}
+    {"op": "shutdown"}                                            -> {"ok": true}
+Failures are answered with {"error": "..."}.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from sibyl_cli.client import SibylClientError, get_client
+from sibyl_cli.common import _strip_embeddings, error, info, run_async, success
+from sibyl_cli.config_store import config_dir, resolve_project_from_cwd
+
+app = typer.Typer(
+    name="hook",
+    help="Claude Code hook helpers",
+    no_args_is_help=True,
+)
+
+# Exit after this many idle seconds; the hook restarts the daemon on demand
+IDLE_TIMEOUT = 1800.0
+
+# Largest request line accepted
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Results per search are capped; the hook only injects a few
+MAX_LIMIT = 20
+
+
+def socket_path() -> Path:
+    """Path of the daemon's Unix socket (SIBYL_HOOK_SOCKET overrides)."""
+    override = os.environ.get("SIBYL_HOOK_SOCKET", "").strip()
+    return Path(override) if override else config_dir() / "hook.sock"
+
+
+def send_request(request: dict[str, Any], timeout: float = 2.0) -> dict[str, Any]:
+    """Send one request to a running daemon and return its response.
+
+    Raises:
+        OSError: If no daemon is listening or it does not answer in time.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path()))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as response:
+            return json.loads(response.readline() or b"{}")
+
+
+class HookDaemon:
+    """Answers hook requests with one long-lived API client."""
+
+    def __init__(self, path: Path, idle_timeout: float = IDLE_TIMEOUT):
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self._stop = asyncio.Event()
+
+    async def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one decoded request."""
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "shutdown":
+            self._stop.set()
+            return {"ok": True}
+        if op != "search":
+            return {"error": f"Unknown op: {op}"}
+
+        query = str(request.get("query") or "").strip()
+        if not query:
+            return {"error": "Missing query"}
+        limit = min(int(request.get("limit") or 3), MAX_LIMIT)
+
+        # Resolve the project per request: one daemon serves every checkout
+        cwd = request.get("cwd")
+        project = resolve_project_from_cwd(cwd) if cwd else None
+
+        try:
+            data = await get_client().search(query, limit=limit, project=project)
+        except SibylClientError as e:
+            return {"error": str(e), "status_code": e.status_code}
+        return _strip_embeddings(data)  # type: ignore[return-value]
+
+    async def _on_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.last_request = time.monotonic()
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                response: dict[str, Any] = {"error": "Invalid JSON request"}
+            else:
+                response = await self.handle(request if isinstance(request, dict) else {})
+            writer.write(json.dumps(response, default=str).encode() + b"\n")
+            await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # Client gave up or sent an oversized line
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+            self.last_request = time.monotonic()
+
+    async def _watch_idle(self) -> None:
+        while not self._stop.is_set():
+            idle = time.monotonic() - self.last_request
+            if idle >= self.idle_timeout:
+                self._stop.set()
+                return
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), self.idle_timeout - idle)
+
+    async def serve(self) -> None:
+        """Listen until shut down or idle for ``idle_timeout`` seconds."""
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # Owner-only socket: whoever connects searches with this user's credentials
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._on_connection, path=str(self.path), limit=MAX_REQUEST_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+
+        try:
+            async with server:
+                await self._watch_idle()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+            await get_client().close()
+
+
+def _daemon_running() -> bool:
+    try:
+        return send_request({"op": "ping"}, timeout=0.5).get("ok") is True
+    except (OSError, ValueError):
+        return False
+
+
+@app.command("serve")
+def serve(
+    idle_timeout: float = typer.Option(
+        IDLE_TIMEOUT, "--idle-timeout", help="Exit after this many idle seconds"
+    ),
+) -> None:
+    """Run the hook search daemon in the foreground."""
+    path = socket_path()
+    if _daemon_running():
+        info(f"Hook daemon already running on {path}")
+        return
+    # Left behind by a daemon that did not exit cleanly
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+    @run_async
+    async def run() -> None:
+        await HookDaemon(path, idle_timeout=idle_timeout).serve()
+
+    run()
+
+
+@app.command("status")
+def status() -> None:
+    """Check whether the hook search daemon is running."""
+    if _daemon_running():
+        success(f"Hook daemon running on {socket_path()}")
+    else:
+        error("Hook daemon not running")
+        raise typer.Exit(1)
+
+
+@app.command("stop")
+def stop() -> None:
+    """Stop the hook search daemon."""
+    try:
+        send_request({"op": "shutdown"}, timeout=1.0)
+    except (OSError, ValueError):
+        info("Hook daemon not running")
+        return
+    success("Hook daemon stopped")
@@ -0,0 +1,54 @@
+"""Lazily imported subcommand groups.
+
+Importing every subcommand module (and their rich, yaml and pydantic
+imports) made each one-shot `sibyl search` pay for the whole CLI. The root
+group instead knows its subcommand groups by module path and imports one
+only when it is invoked, or when help lists them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+if TYPE_CHECKING:
+    import click
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports its subcommand groups on first use.
+
+    Subclasses set ``lazy_subcommands``: command name -> "module:attribute" of
+    a `typer.Typer` app. Use `lazy_group` to build one.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, str]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        loaded = super().list_commands(ctx)
+        return [*loaded, *(name for name in self.lazy_subcommands if name not in loaded)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        # get_group, not get_command: a single-command app must stay a group
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        return command
+
+
+def lazy_group(subcommands: dict[str, str]) -> type[LazyTyperGroup]:
+    """Build a root group class for ``typer.Typer(cls=...)``.
+
+    Args:
+        subcommands: Command name -> "module:attribute" of its Typer app.
+    """
+    return type("SibylLazyGroup", (LazyTyperGroup,), {"lazy_subcommands": subcommands})
@@ -20,7 +20,6 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
 from rich.table import Table
 
 from sibyl_cli.common import (
@@ -248,6 +247,8 @@ def is_running() -> bool:
 
 def write_compose_file() -> None:
     """Write the compose config to disk."""
+    import yaml
+
     SIBYL_LOCAL_DIR.mkdir(parents=True, exist_ok=True)
     with open(SIBYL_LOCAL_COMPOSE, "w") as f:
         yaml.dump(COMPOSE_CONFIG, f, default_flow_style=False, sort_keys=False)
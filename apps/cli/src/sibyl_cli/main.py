@@ -10,7 +10,6 @@ from typing import Annotated
 
 import typer
 
-from sibyl_cli.auth import app as auth_app
 from sibyl_cli.client import SibylClientError, get_client
 from sibyl_cli.common import (
     CORAL,
@@ -23,22 +22,27 @@ from sibyl_cli.common import (
     run_async,
     success,
 )
-
-# Import subcommand apps
-from sibyl_cli.config_cmd import app as config_app
 from sibyl_cli.config_store import resolve_project_from_cwd
-from sibyl_cli.context import app as context_app
-from sibyl_cli.crawl import app as crawl_app
-from sibyl_cli.document import app as document_app
-from sibyl_cli.entity import app as entity_app
-from sibyl_cli.epic import app as epic_app
-from sibyl_cli.explore import app as explore_app
-from sibyl_cli.local import app as local_app
-from sibyl_cli.org import app as org_app
-from sibyl_cli.project import app as project_app
-from sibyl_cli.source import app as source_app
+from sibyl_cli.lazy import lazy_group
 from sibyl_cli.state import set_context_override
-from sibyl_cli.task import app as task_app
+
+# Subcommand groups, imported only when invoked
+SUBCOMMANDS = {
+    "task": "sibyl_cli.task:app",
+    "epic": "sibyl_cli.epic:app",
+    "project": "sibyl_cli.project:app",
+    "entity": "sibyl_cli.entity:app",
+    "explore": "sibyl_cli.explore:app",
+    "source": "sibyl_cli.source:app",
+    "crawl": "sibyl_cli.crawl:app",
+    "document": "sibyl_cli.document:app",
+    "auth": "sibyl_cli.auth:app",
+    "org": "sibyl_cli.org:app",
+    "config": "sibyl_cli.config_cmd:app",
+    "context": "sibyl_cli.context:app",
+    "local": "sibyl_cli.local:app",
+    "hook": "sibyl_cli.hook_daemon:app",
+}
 
 # Main app
 app = typer.Typer(
@@ -46,25 +50,10 @@ app = typer.Typer(
     help="Sibyl - Oracle of Development Wisdom (CLI Client)",
     add_completion=False,
     no_args_is_help=False,
+    cls=lazy_group(SUBCOMMANDS),
 )
 
 
-# Register subcommand groups
-app.add_typer(task_app, name="task")
-app.add_typer(epic_app, name="epic")
-app.add_typer(project_app, name="project")
-app.add_typer(entity_app, name="entity")
-app.add_typer(explore_app, name="explore")
-app.add_typer(source_app, name="source")
-app.add_typer(crawl_app, name="crawl")
-app.add_typer(document_app, name="document")
-app.add_typer(auth_app, name="auth")
-app.add_typer(org_app, name="org")
-app.add_typer(config_app, name="config")
-app.add_typer(context_app, name="context")
-app.add_typer(local_app, name="local")
-
-
 def _handle_client_error(e: SibylClientError) -> None:
     """Handle client errors with helpful messages and exit with code 1."""
     if "Cannot connect" in str(e):
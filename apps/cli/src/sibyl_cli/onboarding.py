@@ -6,7 +6,6 @@ Uses Rich for beautiful terminal output.
 
 from __future__ import annotations
 
-import httpx
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
@@ -106,6 +105,8 @@ def test_connection(url: str) -> bool:
     if not Confirm.ask("  [dim]Test connection now?[/dim]", default=True):
         return True  # Skip test, assume it's fine
 
+    import httpx
+
     console.print()
     with console.status(f"[{NEON_CYAN}]Connecting to server...[/{NEON_CYAN}]"):
         try:
@@ -180,6 +180,7 @@ def _output_tasks_table(
     effective_limit: int,
     has_more: bool,
     total: int,
+    next_cursor: str | None = None,
 ) -> None:
     """Output tasks as a formatted table."""
     if not entities:
@@ -209,7 +210,11 @@ def _output_tasks_table(
     # Pagination info
     start = effective_offset + 1
     end = effective_offset + len(entities)
-    if has_more:
+    if next_cursor:
+        console.print(
+            f"\n[dim]Showing {len(entities)} task(s) (--cursor {next_cursor} for more)[/dim]"
+        )
+    elif has_more:
         next_page = (effective_offset // effective_limit) + 2
         console.print(
             f"\n[dim]Showing {start}-{end} of {total}+ task(s) (--page {next_page} for more)[/dim]"
@@ -262,6 +267,12 @@ def list_tasks(
     page: Annotated[
         int | None, typer.Option("--page", help="Page number (1-based, uses limit)")
     ] = None,
+    cursor: Annotated[
+        str | None,
+        typer.Option(
+            "--cursor", help="Keyset page cursor ('' for the first page, then the printed token)"
+        ),
+    ] = None,
     json_out: Annotated[
         bool, typer.Option("--json", "-j", help="JSON output (for scripting)")
     ] = False,
@@ -275,6 +286,8 @@ def list_tasks(
     Auto-scopes to current project context unless --all is specified.
 
     Pagination: Use --limit (max 200) and --offset, or --page for convenience.
+    For deep listings pass --cursor '' and then the cursor printed after each page;
+    every page then costs the same no matter how far in it is.
     """
     fmt = "json" if json_out else ("csv" if csv_out else "table")
 
@@ -299,6 +312,7 @@ def list_tasks(
         client = get_client()
 
         try:
+            next_cursor = None
             # Use semantic search if query provided, otherwise use explore
             if query:
                 response = await client.search(
@@ -332,10 +346,12 @@ def list_tasks(
                     no_epic=no_epic,
                     limit=effective_limit,
                     offset=effective_offset,
+                    cursor=cursor,
                 )
                 entities = response.get("entities", [])
                 has_more = response.get("has_more", False)
                 total = response.get("actual_total") or response.get("total", len(entities))
+                next_cursor = response.get("next_cursor")
 
             # Client-side filters (needed for search, or when API doesn't filter)
             entities = _apply_task_filters(
@@ -354,12 +370,20 @@ def list_tasks(
             if fmt == "json":
                 print_json(entities)
                 pagination_hint(
-                    effective_offset, len(entities), total, has_more, effective_limit, "task"
+                    effective_offset,
+                    len(entities),
+                    total,
+                    has_more,
+                    effective_limit,
+                    "task",
+                    next_cursor=next_cursor,
                 )
             elif fmt == "csv":
                 _output_tasks_csv(entities)
             else:
-                _output_tasks_table(entities, effective_offset, effective_limit, has_more, total)
+                _output_tasks_table(
+                    entities, effective_offset, effective_limit, has_more, total, next_cursor
+                )
 
         except SibylClientError as e:
             _handle_client_error(e)
@@ -967,6 +991,12 @@ def add_note(
 def list_notes(
     task_id: Annotated[str, typer.Argument(help="Task ID (full ID required)")],
     limit: Annotated[int, typer.Option("-n", "--limit", help="Max results")] = 20,
+    cursor: Annotated[
+        str | None,
+        typer.Option(
+            "--cursor", help="Keyset page cursor ('' for the first page, then the printed token)"
+        ),
+    ] = None,
     json_out: Annotated[
         bool, typer.Option("--json", "-j", help="JSON output (for scripting)")
     ] = False,
@@ -984,8 +1014,9 @@ def list_notes(
         try:
             resolved_id = _validate_task_id(task_id)
 
-            response = await client.list_notes(resolved_id, limit)
+            response = await client.list_notes(resolved_id, limit, cursor=cursor)
             notes = response.get("notes", [])
+            next_cursor = response.get("next_cursor")
 
             if json_out:
                 print_json(notes)
@@ -1011,7 +1042,10 @@ def list_notes(
                 console.print(f"[{color}]{author_display}[/{color}] [dim]{created_at}[/dim]")
                 console.print(f"  {note.get('content', '')}\n")
 
-            console.print(f"[dim]{len(notes)} note(s)[/dim]")
+            if next_cursor:
+                console.print(f"[dim]{len(notes)} note(s) (--cursor {next_cursor} for more)[/dim]")
+            else:
+                console.print(f"[dim]{len(notes)} note(s)[/dim]")
 
         except SibylClientError as e:
             _handle_client_error(e)
@@ -0,0 +1,108 @@
+"""Tests for the prompt hook search daemon."""
+
+import asyncio
+import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sibyl_cli import hook_daemon
+
+
+@pytest.fixture
+def client() -> Iterator[MagicMock]:
+    client = MagicMock()
+    client.search = AsyncMock(
+        return_value={"results": [{"name": "Pooling", "embedding": [0.1, 0.2]}], "total": 1}
+    )
+    client.close = AsyncMock()
+    with patch.object(hook_daemon, "get_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def sock_path() -> Iterator[Path]:
+    # Short path: Unix socket paths are limited to ~100 bytes
+    with tempfile.TemporaryDirectory(prefix="sibyl") as tmp:
+        yield Path(tmp) / "hook.sock"
+
+
+class TestHandle:
+    """Tests for request handling."""
+
+    async def test_search_resolves_project_from_cwd(self, client: MagicMock) -> None:
+        """Searches use the project linked to the hook's directory."""
+        daemon = hook_daemon.HookDaemon(Path("unused.sock"))
+        resolve = MagicMock(return_value="proj_1")
+        with patch.object(hook_daemon, "resolve_project_from_cwd", resolve):
+            response = await daemon.handle(
+                {"op": "search", "query": "pooling", "limit": 3, "cwd": "/repo"}
+            )
+
+        resolve.assert_called_once_with("/repo")
+        client.search.assert_awaited_once_with("pooling", limit=3, project="proj_1")
+        assert response == {"results": [{"name": "Pooling"}], "total": 1}
+
+    async def test_limit_capped(self, client: MagicMock) -> None:
+        """Oversized limits are capped."""
+        daemon = hook_daemon.HookDaemon(Path("unused.sock"))
+        await daemon.handle({"op": "search", "query": "pooling", "limit": 500})
+
+        assert client.search.await_args.kwargs["limit"] == hook_daemon.MAX_LIMIT
+
+    async def test_client_error_returned(self, client: MagicMock) -> None:
+        """API errors are answered, not raised."""
+        client.search.side_effect = hook_daemon.SibylClientError("API error: nope", status_code=401)
+        daemon = hook_daemon.HookDaemon(Path("unused.sock"))
+
+        response = await daemon.handle({"op": "search", "query": "pooling"})
+
+        assert response == {"error": "API error: nope", "status_code": 401}
+
+    async def test_invalid_requests(self, client: MagicMock) -> None:
+        """Missing queries and unknown ops are errors."""
+        daemon = hook_daemon.HookDaemon(Path("unused.sock"))
+
+        assert "error" in await daemon.handle({"op": "search", "query": "  "})
+        assert "error" in await daemon.handle({"op": "explode"})
+        assert await daemon.handle({"op": "ping"}) == {"ok": True}
+        client.search.assert_not_awaited()
+
+
+class TestServe:
+    """Tests for the Unix socket server."""
+
+    async def test_round_trip_and_shutdown(self, client: MagicMock, sock_path: Path) -> None:
+        """Requests are answered over the socket until shutdown."""
+        daemon = hook_daemon.HookDaemon(sock_path)
+        server = asyncio.create_task(daemon.serve())
+        while not sock_path.exists():
+            await asyncio.sleep(0.01)
+
+        with patch.dict(os.environ, {"SIBYL_HOOK_SOCKET": str(sock_path)}):
+            mode = stat.S_IMODE(sock_path.stat().st_mode)
+            pong = await asyncio.to_thread(hook_daemon.send_request, {"op": "ping"})
+            found = await asyncio.to_thread(
+                hook_daemon.send_request, {"op": "search", "query": "pooling"}
+            )
+            await asyncio.to_thread(hook_daemon.send_request, {"op": "shutdown"})
+
+        await asyncio.wait_for(server, timeout=5)
+
+        assert mode == 0o600
+        assert pong == {"ok": True}
+        assert found["results"] == [{"name": "Pooling"}]
+        assert not sock_path.exists()
+        client.close.assert_awaited_once()
+
+    async def test_exits_when_idle(self, client: MagicMock, sock_path: Path) -> None:
+        """The daemon exits after the idle timeout."""
+        daemon = hook_daemon.HookDaemon(sock_path, idle_timeout=0.05)
+
+        await asyncio.wait_for(daemon.serve(), timeout=5)
+
+        assert not sock_path.exists()
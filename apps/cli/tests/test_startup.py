@@ -0,0 +1,70 @@
+"""Startup cost regression tests for the CLI.
+
+Hooks and agents run one-shot commands like `sibyl search` hundreds of times
+per session, so importing the CLI must stay cheap. These tests check which
+modules a fresh interpreter has loaded after ``import sibyl_cli.main``;
+import timings live in ``benchmarks/bench_startup.py``.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from sibyl_cli.main import SUBCOMMANDS, app
+
+# Loaded only by the commands that need them
+DEFERRED_MODULES = ["httpx", "yaml", "structlog", "pydantic_settings", "rich.table"]
+
+
+def loaded_modules(module: str = "sibyl_cli.main") -> set[str]:
+    """Import ``module`` in a fresh interpreter; the names left in sys.modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules, sep='\\n')"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.fixture(scope="module")
+def startup() -> set[str]:
+    return loaded_modules()
+
+
+class TestStartup:
+    """Importing the CLI loads only what every command needs."""
+
+    def test_subcommand_modules_not_imported(self, startup: set[str]) -> None:
+        """Subcommand groups are imported only when invoked."""
+        modules = {target.split(":")[0] for target in SUBCOMMANDS.values()}
+        assert sorted(modules & startup) == []
+
+    def test_heavy_dependencies_deferred(self, startup: set[str]) -> None:
+        """Heavy dependencies are not imported at startup."""
+        assert "sibyl_cli.main" in startup
+        assert [m for m in DEFERRED_MODULES if m in startup] == []
+
+
+class TestLazySubcommands:
+    """Lazily registered groups behave like eagerly added ones."""
+
+    def test_help_lists_all_groups(self) -> None:
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in SUBCOMMANDS:
+            assert name in result.output
+
+    def test_group_loads_on_invoke(self) -> None:
+        result = CliRunner().invoke(app, ["task", "--help"])
+
+        assert result.exit_code == 0
+        assert "Task lifecycle management" in result.output
+
+    def test_unknown_command(self) -> None:
+        result = CliRunner().invoke(app, ["nope"])
+
+        assert result.exit_code != 0
@@ -37,6 +37,17 @@ export interface CrawlProgressPayload {
   chunks_created?: number;
   chunks_added?: number;
   errors?: number;
+  stages?: Record<string, CrawlStageProgress>;
+}
+
+export interface CrawlStageProgress {
+  workers: number;
+  processed: number;
+  failed: number;
+  in_flight: number;
+  backlog: number;
+  busy_seconds: number;
+  throughput: number;
 }
 
 export interface CrawlCompletePayload {
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Benchmark UserPromptSubmit hook latency end to end.
+
+Writes a synthetic session transcript and runs `user-prompt-submit.py` as
+Claude Code does (a fresh `python3` per prompt, hook input on stdin),
+reporting p50/p95 wall time for:
+
+- ``daemon``: searches through the `sibyl hook serve` socket (started here
+  if not already running, and stopped again afterwards).
+- ``cli``: the previous path, a `sibyl search` subprocess per prompt.
+
+Both runs need a reachable Sibyl server and a logged-in CLI. Haiku query
+generation is skipped (ANTHROPIC_API_KEY is unset for the hook) so the
+numbers measure the hook itself. Transcript parsing is also timed on its own
+against the previous full-file read.
+
+Usage:
+    python3 benchmarks/bench_prompt_hook.py
+    python3 benchmarks/bench_prompt_hook.py --runs 50 --transcript-mb 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HOOK = Path(__file__).resolve().parent.parent / "user-prompt-submit.py"
+
+PROMPT = "How should the graph client handle FalkorDB connection pooling under load?"
+
+
+def load_hook():
+    spec = importlib.util.spec_from_file_location("user_prompt_submit", HOOK)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_transcript(path: Path, size_mb: float) -> None:
+    filler = "tool output " * 400
+    with path.open("w", encoding="utf-8") as f:
+        i = 0
+        while f.tell() < size_mb * 1e6:
+            if i % 3 == 0:
+                entry = {"type": "tool_use", "name": "Edit", "input": {"file_path": f"src/mod_{i}.py"}}
+            else:
+                role = "user" if i % 2 else "assistant"
+                entry = {"type": "message", "role": role, "content": f"Message {i}: {filler}"}
+            f.write(json.dumps(entry) + "\n")
+            i += 1
+
+
+def percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return statistics.median(ordered), p95
+
+
+def report(label: str, samples: list[float]) -> None:
+    p50, p95 = percentiles(samples)
+    print(f"{label:22} p50 {p50 * 1000:8.1f} ms   p95 {p95 * 1000:8.1f} ms   (n={len(samples)})")
+
+
+def time_parse(transcript: Path, runs: int) -> None:
+    hook = load_hook()
+
+    def full_read() -> None:
+        lines = transcript.read_text().strip().split("\n")
+        for line in lines[-hook.TRANSCRIPT_TAIL_LINES :]:
+            json.loads(line)
+
+    for label, fn in (
+        ("parse (full read)", full_read),
+        ("parse (tail)", lambda: hook.parse_transcript(str(transcript))),
+    ):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        report(label, samples)
+
+
+def daemon_request(sock: Path, request: dict, timeout: float = 1.0) -> dict:
+    """Send one request to the daemon (same protocol as `sibyl hook`)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(sock))
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        with conn.makefile("rb") as response:
+            return json.loads(response.readline() or b"{}")
+
+
+def daemon_running(sock: Path) -> bool:
+    try:
+        return daemon_request(sock, {"op": "ping"}, timeout=0.5).get("ok") is True
+    except (OSError, ValueError):
+        return False
+
+
+def ensure_daemon(sock: Path, timeout: float = 15.0) -> bool:
+    """Start the daemon unless one is running; returns True if started here."""
+    if daemon_running(sock):
+        return False
+    subprocess.Popen(
+        ["sibyl", "hook", "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while not daemon_running(sock):
+        if time.monotonic() > deadline:
+            sys.exit(f"daemon did not start: no answer on {sock}")
+        time.sleep(0.1)
+    return True
+
+
+def stop_daemon(sock: Path) -> None:
+    with contextlib.suppress(OSError, ValueError):
+        daemon_request(sock, {"op": "shutdown"})
+
+
+def time_hook(transcript: Path, runs: int, use_daemon: bool) -> list[float]:
+    env = {k: v for k, v in os.environ.items() if k != "ANTHROPIC_API_KEY"}
+    env["SIBYL_HOOK_DAEMON"] = "1" if use_daemon else "0"
+    payload = json.dumps({"prompt": PROMPT, "transcript_path": str(transcript)})
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(HOOK)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--transcript-mb", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        transcript = Path(tmp) / "session.jsonl"
+        write_transcript(transcript, args.transcript_mb)
+        print(f"transcript: {transcript.stat().st_size / 1e6:.1f} MB")
+
+        time_parse(transcript, args.runs)
+
+        sock = load_hook().daemon_socket_path()
+        started = ensure_daemon(sock)
+        try:
+            time_hook(transcript, 2, use_daemon=True)  # Warm up the daemon's connection
+            report("hook (daemon)", time_hook(transcript, args.runs, use_daemon=True))
+            report("hook (cli subprocess)", time_hook(transcript, args.runs, use_daemon=False))
+        finally:
+            if started:
+                stop_daemon(sock)
+
+
+if __name__ == "__main__":
+    main()
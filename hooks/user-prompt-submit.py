@@ -5,19 +5,25 @@ Uses Haiku 4.5 to generate semantic search queries from conversation
 context, then injects relevant knowledge from Sibyl's graph.
 
 Architecture:
-  Hook Input → Transcript Parse → Haiku 4.5 (query gen) → Sibyl Search → Format → Output
+  Hook Input → Transcript Tail → Haiku 4.5 (query gen) → Sibyl Search → Format → Output
 
 Latency budget: <500ms total
-  - Transcript parse: <50ms
+  - Transcript parse: <50ms (reads only the tail of the JSONL)
   - Haiku 4.5: <250ms
-  - Sibyl search: <150ms
+  - Sibyl search: <150ms (via the `sibyl hook serve` daemon socket)
   - Format: <50ms
+
+Searches go to a long-lived `sibyl hook serve` process over a Unix socket,
+which keeps the CLI's auth and a warm API connection. The hook starts it when
+it is not running and falls back to `sibyl search` for that prompt.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import socket
 import subprocess
 import sys
 import time
@@ -30,6 +36,13 @@ MIN_PROMPT_LENGTH = 20
 # Maximum transcript messages to consider
 MAX_TRANSCRIPT_MESSAGES = 10
 
+# Transcript entries scanned for context (from the end of the file)
+TRANSCRIPT_TAIL_LINES = 50
+
+# Tail reading: chunk size, and a cap for transcripts with huge tool outputs
+TAIL_CHUNK_BYTES = 64 * 1024
+MAX_TAIL_BYTES = 4 * 1024 * 1024
+
 # Haiku model for query generation
 HAIKU_MODEL = "claude-haiku-4-5-20251001"
 
@@ -49,6 +62,34 @@ Current prompt: {prompt}
 Search query (or SKIP):"""
 
 
+def tail_lines(path: Path, max_lines: int, max_bytes: int = MAX_TAIL_BYTES) -> list[str]:
+    """Read the last ``max_lines`` lines of a file by seeking backwards from the end.
+
+    Session transcripts grow to tens of MB; only the tail is read, in
+    ``TAIL_CHUNK_BYTES`` chunks and at most ``max_bytes``. A line cut off by
+    the byte cap is dropped.
+    """
+    with path.open("rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        chunks: list[bytes] = []
+        newlines = 0
+        # One extra newline: the line before the tail must be complete
+        while pos > 0 and newlines <= max_lines and end - pos < max_bytes:
+            size = min(TAIL_CHUNK_BYTES, pos, max_bytes - (end - pos))
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(reversed(chunks)).decode("utf-8", errors="replace").split("\n")
+    if pos > 0:
+        lines = lines[1:]  # Partial first line
+    lines = [line for line in lines if line.strip()]
+    return lines[-max_lines:]
+
+
 def parse_transcript(transcript_path: str) -> dict[str, Any]:
     """Parse transcript JSONL to extract working context.
 
@@ -71,11 +112,8 @@ def parse_transcript(transcript_path: str) -> dict[str, Any]:
         if not path.exists():
             return context
 
-        # Read JSONL (each line is a JSON object)
-        lines = path.read_text().strip().split("\n")
-
-        # Process recent entries (last N)
-        for line in lines[-50:]:  # Look at last 50 entries for context
+        # Read JSONL (each line is a JSON object), last N entries only
+        for line in tail_lines(path, TRANSCRIPT_TAIL_LINES):
             try:
                 entry = json.loads(line)
             except json.JSONDecodeError:
@@ -232,6 +270,81 @@ def run_sibyl(*args: str, timeout: int = 4) -> str | None:
     return None
 
 
+def daemon_socket_path() -> Path:
+    """Socket of the `sibyl hook serve` daemon (matches the CLI's default)."""
+    override = os.environ.get("SIBYL_HOOK_SOCKET", "").strip()
+    return Path(override) if override else Path.home() / ".sibyl" / "hook.sock"
+
+
+def start_daemon() -> None:
+    """Start `sibyl hook serve` in the background, detached from this hook."""
+    # No CLI on PATH; search_sibyl falls back to `sibyl search`, which fails quietly
+    with contextlib.suppress(OSError):
+        subprocess.Popen(
+            ["sibyl", "hook", "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            cwd=Path.home(),
+        )
+
+
+def search_via_daemon(query: str, limit: int, timeout: float = 2.0) -> dict | None:
+    """Search through the daemon socket.
+
+    Returns:
+        The search response; an empty one if the daemon timed out or failed.
+        None only if no daemon is listening.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = daemon_socket_path()
+    request = {
+        "op": "search",
+        "query": query,
+        "limit": limit,
+        "cwd": os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as response:
+                data = json.loads(response.readline() or b"{}")
+    except (FileNotFoundError, ConnectionRefusedError):
+        # Not running (or died and left its socket): start it for the next prompt
+        start_daemon()
+        return None
+    except (OSError, json.JSONDecodeError):
+        # Timed out or broke mid-request; a CLI search would only be slower
+        return {}
+
+    if not isinstance(data, dict) or "error" in data:
+        if os.environ.get("SIBYL_HOOK_DEBUG") and isinstance(data, dict):
+            print(f"[sibyl-hook] daemon error: {data['error']}", file=sys.stderr)
+        return {}
+    return data
+
+
+def search_sibyl(query: str, limit: int = 3) -> list[dict]:
+    """Search Sibyl through the daemon, or the CLI when no daemon is running."""
+    if os.environ.get("SIBYL_HOOK_DAEMON", "1") != "0":
+        data = search_via_daemon(query, limit)
+        if data is not None:
+            return data.get("results", [])
+
+    output = run_sibyl("search", query, "--limit", str(limit), "-j", timeout=3)
+    if not output:
+        return []
+    try:
+        return json.loads(output).get("results", [])
+    except json.JSONDecodeError:
+        return []
+
+
 def fallback_extract_terms(prompt: str) -> str | None:
     """Fallback: extract search terms without LLM (original logic)."""
     import re
@@ -365,17 +478,7 @@ def main():
             sys.exit(0)
 
         # Search Sibyl (target: <150ms)
-        output = run_sibyl("search", search_query, "--limit", "3", "-j", timeout=3)
-        if not output:
-            sys.exit(0)
-
-        # Parse results
-        try:
-            search_data = json.loads(output)
-            results = search_data.get("results", [])
-        except json.JSONDecodeError:
-            sys.exit(0)
-
+        results = search_sibyl(search_query, limit=3)
         if not results:
             sys.exit(0)
 
@@ -0,0 +1,141 @@
+"""Benchmark the inverted BM25 index against the exhaustive scorer.
+
+The exhaustive scorer reproduces the previous ``BM25Index`` behaviour: every
+query scores every document, and every add recomputes the average document
+length from scratch. Its build cost is quadratic, so it is only built up to
+``--legacy-max`` documents; above that only its query cost is measured, by
+scoring every document of the inverted index.
+
+Usage:
+    uv run python benchmarks/bench_bm25.py
+    uv run python benchmarks/bench_bm25.py --sizes 10000 100000 --queries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+
+import structlog
+
+from sibyl_core.retrieval.bm25 import BM25Index, tokenize
+
+VOCABULARY_SIZE = 50_000
+WORDS_PER_DOC = (8, 40)
+
+
+class ExhaustiveBM25(BM25Index):
+    """Previous behaviour: O(N) add bookkeeping and O(N) search."""
+
+    def add(self, entity: dict[str, str]) -> str:
+        entity_id = super().add(entity)
+        # The old index summed every document length on each add
+        self._legacy_avg = sum(self._doc_lengths.values()) / max(self._total_docs, 1)
+        return entity_id
+
+    def search(
+        self, query: str, limit: int = 10, min_score: float = 0.0
+    ) -> list[tuple[dict[str, str], float]]:
+        query_terms = tokenize(query, self.config.min_token_length, self.config.stop_words)
+        scores = []
+        for entity_id in self._entities:
+            score = self._score_document(entity_id, query_terms)
+            if score > min_score:
+                scores.append((entity_id, score))
+        scores.sort(key=lambda x: x[1], reverse=True)
+        return [(self._entities[d], s) for d, s in scores[:limit]]
+
+
+def make_corpus(size: int, rng: random.Random) -> list[dict[str, str]]:
+    """Generate documents with a Zipfian term distribution."""
+    vocab = [f"term{i}" for i in range(VOCABULARY_SIZE)]
+    weights = [1.0 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    docs = []
+    for i in range(size):
+        words = rng.choices(vocab, weights, k=rng.randint(*WORDS_PER_DOC))
+        docs.append({"id": f"doc_{i}", "name": " ".join(words)})
+    return docs
+
+
+def make_queries(count: int, rng: random.Random) -> list[str]:
+    """Mix of common, mid-frequency and rare terms, 1-4 terms per query."""
+    queries = []
+    for _ in range(count):
+        terms = [
+            f"term{int(rng.paretovariate(0.6)) % VOCABULARY_SIZE}" for _ in range(rng.randint(1, 4))
+        ]
+        queries.append(" ".join(terms))
+    return queries
+
+
+def time_queries(
+    search: Callable[[str, int], object], queries: list[str], limit: int
+) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query, limit)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def fmt(timings: list[float]) -> str:
+    if not timings:
+        return "-"
+    p95 = sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    return f"p50 {statistics.median(timings):9.2f} ms  p95 {p95:9.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--legacy-max", type=int, default=20_000)
+    parser.add_argument("--legacy-queries", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+    rng = random.Random(args.seed)
+    queries = make_queries(args.queries, rng)
+
+    for size in args.sizes:
+        docs = make_corpus(size, rng)
+        print(f"\n== {size:,} documents ==")
+
+        index = BM25Index()
+        start = time.perf_counter()
+        for doc in docs:
+            index.add(doc)
+        build = time.perf_counter() - start
+        print(
+            f"inverted   build {build:8.2f} s   search {fmt(time_queries(index.search, queries, args.limit))}"
+        )
+
+        legacy_queries = queries[: args.legacy_queries]
+        if size <= args.legacy_max:
+            legacy = ExhaustiveBM25()
+            start = time.perf_counter()
+            for doc in docs:
+                legacy.add(doc)
+            build = time.perf_counter() - start
+            print(
+                f"exhaustive build {build:8.2f} s   search {fmt(time_queries(legacy.search, legacy_queries, args.limit))}"
+            )
+        else:
+            # Reuse the inverted index's structures; only the full scan is measured
+            scan = partial(ExhaustiveBM25.search, index)
+            print(
+                f"exhaustive build  skipped      search {fmt(time_queries(scan, legacy_queries, args.limit))}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark bulk relationship creation.
+
+Creates a chain of synthetic Entity nodes in a throwaway org graph in a
+running FalkorDB (configured through the usual SIBYL_* settings) and links
+them with RELATED_TO edges, timing:
+
+- ``bulk``: `RelationshipManager.create_bulk`, labelled UNWIND batches.
+- ``bulk (existing)``: the same call again, where every edge already exists.
+- ``per-edge``: the previous approach, one `create` per edge, timed on a
+  sample and extrapolated.
+
+The graph is deleted afterwards.
+
+Usage:
+    uv run python benchmarks/bench_bulk_relationships.py
+    uv run python benchmarks/bench_bulk_relationships.py --edges 200000 --batch-size 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+import structlog
+
+from sibyl_core.graph.batch import batch_create_nodes
+from sibyl_core.graph.client import get_graph_client
+from sibyl_core.graph.relationships import RelationshipManager
+from sibyl_core.models.entities import Relationship, RelationshipType
+
+NODE_BATCH = 5000
+
+
+def make_edges(count: int, prefix: str) -> list[Relationship]:
+    return [
+        Relationship(
+            id=f"{prefix}_rel_{i:07d}",
+            relationship_type=RelationshipType.RELATED_TO,
+            source_id=f"bench_{i:07d}",
+            target_id=f"bench_{i + 1:07d}",
+        )
+        for i in range(count)
+    ]
+
+
+async def create_nodes(group_id: str, count: int) -> None:
+    client = await get_graph_client()
+    for start in range(0, count, NODE_BATCH):
+        nodes = [
+            {"uuid": f"bench_{i:07d}", "name": f"Entity {i}", "entity_type": "topic"}
+            for i in range(start, min(start + NODE_BATCH, count))
+        ]
+        await batch_create_nodes(client, group_id, nodes, return_ids=False)
+
+
+async def drop_graph(group_id: str) -> None:
+    client = await get_graph_client()
+    await client.execute_write_org(
+        "MATCH (n) WHERE n.group_id = $group_id DETACH DELETE n", group_id, group_id=group_id
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    client = await get_graph_client()
+    group_id = f"bench_rels_{uuid.uuid4().hex[:8]}"
+
+    try:
+        await client.ensure_indexes(group_id)
+        await create_nodes(group_id, args.edges + 1)
+        manager = RelationshipManager(client, group_id=group_id)
+        edges = make_edges(args.edges, "bulk")
+
+        for label in ("bulk", "bulk (existing)"):
+            start = time.perf_counter()
+            result = await manager.create_bulk(edges, batch_size=args.batch_size)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:16} {elapsed:8.1f} s   {args.edges / elapsed:8.0f} edges/s   "
+                f"(created {result.created:,}, existing {result.existing:,}, "
+                f"failed {result.failed:,})"
+            )
+
+        # Fresh edge type so the sample isn't short-circuited by existing edges
+        sample = [
+            edge.model_copy(update={"relationship_type": RelationshipType.REQUIRES})
+            for edge in make_edges(args.sample, "single")
+        ]
+        start = time.perf_counter()
+        for edge in sample:
+            await manager.create(edge)
+        per_edge = (time.perf_counter() - start) / args.sample
+        print(
+            f"{'per-edge':16} {per_edge * args.edges:8.1f} s   {1 / per_edge:8.0f} edges/s   "
+            f"(extrapolated from {args.sample:,})"
+        )
+    finally:
+        await drop_graph(group_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark list_by_type page latency as the number of tasks grows.
+
+Seeds a throwaway org graph in a running FalkorDB (configured through the
+usual SIBYL_* settings) with tasks in batches, and after each batch times:
+
+- ``list_by_type``: filters, ordering and SKIP/LIMIT run in Cypher.
+- ``legacy``: the previous approach, which fetched every task of the org and
+  parsed each node's metadata JSON to filter and paginate in Python.
+
+The graph is deleted afterwards.
+
+Usage:
+    uv run python benchmarks/bench_list_by_type.py
+    uv run python benchmarks/bench_list_by_type.py --sizes 1000 10000 50000 --repeat 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from sibyl_core.graph.batch import batch_create_nodes
+from sibyl_core.graph.client import GraphClient, get_graph_client
+from sibyl_core.graph.entities import EntityManager
+from sibyl_core.models.entities import EntityType
+
+STATUSES = ["backlog", "todo", "doing", "blocked", "review", "done", "archived"]
+PRIORITIES = ["critical", "high", "medium", "low", "someday"]
+SEED_BATCH = 1000
+
+
+def make_tasks(start: int, count: int, rng: random.Random) -> list[dict[str, object]]:
+    """Task nodes carrying both the metadata JSON and promoted filter properties."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    nodes = []
+    for i in range(start, start + count):
+        fields = {
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(PRIORITIES),
+            "project_id": f"project_{i % 20}",
+            "tags": rng.sample(["backend", "frontend", "infra", "docs", "auth"], 2),
+        }
+        nodes.append(
+            {
+                "uuid": f"task_{i:07d}",
+                "name": f"Task {i}",
+                "entity_type": EntityType.TASK.value,
+                "description": f"Benchmark task {i}",
+                "content": "",
+                "created_at": (base + timedelta(minutes=i)).isoformat(),
+                "metadata": json.dumps(fields),
+                **fields,
+            }
+        )
+    return nodes
+
+
+async def legacy_list_tasks(
+    client: GraphClient, group_id: str, *, status: str, limit: int
+) -> list[dict[str, object]]:
+    """Previous behaviour: unbounded fetch, then JSON parsing and filtering in Python."""
+    records = await client.execute_read_org(
+        """
+        MATCH (n)
+        WHERE n.entity_type = $entity_type
+          AND n.group_id = $group_id
+        RETURN n.uuid AS uuid, n.name AS name, n.metadata AS metadata,
+               n.created_at AS created_at
+        ORDER BY n.created_at DESC
+        """,
+        group_id,
+        entity_type=EntityType.TASK.value,
+        group_id=group_id,
+    )
+    page = []
+    for record in records:
+        metadata = json.loads(record.get("metadata") or "{}")
+        if metadata.get("status") != status:
+            continue
+        page.append(record)
+        if len(page) >= limit:
+            break
+    return page
+
+
+async def time_calls(fn: Callable[[], Awaitable[object]], repeat: int) -> list[float]:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def fmt(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered):8.2f} ms   p95 {p95:8.2f} ms"
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    client = await get_graph_client()
+    group_id = f"bench_list_{uuid.uuid4().hex[:8]}"
+    manager = EntityManager(client, group_id=group_id)
+    await client.ensure_indexes(group_id)
+
+    seeded = 0
+    try:
+        for size in sorted(args.sizes):
+            while seeded < size:
+                count = min(SEED_BATCH, size - seeded)
+                await batch_create_nodes(
+                    client, group_id, make_tasks(seeded, count, rng), return_ids=False
+                )
+                seeded += count
+
+            print(f"\n== {size:,} tasks ==")
+            pushed = await time_calls(
+                lambda: manager.list_by_type(EntityType.TASK, status="todo", limit=args.limit),
+                args.repeat,
+            )
+            print(f"list_by_type  {fmt(pushed)}")
+            legacy = await time_calls(
+                lambda: legacy_list_tasks(client, group_id, status="todo", limit=args.limit),
+                args.repeat,
+            )
+            print(f"legacy        {fmt(legacy)}")
+    finally:
+        await client.execute_write_org(
+            "MATCH (n) WHERE n.group_id = $group_id DETACH DELETE n", group_id, group_id=group_id
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark graph backup restore throughput.
+
+Writes a synthetic NDJSON backup (entities plus a chain of RELATED_TO
+relationships) and restores it into a throwaway org graph in a running
+FalkorDB (configured through the usual SIBYL_* settings), timing:
+
+- ``stream``: `restore_backup_stream`, batched UNWIND writes with checkpoints.
+  Includes one embedder call per batch through the configured embedder.
+- ``per-entity``: the previous approach, one existence check and one node
+  write per entity, timed on a sample and extrapolated. It is a lower bound:
+  the old restore went through ``EntityManager.create``, which also ran LLM
+  extraction for every entity.
+
+The graphs are deleted afterwards.
+
+Usage:
+    uv run python benchmarks/bench_restore_backup.py
+    uv run python benchmarks/bench_restore_backup.py --entities 100000 --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import structlog
+
+from sibyl_core.graph.client import get_graph_client
+from sibyl_core.graph.entities import EntityManager
+from sibyl_core.models.entities import Entity, EntityType, Relationship, RelationshipType
+from sibyl_core.tools.admin import read_backup_ndjson, restore_backup_stream
+
+TYPES = [EntityType.PATTERN, EntityType.TASK, EntityType.EPISODE, EntityType.TOPIC]
+
+
+def make_entity(i: int) -> Entity:
+    return Entity(
+        id=f"bench_{i:07d}",
+        entity_type=TYPES[i % len(TYPES)],
+        name=f"Entity {i}",
+        description=f"Benchmark entity {i} " + "lorem ipsum " * 10,
+        metadata={"tags": ["bench", f"group_{i % 50}"]},
+    )
+
+
+def write_backup(path: Path, entities: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps({"kind": "header", "version": "3.0"}) + "\n")
+        for i in range(entities):
+            record = {"kind": "entity", "data": make_entity(i).model_dump(mode="json")}
+            f.write(json.dumps(record) + "\n")
+        for i in range(entities - 1):
+            rel = Relationship(
+                id=f"bench_rel_{i:07d}",
+                relationship_type=RelationshipType.RELATED_TO,
+                source_id=f"bench_{i:07d}",
+                target_id=f"bench_{i + 1:07d}",
+            )
+            f.write(json.dumps({"kind": "relationship", "data": rel.model_dump(mode="json")}))
+            f.write("\n")
+        footer = {"kind": "footer", "entity_count": entities, "relationship_count": entities - 1}
+        f.write(json.dumps(footer) + "\n")
+
+
+async def per_entity_restore(manager: EntityManager, count: int) -> float:
+    """Seconds per entity for the previous get-then-create loop."""
+    start = time.perf_counter()
+    for i in range(count):
+        entity = make_entity(i)
+        try:
+            await manager.get(entity.id)
+        except Exception:
+            await manager.create_direct(entity, generate_embedding=False)
+    return (time.perf_counter() - start) / count
+
+
+async def drop_graph(group_id: str) -> None:
+    client = await get_graph_client()
+    await client.execute_write_org(
+        "MATCH (n) WHERE n.group_id = $group_id DETACH DELETE n", group_id, group_id=group_id
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    client = await get_graph_client()
+    stream_org = f"bench_restore_{uuid.uuid4().hex[:8]}"
+    legacy_org = f"bench_restore_{uuid.uuid4().hex[:8]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backup = Path(tmp) / "graph.ndjson"
+        write_backup(backup, args.entities)
+        size_mb = backup.stat().st_size / 1e6
+        print(f"backup: {args.entities:,} entities, {size_mb:.1f} MB")
+
+        try:
+            await client.ensure_indexes(stream_org)
+            start = time.perf_counter()
+            result = await restore_backup_stream(
+                read_backup_ndjson(backup),
+                organization_id=stream_org,
+                batch_size=args.batch_size,
+                checkpoint_path=Path(tmp) / "restore.checkpoint",
+            )
+            elapsed = time.perf_counter() - start
+            if not result.success:
+                print(f"restore reported errors: {result.errors[:3]}")
+            rate = result.entities_restored / elapsed
+            print(
+                f"stream      {elapsed:8.1f} s   {rate:8.0f} entities/s   "
+                f"({result.entities_restored:,} entities, "
+                f"{result.relationships_restored:,} relationships)"
+            )
+
+            await client.ensure_indexes(legacy_org)
+            manager = EntityManager(client, group_id=legacy_org)
+            per_entity = await per_entity_restore(manager, args.sample)
+            estimate = per_entity * args.entities
+            print(
+                f"per-entity  {estimate:8.1f} s   {1 / per_entity:8.0f} entities/s   "
+                f"(extrapolated from {args.sample:,}, entities only)"
+            )
+        finally:
+            await drop_graph(stream_org)
+            await drop_graph(legacy_org)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,9 @@ This package provides:
 - Auth primitives (JWT, password hashing)
 """
 
+from typing import TYPE_CHECKING
+
 from sibyl_core._version import __version__, get_version
-from sibyl_core.config import CoreConfig, core_config
 from sibyl_core.errors import (
     ConventionsMCPError,
     EntityCreationError,
@@ -25,6 +26,19 @@ from sibyl_core.errors import (
     ValidationError,
 )
 
+if TYPE_CHECKING:
+    from sibyl_core.config import CoreConfig, core_config
+
+
+def __getattr__(name: str) -> object:
+    # Settings load lazily: light consumers (the CLI's color palette) skip pydantic
+    if name in ("CoreConfig", "core_config"):
+        from sibyl_core import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Errors
     "ConventionsMCPError",
@@ -100,6 +100,34 @@ class CoreConfig(BaseSettings):
         le=50,
         description="Graphiti concurrent LLM operations limit (controls SEMAPHORE_LIMIT)",
     )
+    embedding_cache_size: int = Field(
+        default=2048,
+        ge=0,
+        description="Query embeddings kept in the in-process cache",
+    )
+    embedding_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        gt=0,
+        description="Lifetime of cached query embeddings",
+    )
+    embedding_cache_redis: bool = Field(
+        default=False,
+        description="Share cached query embeddings across processes through Redis",
+    )
+    community_cache_redis: bool = Field(
+        default=False,
+        description="Share detected graph communities across processes through Redis",
+    )
+    bm25_max_org_indexes: int = Field(
+        default=128,
+        ge=1,
+        description="Per-organization BM25 indexes kept in process (least recently used go first)",
+    )
+    bm25_index_ttl_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Idle time after which an organization's BM25 index is dropped",
+    )
 
     # Ingestion configuration
     chunk_max_tokens: int = Field(
@@ -4,6 +4,7 @@ from sibyl_core.graph.batch import (
     batch_create_nodes,
     batch_create_relationships,
     batch_delete_nodes,
+    batch_set_embeddings,
     batch_update_nodes,
 )
 from sibyl_core.graph.client import GraphClient, get_graph_client, reset_graph_client
@@ -17,6 +18,7 @@ __all__ = [
     "batch_create_nodes",
     "batch_create_relationships",
     "batch_delete_nodes",
+    "batch_set_embeddings",
     "batch_update_nodes",
     "get_graph_client",
     "reset_graph_client",
@@ -136,6 +136,7 @@ async def batch_create_relationships(
     relationships: list[dict[str, Any]],
     *,
     rel_type: str = "RELATES_TO",
+    label: str | None = None,
 ) -> int:
     """Create multiple relationships in a single UNWIND query.
 
@@ -147,6 +148,8 @@ async def batch_create_relationships(
             - to_uuid: Target node UUID
             - properties: Optional dict of relationship properties
         rel_type: Relationship type (default: "RELATES_TO")
+        label: Optional label of both endpoints. Lets the lookups use the
+            label's uuid index instead of scanning every node.
 
     Returns:
         Number of relationships created.
@@ -181,10 +184,11 @@ async def batch_create_relationships(
 
     # UNWIND for batch relationship creation
     # MATCH finds both nodes, MERGE creates the relationship
+    label_clause = f":{label}" if label else ""
     query = f"""
         UNWIND $rels AS rel
-        MATCH (from {{uuid: rel.from_uuid}})
-        MATCH (to {{uuid: rel.to_uuid}})
+        MATCH (from{label_clause} {{uuid: rel.from_uuid}})
+        MATCH (to{label_clause} {{uuid: rel.to_uuid}})
         MERGE (from)-[r:{rel_type}]->(to)
         SET r += rel.properties
         RETURN count(r) AS created
@@ -272,6 +276,52 @@ async def batch_update_nodes(
         raise
 
 
+async def batch_set_embeddings(
+    client: GraphClient,
+    organization_id: str,
+    embeddings: dict[str, list[float]],
+    *,
+    label: str = "Entity",
+) -> int:
+    """Set ``name_embedding`` on multiple nodes in a single UNWIND query.
+
+    Vectors are cast with ``vecf32()``, as FalkorDB's vector index and
+    ``vec.cosineDistance`` reject plain lists.
+
+    Args:
+        client: GraphClient instance.
+        organization_id: Org UUID for graph scoping.
+        embeddings: Node UUID -> embedding vector.
+        label: Label to match the nodes on (uses its uuid index).
+
+    Returns:
+        Number of nodes updated.
+    """
+    if not embeddings:
+        return 0
+
+    rows = [{"uuid": uuid, "embedding": vector} for uuid, vector in embeddings.items()]
+    query = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{uuid: row.uuid}})
+        SET n.name_embedding = vecf32(row.embedding)
+        RETURN count(n) AS updated
+    """
+
+    try:
+        result = await client.execute_write_org(query, organization_id, rows=rows)
+        return result[0]["updated"] if result else 0
+
+    except Exception as e:
+        log.error(
+            "batch_set_embeddings failed",
+            org_id=organization_id,
+            node_count=len(rows),
+            error=str(e),
+        )
+        raise
+
+
 async def batch_delete_nodes(
     client: GraphClient,
     organization_id: str,
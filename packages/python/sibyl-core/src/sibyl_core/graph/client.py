@@ -215,8 +215,17 @@ class GraphClient:
             if openai_key and not os.getenv("OPENAI_API_KEY"):
                 os.environ["OPENAI_API_KEY"] = openai_key
 
+            # Query embeddings go through the shared embedding cache
+            from graphiti_core.embedder.openai import OpenAIEmbedder
+
+            from sibyl_core.retrieval.embedding_cache import CachingEmbedder
+
             # Initialize Graphiti with the driver and LLM client
-            self._client = Graphiti(graph_driver=driver, llm_client=llm_client)
+            self._client = Graphiti(
+                graph_driver=driver,
+                llm_client=llm_client,
+                embedder=CachingEmbedder(OpenAIEmbedder()),
+            )
             self._connected = True
             log.info("Connected to FalkorDB successfully", llm_provider=settings.llm_provider)
 
@@ -431,6 +440,10 @@ class GraphClient:
             "CREATE INDEX FOR (n:Entity) ON (n.entity_type)",
             # Episodic node type filtering
             "CREATE INDEX FOR (n:Episodic) ON (n.entity_type)",
+            # Remaining list_by_type filter properties (see entities.FILTER_PROPERTIES)
+            "CREATE INDEX FOR (n:Entity) ON (n.priority, n.complexity, n.feature, n.epic_id)",
+            "CREATE INDEX FOR (n:Episodic) ON (n.project_id, n.status, n.priority)",
+            "CREATE INDEX FOR (n:Episodic) ON (n.complexity, n.feature, n.epic_id)",
         ]
         for idx_query in composite_indexes:
             try:
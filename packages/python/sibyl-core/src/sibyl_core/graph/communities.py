@@ -2,19 +2,36 @@
 
 Detects hierarchical communities in the knowledge graph for
 GraphRAG-style retrieval and summarization.
+
+The graph is exported as a compact CSR edge array and the algorithm runs in
+a worker process, so detection never blocks the event loop. Visualization
+results are shared across processes through Redis and re-clustered
+incrementally, seeded with the previous partition, when the graph changes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import itertools
+import json
+import multiprocessing
 import uuid
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from sibyl_core.config import core_config
+
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
     from sibyl_core.graph.client import GraphClient
 
 log = structlog.get_logger()
@@ -23,12 +40,21 @@ log = structlog.get_logger()
 # Cluster Cache for Visualization
 # =============================================================================
 
-CLUSTER_CACHE: dict[str, tuple[datetime, list[ClusterSummary]]] = {}
-CLUSTER_CACHE_TTL = timedelta(minutes=5)
+# Cluster summaries per org, keyed by the community result version they came from
+CLUSTER_CACHE: dict[str, tuple[str, list[ClusterSummary]]] = {}
+
+# Re-cluster after this long even if the graph's node and edge counts are unchanged
+CLUSTER_CACHE_TTL = timedelta(minutes=30)
+
+# Redis database for shared community results (2 = pubsub, 3 = locks, 4 = embeddings)
+COMMUNITY_CACHE_DB = 5
+_REDIS_PREFIX = "sibyl:communities:"
 
-# Cache for hierarchical graph community detection (expensive operation)
-HIERARCHICAL_CACHE: dict[str, tuple[datetime, dict[str, str], list[dict]]] = {}
-HIERARCHICAL_CACHE_TTL = timedelta(minutes=5)
+# Seconds one process may hold an org's recompute lock
+_RECOMPUTE_LOCK_SECONDS = 300
+
+# Worker processes running community detection
+COMMUNITY_DETECTION_WORKERS = 1
 
 
 @dataclass
@@ -59,54 +85,38 @@ async def get_clusters_for_visualization(
 ) -> list[ClusterSummary]:
     """Get clusters optimized for bubble visualization.
 
-    Uses caching to avoid expensive community detection on every request.
+    Communities come from the shared result of `get_visualization_communities`;
+    the summaries built from them are cached per result version.
 
     Args:
         client: Graph client.
         organization_id: Organization UUID.
-        force_refresh: Bypass cache and recompute.
+        force_refresh: Bypass cache and recompute from scratch.
 
     Returns:
         List of ClusterSummary objects for visualization.
     """
-    cache_key = organization_id
-
-    # Check cache
-    if not force_refresh and cache_key in CLUSTER_CACHE:
-        cached_at, clusters = CLUSTER_CACHE[cache_key]
-        if datetime.now(UTC) - cached_at < CLUSTER_CACHE_TTL:
-            log.debug("cluster_cache_hit", org_id=organization_id, count=len(clusters))
-            return clusters
-
-    log.info("cluster_cache_miss", org_id=organization_id)
-
-    # Run community detection
     try:
-        detected = await detect_communities(
-            client,
-            organization_id,
-            config=CommunityConfig(
-                resolutions=[1.0],  # Single level for now
-                min_community_size=2,
-                max_levels=1,
-                store_in_graph=False,  # Don't persist, just visualize
-            ),
-            algorithm="louvain",
+        result: CommunityResult | None = await get_visualization_communities(
+            client, organization_id, force_refresh=force_refresh
         )
     except ImportError:
         # Fallback: Group by entity type if networkx not available
         log.warning("networkx_not_available", msg="falling back to type-based clustering")
-        detected = []
+        result = None
 
-    if not detected:
+    if result is None or not result.communities:
         # Fallback: Create pseudo-clusters by entity type
-        clusters = await _create_type_based_clusters(client, organization_id)
-    else:
-        # Convert DetectedCommunity to ClusterSummary
-        clusters = await _enrich_cluster_summaries(client, organization_id, detected)
+        return await _create_type_based_clusters(client, organization_id)
 
-    # Cache result
-    CLUSTER_CACHE[cache_key] = (datetime.now(UTC), clusters)
+    cached = CLUSTER_CACHE.get(organization_id)
+    if cached is not None and cached[0] == result.version:
+        log.debug("cluster_cache_hit", org_id=organization_id, count=len(cached[1]))
+        return cached[1]
+
+    # Convert DetectedCommunity to ClusterSummary
+    clusters = await _enrich_cluster_summaries(client, organization_id, result.communities)
+    CLUSTER_CACHE[organization_id] = (result.version, clusters)
     log.info("cluster_cache_updated", org_id=organization_id, count=len(clusters))
 
     return clusters
@@ -308,31 +318,253 @@ async def get_cluster_nodes(
 
 
 def invalidate_cluster_cache(organization_id: str | None = None) -> None:
-    """Invalidate cluster cache for an organization or all.
+    """Mark cached communities stale so the next read re-clusters.
+
+    The previous partition is kept to seed the incremental recompute. Other
+    processes pick up graph changes through the node and edge count check.
 
     Args:
         organization_id: Specific org to invalidate, or None for all.
     """
     if organization_id:
         CLUSTER_CACHE.pop(organization_id, None)
+        _stale_orgs.add(organization_id)
         log.debug("cluster_cache_invalidated", org_id=organization_id)
     else:
         CLUSTER_CACHE.clear()
+        _stale_orgs.update(_community_results)
         log.debug("cluster_cache_cleared")
 
 
 def invalidate_hierarchical_cache(organization_id: str | None = None) -> None:
     """Invalidate hierarchical graph cache for an organization or all.
 
+    The hierarchical graph and the cluster bubbles share one community
+    result, so this is the same as `invalidate_cluster_cache`.
+
     Args:
         organization_id: Specific org to invalidate, or None for all.
     """
-    if organization_id:
-        HIERARCHICAL_CACHE.pop(organization_id, None)
-        log.debug("hierarchical_cache_invalidated", org_id=organization_id)
-    else:
-        HIERARCHICAL_CACHE.clear()
-        log.debug("hierarchical_cache_cleared")
+    invalidate_cluster_cache(organization_id)
+
+
+# =============================================================================
+# Shared Community Results
+# =============================================================================
+
+
+@dataclass
+class CommunityResult:
+    """Visualization communities for one organization, shared through Redis.
+
+    Attributes:
+        version: New on every recompute; derived caches key on it.
+        fingerprint: (node count, edge count) of the graph it was computed from.
+        computed_at: When detection ran.
+        communities: Detected communities.
+        partitions: Node -> community number per level; seeds the next recompute.
+    """
+
+    version: str
+    fingerprint: tuple[int, int]
+    computed_at: datetime
+    communities: list[DetectedCommunity]
+    partitions: list[dict[str, int]]
+
+    def is_fresh(self, fingerprint: tuple[int, int]) -> bool:
+        """Whether the graph is unchanged and the result younger than the TTL."""
+        return (
+            self.fingerprint == fingerprint
+            and datetime.now(UTC) - self.computed_at < CLUSTER_CACHE_TTL
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": self.version,
+                "fingerprint": list(self.fingerprint),
+                "computed_at": self.computed_at.isoformat(),
+                "communities": [asdict(c) for c in self.communities],
+                "partitions": self.partitions,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> CommunityResult:
+        data = json.loads(raw)
+        nodes, edges = data["fingerprint"]
+        return cls(
+            version=data["version"],
+            fingerprint=(nodes, edges),
+            computed_at=datetime.fromisoformat(data["computed_at"]),
+            communities=[DetectedCommunity(**c) for c in data["communities"]],
+            partitions=data["partitions"],
+        )
+
+
+# Latest known result per org, and orgs invalidated locally since
+_community_results: dict[str, CommunityResult] = {}
+_stale_orgs: set[str] = set()
+_recompute_locks: dict[str, asyncio.Lock] = {}
+_redis: Redis | None = None
+
+
+def _visualization_config() -> CommunityConfig:
+    # Single level, not persisted
+    return CommunityConfig(
+        resolutions=[1.0], min_community_size=2, max_levels=1, store_in_graph=False
+    )
+
+
+def _get_redis() -> Redis | None:
+    global _redis
+    if _redis is None and core_config.community_cache_redis:
+        from redis.asyncio import Redis
+
+        _redis = Redis(
+            host=core_config.falkordb_host,
+            port=core_config.falkordb_port,
+            password=core_config.falkordb_password or None,
+            db=COMMUNITY_CACHE_DB,
+            socket_timeout=2.0,
+            socket_connect_timeout=0.5,
+        )
+    return _redis
+
+
+async def _load_shared_result(organization_id: str) -> CommunityResult | None:
+    redis = _get_redis()
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(_REDIS_PREFIX + organization_id)
+        return CommunityResult.from_json(raw) if raw else None
+    except Exception as e:
+        log.debug("community_cache_redis_get_failed", error=str(e))
+        return None
+
+
+async def _store_shared_result(organization_id: str, result: CommunityResult) -> None:
+    redis = _get_redis()
+    if redis is None:
+        return
+    try:
+        # Outlive the TTL so a stale result can still seed the next recompute
+        expiry = int(CLUSTER_CACHE_TTL.total_seconds()) * 4
+        await redis.set(_REDIS_PREFIX + organization_id, result.to_json(), ex=expiry)
+    except Exception as e:
+        log.debug("community_cache_redis_set_failed", error=str(e))
+
+
+async def _acquire_recompute_lock(organization_id: str) -> bool:
+    """Claim an org's recompute across processes; True without Redis."""
+    redis = _get_redis()
+    if redis is None:
+        return True
+    try:
+        key = f"{_REDIS_PREFIX}lock:{organization_id}"
+        return bool(await redis.set(key, "1", nx=True, ex=_RECOMPUTE_LOCK_SECONDS))
+    except Exception as e:
+        log.debug("community_cache_redis_lock_failed", error=str(e))
+        return True
+
+
+async def _release_recompute_lock(organization_id: str) -> None:
+    redis = _get_redis()
+    if redis is None:
+        return
+    with contextlib.suppress(Exception):
+        await redis.delete(f"{_REDIS_PREFIX}lock:{organization_id}")
+
+
+async def get_visualization_communities(
+    client: GraphClient,
+    organization_id: str,
+    *,
+    force_refresh: bool = False,
+    totals: tuple[int, int] | None = None,
+) -> CommunityResult:
+    """Get an organization's visualization communities, re-clustering only on change.
+
+    A result is reused while the graph's node and edge counts match the ones
+    it was computed from and it is younger than ``CLUSTER_CACHE_TTL``. Results
+    live in process memory and in Redis, so every API process shares one
+    computation. A recompute is seeded with the previous partition, which
+    makes re-clustering after small changes much cheaper than starting over.
+    While another process holds the recompute lock, its last result is served.
+
+    Args:
+        client: Graph client.
+        organization_id: Organization UUID.
+        force_refresh: Recompute from scratch, ignoring cached results.
+        totals: Org-wide (node count, edge count), if the caller already has them.
+
+    Returns:
+        The current CommunityResult.
+
+    Raises:
+        ImportError: If networkx or the community algorithm is not installed.
+    """
+    fingerprint = totals or await _get_graph_totals(client, organization_id)
+    known = _community_results.get(organization_id)
+
+    if not force_refresh and organization_id not in _stale_orgs:
+        if known is not None and known.is_fresh(fingerprint):
+            log.debug("community_cache_hit", org_id=organization_id)
+            return known
+        shared = await _load_shared_result(organization_id)
+        if shared is not None:
+            _community_results[organization_id] = known = shared
+            if shared.is_fresh(fingerprint):
+                log.debug("community_cache_shared_hit", org_id=organization_id)
+                return shared
+
+    lock = _recompute_locks.setdefault(organization_id, asyncio.Lock())
+    async with lock:
+        # A concurrent request in this process may have just recomputed
+        current = _community_results.get(organization_id)
+        if (
+            current is not None
+            and current is not known
+            and not force_refresh
+            and current.is_fresh(fingerprint)
+        ):
+            return current
+
+        claimed = await _acquire_recompute_lock(organization_id)
+        if not claimed and current is not None:
+            log.info("community_recompute_in_progress_elsewhere", org_id=organization_id)
+            return current
+
+        seeds = None if force_refresh or current is None else current.partitions
+        log.info("community_recompute", org_id=organization_id, incremental=seeds is not None)
+        try:
+            communities, partitions = await _detect_with_partitions(
+                client, organization_id, _visualization_config(), "louvain", seeds
+            )
+        finally:
+            if claimed:
+                await _release_recompute_lock(organization_id)
+
+        result = CommunityResult(
+            version=uuid.uuid4().hex,
+            fingerprint=fingerprint,
+            computed_at=datetime.now(UTC),
+            communities=communities,
+            partitions=partitions,
+        )
+        _community_results[organization_id] = result
+        _stale_orgs.discard(organization_id)
+        await _store_shared_result(organization_id, result)
+        return result
+
+
+def reset_community_results() -> None:
+    """Drop all locally cached community results and cluster summaries."""
+    _community_results.clear()
+    _stale_orgs.clear()
+    _recompute_locks.clear()
+    CLUSTER_CACHE.clear()
 
 
 # =============================================================================
@@ -811,52 +1043,36 @@ async def get_hierarchical_graph(
         filtered_by_projects=bool(project_ids),
     )
 
-    # Check cache for community detection (expensive operation)
-    # Cache key includes org only - community structure is org-wide
-    cache_key = organization_id
+    # Community structure is org-wide and shared with the cluster bubbles
     node_to_cluster: dict[str, str] = {}
     clusters_meta: list[dict[str, Any]] = []
 
-    if cache_key in HIERARCHICAL_CACHE:
-        cached_at, cached_clusters, cached_meta = HIERARCHICAL_CACHE[cache_key]
-        if datetime.now(UTC) - cached_at < HIERARCHICAL_CACHE_TTL:
-            log.info("hierarchical_cache_hit", org_id=organization_id)
-            node_to_cluster = cached_clusters
-            clusters_meta = cached_meta
-        else:
-            log.debug("hierarchical_cache_expired", org_id=organization_id)
-
-    # Run community detection if not cached
-    if not node_to_cluster:
-        try:
-            detected = await detect_communities(
-                client,
-                organization_id,
-                config=CommunityConfig(
-                    resolutions=[1.0], min_community_size=2, max_levels=1, store_in_graph=False
-                ),
-                algorithm="louvain",
+    try:
+        result = await get_visualization_communities(
+            client,
+            organization_id,
+            # Unfiltered totals are the org-wide counts the result is keyed on
+            totals=None if project_ids else (total_node_count, total_edge_count),
+        )
+        for community in result.communities:
+            for member_id in community.member_ids:
+                node_to_cluster[member_id] = community.id
+        clusters_meta = [
+            {"id": c.id, "member_count": c.member_count, "level": c.level}
+            for c in result.communities
+        ]
+        if result.communities:
+            log.info(
+                "community_detection_success",
+                clusters=len(result.communities),
+                assigned_nodes=len(node_to_cluster),
             )
-            if detected:
-                for community in detected:
-                    for member_id in community.member_ids:
-                        node_to_cluster[member_id] = community.id
-                clusters_meta = [
-                    {"id": c.id, "member_count": c.member_count, "level": c.level} for c in detected
-                ]
-                log.info(
-                    "community_detection_success",
-                    clusters=len(detected),
-                    assigned_nodes=len(node_to_cluster),
-                )
-                # Cache the result
-                HIERARCHICAL_CACHE[cache_key] = (datetime.now(UTC), node_to_cluster, clusters_meta)
-            else:
-                log.warning("community_detection_empty", msg="no communities detected")
-        except ImportError:
-            log.warning("networkx_not_available", msg="community detection unavailable")
-        except Exception as e:
-            log.warning("community_detection_failed", error=str(e))
+        else:
+            log.warning("community_detection_empty", msg="no communities detected")
+    except ImportError:
+        log.warning("networkx_not_available", msg="community detection unavailable")
+    except Exception as e:
+        log.warning("community_detection_failed", error=str(e))
 
     # Fetch nodes and edges with optional project/type filtering
     nodes, node_ids = await _fetch_graph_nodes(
@@ -905,12 +1121,15 @@ class CommunityConfig:
         min_community_size: Minimum members to form a community.
         max_levels: Maximum hierarchy levels to compute.
         store_in_graph: Whether to persist communities to graph.
+        use_process_pool: Run the algorithm in a worker process instead of
+                    on the event loop.
     """
 
     resolutions: list[float] = field(default_factory=lambda: [0.5, 1.0, 2.0])
     min_community_size: int = 2
     max_levels: int = 3
     store_in_graph: bool = True
+    use_process_pool: bool = True
 
 
 @dataclass
@@ -939,6 +1158,201 @@ class DetectedCommunity:
         return len(self.member_ids)
 
 
+_NETWORKX_REQUIRED = (
+    "networkx is required for community detection. Install with: pip install networkx"
+)
+
+# Fetch ALL nodes - both Episodic and Entity labels with group_id filter
+# Also fetch labels array for type resolution
+_EXPORT_NODE_QUERY = """
+MATCH (n)
+WHERE (n:Episodic OR n:Entity) AND n.group_id = $group_id
+RETURN n.uuid AS id, n.name AS name, n.entity_type AS type, n.labels AS labels
+"""
+
+# Fetch ALL edges - use group_id filter on relationship
+_EXPORT_EDGE_QUERY = """
+MATCH (a)-[r]->(b)
+WHERE r.group_id = $group_id
+RETURN a.uuid AS source, b.uuid AS target, type(r) AS rel_type
+"""
+
+
+def _node_record(record: Any) -> tuple[str | None, str, str]:
+    """Parse a node export row into (id, name, resolved type)."""
+    if isinstance(record, (list, tuple)):
+        node_id = record[0] if len(record) > 0 else None
+        name = record[1] if len(record) > 1 else ""
+        entity_type = record[2] if len(record) > 2 else None
+        labels = record[3] if len(record) > 3 else None
+    else:
+        node_id = record.get("id")
+        name = record.get("name", "")
+        entity_type = record.get("type")
+        labels = record.get("labels")
+    return node_id, name, _extract_entity_type(entity_type, labels, name)
+
+
+def _edge_record(record: Any) -> tuple[str | None, str | None, str]:
+    """Parse an edge export row into (source, target, relationship type)."""
+    if isinstance(record, (list, tuple)):
+        source = record[0] if len(record) > 0 else None
+        target = record[1] if len(record) > 1 else None
+        rel_type = record[2] if len(record) > 2 else ""
+    else:
+        source = record.get("source")
+        target = record.get("target")
+        rel_type = record.get("rel_type", "")
+    return source, target, rel_type
+
+
+def _edge_weight(source_type: str, target_type: str, type_affinity_weight: float) -> float:
+    # Base weight + bonus if same type
+    weight = 1.0
+    if source_type and target_type and source_type == target_type:
+        weight += type_affinity_weight
+    return weight
+
+
+@dataclass
+class CommunityGraph:
+    """Undirected weighted graph in compressed sparse row (CSR) form.
+
+    Each edge is stored once, in the row of its lower-indexed endpoint, so
+    ``indices[indptr[i]:indptr[i + 1]]`` are the neighbours j >= i of node i.
+    Flat typed arrays keep the graph small in memory and cheap to pickle to a
+    worker process.
+
+    Attributes:
+        node_ids: Entity ID per node index.
+        indptr: Row offsets into ``indices`` and ``weights`` (node_count + 1).
+        indices: Neighbour node index per edge.
+        weights: Accumulated weight per edge.
+    """
+
+    node_ids: list[str]
+    indptr: array[int] = field(default_factory=lambda: array("q", [0]))
+    indices: array[int] = field(default_factory=lambda: array("q"))
+    weights: array[float] = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_pair_weights(
+        cls, node_ids: list[str], pair_weights: dict[int, float]
+    ) -> CommunityGraph:
+        """Build from weights keyed by ``low * node_count + high`` node index pairs."""
+        n = len(node_ids)
+        indptr = array("q", bytes(8 * (n + 1)))
+        indices = array("q")
+        weights = array("d")
+        # Sorted keys are ordered by row, then by column
+        for key in sorted(pair_weights):
+            low, high = divmod(key, n)
+            indptr[low + 1] += 1
+            indices.append(high)
+            weights.append(pair_weights[key])
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        return cls(node_ids=node_ids, indptr=indptr, indices=indices, weights=weights)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def edges(self) -> Iterator[tuple[int, int, float]]:
+        """Yield (low index, high index, weight) for every edge."""
+        for i in range(self.node_count):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                yield i, self.indices[k], self.weights[k]
+
+    def to_networkx(self) -> Any:
+        """Build a weighted NetworkX graph keyed by entity ID.
+
+        Raises:
+            ImportError: If networkx is not installed.
+        """
+        try:
+            import networkx as nx  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(_NETWORKX_REQUIRED) from e
+
+        G = nx.Graph()
+        G.add_nodes_from(self.node_ids)
+        ids = self.node_ids
+        G.add_weighted_edges_from((ids[i], ids[j], w) for i, j, w in self.edges())
+        return G
+
+
+async def export_community_graph(
+    client: GraphClient,
+    organization_id: str,
+    type_affinity_weight: float = 2.0,
+) -> CommunityGraph:
+    """Export the knowledge graph as a CSR edge array with type affinity.
+
+    Same weighting as `export_to_networkx`, without building a NetworkX
+    graph on the event loop.
+
+    Args:
+        client: Graph client.
+        organization_id: Organization UUID for filtering.
+        type_affinity_weight: Extra weight for same-type connections (default 2.0).
+
+    Returns:
+        CommunityGraph with accumulated edge weights.
+    """
+    log.info("export_community_graph_start", org_id=organization_id)
+
+    index: dict[str, int] = {}
+    node_ids: list[str] = []
+    node_types: list[str] = []
+
+    try:
+        node_result = await client.execute_read_org(
+            _EXPORT_NODE_QUERY, organization_id, group_id=organization_id
+        )
+        for record in node_result:
+            node_id, _, node_type = _node_record(record)
+            if node_id and node_id not in index:
+                index[node_id] = len(node_ids)
+                node_ids.append(node_id)
+                node_types.append(node_type)
+    except Exception as e:
+        log.warning("export_nodes_failed", error=str(e))
+
+    n = len(node_ids)
+    pair_weights: dict[int, float] = {}
+
+    try:
+        edge_result = await client.execute_read_org(
+            _EXPORT_EDGE_QUERY, organization_id, group_id=organization_id
+        )
+        for record in edge_result:
+            source, target, _ = _edge_record(record)
+            i = index.get(source) if source else None
+            j = index.get(target) if target else None
+            if i is None or j is None:
+                continue
+            weight = _edge_weight(node_types[i], node_types[j], type_affinity_weight)
+            # Accumulate weight for multi-edges and both directions
+            key = min(i, j) * n + max(i, j)
+            pair_weights[key] = pair_weights.get(key, 0.0) + weight
+    except Exception as e:
+        log.warning("export_edges_failed", error=str(e))
+
+    graph = CommunityGraph.from_pair_weights(node_ids, pair_weights)
+    log.info(
+        "export_community_graph_complete",
+        org_id=organization_id,
+        nodes=graph.node_count,
+        edges=graph.edge_count,
+    )
+    return graph
+
+
 async def export_to_networkx(
     client: GraphClient,
     organization_id: str,
@@ -963,79 +1377,38 @@ async def export_to_networkx(
     try:
         import networkx as nx  # type: ignore[import-not-found]
     except ImportError as e:
-        raise ImportError(
-            "networkx is required for community detection. Install with: pip install networkx"
-        ) from e
+        raise ImportError(_NETWORKX_REQUIRED) from e
 
     log.info("export_to_networkx_start", org_id=organization_id, type_affinity=type_affinity_weight)
 
     # Create undirected graph for community detection
     G = nx.Graph()
 
-    # Fetch ALL nodes - both Episodic and Entity labels with group_id filter
-    # Also fetch labels array for type resolution
-    node_query = """
-    MATCH (n)
-    WHERE (n:Episodic OR n:Entity) AND n.group_id = $group_id
-    RETURN n.uuid AS id, n.name AS name, n.entity_type AS type, n.labels AS labels
-    """
-
     try:
         node_result = await client.execute_read_org(
-            node_query, organization_id, group_id=organization_id
+            _EXPORT_NODE_QUERY, organization_id, group_id=organization_id
         )
-
         for record in node_result:
-            if isinstance(record, (list, tuple)):
-                node_id = record[0] if len(record) > 0 else None
-                name = record[1] if len(record) > 1 else ""
-                entity_type = record[2] if len(record) > 2 else None
-                labels = record[3] if len(record) > 3 else None
-            else:
-                node_id = record.get("id")
-                name = record.get("name", "")
-                entity_type = record.get("type")
-                labels = record.get("labels")
-
+            node_id, name, resolved_type = _node_record(record)
             if node_id:
-                # Resolve entity type using helper
-                resolved_type = _extract_entity_type(entity_type, labels, name)
                 G.add_node(node_id, name=name, type=resolved_type)
 
     except Exception as e:
         log.warning("export_nodes_failed", error=str(e))
 
-    # Fetch ALL edges - use group_id filter on relationship
-    edge_query = """
-    MATCH (a)-[r]->(b)
-    WHERE r.group_id = $group_id
-    RETURN a.uuid AS source, b.uuid AS target, type(r) AS rel_type
-    """
-
     try:
         edge_result = await client.execute_read_org(
-            edge_query, organization_id, group_id=organization_id
+            _EXPORT_EDGE_QUERY, organization_id, group_id=organization_id
         )
-
         for record in edge_result:
-            if isinstance(record, (list, tuple)):
-                source = record[0] if len(record) > 0 else None
-                target = record[1] if len(record) > 1 else None
-                rel_type = record[2] if len(record) > 2 else ""
-            else:
-                source = record.get("source")
-                target = record.get("target")
-                rel_type = record.get("rel_type", "")
-
+            source, target, rel_type = _edge_record(record)
             if source and target and source in G and target in G:
                 # Calculate edge weight with type affinity boost
-                source_type = G.nodes[source].get("type", "")
-                target_type = G.nodes[target].get("type", "")
-
-                # Base weight + bonus if same type
-                weight = 1.0
-                if source_type and target_type and source_type == target_type:
-                    weight += type_affinity_weight
+                weight = _edge_weight(
+                    G.nodes[source].get("type", ""),
+                    G.nodes[target].get("type", ""),
+                    type_affinity_weight,
+                )
 
                 # Update or add edge (accumulate weight for multi-edges)
                 if G.has_edge(source, target):
@@ -1059,12 +1432,14 @@ async def export_to_networkx(
 def detect_communities_louvain(
     G: Any,
     resolution: float = 1.0,
+    seed: dict[str, int] | None = None,
 ) -> tuple[dict[str, int], float]:
     """Detect communities using Louvain algorithm.
 
     Args:
         G: NetworkX graph.
         resolution: Resolution parameter (higher = more communities).
+        seed: Starting partition covering every node, e.g. from `_seed_partition`.
 
     Returns:
         Tuple of (node_id -> community_id mapping, modularity score).
@@ -1084,7 +1459,7 @@ def detect_communities_louvain(
         return {}, 0.0
 
     # Run Louvain algorithm
-    partition = community_louvain.best_partition(G, resolution=resolution)
+    partition = community_louvain.best_partition(G, partition=seed, resolution=resolution)
     modularity = community_louvain.modularity(partition, G)
 
     return partition, modularity
@@ -1093,12 +1468,14 @@ def detect_communities_louvain(
 def detect_communities_leiden(
     G: Any,
     resolution: float = 1.0,
+    seed: dict[str, int] | None = None,
 ) -> tuple[dict[str, int], float]:
     """Detect communities using Leiden algorithm.
 
     Args:
         G: NetworkX graph.
         resolution: Resolution parameter (higher = more communities).
+        seed: Starting partition covering every node, e.g. from `_seed_partition`.
 
     Returns:
         Tuple of (node_id -> community_id mapping, modularity score).
@@ -1118,18 +1495,19 @@ def detect_communities_leiden(
     if G.number_of_nodes() == 0:
         return {}, 0.0
 
-    # Convert NetworkX to igraph
+    # Convert NetworkX to igraph (vertices keep the NetworkX node order)
     G_ig = ig.Graph.from_networkx(G)
+    node_ids = list(G.nodes())
 
     # Run Leiden algorithm
     partition = leidenalg.find_partition(
         G_ig,
         leidenalg.CPMVertexPartition,
+        initial_membership=[seed[n] for n in node_ids] if seed else None,
         resolution_parameter=resolution,
     )
 
     # Map back to node IDs
-    node_ids = list(G.nodes())
     partition_dict = {node_ids[i]: partition.membership[i] for i in range(len(node_ids))}
 
     # Calculate modularity
@@ -1221,73 +1599,163 @@ def link_hierarchy(
     return flat
 
 
-async def detect_communities(
-    client: GraphClient,
-    organization_id: str,
-    config: CommunityConfig | None = None,
-    algorithm: str = "louvain",
-) -> list[DetectedCommunity]:
-    """Detect hierarchical communities in the knowledge graph.
+def _seed_partition(previous: dict[str, int], node_ids: list[str]) -> dict[str, int]:
+    """Turn a previous partition into a starting partition for the current nodes.
 
-    Args:
-        client: Graph client.
-        config: Detection configuration.
-        algorithm: "louvain" or "leiden".
+    Known nodes keep their community; new nodes start as singletons. Community
+    numbers are renumbered to 0..k-1, as Leiden's initial membership requires.
+    """
+    renumbered: dict[int, int] = {}
+    counter = itertools.count()
+    seed: dict[str, int] = {}
+    for node_id in node_ids:
+        community = previous.get(node_id)
+        if community is None:
+            seed[node_id] = next(counter)
+        else:
+            if community not in renumbered:
+                renumbered[community] = next(counter)
+            seed[node_id] = renumbered[community]
+    return seed
 
-    Returns:
-        List of detected communities with hierarchy links.
+
+def _detect_partitions(
+    graph: CommunityGraph,
+    algorithm: str,
+    resolutions: list[float],
+    seeds: list[dict[str, int]] | None = None,
+) -> list[tuple[dict[str, int], float] | None]:
+    """Run community detection at each resolution; None for a failed level.
+
+    Module-level so it can run in the detection worker process.
+
+    Raises:
+        ImportError: If networkx or the algorithm's package is not installed.
     """
-    if config is None:
-        config = CommunityConfig()
+    G = graph.to_networkx()
+
+    # Select algorithm
+    detect_fn = detect_communities_leiden if algorithm == "leiden" else detect_communities_louvain
+
+    results: list[tuple[dict[str, int], float] | None] = []
+    for level, resolution in enumerate(resolutions):
+        previous = seeds[level] if seeds and level < len(seeds) else None
+        seed = _seed_partition(previous, graph.node_ids) if previous else None
+        try:
+            results.append(detect_fn(G, resolution=resolution, seed=seed))
+        except ImportError:
+            raise
+        except Exception as e:
+            log.warning("detect_communities_level_failed", level=level, error=str(e))
+            results.append(None)
+    return results
+
+
+_detection_executor: ProcessPoolExecutor | None = None
+
+
+def _get_detection_executor() -> ProcessPoolExecutor:
+    global _detection_executor
+    if _detection_executor is None:
+        # spawn: forking a process with a running event loop and open sockets is unsafe
+        _detection_executor = ProcessPoolExecutor(
+            max_workers=COMMUNITY_DETECTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _detection_executor
+
+
+def shutdown_detection_executor() -> None:
+    """Stop the community detection worker process, if one was started."""
+    global _detection_executor
+    if _detection_executor is not None:
+        _detection_executor.shutdown(wait=False, cancel_futures=True)
+        _detection_executor = None
+
 
+async def _run_detection(
+    graph: CommunityGraph,
+    algorithm: str,
+    resolutions: list[float],
+    seeds: list[dict[str, int]] | None,
+    use_process_pool: bool,
+) -> list[tuple[dict[str, int], float] | None]:
+    if not use_process_pool:
+        return _detect_partitions(graph, algorithm, resolutions, seeds)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _get_detection_executor(), _detect_partitions, graph, algorithm, resolutions, seeds
+        )
+    except BrokenProcessPool:
+        # A crashed worker breaks the pool for good; start a fresh one next time
+        shutdown_detection_executor()
+        raise
+
+
+async def _detect_with_partitions(
+    client: GraphClient,
+    organization_id: str,
+    config: CommunityConfig,
+    algorithm: str,
+    seeds: list[dict[str, int]] | None = None,
+) -> tuple[list[DetectedCommunity], list[dict[str, int]]]:
+    """Detect communities, also returning the raw partition per level.
+
+    Partitions are aligned with ``config.resolutions`` ({} for a failed level)
+    and can be passed back as ``seeds`` to re-cluster incrementally.
+    """
     log.info(
         "detect_communities_start",
         algorithm=algorithm,
         resolutions=config.resolutions,
         max_levels=config.max_levels,
+        seeded=seeds is not None,
     )
 
-    # Export graph to NetworkX
-    G = await export_to_networkx(client, organization_id)
+    graph = await export_community_graph(client, organization_id)
 
-    if G.number_of_nodes() < config.min_community_size:
-        log.info("detect_communities_too_few_nodes", nodes=G.number_of_nodes())
-        return []
+    if graph.node_count < config.min_community_size:
+        log.info("detect_communities_too_few_nodes", nodes=graph.node_count)
+        return [], []
 
-    # Select algorithm
-    detect_fn = detect_communities_leiden if algorithm == "leiden" else detect_communities_louvain
+    resolutions = config.resolutions[: config.max_levels]
+    try:
+        results = await _run_detection(
+            graph, algorithm, resolutions, seeds, config.use_process_pool
+        )
+    except ImportError as e:
+        log.exception("detect_communities_missing_dependency", error=str(e))
+        raise
 
     # Detect communities at each resolution level
     all_level_communities: list[list[DetectedCommunity]] = []
+    partitions: list[dict[str, int]] = []
 
-    for level, resolution in enumerate(config.resolutions[: config.max_levels]):
-        try:
-            partition, modularity = detect_fn(G, resolution=resolution)
-
-            communities = partition_to_communities(
-                partition=partition,
-                level=level,
-                resolution=resolution,
-                modularity=modularity,
-                min_size=config.min_community_size,
-            )
-
-            all_level_communities.append(communities)
+    for level, (resolution, outcome) in enumerate(zip(resolutions, results, strict=True)):
+        if outcome is None:
+            partitions.append({})
+            continue
 
-            log.debug(
-                "detect_communities_level_complete",
-                level=level,
-                resolution=resolution,
-                communities=len(communities),
-                modularity=modularity,
-            )
+        partition, modularity = outcome
+        communities = partition_to_communities(
+            partition=partition,
+            level=level,
+            resolution=resolution,
+            modularity=modularity,
+            min_size=config.min_community_size,
+        )
+        all_level_communities.append(communities)
+        partitions.append(partition)
 
-        except ImportError as e:
-            log.exception("detect_communities_missing_dependency", error=str(e))
-            raise
-        except Exception as e:
-            log.warning("detect_communities_level_failed", level=level, error=str(e))
-            continue
+        log.debug(
+            "detect_communities_level_complete",
+            level=level,
+            resolution=resolution,
+            communities=len(communities),
+            modularity=modularity,
+        )
 
     # Link hierarchy
     all_communities = link_hierarchy(all_level_communities)
@@ -1298,7 +1766,32 @@ async def detect_communities(
         levels=len(all_level_communities),
     )
 
-    return all_communities
+    return all_communities, partitions
+
+
+async def detect_communities(
+    client: GraphClient,
+    organization_id: str,
+    config: CommunityConfig | None = None,
+    algorithm: str = "louvain",
+) -> list[DetectedCommunity]:
+    """Detect hierarchical communities in the knowledge graph.
+
+    The algorithm runs in a worker process unless ``config.use_process_pool``
+    is False.
+
+    Args:
+        client: Graph client.
+        config: Detection configuration.
+        algorithm: "louvain" or "leiden".
+
+    Returns:
+        List of detected communities with hierarchy links.
+    """
+    communities, _ = await _detect_with_partitions(
+        client, organization_id, config or CommunityConfig(), algorithm
+    )
+    return communities
 
 
 async def store_communities(
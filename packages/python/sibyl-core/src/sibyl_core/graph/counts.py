@@ -0,0 +1,157 @@
+"""Per-organization entity counts for stats and health probes.
+
+Counts by entity type and status come from one aggregate Cypher query per
+node label and are cached per organization. Entity writes made through
+`EntityManager` adjust the cached counters, so reading them is O(1) instead
+of listing entities. Writes from other processes (API and worker each keep
+their own cache) and raw batch writes are picked up when a cache entry
+expires after ``COUNT_CACHE_TTL`` seconds and is recounted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from sibyl_core.graph.client import GraphClient
+
+log = structlog.get_logger()
+
+# Seconds before cached counts are recounted from the graph
+COUNT_CACHE_TTL = 300.0
+
+# Status key for entities without a status
+NO_STATUS = ""
+
+
+@dataclass
+class EntityCounts:
+    """Entity counts for one organization, by type and status."""
+
+    group_id: str
+    by_type: defaultdict[str, defaultdict[str, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+    loaded_at: float = 0.0
+
+    def type_totals(self) -> dict[str, int]:
+        """Count per entity type."""
+        return {etype: sum(statuses.values()) for etype, statuses in self.by_type.items()}
+
+    def status_counts(self) -> dict[str, dict[str, int]]:
+        """Count per status, for entity types that have statuses."""
+        return {
+            etype: {status: n for status, n in statuses.items() if status != NO_STATUS}
+            for etype, statuses in self.by_type.items()
+            if any(status != NO_STATUS for status in statuses)
+        }
+
+    @property
+    def total(self) -> int:
+        return sum(self.type_totals().values())
+
+    def adjust(self, entity_type: str, status: str | None, delta: int) -> None:
+        statuses = self.by_type[entity_type]
+        key = _status_key(status)
+        statuses[key] = max(statuses[key] + delta, 0)
+
+
+# Loaded counts per organization
+_org_counts: dict[str, EntityCounts] = {}
+_load_locks: dict[str, asyncio.Lock] = {}
+
+
+def _status_key(status: object) -> str:
+    if status is None:
+        return NO_STATUS
+    value = getattr(status, "value", status)
+    return str(value).strip().lower()
+
+
+async def _count_entities(client: GraphClient, group_id: str) -> EntityCounts:
+    # entities.py imports this module for its write hooks
+    from sibyl_core.graph.entities import ENTITY_LABELS
+
+    counts = EntityCounts(group_id=group_id)
+    for label in ENTITY_LABELS:
+        rows = await client.execute_read_org(
+            f"""
+            MATCH (n:{label})
+            WHERE n.group_id = $group_id AND n.entity_type IS NOT NULL
+            RETURN n.entity_type AS entity_type, n.status AS status, count(n) AS count
+            """,
+            group_id,
+            group_id=group_id,
+        )
+        for row in rows:
+            counts.adjust(row["entity_type"], row.get("status"), int(row.get("count") or 0))
+    counts.loaded_at = time.monotonic()
+    return counts
+
+
+async def get_entity_counts(
+    client: GraphClient,
+    group_id: str,
+    *,
+    max_age: float = COUNT_CACHE_TTL,
+) -> EntityCounts:
+    """Get an organization's entity counts, counting the graph only when stale.
+
+    Concurrent callers share one recount.
+    """
+    counts = _org_counts.get(group_id)
+    if counts is not None and time.monotonic() - counts.loaded_at < max_age:
+        return counts
+
+    lock = _load_locks.setdefault(group_id, asyncio.Lock())
+    async with lock:
+        counts = _org_counts.get(group_id)
+        if counts is not None and time.monotonic() - counts.loaded_at < max_age:
+            return counts
+        counts = await _count_entities(client, group_id)
+        _org_counts[group_id] = counts
+        log.debug("Counted entities", group_id=group_id, total=counts.total)
+        return counts
+
+
+def count_entity_added(group_id: str, entity_type: str, status: object = None) -> None:
+    """Record a created entity in its organization's counts, if they are loaded.
+
+    Unloaded counts are left alone; the first read counts the graph anyway.
+    """
+    counts = _org_counts.get(group_id)
+    if counts is not None:
+        counts.adjust(entity_type, _status_key(status), 1)
+
+
+def count_entity_removed(group_id: str, entity_type: str, status: object = None) -> None:
+    """Record a deleted entity in its organization's counts, if they are loaded."""
+    counts = _org_counts.get(group_id)
+    if counts is not None:
+        counts.adjust(entity_type, _status_key(status), -1)
+
+
+def count_status_changed(group_id: str, entity_type: str, old: object, new: object) -> None:
+    """Move an entity between status buckets, if the counts are loaded."""
+    old_key, new_key = _status_key(old), _status_key(new)
+    counts = _org_counts.get(group_id)
+    if counts is not None and old_key != new_key:
+        counts.adjust(entity_type, old_key, -1)
+        counts.adjust(entity_type, new_key, 1)
+
+
+def invalidate_entity_counts(group_id: str) -> None:
+    """Drop an organization's counts so the next read recounts the graph."""
+    _org_counts.pop(group_id, None)
+
+
+def reset_entity_counts() -> None:
+    """Drop all cached counts."""
+    _org_counts.clear()
+    _load_locks.clear()
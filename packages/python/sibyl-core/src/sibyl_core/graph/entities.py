@@ -7,20 +7,29 @@ All graph operations go through EntityNode/EpisodicNode rather than raw Cypher.
 import contextlib
 import json
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 import structlog
 from graphiti_core.nodes import EntityNode, EpisodicNode
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from pydantic import BaseModel
 
-from sibyl_core.errors import EntityNotFoundError, SearchError
+from sibyl_core.errors import EntityNotFoundError, SearchError, ValidationError
 from sibyl_core.graph.client import GraphClient
+from sibyl_core.graph.counts import (
+    count_entity_added,
+    count_entity_removed,
+    count_status_changed,
+    invalidate_entity_counts,
+)
 from sibyl_core.models.agents import AgentCheckpoint, AgentRecord, ApprovalRecord
 from sibyl_core.models.entities import Entity, EntityType
 from sibyl_core.models.sources import Community, Document, Source
 from sibyl_core.models.tasks import Epic, ErrorPattern, Milestone, Note, Project, Task, Team
+from sibyl_core.retrieval.bm25 import index_org_entity, remove_org_entity
+from sibyl_core.utils.pagination import decode_cursor, encode_cursor
 
 log = structlog.get_logger()
 
@@ -29,6 +38,55 @@ log = structlog.get_logger()
 _REDISEARCH_SPECIAL_CHARS = re.compile(r"[|&\-@()~$:*\\/]")
 
 
+# Metadata fields mirrored as top-level node properties so list filters run in
+# Cypher against indexed properties (see GraphClient.ensure_indexes)
+FILTER_PROPERTIES = ("status", "priority", "complexity", "feature", "project_id", "epic_id", "tags")
+
+# Node labels that carry entity_type: create_direct() writes Entity nodes,
+# create() writes Episodic nodes via add_episode
+ENTITY_LABELS = ("Entity", "Episodic")
+
+_ENTITY_RETURN_FIELDS = """
+    RETURN n.uuid AS uuid,
+           n.name AS name,
+           n.entity_type AS entity_type,
+           n.group_id AS group_id,
+           n.content AS content,
+           n.description AS description,
+           n.summary AS summary,
+           n.metadata AS metadata,
+           n.created_at AS created_at,
+           n.updated_at AS updated_at,
+           labels(n) AS labels
+"""
+
+
+def _sort_fallback(order_by: str) -> str:
+    return "updated_at" if order_by == "created_at" else "created_at"
+
+
+def _sort_key(order_by: str) -> str:
+    """Listing sort expression: the timestamp, else the other one, else "".
+
+    Nodes missing ``order_by`` still get a position, so cursor listings
+    return the same nodes as offset listings. Mirrors `_sort_value`.
+    """
+    return f"coalesce(n.{order_by}, n.{_sort_fallback(order_by)}, '')"
+
+
+def _sort_value(record: dict[str, Any], order_by: str) -> str:
+    """A record's `_sort_key` value."""
+    return str(record.get(order_by) or record.get(_sort_fallback(order_by)) or "")
+
+
+@dataclass
+class EntityPage:
+    """One page of a keyset-paginated entity listing."""
+
+    entities: list[Entity]
+    next_cursor: str | None = None  # None on the last page
+
+
 def sanitize_search_query(query: str) -> str:
     """Escape RediSearch special characters in a query string.
 
@@ -118,6 +176,12 @@ class EntityManager:
                 # Persist attributes and metadata on the created node so downstream filters work
                 await self._persist_entity_attributes(desired_id, entity)
 
+            index_org_entity(
+                self._group_id,
+                entity if entity.id == desired_id else entity.model_copy(update={"id": desired_id}),
+            )
+            count_entity_added(self._group_id, entity.entity_type.value, self._status_of(entity))
+
             log.info(
                 "Entity created successfully",
                 entity_id=desired_id,
@@ -129,20 +193,30 @@ class EntityManager:
             log.exception("Failed to create entity", entity_id=entity.id, error=str(e))
             raise
 
-    async def create_direct(self, entity: Entity, *, generate_embedding: bool = True) -> str:
+    async def create_direct(
+        self,
+        entity: Entity,
+        *,
+        generate_embedding: bool = True,
+        embedding: list[float] | None = None,
+    ) -> str:
         """Create an entity directly using Graphiti's EntityNode, bypassing LLM.
 
         This is faster than create() as it skips LLM-based entity extraction.
         Use this for structured entities (tasks, projects) where LLM extraction
         isn't needed. Generates embeddings inline for semantic search support.
 
-        Uses EntityNode.save() which handles idempotent creation (MERGE pattern).
+        The node, its structured properties and its embedding are written by a
+        single EntityNode.save() (one MERGE statement), so the node is never
+        visible without its filter properties or vector.
 
         Args:
             entity: The entity to create.
             generate_embedding: If True (default), generate and store a name_embedding
                 for semantic search. Set to False for bulk inserts where embeddings
                 will be generated separately.
+            embedding: Precomputed embedding of `embedding_text(entity)`, e.g. the
+                vector add() already used for conflict detection. Skips the embedder.
 
         Returns:
             The ID of the created entity.
@@ -150,8 +224,6 @@ class EntityManager:
         Raises:
             EntityCreationError: If creation fails.
         """
-        import json
-
         from sibyl_core.errors import EntityCreationError
 
         log.info(
@@ -160,21 +232,23 @@ class EntityManager:
             name=entity.name,
         )
 
+        if embedding is None and generate_embedding:
+            try:
+                embedding = await self.embed(entity)
+            except Exception as e:
+                # Don't fail entity creation if embedding fails - search will still work via BM25
+                log.warning(
+                    "Failed to generate embedding, entity still created",
+                    entity_id=entity.id,
+                    error=str(e),
+                )
+
         try:
-            # Build attributes dict - all values must be primitives (FalkorDB limitation)
-            # Serialize nested dicts to JSON strings
-            metadata = self._entity_to_metadata(entity)
-            attributes = {
-                "entity_type": entity.entity_type.value,
-                "description": entity.description or "",
-                "content": entity.content or "",
-                "source_file": entity.source_file or "",
-                "updated_at": datetime.now(UTC).isoformat(),
-                "_direct_insert": True,
-                "metadata": json.dumps(metadata),  # Serialize to JSON string
-            }
+            # All values must be primitives (FalkorDB limitation); metadata is a JSON string.
+            # Structured properties (project_id, status, etc.) go on the node for graph
+            # filtering, so create_direct() nodes are queryable the same as create() nodes.
+            attributes = {**self.node_properties(entity), "_direct_insert": True}
 
-            # Create EntityNode instance
             node = EntityNode(
                 uuid=entity.id,
                 name=entity.name,
@@ -182,6 +256,7 @@ class EntityManager:
                 labels=[entity.entity_type.value],
                 created_at=entity.created_at or datetime.now(UTC),
                 summary=entity.description[:500] if entity.description else entity.name,
+                name_embedding=embedding,
                 attributes=attributes,
             )
 
@@ -189,36 +264,14 @@ class EntityManager:
             async with self._client.write_lock:
                 await node.save(self._driver)
 
-                # Persist structured properties (project_id, status, etc.) for graph filtering
-                # This ensures create_direct() nodes are queryable the same as create() nodes
-                await self._persist_entity_attributes(entity.id, entity)
-
-            # Generate embedding for semantic search (name + summary combined)
-            if generate_embedding:
-                try:
-                    embed_text = f"{entity.name}. {entity.description or ''}"[:2000]
-                    embedding = await self._client.client.embedder.create(embed_text)
-
-                    # Store embedding on node using vecf32() for FalkorDB vector ops
-                    async with self._client.write_lock:
-                        await self._driver.execute_query(
-                            "MATCH (n {uuid: $entity_id}) SET n.name_embedding = vecf32($embedding)",
-                            entity_id=entity.id,
-                            embedding=embedding,
-                        )
-                    log.debug("Generated embedding for entity", entity_id=entity.id)
-                except Exception as e:
-                    # Don't fail entity creation if embedding fails - search will still work via BM25
-                    log.warning(
-                        "Failed to generate embedding, entity still created",
-                        entity_id=entity.id,
-                        error=str(e),
-                    )
+            index_org_entity(self._group_id, entity)
+            count_entity_added(self._group_id, entity.entity_type.value, self._status_of(entity))
 
             log.info(
                 "Entity created via EntityNode.save",
                 entity_id=entity.id,
                 entity_type=entity.entity_type,
+                embedded=embedding is not None,
             )
             return entity.id
 
@@ -233,6 +286,26 @@ class EntityManager:
                 entity_id=entity.id,
             ) from e
 
+    @staticmethod
+    def embedding_text(entity: Entity) -> str:
+        """Text embedded into a node's name_embedding (name + summary)."""
+        return f"{entity.name}. {entity.description or ''}"[:2000]
+
+    async def embed(self, entity: Entity) -> list[float]:
+        """Embed an entity the way create_direct() stores it.
+
+        The vector can be reused for `search_by_embedding` and passed back to
+        `create_direct`, so adding an entity embeds it once.
+        """
+        return await self._client.client.embedder.create(self.embedding_text(entity))
+
+    async def embed_many(self, entities: list[Entity]) -> list[list[float]]:
+        """Embed several entities with one embedder call, as `embed` would each."""
+        if not entities:
+            return []
+        texts = [self.embedding_text(entity) for entity in entities]
+        return await self._client.client.embedder.create_batch(texts)
+
     async def get(self, entity_id: str) -> Entity:
         """Get an entity by ID using Graphiti's node APIs.
 
@@ -385,6 +458,70 @@ class EntityManager:
             log.exception("Search failed", query=query, error=str(e))
             raise SearchError(f"Search failed: {e}") from e
 
+    async def search_by_embedding(
+        self,
+        embedding: list[float],
+        entity_types: list[EntityType] | None = None,
+        limit: int = 10,
+        *,
+        exclude_id: str | None = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[Entity, float]]:
+        """Nearest entities to a vector, via the Entity.name_embedding vector index.
+
+        Unlike search(), no query text is embedded and no fulltext or reranking
+        pass runs: one kNN query against the index built by
+        GraphClient.ensure_indexes.
+
+        Args:
+            embedding: Query vector, e.g. from `embed`.
+            entity_types: Optional filter by entity types.
+            limit: Maximum results to return.
+            exclude_id: Entity ID to leave out (the entity being added).
+            min_score: Minimum cosine similarity (0-1).
+
+        Returns:
+            List of (entity, cosine similarity) tuples, most similar first.
+        """
+        type_filter = "AND n.entity_type IN $types" if entity_types else ""
+        exclude_filter = "AND n.uuid <> $exclude_id" if exclude_id else ""
+        query = f"""
+            CALL db.idx.vector.queryNodes('Entity', 'name_embedding', $k, vecf32($embedding))
+            YIELD node AS n
+            WHERE n.group_id = $group_id {type_filter} {exclude_filter}
+            WITH n, 1 - vec.cosineDistance(n.name_embedding, vecf32($embedding)) AS score
+            WHERE score >= $min_score
+            {_ENTITY_RETURN_FIELDS}, score
+            ORDER BY score DESC
+            LIMIT $limit
+        """
+        params: dict[str, Any] = {
+            "embedding": embedding,
+            # Over-fetch: type, exclusion and score filters apply after the kNN
+            "k": limit * 4,
+            "group_id": self._group_id,
+            "min_score": min_score,
+            "limit": limit,
+        }
+        if entity_types:
+            params["types"] = [t.value for t in entity_types]
+        if exclude_id:
+            params["exclude_id"] = exclude_id
+
+        try:
+            result = await self._driver.execute_query(query, **params)
+        except Exception as e:
+            log.exception("Vector search failed", error=str(e))
+            raise SearchError(f"Vector search failed: {e}") from e
+
+        results: list[tuple[Entity, float]] = []
+        for record in GraphClient.normalize_result(result):
+            try:
+                results.append((self._record_to_entity(record), float(record["score"])))
+            except Exception as e:
+                log.debug("Failed to convert record to entity", error=str(e))
+        return results
+
     async def update(self, entity_id: str, updates: dict[str, Any]) -> Entity | None:
         """Update an existing entity with partial updates.
 
@@ -462,6 +599,13 @@ class EntityManager:
                         )
                         log.debug("Cleared embedding on node", entity_id=entity_id)
 
+            index_org_entity(self._group_id, updated_entity)
+            count_status_changed(
+                self._group_id,
+                existing.entity_type.value,
+                self._status_of(existing),
+                self._status_of(updated_entity),
+            )
             log.info("Entity updated successfully", entity_id=entity_id)
             return updated_entity
 
@@ -492,6 +636,16 @@ class EntityManager:
                     node = await EntityNode.get_by_uuid(self._driver, entity_id)
                     if node and node.group_id == self._group_id:
                         await node.delete(self._driver)
+                        remove_org_entity(self._group_id, entity_id)
+                        # Already deleted: bookkeeping must not fall through to EpisodicNode
+                        attributes = getattr(node, "attributes", None) or {}
+                        entity_type = attributes.get("entity_type")
+                        if entity_type:
+                            count_entity_removed(
+                                self._group_id, entity_type, attributes.get("status")
+                            )
+                        else:
+                            invalidate_entity_counts(self._group_id)
                         log.info("Entity deleted via EntityNode", entity_id=entity_id)
                         return True
                 except Exception as e:
@@ -506,6 +660,9 @@ class EntityManager:
                     episodic = await EpisodicNode.get_by_uuid(self._driver, entity_id)
                     if episodic and episodic.group_id == self._group_id:
                         await episodic.delete(self._driver)
+                        remove_org_entity(self._group_id, entity_id)
+                        # Episodic nodes don't load their entity_type; recount later
+                        invalidate_entity_counts(self._group_id)
                         log.info("Entity deleted via EpisodicNode", entity_id=entity_id)
                         return True
                 except Exception as e:
@@ -537,9 +694,12 @@ class EntityManager:
     ) -> list[Entity]:
         """List all entities of a specific type using direct Cypher query.
 
-        Note: Filters like status, priority, epic_id are stored in metadata JSON,
-        not as top-level node properties. We use BELONGS_TO relationship for epic
-        filtering and parse metadata for other filters in Python.
+        Filters, ordering and pagination run in the database against the
+        top-level properties in FILTER_PROPERTIES, so a page costs the same
+        regardless of how many entities of the type exist. Graphs written
+        before those properties were promoted need `backfill_filter_properties`.
+        Deep offsets still read every row before them; use `list_page` to
+        page through large result sets.
 
         Args:
             entity_type: The type of entities to list.
@@ -548,15 +708,15 @@ class EntityManager:
             project_id: Filter by project ID.
             epic_id: Filter by epic ID (uses BELONGS_TO relationship).
             no_epic: Filter for entities without an epic (mutually exclusive with epic_id).
-            status: Filter by status (for tasks, parsed from metadata).
-            priority: Filter by priority (for tasks, parsed from metadata).
-            complexity: Filter by complexity (for tasks, parsed from metadata).
-            feature: Filter by feature area (for tasks, parsed from metadata).
-            tags: Filter by tags (matches if ANY tag present, parsed from metadata).
+            status: Filter by status (comma-separated for multiple).
+            priority: Filter by priority (comma-separated for multiple).
+            complexity: Filter by complexity (comma-separated for multiple).
+            feature: Filter by feature area.
+            tags: Filter by tags (matches if ANY tag present).
             include_archived: Include archived entities.
 
         Returns:
-            List of entities.
+            List of entities, newest first.
         """
         log.debug(
             "Listing entities",
@@ -569,140 +729,271 @@ class EntityManager:
             priority=priority,
         )
 
-        # Build base query - filters are applied in Python from metadata
-        params: dict[str, Any] = {
-            "entity_type": entity_type.value,
-            "group_id": self._group_id,
-        }
-
-        # Use BELONGS_TO relationship for epic filtering (most reliable)
-        if epic_id:
-            query = """
-                MATCH (n)-[:BELONGS_TO]->(e)
-                WHERE n.entity_type = $entity_type
-                  AND n.group_id = $group_id
-                  AND e.uuid = $epic_id
-                RETURN n.uuid AS uuid,
-                       n.name AS name,
-                       n.entity_type AS entity_type,
-                       n.group_id AS group_id,
-                       n.content AS content,
-                       n.description AS description,
-                       n.summary AS summary,
-                       n.metadata AS metadata,
-                       n.created_at AS created_at,
-                       n.updated_at AS updated_at,
-                       labels(n) AS labels
-                ORDER BY n.created_at DESC
-            """
-            params["epic_id"] = epic_id
-        else:
-            query = """
-                MATCH (n)
-                WHERE n.entity_type = $entity_type
-                  AND n.group_id = $group_id
-                RETURN n.uuid AS uuid,
-                       n.name AS name,
-                       n.entity_type AS entity_type,
-                       n.group_id AS group_id,
-                       n.content AS content,
-                       n.description AS description,
-                       n.summary AS summary,
-                       n.metadata AS metadata,
-                       n.created_at AS created_at,
-                       n.updated_at AS updated_at,
-                       labels(n) AS labels
-                ORDER BY n.created_at DESC
-            """
+        conditions, params = self._list_conditions(
+            [entity_type],
+            project_id=project_id,
+            no_epic=no_epic,
+            status=status,
+            priority=priority,
+            complexity=complexity,
+            feature=feature,
+            tags=tags,
+            include_archived=include_archived,
+        )
 
         try:
-            result = await self._driver.execute_query(query, **params)
+            records = await self._run_list_query(
+                conditions,
+                params,
+                order_by="created_at",
+                descending=True,
+                skip=offset,
+                limit=limit,
+                belongs_to=epic_id,
+            )
+            entities = self._records_to_entities(records)
 
-            entities: list[Entity] = []
-            skipped = 0
+            log.debug(
+                "Listed entities",
+                entity_type=entity_type,
+                returned=len(entities),
+            )
+            return entities
 
-            # Handle FalkorDB result format using normalize helper
-            records = GraphClient.normalize_result(result)
-            for record in records:
-                try:
-                    entity = self._record_to_entity(record)
+        except Exception as e:
+            log.exception("Failed to list entities", entity_type=entity_type, error=str(e))
+            return []
 
-                    # Parse metadata for filtering (stored as JSON string)
-                    metadata = entity.metadata or {}
+    async def list_page(
+        self,
+        entity_types: list[EntityType] | None = None,
+        limit: int = 50,
+        *,
+        cursor: str = "",
+        order_by: Literal["created_at", "updated_at"] = "created_at",
+        descending: bool = True,
+        project_id: str | None = None,
+        project_ids: list[str] | None = None,
+        include_unassigned: bool = False,
+        belongs_to: str | None = None,
+        no_epic: bool = False,
+        status: str | None = None,
+        priority: str | None = None,
+        complexity: str | None = None,
+        feature: str | None = None,
+        tags: list[str] | None = None,
+        include_archived: bool = False,
+    ) -> EntityPage:
+        """List entities with keyset (cursor) pagination.
 
-                    # Filter by project_id from metadata
-                    if project_id and metadata.get("project_id") != project_id:
-                        continue
+        Pages are ordered by ``(order_by, uuid)`` and each page continues
+        strictly after the previous page's last row, so a page costs the same
+        no matter how deep it is. Filters behave as in `list_by_type`.
 
-                    # Filter by status from metadata (supports comma-separated)
-                    if status:
-                        entity_status = metadata.get("status", "").lower()
-                        status_list = [s.strip().lower() for s in status.split(",")]
-                        if entity_status not in status_list:
-                            continue
+        Args:
+            entity_types: Types to include; None lists every entity type.
+            limit: Maximum results to return.
+            cursor: ``next_cursor`` from the previous page, or "" for the first page.
+            order_by: Timestamp field to order by.
+            descending: Newest first when True.
+            project_id: Filter by project ID.
+            project_ids: Filter by any of several project IDs.
+            include_unassigned: With project_ids, also include entities without a project.
+            belongs_to: Only entities with a BELONGS_TO edge to this entity (epic, task).
+            no_epic: Filter for entities without an epic.
+            status: Filter by status (comma-separated for multiple).
+            priority: Filter by priority (comma-separated for multiple).
+            complexity: Filter by complexity (comma-separated for multiple).
+            feature: Filter by feature area.
+            tags: Filter by tags (matches if ANY tag present).
+            include_archived: Include archived entities.
 
-                    # Filter by priority from metadata (supports comma-separated)
-                    if priority:
-                        entity_priority = metadata.get("priority", "").lower()
-                        priority_list = [p.strip().lower() for p in priority.split(",")]
-                        if entity_priority not in priority_list:
-                            continue
+        Returns:
+            EntityPage with the entities and the cursor for the next page.
 
-                    # Filter by complexity from metadata (supports comma-separated)
-                    if complexity:
-                        entity_complexity = metadata.get("complexity", "").lower()
-                        complexity_list = [c.strip().lower() for c in complexity.split(",")]
-                        if entity_complexity not in complexity_list:
-                            continue
+        Raises:
+            ValidationError: If the cursor is malformed or the ordering is unsupported.
+        """
+        if order_by not in ("created_at", "updated_at"):
+            raise ValidationError(f"Unsupported ordering for cursor pagination: {order_by}")
+        after = decode_cursor(cursor, order_by)
 
-                    # Filter by feature from metadata
-                    if feature:
-                        entity_feature = metadata.get("feature")
-                        if entity_feature != feature:
-                            continue
+        conditions, params = self._list_conditions(
+            entity_types,
+            project_id=project_id,
+            project_ids=project_ids,
+            include_unassigned=include_unassigned,
+            no_epic=no_epic,
+            status=status,
+            priority=priority,
+            complexity=complexity,
+            feature=feature,
+            tags=tags,
+            include_archived=include_archived,
+        )
+        if after is not None:
+            op = "<" if descending else ">"
+            key = _sort_key(order_by)
+            conditions.append(
+                f"({key} {op} $after_value OR ({key} = $after_value AND n.uuid {op} $after_id))"
+            )
+            params["after_value"], params["after_id"] = after
+
+        records = await self._run_list_query(
+            conditions,
+            params,
+            order_by=order_by,
+            descending=descending,
+            skip=0,
+            limit=limit + 1,
+            belongs_to=belongs_to,
+        )
 
-                    # Filter by tags from metadata (match if ANY tag present)
-                    if tags:
-                        entity_tags = metadata.get("tags", [])
-                        if not any(t in entity_tags for t in tags):
-                            continue
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_cursor(order_by, _sort_value(last, order_by), str(last["uuid"]))
 
-                    # Filter for entities without an epic
-                    if no_epic:
-                        entity_epic = metadata.get("epic_id")
-                        if entity_epic:  # Has an epic, skip it
-                            continue
+        return EntityPage(entities=self._records_to_entities(records), next_cursor=next_cursor)
 
-                    # Filter archived unless include_archived is True
-                    if not include_archived:
-                        entity_status = metadata.get("status")
-                        if entity_status == "archived":
-                            continue
+    def _list_conditions(
+        self,
+        entity_types: list[EntityType] | None,
+        *,
+        project_id: str | None = None,
+        project_ids: list[str] | None = None,
+        include_unassigned: bool = False,
+        no_epic: bool = False,
+        status: str | None = None,
+        priority: str | None = None,
+        complexity: str | None = None,
+        feature: str | None = None,
+        tags: list[str] | None = None,
+        include_archived: bool = False,
+    ) -> tuple[list[str], dict[str, Any]]:
+        """Build WHERE conditions over FILTER_PROPERTIES for entity listings."""
+        params: dict[str, Any] = {"group_id": self._group_id}
+        conditions = ["n.group_id = $group_id"]
+
+        if entity_types is None:
+            conditions.append("n.entity_type IS NOT NULL")
+        elif len(entity_types) == 1:
+            conditions.append("n.entity_type = $entity_type")
+            params["entity_type"] = entity_types[0].value
+        else:
+            conditions.append("n.entity_type IN $entity_types")
+            params["entity_types"] = [t.value for t in entity_types]
+
+        if project_id:
+            conditions.append("n.project_id = $project_id")
+            params["project_id"] = project_id
+        elif project_ids or include_unassigned:
+            options = ["n.project_id IN $project_ids"] if project_ids else []
+            if include_unassigned:
+                options.append("n.project_id IS NULL OR n.project_id = ''")
+            conditions.append(f"({' OR '.join(options)})")
+            if project_ids:
+                params["project_ids"] = project_ids
+
+        # Comma-separated values match any of the listed values
+        for field, value in (
+            ("status", status),
+            ("priority", priority),
+            ("complexity", complexity),
+        ):
+            if value:
+                conditions.append(f"n.{field} IN ${field}")
+                params[field] = [v.strip().lower() for v in value.split(",") if v.strip()]
 
-                    # Apply pagination
-                    if skipped < offset:
-                        skipped += 1
-                        continue
+        if feature:
+            conditions.append("n.feature = $feature")
+            params["feature"] = feature
 
-                    entities.append(entity)
+        if tags:
+            conditions.append("any(tag IN n.tags WHERE tag IN $tags)")
+            params["tags"] = tags
 
-                    # Check limit
-                    if len(entities) >= limit:
-                        break
+        if no_epic:
+            conditions.append("(n.epic_id IS NULL OR n.epic_id = '')")
 
-                except Exception as e:
-                    log.debug("Failed to convert record to entity", error=str(e))
+        if not include_archived:
+            conditions.append("(n.status IS NULL OR n.status <> 'archived')")
 
-            log.debug(
-                "Listed entities",
-                entity_type=entity_type,
-                returned=len(entities),
+        return conditions, params
+
+    async def _run_list_query(
+        self,
+        conditions: list[str],
+        params: dict[str, Any],
+        *,
+        order_by: str,
+        descending: bool,
+        skip: int,
+        limit: int,
+        belongs_to: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run an entity listing ordered by ``(order_by, uuid)`` and return raw records."""
+        where = "\n  AND ".join(conditions)
+        direction = "DESC" if descending else "ASC"
+        order = f"ORDER BY {_sort_key(order_by)} {direction}, n.uuid {direction}"
+
+        if belongs_to:
+            # BELONGS_TO relationship is the most reliable parent link
+            query = f"""
+                MATCH (n)-[:BELONGS_TO]->(e)
+                WHERE e.uuid = $belongs_to
+                  AND {where}
+                {_ENTITY_RETURN_FIELDS}
+                {order}
+                SKIP $skip
+                LIMIT $limit
+            """
+            result = await self._driver.execute_query(
+                query, **params, belongs_to=belongs_to, skip=skip, limit=limit
             )
-            return entities
+            return GraphClient.normalize_result(result)
 
-        except Exception as e:
-            log.exception("Failed to list entities", entity_type=entity_type, error=str(e))
-            return []
+        # One labelled query per node label so property indexes apply. Each
+        # returns its own first skip+limit rows; the page is cut from their merge.
+        per_label: list[list[dict[str, Any]]] = []
+        for label in ENTITY_LABELS:
+            query = f"""
+                MATCH (n:{label})
+                WHERE {where}
+                {_ENTITY_RETURN_FIELDS}
+                {order}
+                SKIP $skip
+                LIMIT $limit
+            """
+            result = await self._driver.execute_query(query, **params, skip=0, limit=skip + limit)
+            if rows := GraphClient.normalize_result(result):
+                per_label.append(rows)
+
+        if len(per_label) == 1:
+            # Already in query order
+            return per_label[0][skip : skip + limit]
+        records = [record for rows in per_label for record in rows]
+        records.sort(
+            key=lambda r: (_sort_value(r, order_by), str(r.get("uuid") or "")),
+            reverse=descending,
+        )
+        seen: set[str] = set()
+        unique = []
+        for record in records:
+            if record.get("uuid") not in seen:
+                seen.add(record.get("uuid"))
+                unique.append(record)
+        return unique[skip : skip + limit]
+
+    def _records_to_entities(self, records: list[dict[str, Any]]) -> list[Entity]:
+        entities: list[Entity] = []
+        for record in records:
+            try:
+                entities.append(self._record_to_entity(record))
+            except Exception as e:
+                log.debug("Failed to convert record to entity", error=str(e))
+        return entities
 
     async def list_all(
         self,
@@ -713,6 +1004,8 @@ class EntityManager:
     ) -> list[Entity]:
         """List all entities regardless of type using a single query.
 
+        For cursor pagination use ``list_page(None, order_by="updated_at")``.
+
         Args:
             limit: Maximum results to return.
             offset: Pagination offset.
@@ -739,7 +1032,7 @@ class EntityManager:
                        n.created_at AS created_at,
                        n.updated_at AS updated_at,
                        labels(n) AS labels
-                ORDER BY n.updated_at DESC
+                ORDER BY n.updated_at DESC, n.uuid DESC
                 SKIP $offset
                 LIMIT $limit
             """
@@ -791,6 +1084,69 @@ class EntityManager:
             log.exception("Failed to list all entities", error=str(e))
             return []
 
+    async def list_for_search_index(
+        self,
+        *,
+        after_id: str | None = None,
+        updated_since: str | None = None,
+        limit: int = 1000,
+        content_chars: int = 4000,
+    ) -> list[Entity]:
+        """Page through entities for building in-process search indexes.
+
+        Pages are keyed on uuid (pass the last id of the previous page as
+        ``after_id``) so every page costs the same regardless of depth.
+        Content is truncated server-side to keep index memory bounded.
+
+        Args:
+            after_id: Return entities with uuid greater than this.
+            updated_since: Only entities whose updated_at is at or after this ISO timestamp.
+            limit: Page size.
+            content_chars: Maximum content characters to return per entity.
+
+        Returns:
+            Entities ordered by uuid.
+        """
+        filters = ["n.group_id = $group_id", "n.entity_type IS NOT NULL"]
+        params: dict[str, Any] = {
+            "group_id": self._group_id,
+            "limit": limit,
+            "content_chars": content_chars,
+        }
+        if after_id:
+            filters.append("n.uuid > $after_id")
+            params["after_id"] = after_id
+        if updated_since:
+            filters.append("n.updated_at >= $updated_since")
+            params["updated_since"] = updated_since
+
+        query = f"""
+            MATCH (n)
+            WHERE {" AND ".join(filters)}
+            RETURN n.uuid AS uuid,
+                   n.name AS name,
+                   n.entity_type AS entity_type,
+                   n.group_id AS group_id,
+                   substring(n.content, 0, $content_chars) AS content,
+                   n.description AS description,
+                   n.summary AS summary,
+                   n.metadata AS metadata,
+                   n.created_at AS created_at,
+                   n.updated_at AS updated_at
+            ORDER BY n.uuid
+            LIMIT $limit
+        """
+
+        result = await self._client.execute_read_org(query, self._group_id, **params)
+
+        entities: list[Entity] = []
+        for record in result:
+            try:
+                entities.append(self._record_to_entity(record))
+            except Exception as e:
+                log.debug("Failed to convert record to entity", error=str(e))
+        return entities
+
     async def get_tasks_for_epic(
         self,
         epic_id: str,
@@ -1292,6 +1648,15 @@ class EntityManager:
         # Remove None values to appease FalkorDB property constraints
         props = {k: v for k, v in props.items() if v is not None}
 
+        # Filter properties explicitly cleared in metadata (e.g. a task moved
+        # out of its epic) must not keep matching list filters
+        cleared = [
+            field
+            for field in FILTER_PROPERTIES
+            if field not in props and field in entity.metadata and entity.metadata[field] is None
+        ]
+        clear_clause = "".join(f",\n                n.{field} = NULL" for field in cleared)
+
         props["updated_at"] = datetime.now(UTC).isoformat()
         if entity.created_at:
             props["created_at"] = entity.created_at.isoformat()
@@ -1301,10 +1666,10 @@ class EntityManager:
         metadata_json = json.dumps(metadata) if metadata else "{}"
 
         await self._driver.execute_query(
-            """
-            MATCH (n {uuid: $entity_id})
+            f"""
+            MATCH (n {{uuid: $entity_id}})
             SET n += $props,
-                n.metadata = $metadata
+                n.metadata = $metadata{clear_clause}
             """,
             entity_id=entity_id,
             props=props,
@@ -1381,6 +1746,10 @@ class EntityManager:
 
         return props
 
+    def _status_of(self, entity: Entity) -> Any:
+        """The status stored on an entity's node, if any."""
+        return self._collect_properties(entity).get("status")
+
     def _serialize_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
         """Convert metadata values to JSON-serializable forms."""
         serialized: dict[str, Any] = {}
@@ -1509,6 +1878,27 @@ class EntityManager:
 
         return self._serialize_metadata(metadata)
 
+    def node_properties(self, entity: Entity) -> dict[str, Any]:
+        """Flatten an entity into the properties of its graph node.
+
+        What `create_direct` writes (minus the embedding); also used by callers
+        that write nodes in bulk through `sibyl_core.graph.batch`.
+        """
+        props = {k: v for k, v in self._collect_properties(entity).items() if v is not None}
+        created_at = entity.created_at or datetime.now(UTC)
+        props.update(
+            {
+                "description": entity.description or "",
+                "content": entity.content or "",
+                "source_file": entity.source_file or "",
+                "summary": entity.description[:500] if entity.description else entity.name,
+                "metadata": json.dumps(self._entity_to_metadata(entity)),
+                "created_at": created_at.isoformat(),
+                "updated_at": (entity.updated_at or created_at).isoformat(),
+            }
+        )
+        return props
+
     async def bulk_create_direct(
         self,
         entities: list[Entity],
@@ -1547,6 +1937,14 @@ class EntityManager:
                         "_generated": True,
                         "metadata": json.dumps(metadata),  # Serialize to JSON string
                     }
+                    props = self._collect_properties(entity)
+                    attributes.update(
+                        {
+                            field: props[field]
+                            for field in FILTER_PROPERTIES
+                            if props.get(field) is not None
+                        }
+                    )
 
                     # Create EntityNode instance
                     node = EntityNode(
@@ -1563,6 +1961,10 @@ class EntityManager:
                     async with self._client.write_lock:
                         await node.save(self._driver)
 
+                    index_org_entity(self._group_id, entity)
+                    count_entity_added(
+                        self._group_id, entity.entity_type.value, self._status_of(entity)
+                    )
                     created += 1
                 except Exception as e:
                     log.debug("Failed to create entity", entity_id=entity.id, error=str(e))
@@ -6,6 +6,8 @@ using Graphiti's native edge system rather than custom Cypher queries.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import uuid4
 
@@ -14,6 +16,7 @@ from graphiti_core.edges import EntityEdge
 
 from sibyl_core.errors import ConventionsMCPError
 from sibyl_core.graph.client import GraphClient
+from sibyl_core.graph.entities import ENTITY_LABELS
 from sibyl_core.models.entities import Entity, Relationship, RelationshipType
 
 log = structlog.get_logger()
@@ -22,6 +25,9 @@ log = structlog.get_logger()
 # Cypher doesn't support parameterized relationship types, so we validate against this
 VALID_RELATIONSHIP_TYPES = frozenset(rt.value for rt in RelationshipType)
 
+# Edges written per UNWIND statement by create_bulk
+BULK_BATCH_SIZE = 1000
+
 
 def _validate_relationship_type(rel_type: str) -> str:
     """Validate relationship type is in the allowed whitelist.
@@ -61,6 +67,23 @@ def _sanitize_pagination(value: int, max_value: int = 10000) -> int:
     return max(0, min(value, max_value))
 
 
+@dataclass
+class RelationshipPage:
+    """One page of a keyset-paginated relationship listing."""
+
+    relationships: list[Relationship]
+    next_cursor: str | None = None  # None on the last page
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of `RelationshipManager.create_bulk`."""
+
+    created: int = 0
+    existing: int = 0  # Already linked by an edge of the same type, or repeated in the input
+    failed: int = 0  # Invalid, missing an endpoint, or in a batch whose write failed
+
+
 class RelationshipManager:
     """Manages relationship operations using Graphiti's EntityEdge API."""
 
@@ -224,30 +247,140 @@ class RelationshipManager:
                 },
             ) from e
 
-    async def create_bulk(self, relationships: list[Relationship]) -> tuple[int, int]:
-        """Create multiple relationships in bulk.
+    async def create_bulk(
+        self,
+        relationships: list[Relationship],
+        *,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> BulkCreateResult:
+        """Create many relationships with a few set-based queries.
+
+        Endpoint labels are resolved up front so every write can MATCH its
+        endpoints through the label's uuid index. Edges are then grouped by
+        relationship type and endpoint labels and written in UNWIND batches.
+        Like `create`, an edge is skipped when the endpoints are already
+        linked by an edge of the same type.
 
         Args:
-            relationships: List of relationships to create.
+            relationships: Relationships to create.
+            batch_size: Edges per UNWIND statement.
 
         Returns:
-            Tuple of (created_count, failed_count)
+            BulkCreateResult with created, existing and failed counts.
         """
         log.info("Creating relationships in bulk", count=len(relationships))
+        result = BulkCreateResult()
 
-        created = 0
-        failed = 0
-
+        # Drop invalid edges and repeats of the same (source, type, target)
+        pending: list[tuple[str, Relationship]] = []
+        seen: set[tuple[str, str, str]] = set()
         for rel in relationships:
             try:
-                await self.create(rel)
-                created += 1
-            except Exception as e:
-                log.warning("Failed to create relationship", error=str(e))
-                failed += 1
+                rel_type = _validate_relationship_type(rel.relationship_type.value)
+            except ValueError as e:
+                log.warning("Skipping relationship", error=str(e))
+                result.failed += 1
+                continue
+            if not rel.source_id or not rel.target_id:
+                result.failed += 1
+                continue
+            key = (rel.source_id, rel_type, rel.target_id)
+            if key in seen:
+                result.existing += 1
+                continue
+            seen.add(key)
+            pending.append((rel_type, rel))
+
+        endpoint_ids = {rel.source_id for _, rel in pending}
+        endpoint_ids |= {rel.target_id for _, rel in pending}
+        labels = await self._resolve_labels(sorted(endpoint_ids), batch_size)
+
+        groups: dict[tuple[str, str, str], list[dict[str, object]]] = defaultdict(list)
+        for rel_type, rel in pending:
+            source_label = labels.get(rel.source_id)
+            target_label = labels.get(rel.target_id)
+            if source_label is None or target_label is None:
+                result.failed += 1
+                continue
+            groups[rel_type, source_label, target_label].append(
+                {
+                    "uuid": rel.id or str(uuid4()),
+                    "source_uuid": rel.source_id,
+                    "target_uuid": rel.target_id,
+                    "weight": rel.weight,
+                }
+            )
+
+        created_at = datetime.now(UTC).isoformat()
+        for (rel_type, source_label, target_label), rows in groups.items():
+            query = f"""
+                UNWIND $rels AS rel
+                MATCH (source:{source_label} {{uuid: rel.source_uuid}})
+                MATCH (target:{target_label} {{uuid: rel.target_uuid}})
+                OPTIONAL MATCH (source)-[e:{rel_type}]->(target)
+                WITH source, target, rel, count(e) AS found
+                WHERE found = 0
+                MERGE (source)-[r:{rel_type} {{uuid: rel.uuid}}]->(target)
+                SET r.name = $name,
+                    r.group_id = $group_id,
+                    r.source_node_uuid = rel.source_uuid,
+                    r.target_node_uuid = rel.target_uuid,
+                    r.created_at = $created_at,
+                    r.weight = rel.weight,
+                    r.fact = $fact
+                RETURN count(r) AS created
+            """
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                try:
+                    written = await self._client.execute_write_org(
+                        query,
+                        self._group_id,
+                        rels=batch,
+                        name=rel_type,
+                        group_id=self._group_id,
+                        created_at=created_at,
+                        fact=f"{rel_type} relationship",
+                    )
+                except Exception as e:
+                    log.warning(
+                        "Failed to create relationship batch",
+                        type=rel_type,
+                        count=len(batch),
+                        error=str(e),
+                    )
+                    result.failed += len(batch)
+                    continue
+                created = int(written[0]["created"]) if written else 0
+                result.created += created
+                result.existing += len(batch) - created
 
-        log.info("Bulk create complete", created=created, failed=failed)
-        return created, failed
+        log.info(
+            "Bulk create complete",
+            created=result.created,
+            existing=result.existing,
+            failed=result.failed,
+        )
+        return result
+
+    async def _resolve_labels(self, ids: list[str], batch_size: int) -> dict[str, str]:
+        """Map node uuids to their label, one UNWIND lookup per label and batch."""
+        labels: dict[str, str] = {}
+        for label in ENTITY_LABELS:
+            ids = [node_id for node_id in ids if node_id not in labels]
+            for start in range(0, len(ids), batch_size):
+                rows = await self._client.execute_read_org(
+                    f"""
+                    UNWIND $ids AS id
+                    MATCH (n:{label} {{uuid: id}})
+                    RETURN n.uuid AS uuid
+                    """,
+                    self._group_id,
+                    ids=ids[start : start + batch_size],
+                )
+                for row in rows:
+                    labels[row["uuid"]] = label
+        return labels
 
     async def get_for_entity(
         self,
@@ -640,3 +773,75 @@ class RelationshipManager:
         except Exception as e:
             log.warning("Failed to list relationships", error=str(e))
             return []
+
+    async def list_page(self, limit: int = 1000, *, after_id: str = "") -> RelationshipPage:
+        """List relationships with keyset pagination on the edge uuid.
+
+        Each page continues strictly after the previous page's last uuid, so
+        paging through every edge of a large graph costs the same per page.
+        Unlike `list_all`, query failures are raised rather than returning an
+        empty list, so exports can't silently come up short.
+
+        Args:
+            limit: Maximum relationships per page.
+            after_id: ``next_cursor`` from the previous page, or "" for the first page.
+
+        Returns:
+            RelationshipPage with the relationships and the cursor for the next page.
+        """
+        safe_limit = _sanitize_pagination(limit, max_value=100000)
+        after = "AND r.uuid > $after_id" if after_id else ""
+        query = f"""
+            MATCH (source)-[r]->(target)
+            WHERE r.group_id = $group_id
+              AND r.uuid IS NOT NULL
+              {after}
+            RETURN r.uuid AS id,
+                   source.uuid AS source_id,
+                   target.uuid AS target_id,
+                   type(r) AS rel_type,
+                   r.weight AS weight,
+                   r.created_at AS created_at
+            ORDER BY r.uuid
+            LIMIT {safe_limit + 1}
+        """
+        result = await self._driver.execute_query(query, group_id=self._group_id, after_id=after_id)
+        rows = GraphClient.normalize_result(result)
+
+        next_cursor = None
+        if len(rows) > safe_limit:
+            rows = rows[:safe_limit]
+            next_cursor = str(rows[-1]["id"])
+
+        relationships = []
+        for row in rows:
+            try:
+                relationship_type = RelationshipType(row.get("rel_type"))
+            except ValueError:
+                relationship_type = RelationshipType.RELATED_TO
+            weight = row.get("weight")
+            created_at = _parse_created_at(row.get("created_at"))
+            relationships.append(
+                Relationship(
+                    id=row["id"],
+                    source_id=row.get("source_id") or "",
+                    target_id=row.get("target_id") or "",
+                    relationship_type=relationship_type,
+                    weight=float(weight) if weight is not None else 1.0,
+                    **({"created_at": created_at} if created_at else {}),
+                )
+            )
+
+        return RelationshipPage(relationships=relationships, next_cursor=next_cursor)
+
+
+def _parse_created_at(value: object) -> datetime | None:
+    """Parse a stored edge timestamp, tolerating legacy formats."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
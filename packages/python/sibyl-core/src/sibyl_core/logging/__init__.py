@@ -14,6 +14,8 @@ Usage:
     log.info("Server starting", port=3334)
 """
 
+from typing import TYPE_CHECKING
+
 from sibyl_core.logging.colors import (
     ANSI_BOLD,
     ANSI_CORAL,
@@ -33,8 +35,26 @@ from sibyl_core.logging.colors import (
     NEON_CYAN,
     SUCCESS_GREEN,
 )
-from sibyl_core.logging.config import configure_logging, get_logger
-from sibyl_core.logging.formatters import SibylRenderer
+
+if TYPE_CHECKING:
+    from sibyl_core.logging.config import configure_logging, get_logger
+    from sibyl_core.logging.formatters import SibylRenderer
+
+_LAZY = {
+    "configure_logging": "sibyl_core.logging.config",
+    "get_logger": "sibyl_core.logging.config",
+    "SibylRenderer": "sibyl_core.logging.formatters",
+}
+
+
+def __getattr__(name: str) -> object:
+    # structlog loads on first use, so importing the color palette stays cheap
+    if name in _LAZY:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ANSI_BOLD",
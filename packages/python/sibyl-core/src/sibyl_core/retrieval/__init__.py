@@ -5,7 +5,9 @@ This module provides advanced retrieval strategies:
 - fusion: Reciprocal Rank Fusion for merging results
 - bm25: Keyword-based BM25 search
 - hybrid: Combined vector + graph traversal
+- linking: Entity-name linking for query seeds
 - dedup: Entity deduplication via embeddings
+- embedding_cache: Content-addressed query embedding cache
 - reranking: Cross-encoder reranking for improved relevance
 """
 
@@ -18,6 +20,11 @@ from sibyl_core.retrieval.dedup import (
     find_duplicates,
     get_deduplicator,
 )
+from sibyl_core.retrieval.embedding_cache import (
+    CachingEmbedder,
+    EmbeddingCache,
+    get_embedding_cache,
+)
 from sibyl_core.retrieval.fusion import (
     FusionConfig,
     rrf_merge,
@@ -30,6 +37,7 @@ from sibyl_core.retrieval.hybrid import (
     hybrid_search,
     simple_hybrid_search,
 )
+from sibyl_core.retrieval.linking import EntityNameIndex, LinkingConfig
 from sibyl_core.retrieval.reranking import (
     CrossEncoderConfig,
     RerankResult,
@@ -47,17 +55,23 @@ __all__ = [
     # BM25
     "BM25Config",
     "BM25Index",
+    # Embedding cache
+    "CachingEmbedder",
     # Reranking
     "CrossEncoderConfig",
     # Dedup
     "DedupConfig",
     "DuplicatePair",
+    "EmbeddingCache",
     "EntityDeduplicator",
+    # Linking
+    "EntityNameIndex",
     # Fusion
     "FusionConfig",
     # Hybrid
     "HybridConfig",
     "HybridResult",
+    "LinkingConfig",
     # Reranking
     "RerankResult",
     # Temporal
@@ -69,6 +83,7 @@ __all__ = [
     "find_duplicates",
     "get_bm25_index",
     "get_deduplicator",
+    "get_embedding_cache",
     "hybrid_search",
     "rerank_results",
     "rrf_merge",
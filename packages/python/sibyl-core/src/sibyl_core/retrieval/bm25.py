@@ -1,24 +1,37 @@
 """BM25 keyword search for exact matching.
 
-Implements Okapi BM25 algorithm for keyword-based retrieval.
+Implements Okapi BM25 algorithm for keyword-based retrieval over an
+inverted index with MaxScore top-k pruning.
 Complements vector search by finding exact term matches.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import math
 import re
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from sibyl_core.config import core_config
+from sibyl_core.retrieval.linking import EntityNameIndex
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 log = structlog.get_logger()
 
+# Alphanumeric runs, optionally joined by underscores (snake_case identifiers)
+_WORD_PATTERN = re.compile(r"[a-z0-9]+(?:_+[a-z0-9]+)*")
+
+# Content characters indexed per entity, both on load and on incremental writes
+BM25_CONTENT_CHARS = 4000
+
 
 @dataclass
 class BM25Config:
@@ -90,6 +103,9 @@ class BM25Config:
 def tokenize(text: str, min_length: int = 2, stop_words: set[str] | None = None) -> list[str]:
     """Tokenize text into lowercase words.
 
+    Snake_case identifiers yield their parts plus the whole identifier, so
+    ``ERR_CONN_RESET`` matches both exactly and on ``conn``/``reset``.
+
     Args:
         text: Input text.
         min_length: Minimum token length.
@@ -101,8 +117,12 @@ def tokenize(text: str, min_length: int = 2, stop_words: set[str] | None = None)
     if not text:
         return []
 
-    # Simple tokenization: split on non-alphanumeric, lowercase
-    tokens = re.findall(r"\b[a-zA-Z0-9]+\b", text.lower())
+    # Split on non-alphanumeric, lowercase; keep underscore-joined identifiers too
+    tokens: list[str] = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if "_" in word:
+            tokens.extend(part for part in word.split("_") if part)
+        tokens.append(word)
 
     # Filter by length and stop words
     stop = stop_words or set()
@@ -137,7 +157,14 @@ def extract_text(entity: Any, fields: list[str] | None = None) -> str:
 
 
 class BM25Index:
-    """In-memory BM25 index for entity search.
+    """In-memory inverted BM25 index for entity search.
+
+    Terms map to postings lists (doc id -> term frequency), so a query only
+    touches documents containing at least one query term. Document length is
+    tracked as a running total, IDF values are cached until the corpus changes,
+    and top-k retrieval uses MaxScore pruning: once the k-th best partial score
+    exceeds what any unseen document could still reach, no new candidates are
+    admitted and the remaining terms only complete existing accumulators.
 
     Usage:
         index = BM25Index()
@@ -167,14 +194,18 @@ class BM25Index:
 
         # Index structures
         self._entities: dict[str, Any] = {}  # id -> entity
+        self._doc_order: dict[str, int] = {}  # id -> insertion ordinal (tie-breaking)
         self._doc_lengths: dict[str, int] = {}  # id -> token count
         self._term_freqs: dict[str, dict[str, int]] = {}  # id -> {term: count}
-        self._doc_freqs: dict[str, int] = defaultdict(int)  # term -> doc count
-        self._avg_doc_length: float = 0.0
+        self._postings: dict[str, dict[str, int]] = {}  # term -> {id: count}
+        self._max_tf: dict[str, int] = {}  # term -> highest tf in its postings
+        self._idf_cache: dict[str, float] = {}  # term -> idf, reset on corpus change
+        self._total_length: int = 0
         self._total_docs: int = 0
+        self._next_ordinal: int = 0
 
     def add(self, entity: Any) -> str:
-        """Add an entity to the index.
+        """Add an entity to the index, replacing any previous version.
 
         Args:
             entity: Entity to index.
@@ -186,38 +217,31 @@ class BM25Index:
         text = self._text_extractor(entity)
         tokens = tokenize(text, self.config.min_token_length, self.config.stop_words)
 
-        # Check if new entity BEFORE storing
-        is_new = entity_id not in self._entities
+        if entity_id in self._entities:
+            self._unindex(entity_id)
+        else:
+            self._doc_order[entity_id] = self._next_ordinal
+            self._next_ordinal += 1
+            self._total_docs += 1
 
-        # Store entity
         self._entities[entity_id] = entity
 
-        # Update term frequencies
         term_freq: dict[str, int] = defaultdict(int)
         for token in tokens:
             term_freq[token] += 1
 
-        # Update document frequencies (count unique terms per doc)
-        old_terms = set(self._term_freqs.get(entity_id, {}).keys())
-        new_terms = set(term_freq.keys())
-
-        # Decrement counts for removed terms
-        for term in old_terms - new_terms:
-            self._doc_freqs[term] -= 1
-
-        # Increment counts for new terms
-        for term in new_terms - old_terms:
-            self._doc_freqs[term] += 1
+        for term, tf in term_freq.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+            postings[entity_id] = tf
+            if tf > self._max_tf.get(term, 0):
+                self._max_tf[term] = tf
 
         self._term_freqs[entity_id] = dict(term_freq)
         self._doc_lengths[entity_id] = len(tokens)
-
-        # Update averages
-        if is_new:
-            self._total_docs += 1
-        self._avg_doc_length = (
-            sum(self._doc_lengths.values()) / self._total_docs if self._total_docs > 0 else 0.0
-        )
+        self._total_length += len(tokens)
+        self._invalidate_stats()
 
         return entity_id
 
@@ -233,33 +257,66 @@ class BM25Index:
         if entity_id not in self._entities:
             return False
 
-        # Decrement doc frequencies
-        for term in self._term_freqs.get(entity_id, {}):
-            self._doc_freqs[term] -= 1
-
-        # Remove from all structures
+        self._unindex(entity_id)
         del self._entities[entity_id]
-        del self._doc_lengths[entity_id]
-        del self._term_freqs[entity_id]
+        del self._doc_order[entity_id]
         self._total_docs -= 1
-
-        # Recalculate average
-        self._avg_doc_length = (
-            sum(self._doc_lengths.values()) / self._total_docs if self._total_docs > 0 else 0.0
-        )
+        self._invalidate_stats()
 
         return True
 
+    def _unindex(self, entity_id: str) -> None:
+        """Drop a document's postings and length contribution."""
+        for term, tf in self._term_freqs.pop(entity_id, {}).items():
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(entity_id, None)
+            if not postings:
+                del self._postings[term]
+                self._max_tf.pop(term, None)
+            elif tf >= self._max_tf.get(term, 0):
+                self._max_tf[term] = max(postings.values())
+
+        self._total_length -= self._doc_lengths.pop(entity_id, 0)
+
+    def _invalidate_stats(self) -> None:
+        """Reset cached IDF values after the corpus changed."""
+        if self._idf_cache:
+            self._idf_cache = {}
+
+    @property
+    def _avg_doc_length(self) -> float:
+        """Average document length from the running total."""
+        return self._total_length / self._total_docs if self._total_docs > 0 else 0.0
+
     def _idf(self, term: str) -> float:
-        """Calculate inverse document frequency for a term."""
-        n = self._total_docs
-        df = self._doc_freqs.get(term, 0)
+        """Calculate inverse document frequency for a term (cached)."""
+        cached = self._idf_cache.get(term)
+        if cached is not None:
+            return cached
 
-        if df == 0:
-            return 0.0
+        n = self._total_docs
+        postings = self._postings.get(term)
+        df = len(postings) if postings else 0
 
         # Standard IDF formula with smoothing
-        return math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+        idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0) if df else 0.0
+        self._idf_cache[term] = idf
+        return idf
+
+    def _term_upper_bound(self, term: str) -> float:
+        """Highest score contribution a single occurrence of ``term`` can make.
+
+        BM25 term weight grows with tf and shrinks with document length, so
+        the bound uses the term's maximum tf and a zero-length document.
+        """
+        max_tf = self._max_tf.get(term, 0)
+        if not max_tf:
+            return 0.0
+        k1 = self.config.k1
+        b = self.config.b
+        return self._idf(term) * (max_tf * (k1 + 1)) / (max_tf + k1 * (1 - b))
 
     def _score_document(self, entity_id: str, query_terms: list[str]) -> float:
         """Calculate BM25 score for a document against query terms."""
@@ -271,7 +328,7 @@ class BM25Index:
 
         k1 = self.config.k1
         b = self.config.b
-        avgdl = self._avg_doc_length if self._avg_doc_length > 0 else 1.0
+        avgdl = self._avg_doc_length or 1.0
 
         score = 0.0
         for term in query_terms:
@@ -306,28 +363,88 @@ class BM25Index:
         """
         query_terms = tokenize(query, self.config.min_token_length, self.config.stop_words)
 
-        if not query_terms:
+        if not query_terms or limit <= 0:
             return []
 
-        # Score all documents
-        scores: list[tuple[str, float]] = []
-        for entity_id in self._entities:
-            score = self._score_document(entity_id, query_terms)
-            if score > min_score:
-                scores.append((entity_id, score))
+        # Repeated query terms count once per occurrence, as in the plain formula
+        term_weights: dict[str, int] = defaultdict(int)
+        for term in query_terms:
+            if term in self._postings:
+                term_weights[term] += 1
 
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        if not term_weights:
+            return []
 
-        # Build result list
-        results: list[tuple[Any, float]] = []
-        for entity_id, score in scores[:limit]:
-            results.append((self._entities[entity_id], score))
+        # Highest-impact terms first so the threshold rises quickly
+        terms = sorted(
+            ((t, w * self._term_upper_bound(t)) for t, w in term_weights.items()),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        # remaining[i]: best score an unseen document can gain after term i
+        remaining = [sum(bound for _, bound in terms[i + 1 :]) for i in range(len(terms))]
+
+        k1 = self.config.k1
+        b = self.config.b
+        avgdl = self._avg_doc_length or 1.0
+        doc_lengths = self._doc_lengths
+
+        accumulators: dict[str, float] = {}
+        admitting = True
+
+        for i, (term, _) in enumerate(terms):
+            remaining_bound = remaining[i]
+            weight = term_weights[term] * self._idf(term)
+            postings = self._postings[term]
+
+            if admitting:
+                for doc_id, tf in postings.items():
+                    contribution = (
+                        weight
+                        * (tf * (k1 + 1))
+                        / (tf + k1 * (1 - b + b * (doc_lengths[doc_id] / avgdl)))
+                    )
+                    accumulators[doc_id] = accumulators.get(doc_id, 0.0) + contribution
+            else:
+                # Only complete scores of existing candidates; iterate the smaller side
+                if len(accumulators) < len(postings):
+                    matches = ((d, postings[d]) for d in accumulators if d in postings)
+                else:
+                    matches = ((d, tf) for d, tf in postings.items() if d in accumulators)
+                for doc_id, tf in matches:
+                    accumulators[doc_id] += (
+                        weight
+                        * (tf * (k1 + 1))
+                        / (tf + k1 * (1 - b + b * (doc_lengths[doc_id] / avgdl)))
+                    )
+
+            # MaxScore: partial scores are lower bounds on final scores, so the
+            # k-th best partial is a floor for the k-th best final score.
+            floor = 0.0
+            if len(accumulators) >= limit:
+                floor = heapq.nlargest(limit, accumulators.values())[-1]
+            if remaining_bound <= min_score or remaining_bound < floor:
+                admitting = False
+                accumulators = {
+                    d: s
+                    for d, s in accumulators.items()
+                    if s + remaining_bound > min_score and s + remaining_bound >= floor
+                }
+
+        order = self._doc_order
+        top = heapq.nsmallest(
+            limit,
+            ((d, s) for d, s in accumulators.items() if s > min_score),
+            key=lambda x: (-x[1], order[x[0]]),
+        )
+
+        results: list[tuple[Any, float]] = [(self._entities[d], s) for d, s in top]
 
         log.debug(
             "bm25_search",
             query=query[:50],
             terms=query_terms,
+            candidates=len(accumulators),
             results=len(results),
         )
 
@@ -338,19 +455,85 @@ class BM25Index:
         """Number of indexed documents."""
         return self._total_docs
 
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct indexed terms."""
+        return len(self._postings)
+
     def clear(self) -> None:
         """Clear the entire index."""
         self._entities.clear()
+        self._doc_order.clear()
         self._doc_lengths.clear()
         self._term_freqs.clear()
-        self._doc_freqs.clear()
-        self._avg_doc_length = 0.0
+        self._postings.clear()
+        self._max_tf.clear()
+        self._idf_cache = {}
+        self._total_length = 0
         self._total_docs = 0
+        self._next_ordinal = 0
+
+
+class OrgBM25Index(BM25Index):
+    """BM25 index over one organization's graph.
+
+    Built once from the graph and then kept current: EntityManager writes are
+    applied incrementally, ``synced_at`` records when the graph was last read
+    so changes from other processes can be caught up by ``updated_at``, and a
+    periodic rebuild drops entities deleted elsewhere. A name index for entity
+    linking is maintained alongside the postings.
+
+    Attributes:
+        group_id: Organization ID (graph name).
+        loaded: True once the initial load from the graph completed.
+        synced_at: ISO timestamp the last graph read started at.
+        built_at: Monotonic time of the last full load.
+        refreshed_at: Monotonic time of the last incremental catch-up.
+        used_at: Monotonic time of the last lookup, for idle eviction.
+        names: Entity name index for query-time linking.
+    """
+
+    def __init__(self, group_id: str, config: BM25Config | None = None) -> None:
+        super().__init__(config=config)
+        self.group_id = group_id
+        self.loaded = False
+        self.synced_at: str | None = None
+        self.built_at: float = 0.0
+        self.refreshed_at: float = 0.0
+        self.used_at: float = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.load_task: asyncio.Task[Any] | None = None
+        self.refresh_task: asyncio.Task[Any] | None = None
+        self.names = EntityNameIndex()
+
+    def add(self, entity: Any) -> str:
+        """Add an entity to the postings and the name index."""
+        entity_id = super().add(entity)
+        name = entity.get("name") if isinstance(entity, dict) else getattr(entity, "name", "")
+        self.names.add(entity_id, name or "")
+        return entity_id
+
+    def remove(self, entity_id: str) -> bool:
+        """Remove an entity from the postings and the name index."""
+        self.names.remove(entity_id)
+        return super().remove(entity_id)
+
+    def get(self, entity_id: str) -> Any | None:
+        """Get an indexed entity by ID."""
+        return self._entities.get(entity_id)
+
+    def clear(self) -> None:
+        """Clear postings and names."""
+        super().clear()
+        self.names.clear()
 
 
 # Global index instance
 _bm25_index: BM25Index | None = None
 
+# Per-organization indexes used by hybrid search, least recently used first
+_org_indexes: OrderedDict[str, OrgBM25Index] = OrderedDict()
+
 
 def get_bm25_index() -> BM25Index:
     """Get the global BM25 index."""
@@ -378,3 +561,81 @@ def bm25_search(
     Convenience function using the global index.
     """
     return get_bm25_index().search(query, limit, min_score)
+
+
+def get_org_bm25_index(group_id: str) -> OrgBM25Index:
+    """Get (or create an empty, unloaded) BM25 index for an organization."""
+    index = _org_indexes.get(group_id)
+    if index is None:
+        index = _org_indexes[group_id] = OrgBM25Index(group_id)
+    _touch_org_index(index)
+    return index
+
+
+def replace_org_bm25_index(index: OrgBM25Index) -> None:
+    """Swap in a freshly built index for its organization."""
+    _org_indexes[index.group_id] = index
+    _touch_org_index(index)
+
+
+def _touch_org_index(index: OrgBM25Index) -> None:
+    """Mark an index most recently used and evict past the LRU/TTL bounds."""
+    index.used_at = time.monotonic()
+    _org_indexes.move_to_end(index.group_id)
+
+    cutoff = index.used_at - core_config.bm25_index_ttl_seconds
+    for group_id, other in list(_org_indexes.items()):
+        if other is index:
+            break
+        if len(_org_indexes) <= core_config.bm25_max_org_indexes and other.used_at > cutoff:
+            break
+        # A build in flight re-publishes its index when done; let it finish
+        if other.load_task is not None and not other.load_task.done():
+            continue
+        del _org_indexes[group_id]
+        _discard_org_index(other)
+        log.debug("bm25_index_evicted", group_id=group_id)
+
+
+def _discard_org_index(index: OrgBM25Index) -> None:
+    for task in (index.load_task, index.refresh_task):
+        if task is not None and not task.done():
+            task.cancel()
+    index.clear()
+
+
+def index_org_entity(group_id: str, entity: Any) -> None:
+    """Add or update an entity in its organization's index, if one is loaded.
+
+    Unloaded indexes are left alone; the initial load reads the graph anyway.
+    """
+    index = _org_indexes.get(group_id)
+    if index is not None and index.loaded:
+        index.add(_truncate_content(entity))
+
+
+def _truncate_content(entity: Any) -> Any:
+    """Cap an entity's content at ``BM25_CONTENT_CHARS``, as the graph load does."""
+    if isinstance(entity, dict):
+        content = entity.get("content")
+        if isinstance(content, str) and len(content) > BM25_CONTENT_CHARS:
+            return {**entity, "content": content[:BM25_CONTENT_CHARS]}
+        return entity
+    content = getattr(entity, "content", None)
+    if isinstance(content, str) and len(content) > BM25_CONTENT_CHARS:
+        return entity.model_copy(update={"content": content[:BM25_CONTENT_CHARS]})
+    return entity
+
+
+def remove_org_entity(group_id: str, entity_id: str) -> None:
+    """Remove an entity from its organization's index, if one is loaded."""
+    index = _org_indexes.get(group_id)
+    if index is not None and index.loaded:
+        index.remove(entity_id)
+
+
+def reset_org_bm25_indexes() -> None:
+    """Drop all per-organization indexes."""
+    for index in _org_indexes.values():
+        _discard_org_index(index)
+    _org_indexes.clear()
@@ -3,21 +3,27 @@
 Detects and merges duplicate entities based on semantic similarity
 of their embeddings. Redirects relationships during merge.
 
-Performance: Uses numpy vectorized operations for O(n²) similarity computation
-in optimized C code, making it ~100x faster than pure Python loops.
+Performance: Embeddings are fetched in pages and compared in row tiles of
+the normalized embedding matrix, so the similarity matrix is never held whole:
+each tile is bounded by ``DedupConfig.max_tile_memory_mb``. With
+``same_type_only`` the comparison is blocked by entity type. For very large
+graphs, ``approximate`` mode asks the FalkorDB vector index for each entity's
+nearest neighbours instead of comparing every pair.
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
 import structlog
 
+from sibyl_core.graph.client import GraphClient
+
 if TYPE_CHECKING:
-    from sibyl_core.graph.client import GraphClient
     from sibyl_core.graph.entities import EntityManager
 
 log = structlog.get_logger()
@@ -31,15 +37,27 @@ class DedupConfig:
 
     Attributes:
         similarity_threshold: Minimum cosine similarity to consider duplicates (0.0-1.0).
-        batch_size: Number of entities to process per batch.
-        same_type_only: Only compare entities of the same type.
+        batch_size: Number of entities per nearest-neighbour query in approximate mode.
+        same_type_only: Only compare entities of the same type (blocks the search by type).
         min_name_overlap: Minimum Jaccard similarity of names (extra filter).
+        top_k: Maximum candidate duplicates kept per entity, after the name
+            filter. None (the default) keeps every pair above the threshold;
+            approximate mode then asks the index for 20 neighbours.
+        max_tile_memory_mb: Memory budget for one tile of the similarity matrix.
+            The normalized embeddings (entities x dimensions x 4 bytes) come on top.
+        fetch_page_size: Entities fetched per query.
+        approximate: Use the FalkorDB vector index for per-entity kNN instead of
+            comparing every pair. Embeddings then never leave the database.
     """
 
     similarity_threshold: float = 0.95
     batch_size: int = 100
     same_type_only: bool = True
     min_name_overlap: float = 0.3
+    top_k: int | None = None
+    max_tile_memory_mb: float = 256.0
+    fetch_page_size: int = 1000
+    approximate: bool = False
 
 
 @dataclass
@@ -127,6 +145,43 @@ def jaccard_similarity(s1: str, s2: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+@dataclass
+class _EmbeddingMatrix:
+    """Entity ids, names and types with their L2-normalized float32 embeddings."""
+
+    ids: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    types: list[str] = field(default_factory=list)
+    _pages: list[np.ndarray] = field(default_factory=list)
+
+    def add_page(self, entities: list[tuple[str, str, str, list[float]]]) -> None:
+        vectors = np.asarray([e[3] for e in entities], dtype=np.float32)
+        # Avoid division by zero
+        norms = np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-10)
+        self._pages.append(vectors / norms)
+        self.ids.extend(e[0] for e in entities)
+        self.names.extend(e[1] for e in entities)
+        self.types.extend(e[2] for e in entities)
+
+    def matrix(self) -> np.ndarray:
+        """All embeddings as one (n, dim) array."""
+        if len(self._pages) > 1:
+            self._pages = [np.concatenate(self._pages)]
+        return self._pages[0]
+
+
+def _top_k_per_row(
+    rows: np.ndarray, cols: np.ndarray, sims: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Keep the k highest-scoring candidates of each row."""
+    order = np.lexsort((-sims, rows))
+    rows, cols, sims = rows[order], cols[order], sims[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    rank = np.arange(len(rows)) - np.repeat(starts, np.diff(np.r_[starts, len(rows)]))
+    keep = rank < k
+    return rows[keep], cols[keep], sims[keep]
+
+
 @dataclass
 class EntityDeduplicator:
     """Detects and merges duplicate entities.
@@ -172,15 +227,17 @@ class EntityDeduplicator:
             entity_types=entity_types,
         )
 
-        # Fetch all entities with embeddings
-        entities = await self._fetch_entities_with_embeddings(entity_types)
-
-        if len(entities) < 2:
-            log.info("find_duplicates_insufficient_entities", count=len(entities))
-            return []
-
-        # Use numpy vectorized cosine similarity for ~100x speedup over Python loops
-        pairs = self._find_similar_pairs_vectorized(entities, similarity_threshold)
+        if self.config.approximate:
+            pairs, total = await self._find_similar_pairs_approximate(
+                entity_types, similarity_threshold
+            )
+        else:
+            embeddings = await self._fetch_entities_with_embeddings(entity_types)
+            total = len(embeddings.ids)
+            if total < 2:
+                log.info("find_duplicates_insufficient_entities", count=total)
+                return []
+            pairs = self._find_similar_pairs_blocked(embeddings, similarity_threshold)
 
         # Sort by similarity (highest first)
         pairs.sort(key=lambda p: p.similarity, reverse=True)
@@ -189,7 +246,7 @@ class EntityDeduplicator:
 
         log.info(
             "find_duplicates_complete",
-            total_entities=len(entities),
+            total_entities=total,
             duplicate_pairs=len(pairs),
         )
 
@@ -210,10 +267,7 @@ class EntityDeduplicator:
         entities: list[tuple[str, str, str, list[float]]],
         threshold: float,
     ) -> list[DuplicatePair]:
-        """Find similar entity pairs using numpy vectorized operations.
-
-        Uses matrix multiplication for cosine similarity computation,
-        which is ~100x faster than Python loops due to SIMD optimization.
+        """Find similar entity pairs among in-memory (id, name, type, embedding) tuples.
 
         Args:
             entities: List of (id, name, type, embedding) tuples.
@@ -222,62 +276,176 @@ class EntityDeduplicator:
         Returns:
             List of DuplicatePair objects for pairs above threshold.
         """
-        n = len(entities)
-        if n < 2:
+        if len(entities) < 2:
             return []
 
-        # Extract data into numpy arrays
-        ids = [e[0] for e in entities]
-        names = [e[1] for e in entities]
-        types = [e[2] for e in entities]
-        embeddings = np.array([e[3] for e in entities], dtype=np.float32)
+        embeddings = _EmbeddingMatrix()
+        embeddings.add_page(entities)
+        return self._find_similar_pairs_blocked(embeddings, threshold)
 
-        # Normalize embeddings for cosine similarity
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        # Avoid division by zero
-        norms = np.maximum(norms, 1e-10)
-        normalized = embeddings / norms
+    def _find_similar_pairs_blocked(
+        self,
+        embeddings: _EmbeddingMatrix,
+        threshold: float,
+    ) -> list[DuplicatePair]:
+        """Find similar pairs by comparing row tiles of the normalized embeddings.
 
-        # Compute similarity matrix via dot product (cosine similarity of normalized vectors)
-        similarity_matrix = normalized @ normalized.T
+        Each tile multiplies a slice of rows against the rows after it, so every
+        pair is scored once and no more than ``max_tile_memory_mb`` of scores
+        exist at a time. With ``same_type_only`` each entity type is its own
+        block, which skips every cross-type comparison.
 
-        # Find pairs above threshold (only upper triangle to avoid duplicates)
-        pairs: list[DuplicatePair] = []
-        indices = np.triu_indices(n, k=1)  # Upper triangle, k=1 excludes diagonal
+        Args:
+            embeddings: Fetched entities with normalized embeddings.
+            threshold: Minimum similarity threshold.
 
-        for idx in range(len(indices[0])):
-            i, j = indices[0][idx], indices[1][idx]
-            sim = float(similarity_matrix[i, j])
+        Returns:
+            List of DuplicatePair objects for pairs above threshold.
+        """
+        vectors = embeddings.matrix()
+        types = embeddings.types
 
-            if sim < threshold:
-                continue
+        if self.config.same_type_only:
+            type_array = np.array(types, dtype=object)
+            blocks = [np.flatnonzero(type_array == t) for t in dict.fromkeys(types)]
+        else:
+            blocks = [np.arange(len(types))]
 
-            # Skip if different types (when same_type_only)
-            if self.config.same_type_only and types[i] != types[j]:
+        pairs: list[DuplicatePair] = []
+        for block in blocks:
+            m = len(block)
+            if m < 2:
                 continue
+            block_vectors = vectors if m == len(types) else vectors[block]
+            # Scores (float32) plus the threshold mask (bool) per tile row
+            tile_rows = max(1, int(self.config.max_tile_memory_mb * 1024 * 1024) // (5 * m))
+
+            for start in range(0, m - 1, tile_rows):
+                stop = min(start + tile_rows, m)
+                scores = block_vectors[start:stop] @ block_vectors[start:].T
+                rows, cols = np.nonzero(scores >= threshold)
+                # Column c is block row start + c; keep each pair once (j > i)
+                upper = cols > rows
+                rows, cols = rows[upper], cols[upper]
+                sims = scores[rows, cols]
+                del scores
+
+                # Name-filtered candidates must not use up top_k slots
+                if self.config.min_name_overlap > 0 and len(rows):
+                    keep = self._name_mask(embeddings, block[start + rows], block[start + cols])
+                    rows, cols, sims = rows[keep], cols[keep], sims[keep]
+                if self.config.top_k is not None and len(rows):
+                    rows, cols, sims = _top_k_per_row(rows, cols, sims, self.config.top_k)
+
+                for row, col, sim in zip(rows, cols, sims, strict=True):
+                    i = int(block[start + row])
+                    j = int(block[start + col])
+                    pairs.append(self._make_pair(embeddings, i, j, float(sim)))
+
+        return pairs
 
-            # Optional: check name overlap as secondary filter
-            if self.config.min_name_overlap > 0:
-                name_sim = jaccard_similarity(names[i], names[j])
-                if name_sim < self.config.min_name_overlap:
+    async def _find_similar_pairs_approximate(
+        self,
+        entity_types: list[str] | None,
+        threshold: float,
+    ) -> tuple[list[DuplicatePair], int]:
+        """Find similar pairs with per-entity kNN queries against the vector index.
+
+        Only ids, names and types are fetched; each batch of entities queries
+        the index with its own stored embeddings.
+
+        Returns:
+            Tuple of (pairs, entities searched).
+        """
+        k = (self.config.top_k or 20) + 1  # Each entity finds itself first
+        type_filter = "AND node.entity_type IN $types" if entity_types else ""
+        same_type = "AND node.entity_type = n.entity_type" if self.config.same_type_only else ""
+        query = f"""
+        UNWIND $ids AS id
+        MATCH (n:Entity {{uuid: id}})
+        CALL db.idx.vector.queryNodes('Entity', 'name_embedding', $k, n.name_embedding)
+        YIELD node
+        WHERE node.uuid <> n.uuid {same_type} {type_filter}
+        WITH n, node, 1 - vec.cosineDistance(n.name_embedding, node.name_embedding) AS similarity
+        WHERE similarity >= $threshold
+        RETURN n.uuid AS id, n.name AS name, n.entity_type AS type,
+               node.uuid AS other_id, node.name AS other_name, similarity
+        """
+
+        driver = self.client.client.driver
+        pairs: list[DuplicatePair] = []
+        seen: set[tuple[str, str]] = set()
+        total = 0
+        async for page in self._iter_entity_pages(entity_types, with_embeddings=False):
+            total += len(page)
+            for start in range(0, len(page), self.config.batch_size):
+                ids = [record[0] for record in page[start : start + self.config.batch_size]]
+                params: dict[str, Any] = {"ids": ids, "k": k, "threshold": threshold}
+                if entity_types:
+                    params["types"] = entity_types
+                try:
+                    result = await driver.execute_query(query, **params)  # type: ignore[arg-type]
+                except Exception as e:
+                    log.warning("find_duplicates_knn_failed", error=str(e))
                     continue
 
+                for row in GraphClient.normalize_result(result):
+                    id1, id2 = str(row["id"]), str(row["other_id"])
+                    key = (min(id1, id2), max(id1, id2))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    name1, name2 = str(row.get("name") or ""), str(row.get("other_name") or "")
+                    if self._names_differ(name1, name2):
+                        continue
+                    pairs.append(
+                        DuplicatePair(
+                            entity1_id=id1,
+                            entity2_id=id2,
+                            similarity=float(row["similarity"]),
+                            entity1_name=name1,
+                            entity2_name=name2,
+                            entity_type=str(row.get("type") or ""),
+                            suggested_keep=self._suggest_keep(id1, id2, name1, name2),
+                        )
+                    )
+
+        return pairs, total
+
+    def _name_mask(
+        self, embeddings: _EmbeddingMatrix, first: np.ndarray, second: np.ndarray
+    ) -> np.ndarray:
+        """Which (first[n], second[n]) row pairs pass the name overlap filter."""
+        names = embeddings.names
+        rows = zip(first.tolist(), second.tolist(), strict=True)
+        return np.fromiter(
+            (not self._names_differ(names[i], names[j]) for i, j in rows),
+            dtype=bool,
+            count=len(first),
+        )
+
+    def _make_pair(
+        self, embeddings: _EmbeddingMatrix, i: int, j: int, similarity: float
+    ) -> DuplicatePair:
+        """Build the pair for rows i and j."""
+        names = embeddings.names
+        ids = embeddings.ids
+        return DuplicatePair(
+            entity1_id=ids[i],
+            entity2_id=ids[j],
+            similarity=similarity,
+            entity1_name=names[i],
+            entity2_name=names[j],
+            entity_type=embeddings.types[i],
             # Suggest keeping the entity with more content/metadata
-            suggested_keep = self._suggest_keep(ids[i], ids[j], names[i], names[j])
-
-            pairs.append(
-                DuplicatePair(
-                    entity1_id=ids[i],
-                    entity2_id=ids[j],
-                    similarity=sim,
-                    entity1_name=names[i],
-                    entity2_name=names[j],
-                    entity_type=types[i],
-                    suggested_keep=suggested_keep,
-                )
-            )
+            suggested_keep=self._suggest_keep(ids[i], ids[j], names[i], names[j]),
+        )
 
-        return pairs
+    def _names_differ(self, name1: str, name2: str) -> bool:
+        """Whether the optional name overlap filter rejects a pair."""
+        if self.config.min_name_overlap <= 0:
+            return False
+        return jaccard_similarity(name1, name2) < self.config.min_name_overlap
 
     async def merge_entities(
         self,
@@ -347,55 +515,89 @@ class EntityDeduplicator:
     async def _fetch_entities_with_embeddings(
         self,
         entity_types: list[str] | None = None,
-    ) -> list[tuple[str, str, str, list[float]]]:
-        """Fetch all entities that have embeddings.
+    ) -> _EmbeddingMatrix:
+        """Fetch all entities that have embeddings, one page at a time.
+
+        Each page is normalized into float32 as it arrives, so the raw
+        embedding lists of only one page are alive at once.
 
         Returns:
-            List of (id, name, type, embedding) tuples.
+            The entities and their normalized embeddings.
+        """
+        embeddings = _EmbeddingMatrix()
+        async for page in self._iter_entity_pages(entity_types, with_embeddings=True):
+            embeddings.add_page(page)
+        return embeddings
+
+    async def _iter_entity_pages(
+        self,
+        entity_types: list[str] | None,
+        *,
+        with_embeddings: bool,
+    ) -> AsyncIterator[list[tuple[str, str, str, list[float]]]]:
+        """Yield pages of (id, name, type, embedding) with keyset pagination on uuid.
+
+        Without embeddings the embedding slot is an empty list.
         """
-        # Build Cypher query to fetch entities with embeddings
         type_filter = ""
-        params: dict[str, Any] = {}
+        params: dict[str, Any] = {"limit": self.config.fetch_page_size}
 
         if entity_types:
             type_filter = "AND n.entity_type IN $types"
             params["types"] = entity_types
 
+        embedding = "n.name_embedding AS embedding" if with_embeddings else "[] AS embedding"
         query = f"""
         MATCH (n:Entity)
-        WHERE n.name_embedding IS NOT NULL {type_filter}
+        WHERE n.name_embedding IS NOT NULL AND n.uuid > $after {type_filter}
         RETURN n.uuid AS id,
                n.name AS name,
                n.entity_type AS type,
-               n.name_embedding AS embedding
+               {embedding}
+        ORDER BY n.uuid
+        LIMIT $limit
         """
 
-        try:
-            result = await self.client.client.driver.execute_query(query, **params)  # type: ignore[arg-type]
-
-            entities: list[tuple[str, str, str, list[float]]] = []
-            for record in result:
+        driver = self.client.client.driver
+        after = ""
+        while True:
+            try:
+                params["after"] = after
+                result = await driver.execute_query(query, **params)  # type: ignore[arg-type]
+            except Exception as e:
+                log.warning("fetch_entities_with_embeddings_failed", error=str(e))
+                return
+
+            records = GraphClient.normalize_result(result)
+            page: list[tuple[str, str, str, list[float]]] = []
+            last_id = after
+            for record in records:
                 if isinstance(record, (list, tuple)):
                     entity_id = str(record[0]) if len(record) > 0 else None
                     name = str(record[1]) if len(record) > 1 else ""
                     entity_type = str(record[2]) if len(record) > 2 else ""
-                    embedding = record[3] if len(record) > 3 else None
+                    vector = record[3] if len(record) > 3 else None
                 elif isinstance(record, dict):
                     entity_id = str(record.get("id", ""))
                     name = str(record.get("name", ""))
                     entity_type = str(record.get("type", ""))
-                    embedding = record.get("embedding")
+                    vector = record.get("embedding")
                 else:
                     continue  # Skip unknown record types
 
-                if entity_id and embedding and isinstance(embedding, list):
-                    entities.append((entity_id, name, entity_type, embedding))
+                if not entity_id:
+                    continue
+                last_id = entity_id
+                if with_embeddings and not (vector and isinstance(vector, list)):
+                    continue
+                page.append((entity_id, name, entity_type, vector if with_embeddings else []))
 
-            return entities
+            if page:
+                yield page
 
-        except Exception as e:
-            log.warning("fetch_entities_with_embeddings_failed", error=str(e))
-            return []
+            if len(records) < self.config.fetch_page_size or last_id <= after:
+                return
+            after = last_id
 
     async def _redirect_relationships(self, from_id: str, to_id: str) -> int:
         """Redirect all relationships from one entity to another.
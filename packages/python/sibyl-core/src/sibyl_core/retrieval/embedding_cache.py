@@ -0,0 +1,294 @@
+"""Content-addressed cache for query embeddings.
+
+Agents repeat the same searches constantly, and every search entry point
+(RAG search, hybrid RAG, code examples, unified search and Graphiti's graph
+search) embeds its query text afresh. This cache keys embeddings by
+``(model, dimensions, normalized text)`` so any caller asking for the same
+vector gets it without another API round trip.
+
+Tiers:
+- In-process LRU with TTL (always on). Vectors are held as float32 arrays,
+  a quarter of the size of a list of Python floats.
+- Redis (optional, ``SIBYL_EMBEDDING_CACHE_REDIS=true``), shared across
+  API and worker processes. Redis failures fall through to the API.
+
+Concurrent requests for the same key are coalesced: one caller embeds,
+the others await its result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from graphiti_core.embedder.client import EmbedderClient
+
+from sibyl_core.config import core_config
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from redis.asyncio import Redis
+
+log = structlog.get_logger()
+
+# Dedicated Redis database (2 = pubsub, 3 = locks)
+EMBEDDING_CACHE_DB = 4
+_REDIS_PREFIX = "sibyl:emb:"
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Embedding cache counters."""
+
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    redis_errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without calling the embedding API."""
+        hits = self.memory_hits + self.redis_hits + self.coalesced
+        total = hits + self.misses
+        return hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "redis_errors": self.redis_errors,
+            "hit_rate": round(self.hit_rate, 4),
+            "total_requests": self.memory_hits + self.redis_hits + self.coalesced + self.misses,
+        }
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different queries share a key."""
+    return " ".join(text.split())
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache with single-flight misses."""
+
+    def __init__(
+        self,
+        maxsize: int = 2048,
+        ttl_seconds: float = 86400.0,
+        redis: Redis | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum vectors kept in process.
+            ttl_seconds: Lifetime of cached vectors in both tiers.
+            redis: Optional client for the shared tier (bytes responses).
+        """
+        self._memory: OrderedDict[str, tuple[float, array[float]]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._redis = redis
+        self._inflight: dict[str, asyncio.Task[list[float]]] = {}
+        self.stats = EmbeddingCacheStats()
+
+    @staticmethod
+    def make_key(model: str, dimensions: int | None, text: str) -> str:
+        """Content address for an embedding."""
+        raw = f"{model}\0{dimensions or ''}\0{normalize_text(text)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """Number of vectors held in process."""
+        return len(self._memory)
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether the shared Redis tier is configured."""
+        return self._redis is not None
+
+    async def get_or_embed(
+        self,
+        model: str,
+        dimensions: int | None,
+        text: str,
+        embed: Callable[[str], Awaitable[list[float]]],
+    ) -> list[float]:
+        """Return the cached embedding for ``text``, computing it at most once.
+
+        Args:
+            model: Embedding model name.
+            dimensions: Output dimensions, if the model is truncated.
+            text: Text to embed. ``embed`` receives it unchanged.
+            embed: Called on a miss to produce the vector.
+
+        Returns:
+            The embedding, rounded to float32. Coalesced callers share one list.
+        """
+        key = self.make_key(model, dimensions, text)
+
+        vector = self._memory_get(key)
+        if vector is not None:
+            self.stats.memory_hits += 1
+            return vector
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            # Detached so no caller's cancellation (e.g. a search branch timeout)
+            # cancels the lookup other requests are waiting on
+            task = asyncio.create_task(self._lookup(key, text, embed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._lookup_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _lookup(
+        self, key: str, text: str, embed: Callable[[str], Awaitable[list[float]]]
+    ) -> list[float]:
+        vector = await self._redis_get(key)
+        if vector is not None:
+            self.stats.redis_hits += 1
+        else:
+            self.stats.misses += 1
+            vector = await embed(text)
+            await self._redis_set(key, vector)
+        # Every caller sees the float32 values later memory hits return
+        return self._memory_set(key, vector).tolist()
+
+    def _lookup_done(self, key: str, task: asyncio.Task[list[float]]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every waiter was cancelled
+
+    def clear(self) -> None:
+        """Drop the in-process tier."""
+        self._memory.clear()
+
+    def _memory_get(self, key: str) -> list[float] | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if time.monotonic() >= expires_at:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return vector.tolist()
+
+    def _memory_set(self, key: str, vector: list[float]) -> array[float]:
+        stored = array("f", vector)
+        self._memory[key] = (time.monotonic() + self._ttl, stored)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+        return stored
+
+    async def _redis_get(self, key: str) -> list[float] | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(_REDIS_PREFIX + key)
+        except Exception as e:
+            self.stats.redis_errors += 1
+            log.debug("embedding_cache_redis_get_failed", error=str(e))
+            return None
+        if raw is None:
+            return None
+        return array("d", raw).tolist()
+
+    async def _redis_set(self, key: str, vector: list[float]) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                _REDIS_PREFIX + key, array("d", vector).tobytes(), ex=int(self._ttl)
+            )
+        except Exception as e:
+            self.stats.redis_errors += 1
+            log.debug("embedding_cache_redis_set_failed", error=str(e))
+
+
+class CachingEmbedder(EmbedderClient):
+    """Graphiti embedder that serves single-text embeddings from the cache.
+
+    Graphiti embeds search queries (and node names) one at a time through
+    ``create``; batches are passed straight through.
+    """
+
+    def __init__(self, inner: EmbedderClient, cache: EmbeddingCache | None = None) -> None:
+        self.inner = inner
+        self._cache = cache
+
+    @property
+    def config(self) -> Any:
+        return getattr(self.inner, "config", None)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, list) and len(input_data) == 1:
+            text = input_data[0]
+        else:
+            text = input_data
+        if not isinstance(text, str):
+            return await self.inner.create(input_data)
+
+        config = self.config
+        model = str(getattr(config, "embedding_model", type(self.inner).__name__))
+        dimensions = getattr(config, "embedding_dim", None)
+        cache = self._cache or get_embedding_cache()
+        return await cache.get_or_embed(
+            model, dimensions, text, lambda _: self.inner.create(input_data)
+        )
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await self.inner.create_batch(input_data_list)
+
+
+# Global cache instance
+_embedding_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the global embedding cache, configured from core settings."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        redis = None
+        if core_config.embedding_cache_redis:
+            from redis.asyncio import Redis
+
+            redis = Redis(
+                host=core_config.falkordb_host,
+                port=core_config.falkordb_port,
+                password=core_config.falkordb_password or None,
+                db=EMBEDDING_CACHE_DB,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+            )
+        _embedding_cache = EmbeddingCache(
+            maxsize=core_config.embedding_cache_size,
+            ttl_seconds=core_config.embedding_cache_ttl_seconds,
+            redis=redis,
+        )
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Reset the global embedding cache."""
+    global _embedding_cache
+    if _embedding_cache is not None:
+        _embedding_cache.clear()
+    _embedding_cache = None
@@ -1,24 +1,34 @@
-"""Hybrid retrieval combining vector search and graph traversal.
+"""Hybrid retrieval combining vector search, BM25 and graph traversal.
 
 Implements a two-phase retrieval strategy:
-1. Entity linking: Identify entities mentioned in the query
-2. Parallel retrieval: Vector search + graph traversal from linked entities
+1. Entity linking: Identify entities named in the query
+2. Parallel retrieval: Vector search + BM25 + graph traversal from linked entities
 3. Fusion: Merge results using RRF
 """
 
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
 
 from sibyl_core.models.entities import Entity, EntityType
+from sibyl_core.retrieval.bm25 import (
+    BM25_CONTENT_CHARS,
+    OrgBM25Index,
+    get_org_bm25_index,
+    replace_org_bm25_index,
+)
 from sibyl_core.retrieval.fusion import rrf_merge, rrf_merge_with_metadata
 from sibyl_core.retrieval.temporal import temporal_boost
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from sibyl_core.graph.client import GraphClient
     from sibyl_core.graph.entities import EntityManager
 
@@ -26,6 +36,13 @@ log = structlog.get_logger()
 
 T = TypeVar("T")
 
+# Per-org BM25 index maintenance
+BM25_PAGE_SIZE = 1000
+BM25_REFRESH_SECONDS = 30.0  # Catch up on writes from other processes
+BM25_REBUILD_SECONDS = 900.0  # Full reload to drop entities deleted elsewhere
+BM25_CLOCK_SKEW = timedelta(seconds=60)  # Overlap for updated_at catch-up
+BM25_LOAD_WAIT_SECONDS = 0.5  # How long a query waits on an initial load
+
 
 @dataclass
 class HybridConfig:
@@ -37,6 +54,8 @@ class HybridConfig:
         bm25_weight: Weight for BM25 keyword results.
         rrf_k: RRF constant (higher = more uniform).
         graph_depth: Maximum depth for graph traversal.
+        speculative_graph: Seed graph traversal from entities linked by name.
+        graph_seeds: Maximum number of traversal seeds.
         apply_temporal: Whether to apply temporal boosting.
         temporal_decay_days: Decay half-life for temporal boosting.
         apply_reranking: Whether to apply cross-encoder reranking after RRF.
@@ -51,6 +70,10 @@ class HybridConfig:
     graph_depth: int = 2
     apply_temporal: bool = True
     temporal_decay_days: float = 365.0
+    # Start graph traversal from entities named in the query, concurrently
+    # with vector search; vector results seed traversal only as a fallback
+    speculative_graph: bool = True
+    graph_seeds: int = 5
     # Cross-encoder reranking (disabled by default for performance)
     apply_reranking: bool = False
     rerank_top_k: int = 20
@@ -208,6 +231,179 @@ async def graph_traversal(
         return []
 
 
+async def _read_bm25_pages(
+    index: OrgBM25Index,
+    entity_manager: EntityManager,
+    updated_since: str | None = None,
+) -> int:
+    """Page entities from the graph into ``index``; returns the count read."""
+    count = 0
+    after_id: str | None = None
+    while True:
+        page = await entity_manager.list_for_search_index(
+            after_id=after_id,
+            updated_since=updated_since,
+            limit=BM25_PAGE_SIZE,
+            content_chars=BM25_CONTENT_CHARS,
+        )
+        for entity in page:
+            index.add(entity)
+        count += len(page)
+        if len(page) < BM25_PAGE_SIZE:
+            return count
+        after_id = page[-1].id
+
+
+def _graph_read_watermark() -> str:
+    """Timestamp to resume ``updated_at`` catch-up from, allowing for clock skew."""
+    return (datetime.now(UTC) - BM25_CLOCK_SKEW).isoformat()
+
+
+async def build_org_bm25_index(entity_manager: EntityManager, group_id: str) -> OrgBM25Index:
+    """Load an organization's entities into a fresh BM25 index and publish it.
+
+    Writes made through EntityManager while the load runs are caught up by
+    the next incremental refresh, since the watermark predates the load.
+    """
+    start = time.perf_counter()
+    watermark = _graph_read_watermark()
+    index = OrgBM25Index(group_id)
+    count = await _read_bm25_pages(index, entity_manager)
+
+    index.synced_at = watermark
+    index.built_at = index.refreshed_at = time.monotonic()
+    index.loaded = True
+    replace_org_bm25_index(index)
+
+    log.info(
+        "bm25_index_built",
+        group_id=group_id,
+        entities=count,
+        terms=index.vocabulary_size,
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
+    return index
+
+
+async def refresh_org_bm25_index(index: OrgBM25Index, entity_manager: EntityManager) -> int:
+    """Catch an index up with entities updated since its last graph read.
+
+    Concurrent callers skip rather than queue behind a refresh in progress.
+    """
+    if index.lock.locked():
+        return 0
+    async with index.lock:
+        watermark = _graph_read_watermark()
+        count = await _read_bm25_pages(index, entity_manager, updated_since=index.synced_at)
+        index.synced_at = watermark
+        index.refreshed_at = time.monotonic()
+    log.debug("bm25_index_refreshed", group_id=index.group_id, updated=count)
+    return count
+
+
+def _start_bm25_build(index: OrgBM25Index, entity_manager: EntityManager) -> asyncio.Task[Any]:
+    """Start (or reuse) a background full build for ``index``'s org."""
+    if index.load_task is None or index.load_task.done():
+
+        def _log_failure(task: asyncio.Task[Any]) -> None:
+            if not task.cancelled() and (exc := task.exception()):
+                log.warning("bm25_index_build_failed", group_id=index.group_id, error=str(exc))
+
+        index.load_task = asyncio.create_task(build_org_bm25_index(entity_manager, index.group_id))
+        index.load_task.add_done_callback(_log_failure)
+    return index.load_task
+
+
+def _start_bm25_refresh(index: OrgBM25Index, entity_manager: EntityManager) -> None:
+    """Start a background catch-up for ``index`` unless one is already running."""
+    if index.refresh_task is None or index.refresh_task.done():
+
+        def _log_failure(task: asyncio.Task[Any]) -> None:
+            if not task.cancelled() and (exc := task.exception()):
+                log.warning("bm25_index_refresh_failed", group_id=index.group_id, error=str(exc))
+
+        index.refresh_task = asyncio.create_task(refresh_org_bm25_index(index, entity_manager))
+        index.refresh_task.add_done_callback(_log_failure)
+
+
+async def keyword_search(
+    query: str,
+    entity_manager: EntityManager,
+    group_id: str,
+    entity_types: list[Any] | None = None,
+    limit: int = 20,
+) -> list[tuple[Any, float]]:
+    """BM25 keyword search over the organization's in-process index.
+
+    The first query for an org starts a background build and waits briefly for
+    it; small orgs are served immediately, large ones fall back to the other
+    retrievers until the build finishes. Loaded indexes are caught up with
+    other processes' writes every ``BM25_REFRESH_SECONDS`` and rebuilt every
+    ``BM25_REBUILD_SECONDS``, both in the background.
+
+    Args:
+        query: Search query.
+        entity_manager: Entity manager for the org (used to read the graph).
+        group_id: Organization ID.
+        entity_types: Optional type filter.
+        limit: Maximum results.
+
+    Returns:
+        List of (entity, score) tuples.
+    """
+    try:
+        index = get_org_bm25_index(group_id)
+
+        if not index.loaded:
+            task = _start_bm25_build(index, entity_manager)
+            try:
+                index = await asyncio.wait_for(asyncio.shield(task), BM25_LOAD_WAIT_SECONDS)
+            except TimeoutError:
+                log.debug("bm25_index_loading", group_id=group_id)
+                return []
+        else:
+            now = time.monotonic()
+            if now - index.built_at > BM25_REBUILD_SECONDS:
+                _start_bm25_build(index, entity_manager)
+            elif now - index.refreshed_at > BM25_REFRESH_SECONDS:
+                _start_bm25_refresh(index, entity_manager)
+
+        # Over-fetch when filtering by type so the filter doesn't starve results
+        fetch = limit * 3 if entity_types else limit
+        results = index.search(query, limit=fetch)
+        if entity_types:
+            results = [(e, s) for e, s in results if e.entity_type in entity_types]
+
+        log.debug("keyword_search_complete", query=query[:50], results=len(results))
+        return results[:limit]
+    except Exception as e:
+        log.warning("keyword_search_failed", query=query[:50], error=str(e))
+        return []
+
+
+def link_query_entities(query: str, group_id: str, limit: int = 5) -> list[str]:
+    """Link entity names mentioned in the query to entity IDs.
+
+    Uses the name index kept alongside the org's BM25 index, so it costs no
+    graph round-trip. Returns nothing until that index has loaded.
+    """
+    index = get_org_bm25_index(group_id)
+    if not index.loaded:
+        return []
+    linked = index.names.link(query, limit=limit)
+    if linked:
+        log.debug("entities_linked", query=query[:50], linked=linked)
+    return [entity_id for entity_id, _ in linked]
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+async def _no_results() -> list[tuple[Any, float]]:
+    return []
+
+
 async def hybrid_search(
     query: str,
     client: GraphClient,
@@ -221,10 +417,14 @@ async def hybrid_search(
     """Perform hybrid search combining multiple retrieval strategies.
 
     Strategy:
-    1. Run vector search in parallel with BM25 search
-    2. Use top vector results as seeds for graph traversal
-    3. Merge all results using RRF
-    4. Optionally apply temporal boosting
+    1. Link entities named in the query against the org's name index
+    2. Run vector search, BM25 search and (if entities were linked) graph
+       traversal from the linked seeds concurrently
+    3. If nothing was linked, traverse from the top vector results instead
+    4. Merge all results using RRF
+    5. Optionally rerank and apply temporal boosting
+
+    Per-phase wall-clock timings are reported in ``metadata["timings_ms"]``.
 
     Args:
         query: Search query.
@@ -234,6 +434,8 @@ async def hybrid_search(
         limit: Maximum results.
         config: Hybrid configuration.
         include_metadata: Include detailed source metadata.
+        group_id: Organization ID; scopes graph traversal and enables BM25
+            and entity linking.
 
     Returns:
         HybridResult with merged, scored results.
@@ -243,31 +445,69 @@ async def hybrid_search(
 
     log.info("hybrid_search_start", query=query[:50], limit=limit)
 
-    # Phase 1: Parallel vector and BM25 search
-    vector_task = asyncio.create_task(
-        vector_search(query, entity_manager, entity_types, limit=limit * 2)
-    )
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
 
-    # Get vector results first (we need them for graph seeds)
-    vector_results = await vector_task
+    async def timed(name: str, coro: Awaitable[T]) -> T:
+        phase_start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[name] = _elapsed_ms(phase_start)
+
+    # Phase 1: Entity linking for speculative graph seeds
+    linked_ids: list[str] = []
+    if group_id and config.graph_weight > 0 and config.speculative_graph:
+        phase_start = time.perf_counter()
+        linked_ids = link_query_entities(query, group_id, limit=config.graph_seeds)
+        timings["linking"] = _elapsed_ms(phase_start)
+
+    # Phase 2: Vector, BM25 and (speculative) graph retrieval in parallel
+    seed_source = "linked" if linked_ids else None
+    bm25_coro = (
+        timed("bm25", keyword_search(query, entity_manager, group_id, entity_types, limit * 2))
+        if group_id and config.bm25_weight > 0
+        else _no_results()
+    )
+    graph_coro = (
+        timed(
+            "graph",
+            graph_traversal(
+                linked_ids, client, depth=config.graph_depth, limit=limit * 2, group_id=group_id
+            ),
+        )
+        if linked_ids
+        else _no_results()
+    )
+    vector_results, bm25_results, graph_results = await asyncio.gather(
+        timed("vector", vector_search(query, entity_manager, entity_types, limit=limit * 2)),
+        bm25_coro,
+        graph_coro,
+    )
 
-    # Phase 2: Graph traversal from top vector results
-    graph_results: list[tuple[Any, float]] = []
-    if vector_results and config.graph_weight > 0:
-        # Use top 5 results as seeds
-        seed_ids = [e.id if hasattr(e, "id") else e.get("id", "") for e, _ in vector_results[:5]]
+    # Phase 3: Without linked seeds, traverse from the top vector results
+    if not linked_ids and vector_results and config.graph_weight > 0:
+        seed_ids = [
+            e.id if hasattr(e, "id") else e.get("id", "")
+            for e, _ in vector_results[: config.graph_seeds]
+        ]
         seed_ids = [sid for sid in seed_ids if sid]
 
         if seed_ids:
-            graph_results = await graph_traversal(
-                seed_ids,
-                client,
-                depth=config.graph_depth,
-                limit=limit * 2,
-                group_id=group_id,
+            seed_source = "vector"
+            graph_results = await timed(
+                "graph",
+                graph_traversal(
+                    seed_ids,
+                    client,
+                    depth=config.graph_depth,
+                    limit=limit * 2,
+                    group_id=group_id,
+                ),
             )
+    timings["retrieval"] = _elapsed_ms(start)
 
-    # Phase 3: Merge results using RRF
+    # Phase 4: Merge results using RRF
     result_lists = []
     weights = []
     list_names = []
@@ -277,13 +517,23 @@ async def hybrid_search(
         weights.append(config.vector_weight)
         list_names.append("vector")
 
+    if bm25_results:
+        result_lists.append(bm25_results)
+        weights.append(config.bm25_weight)
+        list_names.append("bm25")
+
     if graph_results:
         result_lists.append(graph_results)
         weights.append(config.graph_weight)
         list_names.append("graph")
 
     if not result_lists:
-        return HybridResult(results=[], metadata={"sources": [], "query": query})
+        timings["total"] = _elapsed_ms(start)
+        return HybridResult(
+            results=[], metadata={"sources": [], "query": query, "timings_ms": timings}
+        )
+
+    phase_start = time.perf_counter()
 
     # Merge with or without metadata
     if include_metadata:
@@ -306,8 +556,9 @@ async def hybrid_search(
             limit=limit * 2,
         )
         source_metadata = {}
+    timings["fusion"] = _elapsed_ms(phase_start)
 
-    # Phase 4: Apply cross-encoder reranking (optional)
+    # Phase 5: Apply cross-encoder reranking (optional)
     reranking_applied = False
     if config.apply_reranking and merged:
         try:
@@ -319,7 +570,7 @@ async def hybrid_search(
                 top_k=config.rerank_top_k,
                 fallback_on_error=True,
             )
-            rerank_result = await rerank_results(query, merged, rerank_config)
+            rerank_result = await timed("rerank", rerank_results(query, merged, rerank_config))
             merged = rerank_result.results
             reranking_applied = rerank_result.reranked_count > 0
             log.debug(
@@ -330,7 +581,7 @@ async def hybrid_search(
         except Exception as e:
             log.warning("reranking_failed_continuing", error=str(e))
 
-    # Phase 5: Apply temporal boosting
+    # Phase 6: Apply temporal boosting
     if config.apply_temporal and merged:
         merged = temporal_boost(
             merged,
@@ -339,15 +590,20 @@ async def hybrid_search(
 
     # Trim to limit
     final_results = merged[:limit]
+    timings["total"] = _elapsed_ms(start)
 
     metadata = {
         "query": query,
         "sources": list_names,
         "vector_count": len(vector_results),
+        "bm25_count": len(bm25_results),
         "graph_count": len(graph_results),
         "merged_count": len(merged),
         "reranking_applied": reranking_applied,
         "temporal_applied": config.apply_temporal,
+        "graph_seed_source": seed_source,
+        "linked_entities": linked_ids,
+        "timings_ms": timings,
     }
 
     if include_metadata:
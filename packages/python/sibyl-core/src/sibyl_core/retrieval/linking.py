@@ -0,0 +1,162 @@
+"""Entity linking by name for query-time graph seeding.
+
+Finds entities whose names are mentioned in a query, either verbatim or
+with small spelling differences. Hybrid search uses the linked entities as
+graph traversal seeds so traversal can start without waiting on vector search.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+import structlog
+
+log = structlog.get_logger()
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace to single spaces."""
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+@dataclass
+class LinkingConfig:
+    """Configuration for name-based entity linking.
+
+    Attributes:
+        max_name_words: Longest name (in words) considered for exact matching.
+        min_single_word_length: Single-word names shorter than this are not linked.
+        fuzzy_threshold: Minimum similarity ratio for fuzzy matches.
+        max_fuzzy_candidates: Cap on names compared during fuzzy matching.
+    """
+
+    max_name_words: int = 8
+    min_single_word_length: int = 4
+    fuzzy_threshold: float = 0.85
+    max_fuzzy_candidates: int = 200
+
+
+class EntityNameIndex:
+    """In-memory index from normalized entity names to entity IDs.
+
+    Usage:
+        names = EntityNameIndex()
+        names.add("task_123", "OAuth callback handler")
+        names.link("why does the oauth callback handler fail")
+        # -> [("task_123", 1.0)]
+    """
+
+    def __init__(self, config: LinkingConfig | None = None) -> None:
+        self.config = config or LinkingConfig()
+        self._by_name: dict[str, set[str]] = defaultdict(set)  # name -> ids
+        self._by_token: dict[str, set[str]] = defaultdict(set)  # token -> names
+        self._names: dict[str, str] = {}  # id -> name
+
+    def add(self, entity_id: str, name: str) -> None:
+        """Index (or re-index) an entity's name."""
+        self.remove(entity_id)
+        normalized = normalize_name(name or "")
+        if not normalized or len(normalized.split()) > self.config.max_name_words:
+            return
+        self._names[entity_id] = normalized
+        self._by_name[normalized].add(entity_id)
+        for token in normalized.split():
+            self._by_token[token].add(normalized)
+
+    def remove(self, entity_id: str) -> None:
+        """Drop an entity from the index."""
+        normalized = self._names.pop(entity_id, None)
+        if normalized is None:
+            return
+        ids = self._by_name[normalized]
+        ids.discard(entity_id)
+        if ids:
+            return
+        del self._by_name[normalized]
+        for token in normalized.split():
+            names = self._by_token.get(token)
+            if names is not None:
+                names.discard(normalized)
+                if not names:
+                    del self._by_token[token]
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._by_name.clear()
+        self._by_token.clear()
+        self._names.clear()
+
+    @property
+    def size(self) -> int:
+        """Number of indexed entities."""
+        return len(self._names)
+
+    def _linkable(self, name: str) -> bool:
+        return " " in name or len(name) >= self.config.min_single_word_length
+
+    def link(self, query: str, limit: int = 5) -> list[tuple[str, float]]:
+        """Find entities named in the query.
+
+        Exact n-gram matches come first (longest names first, confidence 1.0),
+        then fuzzy matches scored by similarity ratio.
+
+        Args:
+            query: Search query.
+            limit: Maximum entities to return.
+
+        Returns:
+            List of (entity_id, confidence) tuples.
+        """
+        words = normalize_name(query).split()
+        if not words or limit <= 0:
+            return []
+
+        linked: dict[str, float] = {}
+        matched_names: set[str] = set()
+
+        # Exact: every query n-gram that is a known name
+        for n in range(min(self.config.max_name_words, len(words)), 0, -1):
+            for i in range(len(words) - n + 1):
+                gram = " ".join(words[i : i + n])
+                ids = self._by_name.get(gram)
+                if not ids or not self._linkable(gram):
+                    continue
+                matched_names.add(gram)
+                for entity_id in sorted(ids):
+                    linked.setdefault(entity_id, 1.0)
+                    if len(linked) >= limit:
+                        return list(linked.items())
+
+        # Fuzzy: names sharing a token with the query, compared to the
+        # query window of the same length
+        candidates: set[str] = set()
+        for word in set(words):
+            if len(word) >= self.config.min_single_word_length:
+                candidates |= self._by_token.get(word, set())
+            if len(candidates) >= self.config.max_fuzzy_candidates:
+                break
+
+        scored: list[tuple[float, str]] = []
+        for name in candidates - matched_names:
+            if not self._linkable(name):
+                continue
+            n = len(name.split())
+            best = 0.0
+            for i in range(max(len(words) - n + 1, 1)):
+                window = " ".join(words[i : i + n])
+                best = max(best, SequenceMatcher(None, name, window).ratio())
+            if best >= self.config.fuzzy_threshold:
+                scored.append((best, name))
+
+        for score, name in sorted(scored, reverse=True):
+            for entity_id in sorted(self._by_name[name]):
+                linked.setdefault(entity_id, round(score, 3))
+                if len(linked) >= limit:
+                    return list(linked.items())
+
+        return list(linked.items())
@@ -1,5 +1,6 @@
 """Add tool for creating new knowledge in the Sibyl graph."""
 
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -33,6 +34,13 @@ log = structlog.get_logger()
 
 __all__ = ["add"]
 
+# Entity types checked for conflicting knowledge (not workflow items)
+_CONFLICT_CHECKED_TYPES = ("episode", "pattern", "rule", "template")
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
 
 async def add(
     title: str,
@@ -107,7 +115,8 @@ async def add(
               Default 0.70. Higher = fewer false positives, lower = catch more conflicts.
 
     Returns:
-        AddResponse with created entity ID, auto-discovered links, conflicts, and timestamp.
+        AddResponse with created entity ID, auto-discovered links, conflicts, timestamp,
+        and per-stage timings_ms.
 
     EXAMPLES:
         add("OAuth redirect bug", "Fixed issue where...", category="debugging", languages=["python"])
@@ -160,6 +169,9 @@ async def add(
         languages=languages,
     )
 
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+
     try:
         client = await get_graph_client()
         org_id = (metadata or {}).get("organization_id") or (metadata or {}).get("group_id")
@@ -173,31 +185,6 @@ async def add(
         # Generate deterministic ID
         entity_id = _generate_id(entity_type, title, category or "general")
 
-        # Detect potential conflicts (duplicates, contradictions) before creating
-        conflicts: list[ConflictWarning] = []
-        if check_conflicts and entity_type in ("episode", "pattern", "rule", "template"):
-            # Only check for knowledge types, not workflow items (tasks/projects/epics)
-            try:
-                conflicts = await detect_conflicts(
-                    title=title,
-                    content=content,
-                    organization_id=org_id,
-                    entity_types=[entity_type] if entity_type else None,
-                    exclude_id=entity_id,  # Exclude self for updates
-                    max_conflicts=3,
-                    min_similarity=conflict_threshold,
-                )
-                if conflicts:
-                    log.info(
-                        "conflicts_detected",
-                        entity_id=entity_id,
-                        count=len(conflicts),
-                        types=[c.conflict_type for c in conflicts],
-                    )
-            except Exception as conflict_err:
-                # Don't fail creation if conflict detection fails
-                log.warning("conflict_detection_failed", error=str(conflict_err))
-
         # Merge metadata
         full_metadata = {
             "category": category,
@@ -350,6 +337,46 @@ async def add(
                 metadata=full_metadata,
             )
 
+        # Embed once: the vector serves conflict detection, auto-linking and the node write.
+        # Async adds without conflict checks leave embedding to the worker.
+        check_knowledge = check_conflicts and entity_type in _CONFLICT_CHECKED_TYPES
+        embedding: list[float] | None = None
+        if check_knowledge or sync:
+            phase_start = time.perf_counter()
+            try:
+                embedding = await entity_manager.embed(entity)
+            except Exception as embed_err:
+                # Searches fall back to hybrid search; create_direct() retries the embedding
+                log.warning("add_embedding_failed", error=str(embed_err))
+            timings["embed"] = _elapsed_ms(phase_start)
+
+        # Detect potential conflicts (duplicates, contradictions) before creating
+        conflicts: list[ConflictWarning] = []
+        if check_knowledge:
+            phase_start = time.perf_counter()
+            try:
+                conflicts = await detect_conflicts(
+                    title=title,
+                    content=content,
+                    organization_id=org_id,
+                    entity_types=[entity_type] if entity_type else None,
+                    exclude_id=entity_id,  # Exclude self for updates
+                    max_conflicts=3,
+                    min_similarity=conflict_threshold,
+                    embedding=embedding,
+                )
+                if conflicts:
+                    log.info(
+                        "conflicts_detected",
+                        entity_id=entity_id,
+                        count=len(conflicts),
+                        types=[c.conflict_type for c in conflicts],
+                    )
+            except Exception as conflict_err:
+                # Don't fail creation if conflict detection fails
+                log.warning("conflict_detection_failed", error=str(conflict_err))
+            timings["conflicts"] = _elapsed_ms(phase_start)
+
         # Build list of explicit relationships to create
         relationships_to_create: list[dict[str, Any]] = []
 
@@ -421,14 +448,17 @@ async def add(
 
         # Sync mode: create entity + relationships immediately via Graphiti
         if sync:
-            # Use create_direct() for structured entities (faster, generates embeddings)
+            # Use create_direct() for structured entities (faster, stores our embedding)
             # Use create() for episodes (LLM extraction may add value)
+            phase_start = time.perf_counter()
             if entity_type in ("task", "project", "epic", "pattern"):
-                created_id = await entity_manager.create_direct(entity)
+                created_id = await entity_manager.create_direct(entity, embedding=embedding)
             else:
                 created_id = await entity_manager.create(entity)
+            timings["create"] = _elapsed_ms(phase_start)
 
             # Create explicit relationships
+            phase_start = time.perf_counter()
             for rel_data in relationships_to_create:
                 try:
                     rel = Relationship(
@@ -441,8 +471,10 @@ async def add(
                     await relationship_manager.create(rel)
                 except Exception as e:
                     log.warning("relationship_creation_failed", error=str(e), rel=rel_data)
+            timings["relationships"] = _elapsed_ms(phase_start)
 
             # Auto-link to related patterns/rules/templates in sync mode
+            phase_start = time.perf_counter()
             try:
                 auto_link_results = await _auto_discover_links(
                     entity_manager=entity_manager,
@@ -453,6 +485,7 @@ async def add(
                     exclude_id=created_id,
                     threshold=0.75,
                     limit=5,
+                    embedding=embedding,
                 )
                 for linked_id, score in auto_link_results:
                     try:
@@ -472,6 +505,7 @@ async def add(
                         log.warning("auto_link_failed", error=str(e), target=linked_id)
             except Exception as e:
                 log.warning("auto_link_search_failed", error=str(e))
+            timings["links"] = _elapsed_ms(phase_start)
 
             message = f"Added: {title}"
             if relationships_to_create:
@@ -479,15 +513,18 @@ async def add(
             if conflicts:
                 message += f" (⚠️ {len(conflicts)} potential conflict(s) detected)"
 
+            timings["total"] = _elapsed_ms(start)
             return AddResponse(
                 success=True,
                 id=created_id,
                 message=message,
                 timestamp=datetime.now(UTC),
                 conflicts=conflicts,
+                timings_ms=timings,
             )
 
         # Async mode (default): queue arq job, return immediately
+        phase_start = time.perf_counter()
         try:
             from sibyl.jobs.queue import enqueue_create_entity
 
@@ -503,17 +540,21 @@ async def add(
                     "technologies": technologies or languages or [],
                     "category": category,
                 },
+                embedding=embedding,
             )
             log.info("add_queued_for_arq", entity_id=entity_id, entity_type=entity_type)
+            timings["enqueue"] = _elapsed_ms(phase_start)
 
         except Exception as e:
             # If arq queue fails, fall back to sync creation
             log.warning("arq_queue_failed_falling_back_to_sync", error=str(e))
-            # Use create_direct() for structured entities (faster, generates embeddings)
+            phase_start = time.perf_counter()
+            # Use create_direct() for structured entities (faster, stores our embedding)
             if entity_type in ("task", "project", "epic", "pattern"):
-                created_id = await entity_manager.create_direct(entity)
+                created_id = await entity_manager.create_direct(entity, embedding=embedding)
             else:
                 created_id = await entity_manager.create(entity)
+            timings["create"] = _elapsed_ms(phase_start)
 
             for rel_data in relationships_to_create:
                 try:
@@ -531,24 +572,28 @@ async def add(
             fallback_message = f"Added (sync fallback): {title}"
             if conflicts:
                 fallback_message += f" (⚠️ {len(conflicts)} potential conflict(s) detected)"
+            timings["total"] = _elapsed_ms(start)
             return AddResponse(
                 success=True,
                 id=created_id,
                 message=fallback_message,
                 timestamp=datetime.now(UTC),
                 conflicts=conflicts,
+                timings_ms=timings,
             )
 
         # Return immediately with the entity ID - entity will be created in background
         queued_message = f"Queued: {title} (processing in background)"
         if conflicts:
             queued_message += f" (⚠️ {len(conflicts)} potential conflict(s) detected)"
+        timings["total"] = _elapsed_ms(start)
         return AddResponse(
             success=True,
             id=entity_id,
             message=queued_message,
             timestamp=datetime.now(UTC),
             conflicts=conflicts,
+            timings_ms=timings,
         )
 
     except Exception as e:
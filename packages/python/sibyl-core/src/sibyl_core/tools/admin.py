@@ -3,17 +3,30 @@
 Provides maintenance and diagnostic capabilities.
 """
 
+import asyncio
+import json
 import time
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 
 import structlog
 
 from sibyl_core.config import settings
+from sibyl_core.graph.batch import (
+    batch_create_nodes,
+    batch_create_relationships,
+    batch_set_embeddings,
+    batch_update_nodes,
+)
 from sibyl_core.graph.client import GraphClient, get_graph_client
-from sibyl_core.graph.entities import EntityManager
+from sibyl_core.graph.counts import get_entity_counts, invalidate_entity_counts
+from sibyl_core.graph.entities import ENTITY_LABELS, FILTER_PROPERTIES, EntityManager
 from sibyl_core.graph.relationships import RelationshipManager
 from sibyl_core.models.entities import Entity, EntityType, Relationship, RelationshipType
+from sibyl_core.retrieval.bm25 import index_org_entity
 
 log = structlog.get_logger()
 
@@ -93,13 +106,14 @@ async def health_check(*, organization_id: str | None = None) -> HealthStatus:
         if organization_id:
             entity_manager = EntityManager(client, group_id=organization_id)
 
-            # Get entity counts
-            for entity_type in EntityType:
-                try:
-                    entities = await entity_manager.list_by_type(entity_type, limit=1000)
-                    entity_counts[entity_type.value] = len(entities)
-                except Exception:
-                    entity_counts[entity_type.value] = -1  # Unknown
+            # Get entity counts (cached aggregate, see graph.counts)
+            try:
+                counts = await get_entity_counts(client, organization_id)
+                totals = counts.type_totals()
+                entity_counts = {t.value: totals.get(t.value, 0) for t in EntityType}
+            except Exception as e:
+                entity_counts = dict.fromkeys((t.value for t in EntityType), -1)  # Unknown
+                errors.append(f"Entity count failed: {e}")
 
             # Test search latency
             try:
@@ -213,19 +227,13 @@ async def get_stats(*, organization_id: str | None = None) -> dict[str, object]:
 
     try:
         client = await get_graph_client()
-        entity_manager = EntityManager(client, group_id=organization_id)
 
-        # Count entities by type
-        entity_stats: dict[str, int] = {}
-        for entity_type in EntityType:
-            try:
-                entities = await entity_manager.list_by_type(entity_type, limit=10000)
-                entity_stats[entity_type.value] = len(entities)
-            except Exception:
-                entity_stats[entity_type.value] = -1
-
-        stats["entities"] = entity_stats
-        stats["total_entities"] = sum(v for v in entity_stats.values() if v > 0)
+        # Count entities by type and status (cached aggregate, see graph.counts)
+        counts = await get_entity_counts(client, organization_id)
+        totals = counts.type_totals()
+        stats["entities"] = {t.value: totals.get(t.value, 0) for t in EntityType}
+        stats["statuses"] = counts.status_counts()
+        stats["total_entities"] = counts.total
 
         # TODO: Add relationship stats from RelationshipManager
         # TODO: Add storage stats from Graphiti
@@ -485,8 +493,166 @@ BACKUP_ENTITY_TYPES = [
 ]
 
 
+# Streamed backup format (NDJSON): a header, one record per entity and per
+# relationship, then a footer with the counts
+BACKUP_VERSION = "3.0"
+
+# Entities or relationships read per page while exporting
+BACKUP_PAGE_SIZE = 1000
+
+# Records restored per batch; each batch is one UNWIND write per entity type
+# and relationship type, followed by a checkpoint
+RESTORE_BATCH_SIZE = 500
+
+
+async def iter_backup_records(
+    *,
+    organization_id: str,
+    page_size: int = BACKUP_PAGE_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream an organization's graph as backup records.
+
+    Entities are paged by ``(created_at, uuid)`` and relationships by uuid, so
+    only one page is held in memory and nothing is truncated. Records, in order:
+
+    - ``{"kind": "header", "version", "created_at", "organization_id"}``
+    - ``{"kind": "entity", "data": {...}}`` for each entity
+    - ``{"kind": "relationship", "data": {...}}`` for each relationship
+    - ``{"kind": "footer", "entity_count", "relationship_count"}``
+
+    Query errors propagate, so a partial backup never looks complete.
+
+    Args:
+        organization_id: Organization UUID to back up.
+        page_size: Entities or relationships read per query.
+
+    Yields:
+        Backup records, one per NDJSON line.
+    """
+    client = await get_graph_client()
+    entity_manager = EntityManager(client, group_id=organization_id)
+    relationship_manager = RelationshipManager(client, group_id=organization_id)
+
+    yield {
+        "kind": "header",
+        "version": BACKUP_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "organization_id": organization_id,
+    }
+
+    entity_count = 0
+    cursor: str | None = ""
+    while cursor is not None:
+        page = await entity_manager.list_page(
+            BACKUP_ENTITY_TYPES,
+            page_size,
+            cursor=cursor,
+            descending=False,
+            include_archived=True,
+        )
+        for entity in page.entities:
+            yield {"kind": "entity", "data": entity.model_dump(mode="json")}
+        entity_count += len(page.entities)
+        cursor = page.next_cursor
+
+    relationship_count = 0
+    cursor = ""
+    while cursor is not None:
+        rel_page = await relationship_manager.list_page(page_size, after_id=cursor)
+        for relationship in rel_page.relationships:
+            yield {"kind": "relationship", "data": relationship.model_dump(mode="json")}
+        relationship_count += len(rel_page.relationships)
+        cursor = rel_page.next_cursor
+
+    yield {
+        "kind": "footer",
+        "entity_count": entity_count,
+        "relationship_count": relationship_count,
+    }
+
+
+async def export_backup_ndjson(
+    write: Callable[[bytes], object],
+    *,
+    organization_id: str,
+    page_size: int = BACKUP_PAGE_SIZE,
+) -> BackupResult:
+    """Write an organization's graph backup as NDJSON.
+
+    Records from `iter_backup_records` are encoded one per line and passed to
+    ``write`` a page at a time, in a worker thread so file I/O stays off the
+    event loop. Memory use is bounded by the page size, not the graph size.
+
+    Args:
+        write: Sink for encoded lines, e.g. the ``write`` of a binary file.
+        organization_id: Organization UUID to back up.
+        page_size: Records read per query and written per call to ``write``.
+
+    Returns:
+        BackupResult with the counts; ``backup_data`` is always None.
+    """
+    log.info("Exporting backup", organization_id=organization_id)
+    start_time = time.time()
+
+    entity_count = 0
+    relationship_count = 0
+    lines: list[bytes] = []
+    try:
+        async for record in iter_backup_records(
+            organization_id=organization_id, page_size=page_size
+        ):
+            lines.append(json.dumps(record, default=str).encode() + b"\n")
+            if record["kind"] == "footer":
+                entity_count = record["entity_count"]
+                relationship_count = record["relationship_count"]
+            if len(lines) >= page_size:
+                await asyncio.to_thread(write, b"".join(lines))
+                lines = []
+        if lines:
+            await asyncio.to_thread(write, b"".join(lines))
+
+    except Exception as e:
+        log.exception("Backup export failed", error=str(e))
+        return BackupResult(
+            success=False,
+            entity_count=0,
+            relationship_count=0,
+            backup_data=None,
+            message=f"Backup failed: {e}",
+            duration_seconds=time.time() - start_time,
+        )
+
+    duration = time.time() - start_time
+    log.info(
+        "Backup exported",
+        entities=entity_count,
+        relationships=relationship_count,
+        duration=duration,
+    )
+    return BackupResult(
+        success=True,
+        entity_count=entity_count,
+        relationship_count=relationship_count,
+        backup_data=None,
+        message=f"Backup created: {entity_count} entities, {relationship_count} relationships",
+        duration_seconds=duration,
+    )
+
+
+def read_backup_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """Read backup records from an NDJSON file, one line at a time."""
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 async def create_backup(*, organization_id: str) -> BackupResult:
-    """Create a backup of all graph data for an organization.
+    """Create an in-memory backup of all graph data for an organization.
+
+    Reads the same pages as `export_backup_ndjson`, so nothing is truncated,
+    but the whole graph is held in memory. Prefer the NDJSON export for large
+    organizations.
 
     Args:
         organization_id: Organization UUID to backup.
@@ -498,47 +664,39 @@ async def create_backup(*, organization_id: str) -> BackupResult:
     start_time = time.time()
 
     try:
-        client = await get_graph_client()
-        entity_manager = EntityManager(client, group_id=organization_id)
-        relationship_manager = RelationshipManager(client, group_id=organization_id)
-
-        # Collect all entities
-        all_entities: list[Entity] = []
-        for entity_type in BACKUP_ENTITY_TYPES:
-            try:
-                entities = await entity_manager.list_by_type(entity_type, limit=10000)
-                all_entities.extend(entities)
-            except Exception as e:
-                log.warning("Failed to backup entity type", type=entity_type.value, error=str(e))
-
-        # Collect all relationships
-        relationships = await relationship_manager.list_all(limit=50000)
+        entities: list[dict[str, Any]] = []
+        relationships: list[dict[str, Any]] = []
+        async for record in iter_backup_records(organization_id=organization_id):
+            if record["kind"] == "entity":
+                entities.append(record["data"])
+            elif record["kind"] == "relationship":
+                relationships.append(record["data"])
 
         # Build backup data
         backup_data = BackupData(
             version="2.0",
             created_at=datetime.now(UTC).isoformat(),
             organization_id=organization_id,
-            entity_count=len(all_entities),
+            entity_count=len(entities),
             relationship_count=len(relationships),
-            entities=[e.model_dump(mode="json") for e in all_entities],
-            relationships=[r.model_dump(mode="json") for r in relationships],
+            entities=entities,
+            relationships=relationships,
         )
 
         duration = time.time() - start_time
         log.info(
             "Backup created",
-            entities=len(all_entities),
+            entities=len(entities),
             relationships=len(relationships),
             duration=duration,
         )
 
         return BackupResult(
             success=True,
-            entity_count=len(all_entities),
+            entity_count=len(entities),
             relationship_count=len(relationships),
             backup_data=backup_data,
-            message=f"Backup created: {len(all_entities)} entities, {len(relationships)} relationships",
+            message=f"Backup created: {len(entities)} entities, {len(relationships)} relationships",
             duration_seconds=duration,
         )
 
@@ -554,107 +712,351 @@ async def create_backup(*, organization_id: str) -> BackupResult:
         )
 
 
-async def restore_backup(
-    backup_data: BackupData,
+@dataclass
+class _RestoreProgress:
+    """Restore counters; saved as the resume checkpoint after each batch."""
+
+    records_done: int = 0
+    entities_restored: int = 0
+    entities_skipped: int = 0
+    relationships_restored: int = 0
+    relationships_skipped: int = 0
+
+
+def _load_checkpoint(path: Path, organization_id: str) -> _RestoreProgress:
+    """Read a restore checkpoint, or start fresh if there is none."""
+    if not path.exists():
+        return _RestoreProgress()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.pop("organization_id", None) != organization_id:
+        raise ValueError(f"Checkpoint {path} belongs to a different organization")
+    return _RestoreProgress(**data)
+
+
+def _save_checkpoint(path: Path, organization_id: str, progress: _RestoreProgress) -> None:
+    """Atomically replace the restore checkpoint."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(
+        json.dumps({"organization_id": organization_id, **asdict(progress)}),
+        encoding="utf-8",
+    )
+    tmp.replace(path)
+
+
+def _backup_data_records(backup_data: BackupData) -> Iterator[dict[str, Any]]:
+    """Present an in-memory backup as a record stream."""
+    yield {
+        "kind": "header",
+        "version": backup_data.version,
+        "created_at": backup_data.created_at,
+        "organization_id": backup_data.organization_id,
+    }
+    for entity in backup_data.entities:
+        yield {"kind": "entity", "data": entity}
+    for relationship in backup_data.relationships:
+        yield {"kind": "relationship", "data": relationship}
+    yield {
+        "kind": "footer",
+        "entity_count": len(backup_data.entities),
+        "relationship_count": len(backup_data.relationships),
+    }
+
+
+async def _aiter_records(
+    records: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+) -> AsyncIterator[dict[str, Any]]:
+    if isinstance(records, AsyncIterable):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
+
+
+async def _restore_entities(
+    client: GraphClient,
+    entity_manager: EntityManager,
+    organization_id: str,
+    entities: list[Entity],
+    *,
+    skip_existing: bool,
+) -> tuple[int, int]:
+    """Write one batch of entities. Returns (restored, skipped)."""
+    ids = [entity.id for entity in entities]
+    existing: set[str] = set()
+    for label in ENTITY_LABELS:
+        rows = await client.execute_read_org(
+            f"UNWIND $ids AS id MATCH (n:{label} {{uuid: id}}) RETURN n.uuid AS uuid",
+            organization_id,
+            ids=ids,
+        )
+        existing.update(row["uuid"] for row in rows)
+
+    new_nodes: dict[str, list[dict[str, Any]]] = {}
+    updates: list[dict[str, Any]] = []
+    restored: list[Entity] = []
+    skipped = 0
+    for entity in entities:
+        if entity.id in existing:
+            if skip_existing:
+                skipped += 1
+                continue
+            props = entity_manager.node_properties(entity)
+            props.pop("uuid")
+            updates.append({"uuid": entity.id, "properties": props})
+        else:
+            nodes = new_nodes.setdefault(entity.entity_type.value, [])
+            nodes.append(entity_manager.node_properties(entity))
+            existing.add(entity.id)
+        restored.append(entity)
+
+    # Embed up front so an embedder failure stops the restore before this
+    # batch is written, rather than leaving nodes invisible to vector search
+    embeddings = await _restore_embeddings(entity_manager, restored)
+
+    # Labels match EntityNode.save(): Entity plus the entity type
+    for entity_type, nodes in new_nodes.items():
+        await batch_create_nodes(
+            client, organization_id, nodes, label=f"Entity:{entity_type}", return_ids=False
+        )
+    await batch_update_nodes(client, organization_id, updates)
+    await batch_set_embeddings(client, organization_id, embeddings)
+
+    for entity in restored:
+        index_org_entity(organization_id, entity)
+    if restored:
+        invalidate_entity_counts(organization_id)
+    return len(restored), skipped
+
+
+async def _restore_embeddings(
+    entity_manager: EntityManager, entities: list[Entity]
+) -> dict[str, list[float]]:
+    """name_embedding for each entity: the record's own vector, else one batch embed."""
+    embeddings = {entity.id: entity.embedding for entity in entities if entity.embedding}
+    missing = [entity for entity in entities if entity.id not in embeddings]
+    vectors = await entity_manager.embed_many(missing)
+    embeddings.update(zip((entity.id for entity in missing), vectors, strict=True))
+    return embeddings
+
+
+async def _restore_relationships(
+    client: GraphClient,
+    organization_id: str,
+    relationships: list[Relationship],
+) -> tuple[int, int]:
+    """Write one batch of relationships. Returns (restored, skipped).
+
+    Relationships are MERGEd, so re-running a batch creates no duplicates.
+    Relationships whose endpoints don't exist are skipped.
+    """
+    by_type: dict[str, list[dict[str, Any]]] = {}
+    for rel in relationships:
+        rel_type = rel.relationship_type.value
+        by_type.setdefault(rel_type, []).append(
+            {
+                "from_uuid": rel.source_id,
+                "to_uuid": rel.target_id,
+                "properties": {
+                    "uuid": rel.id,
+                    "name": rel_type,
+                    "group_id": organization_id,
+                    "source_node_uuid": rel.source_id,
+                    "target_node_uuid": rel.target_id,
+                    "created_at": rel.created_at,
+                    "weight": rel.weight,
+                    "fact": f"{rel_type} relationship",
+                },
+            }
+        )
+
+    restored = 0
+    for rel_type, rels in by_type.items():
+        # Index lookups on Entity nodes first; fall back to any label (e.g.
+        # Episodic endpoints) only when some endpoints weren't found
+        created = await batch_create_relationships(
+            client, organization_id, rels, rel_type=rel_type, label="Entity"
+        )
+        if created < len(rels):
+            created = await batch_create_relationships(
+                client, organization_id, rels, rel_type=rel_type
+            )
+        restored += min(created, len(rels))
+    return restored, len(relationships) - restored
+
+
+def _record_error(errors: list[str], message: str) -> None:
+    errors.append(message)
+    if len(errors) <= 10:
+        log.warning("Restore record failed", error=message)
+
+
+async def restore_backup_stream(
+    records: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
     *,
     organization_id: str,
     skip_existing: bool = True,
+    batch_size: int = RESTORE_BATCH_SIZE,
+    checkpoint_path: Path | None = None,
 ) -> RestoreResult:
-    """Restore graph data from a backup.
+    """Restore graph data from a stream of backup records.
+
+    Records (see `iter_backup_records`) are restored in batches of
+    ``batch_size``. Each batch looks up which entities already exist with one
+    query per node label, then writes entities with one UNWIND query per
+    entity type and relationships with one per relationship type (see
+    `sibyl_core.graph.batch`). Each batch's entities are embedded with one
+    embedder call (records that carry an ``embedding`` keep it), so restored
+    nodes are searchable by vector like those written by `EntityManager.create`.
+
+    With ``checkpoint_path``, progress is saved there after every batch. Run
+    again with the same records and path, a restore that stopped part-way
+    resumes after the last completed batch; the file is removed once the
+    restore finishes. Repeating a batch is harmless: existing entities are
+    skipped (or updated) and relationships are MERGEd.
+
+    Records that fail validation are reported in ``errors``. A failed write
+    stops the restore, leaving the checkpoint at the last completed batch.
 
     Args:
-        backup_data: The backup data to restore.
+        records: Backup records, e.g. from `read_backup_ndjson`.
         organization_id: Organization UUID to restore into.
-        skip_existing: If True, skip entities/relationships that already exist.
+        skip_existing: If True, skip entities that already exist; otherwise
+            overwrite their properties.
+        batch_size: Records written per batch.
+        checkpoint_path: Where to save progress for resuming.
 
     Returns:
-        RestoreResult with restore statistics.
+        RestoreResult with restore statistics, including resumed batches.
     """
-    log.info(
-        "Restoring backup",
-        organization_id=organization_id,
-        entities=backup_data.entity_count,
-        relationships=backup_data.relationship_count,
-    )
+    log.info("Restoring backup", organization_id=organization_id, batch_size=batch_size)
     start_time = time.time()
 
     errors: list[str] = []
-    entities_restored = 0
-    entities_skipped = 0
-    relationships_restored = 0
-    relationships_skipped = 0
+    progress = _RestoreProgress()
+    complete = False
 
     try:
+        if checkpoint_path is not None:
+            progress = _load_checkpoint(checkpoint_path, organization_id)
+            if progress.records_done:
+                log.info("Resuming restore", records_done=progress.records_done)
+
         client = await get_graph_client()
         entity_manager = EntityManager(client, group_id=organization_id)
-        relationship_manager = RelationshipManager(client, group_id=organization_id)
 
-        # Restore entities
-        for entity_data in backup_data.entities:
-            try:
-                entity = Entity.model_validate(entity_data)
-                # Check if entity exists
-                existing = await entity_manager.get(entity.id)
-                if existing and skip_existing:
-                    entities_skipped += 1
-                    continue
+        entities: list[Entity] = []
+        relationships: list[Relationship] = []
+        pending = 0
 
-                await entity_manager.create(entity)
-                entities_restored += 1
-            except Exception as e:
-                error_msg = f"Entity {entity_data.get('id', 'unknown')}: {e}"
-                errors.append(error_msg)
-                if len(errors) <= 10:
-                    log.warning("Entity restore failed", error=error_msg)
+        async def flush() -> None:
+            nonlocal entities, relationships, pending
+            if entities:
+                restored, skipped = await _restore_entities(
+                    client, entity_manager, organization_id, entities, skip_existing=skip_existing
+                )
+                progress.entities_restored += restored
+                progress.entities_skipped += skipped
+            if relationships:
+                restored, skipped = await _restore_relationships(
+                    client, organization_id, relationships
+                )
+                progress.relationships_restored += restored
+                progress.relationships_skipped += skipped
+            progress.records_done += pending
+            entities, relationships, pending = [], [], 0
+            if checkpoint_path is not None:
+                await asyncio.to_thread(
+                    _save_checkpoint, checkpoint_path, organization_id, progress
+                )
 
-        # Restore relationships
-        for rel_data in backup_data.relationships:
+        seen = 0
+        async for record in _aiter_records(records):
+            kind = record.get("kind")
+            if kind == "footer":
+                complete = True
+            if kind not in ("entity", "relationship"):
+                continue
+            seen += 1
+            if seen <= progress.records_done:
+                continue
+
+            data = record.get("data") or {}
             try:
-                relationship = Relationship.model_validate(rel_data)
-                # Note: RelationshipManager doesn't have get(id), so we can't check existence
-                # Create will fail if relationship already exists (handled in except block)
-                await relationship_manager.create(relationship)
-                relationships_restored += 1
+                if kind == "entity":
+                    entities.append(Entity.model_validate(data))
+                else:
+                    relationships.append(Relationship.model_validate(data))
             except Exception as e:
-                error_msg = f"Relationship {rel_data.get('id', 'unknown')}: {e}"
-                errors.append(error_msg)
-                if len(errors) <= 10:
-                    log.warning("Relationship restore failed", error=error_msg)
+                _record_error(errors, f"{kind.capitalize()} {data.get('id', 'unknown')}: {e}")
+            pending += 1
+            if pending >= batch_size:
+                await flush()
+        if pending:
+            await flush()
+
+        if not complete:
+            errors.append("Backup has no footer record; it may be truncated")
+        if checkpoint_path is not None:
+            checkpoint_path.unlink(missing_ok=True)
 
         duration = time.time() - start_time
         log.info(
             "Restore completed",
-            entities_restored=entities_restored,
-            entities_skipped=entities_skipped,
-            relationships_restored=relationships_restored,
-            relationships_skipped=relationships_skipped,
+            entities_restored=progress.entities_restored,
+            entities_skipped=progress.entities_skipped,
+            relationships_restored=progress.relationships_restored,
+            relationships_skipped=progress.relationships_skipped,
             errors=len(errors),
             duration=duration,
         )
 
         return RestoreResult(
             success=len(errors) == 0,
-            entities_restored=entities_restored,
-            relationships_restored=relationships_restored,
-            entities_skipped=entities_skipped,
-            relationships_skipped=relationships_skipped,
+            entities_restored=progress.entities_restored,
+            relationships_restored=progress.relationships_restored,
+            entities_skipped=progress.entities_skipped,
+            relationships_skipped=progress.relationships_skipped,
             errors=errors[:50],  # Limit error list
             duration_seconds=duration,
         )
 
     except Exception as e:
-        log.exception("Restore failed", error=str(e))
+        log.exception("Restore failed", error=str(e), records_done=progress.records_done)
         return RestoreResult(
             success=False,
-            entities_restored=entities_restored,
-            relationships_restored=relationships_restored,
-            entities_skipped=entities_skipped,
-            relationships_skipped=relationships_skipped,
+            entities_restored=progress.entities_restored,
+            relationships_restored=progress.relationships_restored,
+            entities_skipped=progress.entities_skipped,
+            relationships_skipped=progress.relationships_skipped,
             errors=[str(e), *errors[:49]],
             duration_seconds=time.time() - start_time,
         )
 
 
+async def restore_backup(
+    backup_data: BackupData,
+    *,
+    organization_id: str,
+    skip_existing: bool = True,
+) -> RestoreResult:
+    """Restore graph data from an in-memory backup.
+
+    Args:
+        backup_data: The backup data to restore.
+        organization_id: Organization UUID to restore into.
+        skip_existing: If True, skip entities that already exist.
+
+    Returns:
+        RestoreResult with restore statistics.
+    """
+    return await restore_backup_stream(
+        _backup_data_records(backup_data),
+        organization_id=organization_id,
+        skip_existing=skip_existing,
+    )
+
+
 @dataclass
 class BackfillResult:
     """Result of a relationship backfill operation."""
@@ -964,6 +1366,160 @@ async def backfill_project_id_from_relationships(
         )
 
 
+# =============================================================================
+# Filter Property Backfill
+# =============================================================================
+
+# Filter values compared case-insensitively by list_by_type
+_LOWERCASE_FILTER_PROPERTIES = frozenset({"status", "priority", "complexity"})
+
+
+@dataclass
+class FilterPropertyBackfillResult:
+    """Result of filter property backfill."""
+
+    success: bool
+    nodes_scanned: int
+    nodes_updated: int
+    errors: list[str]
+    duration_seconds: float
+
+
+def _filter_property_updates(record: dict[str, object]) -> dict[str, object]:
+    """Diff a node's top-level filter properties against its metadata JSON."""
+    import json
+
+    metadata = record.get("metadata") or {}
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(metadata, dict):
+        return {}
+
+    updates: dict[str, object] = {}
+    for prop in FILTER_PROPERTIES:
+        value = metadata.get(prop)
+        if value is None or value == "" or value == []:
+            continue
+        if prop in _LOWERCASE_FILTER_PROPERTIES and isinstance(value, str):
+            value = value.lower()
+        if record.get(prop) != value:
+            updates[prop] = value
+    return updates
+
+
+async def backfill_filter_properties(
+    *,
+    organization_id: str,
+    dry_run: bool = False,
+    batch_size: int = 500,
+) -> FilterPropertyBackfillResult:
+    """Promote list filter fields from metadata JSON to top-level node properties.
+
+    list_by_type filters on top-level properties (status, priority, project_id,
+    ...) so the database can use its indexes. Nodes written before those
+    properties were promoted only carry them inside the metadata JSON string;
+    this copies them up, paging through nodes by uuid and writing each page
+    with a single UNWIND update. Safe to re-run.
+
+    Args:
+        organization_id: Organization UUID to process.
+        dry_run: If True, only report what would be done without making changes.
+        batch_size: Nodes scanned (and updated) per round-trip.
+
+    Returns:
+        FilterPropertyBackfillResult with statistics about what was processed/updated.
+    """
+    log.info(
+        "backfill_filter_properties_start",
+        organization_id=organization_id,
+        dry_run=dry_run,
+    )
+    start_time = time.time()
+
+    errors: list[str] = []
+    nodes_scanned = 0
+    nodes_updated = 0
+    returned_props = ", ".join(f"n.{prop} AS {prop}" for prop in FILTER_PROPERTIES)
+
+    try:
+        client = await get_graph_client()
+        await client.ensure_indexes(organization_id)
+
+        for label in ENTITY_LABELS:
+            after_id = ""
+            while True:
+                query = f"""
+                MATCH (n:{label})
+                WHERE n.group_id = $group_id
+                  AND n.entity_type IS NOT NULL
+                  AND n.uuid > $after_id
+                RETURN n.uuid AS uuid, n.metadata AS metadata, {returned_props}
+                ORDER BY n.uuid
+                LIMIT $limit
+                """
+                records = await client.execute_read_org(
+                    query,
+                    organization_id,
+                    group_id=organization_id,
+                    after_id=after_id,
+                    limit=batch_size,
+                )
+                if not records:
+                    break
+
+                nodes_scanned += len(records)
+                after_id = records[-1]["uuid"]
+                updates = [
+                    {"uuid": record["uuid"], "properties": props}
+                    for record in records
+                    if (props := _filter_property_updates(record))
+                ]
+                if not updates:
+                    continue
+
+                if dry_run:
+                    nodes_updated += len(updates)
+                    continue
+
+                try:
+                    nodes_updated += await batch_update_nodes(
+                        client, organization_id, updates, label=label
+                    )
+                except Exception as e:
+                    errors.append(f"{label} page after {after_id}: {e}")
+
+        duration = time.time() - start_time
+        log.info(
+            "backfill_filter_properties_complete",
+            nodes_scanned=nodes_scanned,
+            nodes_updated=nodes_updated,
+            errors=len(errors),
+            duration=duration,
+            dry_run=dry_run,
+        )
+
+        return FilterPropertyBackfillResult(
+            success=len(errors) == 0,
+            nodes_scanned=nodes_scanned,
+            nodes_updated=nodes_updated,
+            errors=errors[:50],
+            duration_seconds=duration,
+        )
+
+    except Exception as e:
+        log.exception("backfill_filter_properties_failed", error=str(e))
+        return FilterPropertyBackfillResult(
+            success=False,
+            nodes_scanned=nodes_scanned,
+            nodes_updated=nodes_updated,
+            errors=[str(e), *errors[:49]],
+            duration_seconds=time.time() - start_time,
+        )
+
+
 # =============================================================================
 # Episode -> Task Relationship Backfill
 # =============================================================================
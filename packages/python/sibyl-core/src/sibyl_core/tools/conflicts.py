@@ -40,11 +40,13 @@ async def find_similar_entities(
     entity_types: list[str] | None = None,
     limit: int = 5,
     min_score: float = CONFLICT_THRESHOLD,
+    embedding: list[float] | None = None,
 ) -> list[tuple[str, str, str, float]]:
     """Find existing entities semantically similar to the new content.
 
     Searches by combining title and content into a query, filtering
-    to entities above a minimum similarity threshold.
+    to entities above a minimum similarity threshold. Given the new
+    entity's embedding, queries the vector index with it instead.
 
     Args:
         title: Title of the new entity.
@@ -53,6 +55,7 @@ async def find_similar_entities(
         entity_types: Optional filter by entity types.
         limit: Maximum similar entities to return.
         min_score: Minimum similarity score threshold.
+        embedding: Precomputed embedding of the new entity (see EntityManager.embed).
 
     Returns:
         List of (id, name, content_preview, score) tuples sorted by score desc.
@@ -63,19 +66,29 @@ async def find_similar_entities(
     # Build search query from title + content preview
     query = f"{title}. {content[:500]}" if content else title
 
+    types = (
+        [
+            # Import EntityType to convert strings if needed
+            __import__("sibyl_core.models.entities", fromlist=["EntityType"]).EntityType(t)
+            for t in entity_types
+        ]
+        if entity_types
+        else None
+    )
+
     try:
-        # Use entity manager's semantic search
-        results = await entity_manager.search(
-            query=query,
-            entity_types=[
-                # Import EntityType to convert strings if needed
-                __import__("sibyl_core.models.entities", fromlist=["EntityType"]).EntityType(t)
-                for t in (entity_types or [])
-            ]
-            if entity_types
-            else None,
-            limit=limit * 2,  # Fetch extra for filtering
-        )
+        if embedding is not None:
+            # kNN on the vector index: no second embedding, no fulltext pass
+            results = await entity_manager.search_by_embedding(
+                embedding, entity_types=types, limit=limit * 2, min_score=min_score
+            )
+        else:
+            # Use entity manager's semantic search
+            results = await entity_manager.search(
+                query=query,
+                entity_types=types,
+                limit=limit * 2,  # Fetch extra for filtering
+            )
 
         similar: list[tuple[str, str, str, float]] = []
         for entity, score in results:
@@ -218,6 +231,7 @@ async def detect_conflicts(
     exclude_id: str | None = None,
     max_conflicts: int = 3,
     min_similarity: float = CONFLICT_THRESHOLD,
+    embedding: list[float] | None = None,
 ) -> list[ConflictWarning]:
     """Detect potential conflicts before adding new knowledge.
 
@@ -232,6 +246,8 @@ async def detect_conflicts(
         exclude_id: Entity ID to exclude (for updates).
         max_conflicts: Maximum conflicts to return.
         min_similarity: Minimum similarity score to consider.
+        embedding: Precomputed embedding of the new entity, to search the vector
+            index with instead of embedding a query.
 
     Returns:
         List of ConflictWarning objects, sorted by severity.
@@ -251,6 +267,7 @@ async def detect_conflicts(
         entity_types=entity_types,
         limit=max_conflicts * 2,  # Fetch extra for filtering
         min_score=min_similarity,
+        embedding=embedding,
     )
 
     if not similar:
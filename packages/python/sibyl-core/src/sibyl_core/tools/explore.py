@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
 
+from sibyl_core.errors import ValidationError
 from sibyl_core.graph.client import get_graph_client
 from sibyl_core.graph.entities import EntityManager
 from sibyl_core.graph.relationships import RelationshipManager
@@ -50,6 +51,7 @@ async def explore(
     include_archived: bool = False,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     organization_id: str | None = None,
 ) -> ExploreResponse:
     """Navigate and browse the Sibyl knowledge graph structure.
@@ -98,13 +100,16 @@ async def explore(
         tags: Filter tasks by tags (comma-separated, matches if task has ANY).
         limit: Maximum results (1-200, default 50).
         offset: Offset for pagination (default 0).
+        cursor: Keyset pagination for list mode - "" for the first page, then the
+                previous response's next_cursor. Takes precedence over offset.
 
     Returns:
         ExploreResponse with:
         - entities: List of matching entities
         - total: Count returned in this response
         - has_more: True if more results exist beyond limit
-        - actual_total: Actual count matching filters (for pagination awareness)
+        - actual_total: Actual count matching filters (offset pagination only)
+        - next_cursor: Cursor for the next page (cursor pagination only)
         - filters: Applied filter criteria
 
     EXAMPLES:
@@ -193,10 +198,13 @@ async def explore(
             include_archived=include_archived,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             filters=filters,
             group_id=organization_id,
         )
 
+    except ValidationError:
+        raise
     except Exception as e:
         log.warning("explore_failed", error=str(e), mode=mode)
         return ExploreResponse(mode=mode, entities=[], total=0, filters=filters)
@@ -317,6 +325,7 @@ async def _explore_list(
     include_archived: bool,
     limit: int,
     offset: int,
+    cursor: str | None,
     filters: dict[str, Any],
     group_id: str,
 ) -> ExploreResponse:
@@ -340,6 +349,27 @@ async def _explore_list(
     # Parse tags into list if provided
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
+    if cursor is not None:
+        return await _explore_list_page(
+            entity_manager,
+            target_types,
+            language=language,
+            category=category,
+            project=project,
+            accessible_projects=accessible_projects,
+            epic=epic,
+            no_epic=no_epic,
+            status=status,
+            priority=priority,
+            complexity=complexity,
+            feature=feature,
+            tags=tag_list,
+            include_archived=include_archived,
+            limit=limit,
+            cursor=cursor,
+            filters=filters,
+        )
+
     # Fetch with DB-level filtering for efficiency
     # Over-fetch to detect has_more after any remaining client-side filters
     fetch_limit = limit + offset + 50
@@ -409,6 +439,87 @@ async def _explore_list(
     )
 
 
+async def _explore_list_page(
+    entity_manager: EntityManager,
+    target_types: list[EntityType],
+    *,
+    language: str | None,
+    category: str | None,
+    project: str | None,
+    accessible_projects: set[str] | None,
+    epic: str | None,
+    no_epic: bool,
+    status: str | None,
+    priority: str | None,
+    complexity: str | None,
+    feature: str | None,
+    tags: list[str] | None,
+    include_archived: bool,
+    limit: int,
+    cursor: str,
+    filters: dict[str, Any],
+) -> ExploreResponse:
+    """List one keyset page across all target types, newest first.
+
+    RBAC scoping runs in the query. Filters the database cannot apply
+    (language, category) run on the fetched page, so a page may hold fewer
+    than ``limit`` entities while ``next_cursor`` is still set.
+    """
+    # Accessible projects plus unassigned entities, as _passes_entity_filters allows
+    scoped = accessible_projects is not None and not project
+    page = await entity_manager.list_page(
+        target_types,
+        limit,
+        cursor=cursor,
+        project_id=project,
+        project_ids=sorted(accessible_projects) if scoped and accessible_projects else None,
+        include_unassigned=scoped,
+        belongs_to=epic,
+        no_epic=no_epic,
+        status=status,
+        priority=priority,
+        complexity=complexity,
+        feature=feature,
+        tags=tags,
+        include_archived=include_archived,
+    )
+
+    results = [
+        EntitySummary(
+            id=entity.id,
+            type=entity.entity_type.value,
+            name=entity.name,
+            description=entity.description[:200] if entity.description else "",
+            metadata=_build_entity_metadata(entity),
+        )
+        for entity in page.entities
+        if _passes_entity_filters(
+            entity,
+            language,
+            category,
+            None,
+            accessible_projects,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            include_archived,
+        )
+    ]
+
+    return ExploreResponse(
+        mode="list",
+        entities=results,
+        total=len(results),
+        filters=filters,
+        limit=limit,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
+    )
+
+
 async def _explore_dependencies(
     entity_id: str | None,
     project: str | None,
@@ -3,8 +3,8 @@
 import time
 from typing import Any
 
-from sibyl_core.graph.client import GraphClient, get_graph_client
-from sibyl_core.graph.entities import EntityManager
+from sibyl_core.graph.client import get_graph_client
+from sibyl_core.graph.counts import get_entity_counts
 from sibyl_core.models.entities import EntityType
 
 # Module-level state for uptime tracking
@@ -41,14 +41,13 @@ async def get_health(*, organization_id: str | None = None) -> dict[str, Any]:
 
         # Entity counts require org context
         if organization_id:
-            entity_manager = EntityManager(client, group_id=organization_id)
-
-            # Get entity counts
-            for entity_type in [EntityType.PATTERN, EntityType.RULE, EntityType.EPISODE]:
-                try:
-                    entities = await entity_manager.list_by_type(entity_type, limit=1000)
-                    health["entity_counts"][entity_type.value] = len(entities)
-                except Exception:
+            health_types = [EntityType.PATTERN, EntityType.RULE, EntityType.EPISODE]
+            try:
+                totals = (await get_entity_counts(client, organization_id)).type_totals()
+                for entity_type in health_types:
+                    health["entity_counts"][entity_type.value] = totals.get(entity_type.value, 0)
+            except Exception:
+                for entity_type in health_types:
                     health["entity_counts"][entity_type.value] = -1
 
         health["status"] = "healthy"
@@ -63,7 +62,8 @@ async def get_health(*, organization_id: str | None = None) -> dict[str, Any]:
 async def get_stats(organization_id: str | None = None) -> dict[str, Any]:
     """Get knowledge graph statistics.
 
-    Uses a single aggregation query for performance instead of N separate queries.
+    Served from the organization's cached entity counts (see graph.counts),
+    which are recounted with one aggregate query per node label when stale.
 
     Args:
         organization_id: Organization ID to scope stats to (required).
@@ -76,42 +76,18 @@ async def get_stats(organization_id: str | None = None) -> dict[str, Any]:
 
     try:
         client = await get_graph_client()
+        counts = await get_entity_counts(client, organization_id)
+        totals = counts.type_totals()
 
-        # Clone driver for org-specific graph (multi-tenancy)
-        driver = client.client.driver.clone(organization_id)
-
-        # Single aggregation query - much faster than N separate list queries
-        result = await driver.execute_query(
-            """
-            MATCH (n)
-            WHERE n.entity_type IS NOT NULL
-            RETURN n.entity_type as type, count(*) as count
-            """
-        )
-
-        stats: dict[str, Any] = {
-            "entity_counts": {},
-            "total_entities": 0,
-        }
-
-        # Initialize all known types to 0
-        for entity_type in EntityType:
-            stats["entity_counts"][entity_type.value] = 0
-
-        # Fill in actual counts from query
-        data = GraphClient.normalize_result(result)
-        for row in data:
-            if isinstance(row, dict):
-                etype = row.get("type")
-                count = row.get("count", 0)
-            else:
-                etype, count = row[0], row[1]
+        # All known types are reported, including empty ones
+        entity_counts = {entity_type.value: 0 for entity_type in EntityType}
+        entity_counts.update(totals)
 
-            if etype:
-                stats["entity_counts"][etype] = count
-                stats["total_entities"] += count
-
-        return stats
+        return {
+            "entity_counts": entity_counts,
+            "status_counts": counts.status_counts(),
+            "total_entities": counts.total,
+        }
 
     except Exception as e:
         return {"error": str(e), "entity_counts": {}, "total_entities": 0}
@@ -420,11 +420,13 @@ async def _auto_discover_links(
     exclude_id: str,
     threshold: float = 0.75,
     limit: int = 5,
+    embedding: list[float] | None = None,
 ) -> list[tuple[str, float]]:
     """Discover related entities for auto-linking.
 
     Searches for patterns, rules, templates, and topics that are
-    semantically similar to the new entity.
+    semantically similar to the new entity. Given the entity's
+    embedding, queries the vector index with it instead of searching.
 
     Args:
         entity_manager: Entity manager for search.
@@ -435,6 +437,7 @@ async def _auto_discover_links(
         exclude_id: ID to exclude from results (the new entity).
         threshold: Minimum similarity score (0-1).
         limit: Maximum links to discover.
+        embedding: Precomputed embedding of the new entity (see EntityManager.embed).
 
     Returns:
         List of (entity_id, score) tuples above threshold.
@@ -462,11 +465,20 @@ async def _auto_discover_links(
     ]
 
     try:
-        results = await entity_manager.search(
-            query=query,
-            entity_types=linkable_types,
-            limit=limit * 2,  # Over-fetch to filter by threshold
-        )
+        if embedding is not None:
+            results = await entity_manager.search_by_embedding(
+                embedding,
+                entity_types=linkable_types,
+                limit=limit * 2,
+                exclude_id=exclude_id,
+                min_score=threshold,
+            )
+        else:
+            results = await entity_manager.search(
+                query=query,
+                entity_types=linkable_types,
+                limit=limit * 2,  # Over-fetch to filter by threshold
+            )
 
         # Filter by threshold and exclude self
         links: list[tuple[str, float]] = []
@@ -33,6 +33,10 @@ class SearchResponse:
     limit: int = 10
     offset: int = 0
     has_more: bool = False
+    # True when a search branch timed out or failed; results come from the others
+    partial: bool = False
+    # Per-branch status ("ok", "timeout", "error") and latency
+    metadata: dict[str, Any] = field(default_factory=dict)
     # Agent guidance - tells agents how to get full content
     usage_hint: str = "Results show previews. To get full content, use: sibyl entity show <id>"
 
@@ -72,6 +76,7 @@ class ExploreResponse:
     offset: int = 0  # Current offset
     has_more: bool = False  # True if more results exist beyond the limit
     actual_total: int | None = None  # Actual total count in DB (if available)
+    next_cursor: str | None = None  # Keyset cursor for the next page (cursor mode)
 
 
 @dataclass
@@ -99,6 +104,8 @@ class AddResponse:
     message: str
     timestamp: datetime
     conflicts: list[ConflictWarning] = field(default_factory=list)
+    # Per-stage latency (embed, conflicts, create, links, total)
+    timings_ms: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
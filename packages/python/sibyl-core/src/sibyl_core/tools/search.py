@@ -1,5 +1,8 @@
 """Search tool for unified semantic search across Sibyl knowledge graph and documentation."""
 
+import asyncio
+import time
+from collections.abc import Coroutine
 from datetime import datetime
 from typing import Any
 
@@ -34,127 +37,309 @@ async def _search_documents(
 ) -> list[SearchResult]:
     """Search crawled documentation using pgvector similarity.
 
-    Returns SearchResult objects for unified result merging.
+    Returns SearchResult objects for unified result merging. Failures
+    propagate so the caller can report the branch status.
     """
-    try:
-        from uuid import UUID
-
-        from sibyl.crawler.embedder import embed_text
-        from sibyl.db import CrawledDocument, CrawlSource, DocumentChunk, get_session
-        from sibyl.db.models import ChunkType
-        from sqlalchemy import select
-        from sqlmodel import col
-
-        # Generate query embedding
-        query_embedding = await embed_text(query)
-
-        async with get_session() as session:
-            # Build similarity search query
-            similarity_expr = 1 - DocumentChunk.embedding.cosine_distance(query_embedding)
-
-            # SQLModel columns have .label() method at runtime but pyright sees them as plain types
-            doc_query = (
-                select(
-                    DocumentChunk,
-                    CrawledDocument,
-                    CrawlSource.name.label("source_name"),  # type: ignore[attr-defined]
-                    CrawlSource.id.label("source_id"),  # type: ignore[attr-defined]
-                    similarity_expr.label("similarity"),
+    from uuid import UUID
+
+    from sibyl.crawler.embedder import embed_text
+    from sibyl.db import CrawledDocument, CrawlSource, DocumentChunk, get_session
+    from sibyl.db.models import ChunkType
+    from sqlalchemy import select
+    from sqlmodel import col
+
+    # Generate query embedding
+    query_embedding = await embed_text(query)
+
+    async with get_session() as session:
+        # Build similarity search query
+        similarity_expr = 1 - DocumentChunk.embedding.cosine_distance(query_embedding)
+
+        # SQLModel columns have .label() method at runtime but pyright sees them as plain types
+        doc_query = (
+            select(
+                DocumentChunk,
+                CrawledDocument,
+                CrawlSource.name.label("source_name"),  # type: ignore[attr-defined]
+                CrawlSource.id.label("source_id"),  # type: ignore[attr-defined]
+                similarity_expr.label("similarity"),
+            )
+            .join(CrawledDocument, DocumentChunk.document_id == CrawledDocument.id)  # type: ignore[arg-type]
+            .join(CrawlSource, CrawledDocument.source_id == CrawlSource.id)  # type: ignore[arg-type]
+            .where(col(DocumentChunk.embedding).is_not(None))
+        )
+
+        # Filter by organization (required for multi-tenancy)
+        doc_query = doc_query.where(col(CrawlSource.organization_id) == UUID(organization_id))
+
+        # Apply source filters
+        if source_id:
+            doc_query = doc_query.where(col(CrawlSource.id) == UUID(source_id))
+        if source_name:
+            doc_query = doc_query.where(col(CrawlSource.name).ilike(f"%{source_name}%"))
+
+        # Apply language filter (for code chunks)
+        if language:
+            doc_query = doc_query.where(
+                (col(DocumentChunk.language).ilike(language))
+                | (col(DocumentChunk.chunk_type) != ChunkType.CODE)
+            )
+
+        # Order by similarity - fetch more to allow document-level deduplication
+        # We want `limit` unique documents, so fetch more chunks
+        doc_query = (
+            doc_query.where(similarity_expr >= 0.5)  # Minimum threshold
+            .order_by(similarity_expr.desc())
+            .limit(limit * 5)  # Fetch extra for dedup headroom
+        )
+
+        result = await session.execute(doc_query)
+        rows = result.all()
+
+        # Document-level deduplication: keep only best chunk per document
+        # This prevents 10 chunks from the same doc appearing as 10 results
+        seen_docs: dict[str, Any] = {}  # doc_id -> best row
+        for row in rows:
+            chunk, doc, src_name, src_id, similarity = row
+            doc_id = str(doc.id)
+            if doc_id not in seen_docs or similarity > seen_docs[doc_id][4]:
+                seen_docs[doc_id] = row
+
+        # Sort deduplicated results by score and limit
+        deduped_rows = sorted(seen_docs.values(), key=lambda r: r[4], reverse=True)[:limit]
+
+        # Convert to SearchResult
+        results = []
+        for chunk, doc, src_name, src_id, similarity in deduped_rows:
+            # Control content length based on include_content flag
+            if include_content:
+                content = chunk.content[:500] if chunk.content else ""
+            else:
+                content = chunk.content[:200] if chunk.content else ""
+
+            # Build heading context for better preview
+            heading_context = " > ".join(chunk.heading_path) if chunk.heading_path else ""
+            if heading_context:
+                content = f"[{heading_context}] {content}"
+
+            # Don't expose file:// URLs - agents will try to read them
+            # Instead, provide entity URL for fetching full content
+            display_url = None
+            if doc.url and not doc.url.startswith("file://"):
+                display_url = doc.url
+
+            results.append(
+                SearchResult(
+                    id=str(chunk.id),
+                    type="document",
+                    name=doc.title or src_name,
+                    content=content,
+                    score=float(similarity),
+                    source=src_name,
+                    url=display_url,  # Only show web URLs, not file paths
+                    result_origin="document",
+                    metadata={
+                        "document_id": str(doc.id),
+                        "source_id": str(src_id),
+                        "chunk_type": chunk.chunk_type.value
+                        if hasattr(chunk.chunk_type, "value")
+                        else str(chunk.chunk_type),
+                        "chunk_index": chunk.chunk_index,
+                        "heading_path": chunk.heading_path or [],
+                        "language": chunk.language,
+                        "has_code": doc.has_code,
+                        # Help agents understand how to get full content
+                        "hint": "Use 'sibyl entity <id>' or fetch /api/entities/<id> for full content",
+                    },
                 )
-                .join(CrawledDocument, DocumentChunk.document_id == CrawledDocument.id)  # type: ignore[arg-type]
-                .join(CrawlSource, CrawledDocument.source_id == CrawlSource.id)  # type: ignore[arg-type]
-                .where(col(DocumentChunk.embedding).is_not(None))
             )
+        return results
 
-            # Filter by organization (required for multi-tenancy)
-            doc_query = doc_query.where(col(CrawlSource.organization_id) == UUID(organization_id))
 
-            # Apply source filters
-            if source_id:
-                doc_query = doc_query.where(col(CrawlSource.id) == UUID(source_id))
-            if source_name:
-                doc_query = doc_query.where(col(CrawlSource.name).ilike(f"%{source_name}%"))
+async def _search_graph(
+    query: str,
+    *,
+    organization_id: str | None,
+    types: list[str] | None,
+    language: str | None,
+    category: str | None,
+    status: str | None,
+    project: str | None,
+    accessible_projects: set[str] | None,
+    source: str | None,
+    assignee: str | None,
+    since: str | None,
+    limit: int,
+    include_content: bool,
+    use_enhanced: bool,
+    boost_recent: bool,
+) -> list[SearchResult]:
+    """Search knowledge graph entities, falling back to vector-only search.
 
-            # Apply language filter (for code chunks)
-            if language:
-                doc_query = doc_query.where(
-                    (col(DocumentChunk.language).ilike(language))
-                    | (col(DocumentChunk.chunk_type) != ChunkType.CODE)
-                )
+    Returns SearchResult objects for unified result merging. Failures
+    propagate so the caller can report the branch status.
+    """
+    client = await get_graph_client()
+    if not organization_id:
+        raise ValueError("organization_id is required - cannot access graph without org context")
+    entity_manager = EntityManager(client, group_id=organization_id)
 
-            # Order by similarity - fetch more to allow document-level deduplication
-            # We want `limit` unique documents, so fetch more chunks
-            doc_query = (
-                doc_query.where(similarity_expr >= 0.5)  # Minimum threshold
-                .order_by(similarity_expr.desc())
-                .limit(limit * 5)  # Fetch extra for dedup headroom
+    # Determine entity types to search (exclude 'document' - that's for doc search)
+    entity_types = None
+    if types:
+        entity_types = []
+        for t in types:
+            if t.lower() in VALID_ENTITY_TYPES and t.lower() != "document":
+                entity_types.append(EntityType(t.lower()))
+
+    # Parse since date if provided
+    since_date = None
+    if since:
+        try:
+            since_date = datetime.fromisoformat(since)
+        except ValueError:
+            log.warning("invalid_since_date", since=since)
+
+    # Perform search - try enhanced hybrid first, fall back to vector-only
+    raw_results: list[tuple[Any, float]] = []
+
+    if use_enhanced:
+        try:
+            hybrid_config = HybridConfig(
+                apply_temporal=boost_recent,
+                temporal_decay_days=365.0,
+                graph_depth=2,
             )
 
-            result = await session.execute(doc_query)
-            rows = result.all()
-
-            # Document-level deduplication: keep only best chunk per document
-            # This prevents 10 chunks from the same doc appearing as 10 results
-            seen_docs: dict[str, Any] = {}  # doc_id -> best row
-            for row in rows:
-                chunk, doc, src_name, src_id, similarity = row
-                doc_id = str(doc.id)
-                if doc_id not in seen_docs or similarity > seen_docs[doc_id][4]:
-                    seen_docs[doc_id] = row
-
-            # Sort deduplicated results by score and limit
-            deduped_rows = sorted(seen_docs.values(), key=lambda r: r[4], reverse=True)[:limit]
-
-            # Convert to SearchResult
-            results = []
-            for chunk, doc, src_name, src_id, similarity in deduped_rows:
-                # Control content length based on include_content flag
-                if include_content:
-                    content = chunk.content[:500] if chunk.content else ""
-                else:
-                    content = chunk.content[:200] if chunk.content else ""
-
-                # Build heading context for better preview
-                heading_context = " > ".join(chunk.heading_path) if chunk.heading_path else ""
-                if heading_context:
-                    content = f"[{heading_context}] {content}"
-
-                # Don't expose file:// URLs - agents will try to read them
-                # Instead, provide entity URL for fetching full content
-                display_url = None
-                if doc.url and not doc.url.startswith("file://"):
-                    display_url = doc.url
-
-                results.append(
-                    SearchResult(
-                        id=str(chunk.id),
-                        type="document",
-                        name=doc.title or src_name,
-                        content=content,
-                        score=float(similarity),
-                        source=src_name,
-                        url=display_url,  # Only show web URLs, not file paths
-                        result_origin="document",
-                        metadata={
-                            "document_id": str(doc.id),
-                            "source_id": str(src_id),
-                            "chunk_type": chunk.chunk_type.value
-                            if hasattr(chunk.chunk_type, "value")
-                            else str(chunk.chunk_type),
-                            "chunk_index": chunk.chunk_index,
-                            "heading_path": chunk.heading_path or [],
-                            "language": chunk.language,
-                            "has_code": doc.has_code,
-                            # Help agents understand how to get full content
-                            "hint": "Use 'sibyl entity <id>' or fetch /api/entities/<id> for full content",
-                        },
-                    )
-                )
-            return results
+            hybrid_result = await with_timeout(
+                hybrid_search(
+                    query=query,
+                    client=client,
+                    entity_manager=entity_manager,
+                    entity_types=entity_types,
+                    limit=limit * 3,
+                    config=hybrid_config,
+                    group_id=organization_id,
+                ),
+                timeout_seconds=TIMEOUTS["search"],
+                operation_name="hybrid_search",
+            )
+            raw_results = hybrid_result.results
+            log.debug("graph_search_enhanced", results=len(raw_results))
 
+        except Exception as e:
+            log.warning("enhanced_search_failed_fallback", error=str(e))
+
+    # Fall back to vector-only search
+    if not raw_results:
+        raw_results = await with_timeout(
+            entity_manager.search(
+                query=query,
+                entity_types=entity_types,
+                limit=limit * 3,
+            ),
+            timeout_seconds=TIMEOUTS["search"],
+            operation_name="search",
+        )
+        if boost_recent and raw_results:
+            raw_results = temporal_boost(raw_results, decay_days=365.0)
+
+    # Filter and convert to SearchResult
+    results: list[SearchResult] = []
+    for entity, score in raw_results:
+        # Apply filters
+        if language:
+            entity_langs = _get_field(entity, "languages", [])
+            if language.lower() not in [lang.lower() for lang in entity_langs]:
+                continue
+
+        if category:
+            entity_cat = _get_field(entity, "category", "")
+            if category.lower() not in entity_cat.lower():
+                continue
+
+        if status:
+            entity_status = _get_field(entity, "status")
+            if entity_status is None:
+                continue
+            status_val = str(_serialize_enum(entity_status)).lower()
+            status_list = [s.strip().lower() for s in status.split(",")]
+            if status_val not in status_list:
+                continue
+
+        if project and _get_field(entity, "project_id") != project:
+            continue
+
+        # Filter by accessible projects (RBAC)
+        # Include entities that: have no project_id OR project_id is in accessible set
+        if accessible_projects is not None:
+            entity_project = _get_field(entity, "project_id")
+            if entity_project is not None and entity_project not in accessible_projects:
+                continue
+
+        if source and _get_field(entity, "source_id") != source:
+            continue
+
+        if assignee:
+            entity_assignees = _get_field(entity, "assignees", [])
+            if assignee.lower() not in [a.lower() for a in entity_assignees]:
+                continue
+
+        if since_date:
+            entity_created = _get_field(entity, "created_at")
+            if entity_created:
+                try:
+                    if isinstance(entity_created, str):
+                        entity_created = datetime.fromisoformat(entity_created)
+                    if entity_created < since_date:
+                        continue
+                except (ValueError, TypeError):
+                    pass
+
+        content = ""
+        if include_content:
+            content = entity.content[:500] if entity.content else entity.description
+        else:
+            content = entity.description[:200] if entity.description else ""
+
+        results.append(
+            SearchResult(
+                id=entity.id,
+                type=entity.entity_type.value,
+                name=entity.name,
+                content=content or "",
+                score=score,
+                source=entity.source_file,
+                result_origin="graph",
+                metadata=_build_entity_metadata(entity),
+            )
+        )
+
+        if len(results) >= limit:
+            break
+
+    return results
+
+
+async def _run_branch(
+    name: str, coro: Coroutine[Any, Any, list[SearchResult]], timeout_seconds: float
+) -> tuple[list[SearchResult], str, float]:
+    """Run one search branch, converting failures into a status.
+
+    Returns:
+        Tuple of (results, status, elapsed_ms) where status is "ok",
+        "timeout" or "error". Failed branches contribute no results.
+    """
+    start = time.perf_counter()
+    try:
+        results = await with_timeout(coro, timeout_seconds, operation_name=f"{name}_search")
+        status = "ok"
+    except TimeoutError:
+        results, status = [], "timeout"
     except Exception as e:
-        log.warning("document_search_failed", error=str(e))
-        return []
+        log.warning("search_branch_failed", branch=name, error=str(e))
+        results, status = [], "error"
+    return results, status, round((time.perf_counter() - start) * 1000, 2)
 
 
 async def search(
@@ -221,7 +406,10 @@ async def search(
 
     Returns:
         SearchResponse with ranked results from both sources, including
-        graph_count and document_count for result breakdown.
+        graph_count and document_count for result breakdown. The graph and
+        document branches run concurrently, each under its own timeout; if
+        one times out or fails, the other's results are returned with
+        partial=True. metadata carries each branch's status and timings_ms.
 
     EXAMPLES:
         search("error handling patterns", types=["pattern"], language="python")
@@ -287,174 +475,49 @@ async def search(
             # Types specified but document not included - skip document search
             search_documents = False
 
-    graph_results: list[SearchResult] = []
-    doc_results: list[SearchResult] = []
-
     # =========================================================================
-    # GRAPH SEARCH - Search knowledge graph entities
+    # GRAPH + DOCUMENT SEARCH - independent branches, run concurrently
     # =========================================================================
+    branches: dict[str, Coroutine[Any, Any, list[SearchResult]]] = {}
     if search_graph and query:
-        try:
-            client = await get_graph_client()
-            if not organization_id:
-                raise ValueError(
-                    "organization_id is required - cannot access graph without org context"
-                )
-            entity_manager = EntityManager(client, group_id=organization_id)
-
-            # Determine entity types to search (exclude 'document' - that's for doc search)
-            entity_types = None
-            if types:
-                entity_types = []
-                for t in types:
-                    if t.lower() in VALID_ENTITY_TYPES and t.lower() != "document":
-                        entity_types.append(EntityType(t.lower()))
-
-            # Parse since date if provided
-            since_date = None
-            if since:
-                try:
-                    since_date = datetime.fromisoformat(since)
-                except ValueError:
-                    log.warning("invalid_since_date", since=since)
-
-            # Perform search - try enhanced hybrid first, fall back to vector-only
-            raw_results: list[tuple[Any, float]] = []
-
-            if use_enhanced:
-                try:
-                    hybrid_config = HybridConfig(
-                        apply_temporal=boost_recent,
-                        temporal_decay_days=365.0,
-                        graph_depth=2,
-                    )
-
-                    hybrid_result = await with_timeout(
-                        hybrid_search(
-                            query=query,
-                            client=client,
-                            entity_manager=entity_manager,
-                            entity_types=entity_types,
-                            limit=limit * 3,
-                            config=hybrid_config,
-                            group_id=organization_id,
-                        ),
-                        timeout_seconds=TIMEOUTS["search"],
-                        operation_name="hybrid_search",
-                    )
-                    raw_results = hybrid_result.results
-                    log.debug("graph_search_enhanced", results=len(raw_results))
-
-                except Exception as e:
-                    log.warning("enhanced_search_failed_fallback", error=str(e))
-
-            # Fall back to vector-only search
-            if not raw_results:
-                raw_results = await with_timeout(
-                    entity_manager.search(
-                        query=query,
-                        entity_types=entity_types,
-                        limit=limit * 3,
-                    ),
-                    timeout_seconds=TIMEOUTS["search"],
-                    operation_name="search",
-                )
-                if boost_recent and raw_results:
-                    raw_results = temporal_boost(raw_results, decay_days=365.0)
-
-            # Filter and convert to SearchResult
-            for entity, score in raw_results:
-                # Apply filters
-                if language:
-                    entity_langs = _get_field(entity, "languages", [])
-                    if language.lower() not in [lang.lower() for lang in entity_langs]:
-                        continue
-
-                if category:
-                    entity_cat = _get_field(entity, "category", "")
-                    if category.lower() not in entity_cat.lower():
-                        continue
-
-                if status:
-                    entity_status = _get_field(entity, "status")
-                    if entity_status is None:
-                        continue
-                    status_val = str(_serialize_enum(entity_status)).lower()
-                    status_list = [s.strip().lower() for s in status.split(",")]
-                    if status_val not in status_list:
-                        continue
-
-                if project and _get_field(entity, "project_id") != project:
-                    continue
-
-                # Filter by accessible projects (RBAC)
-                # Include entities that: have no project_id OR project_id is in accessible set
-                if accessible_projects is not None:
-                    entity_project = _get_field(entity, "project_id")
-                    if entity_project is not None and entity_project not in accessible_projects:
-                        continue
-
-                if source and _get_field(entity, "source_id") != source:
-                    continue
-
-                if assignee:
-                    entity_assignees = _get_field(entity, "assignees", [])
-                    if assignee.lower() not in [a.lower() for a in entity_assignees]:
-                        continue
-
-                if since_date:
-                    entity_created = _get_field(entity, "created_at")
-                    if entity_created:
-                        try:
-                            if isinstance(entity_created, str):
-                                entity_created = datetime.fromisoformat(entity_created)
-                            if entity_created < since_date:
-                                continue
-                        except (ValueError, TypeError):
-                            pass
-
-                content = ""
-                if include_content:
-                    content = entity.content[:500] if entity.content else entity.description
-                else:
-                    content = entity.description[:200] if entity.description else ""
-
-                graph_results.append(
-                    SearchResult(
-                        id=entity.id,
-                        type=entity.entity_type.value,
-                        name=entity.name,
-                        content=content or "",
-                        score=score,
-                        source=entity.source_file,
-                        result_origin="graph",
-                        metadata=_build_entity_metadata(entity),
-                    )
-                )
-
-                if len(graph_results) >= limit:
-                    break
-
-        except Exception as e:
-            log.warning("graph_search_failed", error=str(e))
-
-    # =========================================================================
-    # DOCUMENT SEARCH - Search crawled documentation
-    # =========================================================================
+        branches["graph"] = _search_graph(
+            query,
+            organization_id=organization_id,
+            types=types,
+            language=language,
+            category=category,
+            status=status,
+            project=project,
+            accessible_projects=accessible_projects,
+            source=source,
+            assignee=assignee,
+            since=since,
+            limit=limit,
+            include_content=include_content,
+            use_enhanced=use_enhanced,
+            boost_recent=boost_recent,
+        )
     if search_documents and query and organization_id:
-        try:
-            doc_results = await _search_documents(
-                query=query,
-                organization_id=organization_id,
-                source_id=source_id,
-                source_name=source_name,
-                language=language,
-                limit=limit,
-                include_content=include_content,
-            )
-            log.debug("document_search_complete", results=len(doc_results))
-        except Exception as e:
-            log.warning("document_search_failed", error=str(e))
+        branches["documents"] = _search_documents(
+            query=query,
+            organization_id=organization_id,
+            source_id=source_id,
+            source_name=source_name,
+            language=language,
+            limit=limit,
+            include_content=include_content,
+        )
+
+    outcomes = await asyncio.gather(
+        *(_run_branch(name, coro, TIMEOUTS[f"search_{name}"]) for name, coro in branches.items())
+    )
+    branch_results = dict(zip(branches, outcomes, strict=True))
+    graph_results = branch_results["graph"][0] if "graph" in branch_results else []
+    doc_results = branch_results["documents"][0] if "documents" in branch_results else []
+    log.debug(
+        "search_branches_complete",
+        **{name: (len(results), status) for name, (results, status, _) in branch_results.items()},
+    )
 
     # =========================================================================
     # MERGE AND RANK RESULTS
@@ -485,4 +548,9 @@ async def search(
         limit=limit,
         offset=offset,
         has_more=has_more,
+        partial=any(status != "ok" for _, status, _ in branch_results.values()),
+        metadata={
+            "branches": {name: status for name, (_, status, _) in branch_results.items()},
+            "timings_ms": {name: ms for name, (_, _, ms) in branch_results.items()},
+        },
     )
@@ -0,0 +1,53 @@
+"""Opaque cursor tokens for keyset pagination.
+
+A cursor records the sort key of the last row on a page - the value of the
+ordering field and the row's uuid as a tie-breaker - so the next page starts
+with ``WHERE (field, uuid) < (value, id)`` instead of skipping rows. Every page
+then costs the same regardless of how deep it is.
+
+Tokens are URL-safe base64 of a small JSON array; clients must treat them as
+opaque. An empty string requests the first page in cursor mode.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+from sibyl_core.errors import ValidationError
+
+
+def encode_cursor(order_by: str, value: str, uuid: str) -> str:
+    """Encode the sort key of the last row on a page."""
+    raw = json.dumps([order_by, value, uuid], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, order_by: str) -> tuple[str, str] | None:
+    """Decode a cursor into ``(value, uuid)``.
+
+    Args:
+        token: Cursor from a previous page, or "" for the first page.
+        order_by: Field the listing is ordered by; must match the cursor's.
+
+    Returns:
+        The sort key to continue after, or None for the first page.
+
+    Raises:
+        ValidationError: If the token is malformed or was issued for a
+            different ordering.
+    """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        field, value, uuid = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor", details={"cursor": token}) from e
+    if field != order_by or not isinstance(value, str) or not isinstance(uuid, str):
+        raise ValidationError(
+            "Pagination cursor does not match the requested ordering",
+            details={"cursor": token, "order_by": order_by},
+        )
+    return value, uuid
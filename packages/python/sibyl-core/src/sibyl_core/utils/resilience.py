@@ -217,6 +217,9 @@ TIMEOUTS = {
     "graph_connect": 10.0,
     "graph_query": 30.0,
     "search": 15.0,
+    # Whole unified-search branches; the graph branch may retry vector-only
+    "search_graph": 25.0,
+    "search_documents": 15.0,
     "embedding": 20.0,
     "ingestion_file": 60.0,
 }
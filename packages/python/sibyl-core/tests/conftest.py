@@ -296,10 +296,21 @@ class MockEntityManager:
         )
         return entity.id
 
-    async def create_direct(self, entity: Entity, *, generate_embedding: bool = True) -> str:
+    async def create_direct(
+        self,
+        entity: Entity,
+        *,
+        generate_embedding: bool = True,
+        embedding: list[float] | None = None,
+    ) -> str:
         """Create entity directly (bypassing LLM)."""
         return await self.create(entity)
 
+    async def embed(self, entity: Entity) -> list[float]:
+        """Embed an entity (fixed vector)."""
+        self.operation_history.append({"op": "embed", "entity_id": entity.id})
+        return [0.0] * 8
+
     async def get(self, entity_id: str) -> Entity:
         """Get entity by ID."""
         if entity_id not in self.entities:
@@ -385,6 +396,28 @@ class MockEntityManager:
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:limit]
 
+    async def search_by_embedding(
+        self,
+        embedding: list[float],
+        entity_types: list[EntityType] | None = None,
+        limit: int = 10,
+        *,
+        exclude_id: str | None = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[Entity, float]]:
+        """Vector search - returns the preconfigured search results."""
+        self.operation_history.append(
+            {"op": "search_by_embedding", "types": entity_types, "limit": limit}
+        )
+        results = [
+            (e, s)
+            for e, s in self.search_results
+            if e.id != exclude_id
+            and s >= min_score
+            and (not entity_types or e.entity_type in entity_types)
+        ]
+        return results[:limit]
+
     async def list_by_type(
         self,
         entity_type: EntityType,
@@ -0,0 +1,109 @@
+"""Tests for the cached per-organization entity counts."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sibyl_core.graph.counts import (
+    count_entity_added,
+    count_entity_removed,
+    count_status_changed,
+    get_entity_counts,
+    invalidate_entity_counts,
+    reset_entity_counts,
+)
+from sibyl_core.models.tasks import TaskStatus
+
+ORG_ID = "org_1"
+
+
+@pytest.fixture(autouse=True)
+def clean_counts() -> Iterator[None]:
+    reset_entity_counts()
+    yield
+    reset_entity_counts()
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    client = MagicMock()
+    # One aggregate row set per node label (Entity, Episodic)
+    client.execute_read_org = AsyncMock(
+        side_effect=lambda query, *_args, **_kwargs: (
+            [
+                {"entity_type": "task", "status": "todo", "count": 4},
+                {"entity_type": "task", "status": "done", "count": 2},
+                {"entity_type": "pattern", "status": None, "count": 3},
+            ]
+            if ":Entity" in query
+            else [{"entity_type": "episode", "status": None, "count": 1}]
+        )
+    )
+    return client
+
+
+class TestGetEntityCounts:
+    async def test_aggregates_by_type_and_status(self, client: MagicMock) -> None:
+        counts = await get_entity_counts(client, ORG_ID)
+
+        assert counts.type_totals() == {"task": 6, "pattern": 3, "episode": 1}
+        assert counts.status_counts() == {"task": {"todo": 4, "done": 2}}
+        assert counts.total == 10
+
+    async def test_counts_are_cached(self, client: MagicMock) -> None:
+        first = await get_entity_counts(client, ORG_ID)
+        second = await get_entity_counts(client, ORG_ID)
+
+        assert first is second
+        assert client.execute_read_org.await_count == 2  # one query per label
+
+    async def test_stale_counts_are_recounted(self, client: MagicMock) -> None:
+        await get_entity_counts(client, ORG_ID)
+        await get_entity_counts(client, ORG_ID, max_age=0)
+
+        assert client.execute_read_org.await_count == 4
+
+    async def test_invalidate_forces_recount(self, client: MagicMock) -> None:
+        await get_entity_counts(client, ORG_ID)
+        invalidate_entity_counts(ORG_ID)
+        await get_entity_counts(client, ORG_ID)
+
+        assert client.execute_read_org.await_count == 4
+
+
+class TestCountHooks:
+    async def test_hooks_adjust_loaded_counts(self, client: MagicMock) -> None:
+        counts = await get_entity_counts(client, ORG_ID)
+
+        count_entity_added(ORG_ID, "task", "todo")
+        count_entity_added(ORG_ID, "rule")
+        count_status_changed(ORG_ID, "task", "todo", "done")
+        count_entity_removed(ORG_ID, "pattern")
+
+        assert counts.status_counts()["task"] == {"todo": 4, "done": 3}
+        assert counts.type_totals()["rule"] == 1
+        assert counts.type_totals()["pattern"] == 2
+        assert counts.total == 11
+
+    async def test_enum_statuses_are_normalized(self, client: MagicMock) -> None:
+        counts = await get_entity_counts(client, ORG_ID)
+        count_status_changed(ORG_ID, "task", TaskStatus.TODO, TaskStatus.DOING)
+
+        assert counts.status_counts()["task"]["doing"] == 1
+
+    async def test_counts_never_go_negative(self, client: MagicMock) -> None:
+        counts = await get_entity_counts(client, ORG_ID)
+        count_entity_removed(ORG_ID, "rule")
+
+        assert counts.type_totals()["rule"] == 0
+
+    async def test_hooks_ignore_unloaded_orgs(self, client: MagicMock) -> None:
+        count_entity_added("org_2", "task", "todo")
+        count_entity_removed("org_2", "task", "todo")
+
+        counts = await get_entity_counts(client, "org_2")
+
+        assert counts.type_totals()["task"] == 6
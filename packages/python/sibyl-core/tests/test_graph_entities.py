@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from graphiti_core.nodes import EntityNode, EpisodicNode
 
-from sibyl_core.errors import EntityCreationError, EntityNotFoundError, SearchError
+from sibyl_core.errors import (
+    EntityCreationError,
+    EntityNotFoundError,
+    SearchError,
+    ValidationError,
+)
 from sibyl_core.graph.entities import EntityManager, sanitize_search_query
 from sibyl_core.models.entities import Entity, EntityType
 from sibyl_core.models.tasks import (
@@ -319,6 +324,79 @@ class TestEntityCreateDirect:
         with pytest.raises(EntityCreationError, match="Failed to create entity"):
             await entity_manager.create_direct(sample_entity)
 
+    @pytest.mark.asyncio
+    async def test_create_direct_single_write_with_embedding(
+        self,
+        entity_manager: EntityManager,
+        sample_task: Task,
+        mock_graph_client: MagicMock,
+        mock_driver: MagicMock,
+    ) -> None:
+        """A precomputed embedding is saved with the node and its properties in one write."""
+        saved: list[EntityNode] = []
+
+        async def capture_save(node: EntityNode, _driver: object) -> None:
+            saved.append(node)
+
+        with patch.object(EntityNode, "save", autospec=True, side_effect=capture_save):
+            await entity_manager.create_direct(sample_task, embedding=[0.5] * 1536)
+
+        mock_graph_client.client.embedder.create.assert_not_called()
+        mock_driver.execute_query.assert_not_called()
+        assert len(saved) == 1
+        assert saved[0].name_embedding == [0.5] * 1536
+        assert saved[0].attributes["project_id"] == "project-001"
+        assert saved[0].attributes["status"] == "todo"
+
+
+class TestEntitySearchByEmbedding:
+    """Test kNN search on the vector index."""
+
+    @pytest.mark.asyncio
+    async def test_search_by_embedding(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """search_by_embedding() runs one kNN query and returns similarity scores."""
+        mock_driver.execute_query.return_value = (
+            [
+                {
+                    "uuid": "pattern-001",
+                    "name": "Retry with backoff",
+                    "entity_type": "pattern",
+                    "description": "Exponential backoff",
+                    "score": 0.91,
+                }
+            ],
+            None,
+            None,
+        )
+
+        results = await entity_manager.search_by_embedding(
+            [0.1] * 1536, entity_types=[EntityType.PATTERN], limit=3, exclude_id="new-001"
+        )
+
+        assert [(e.id, score) for e, score in results] == [("pattern-001", 0.91)]
+        query = mock_driver.execute_query.call_args.args[0]
+        params = mock_driver.execute_query.call_args.kwargs
+        assert "db.idx.vector.queryNodes" in query
+        assert params["types"] == ["pattern"]
+        assert params["exclude_id"] == "new-001"
+        assert params["k"] == 12
+
+    @pytest.mark.asyncio
+    async def test_search_by_embedding_failure_raises(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """search_by_embedding() raises SearchError when the query fails."""
+        mock_driver.execute_query.side_effect = Exception("no vector index")
+
+        with pytest.raises(SearchError, match="Vector search failed"):
+            await entity_manager.search_by_embedding([0.1] * 1536)
+
 
 # =============================================================================
 # Entity Retrieval Tests
@@ -487,6 +565,26 @@ class TestEntityUpdate:
             # New metadata should be added
             assert result.metadata.get("new_key") == "new_value"
 
+    @pytest.mark.asyncio
+    async def test_update_clears_filter_property(
+        self,
+        entity_manager: EntityManager,
+        sample_entity_node: EntityNode,
+        mock_driver: MagicMock,
+    ) -> None:
+        """update() nulls a filter property that is explicitly cleared."""
+        with patch.object(
+            EntityNode,
+            "get_by_uuid",
+            new_callable=AsyncMock,
+            return_value=sample_entity_node,
+        ):
+            await entity_manager.update("entity-001", {"epic_id": None})
+
+        query = mock_driver.execute_query.call_args.args[0]
+        assert "n.epic_id = NULL" in query
+        assert "n.status = NULL" not in query
+
     @pytest.mark.asyncio
     async def test_update_not_found_raises_error(
         self,
@@ -626,6 +724,12 @@ class TestEntityDelete:
 # =============================================================================
 
 
+def _last_query(mock_driver: MagicMock) -> tuple[str, dict]:
+    """Return the query text and parameters of the last driver call."""
+    call = mock_driver.execute_query.call_args
+    return call.args[0], call.kwargs
+
+
 class TestEntityListByType:
     """Test listing entities by type with filters."""
 
@@ -662,32 +766,12 @@ class TestEntityListByType:
         entity_manager: EntityManager,
         mock_driver: MagicMock,
     ) -> None:
-        """list_by_type() filters by status from metadata."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Task 1",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "doing"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Task 2",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo"}),
-                },
-            ],
-            None,
-            None,
-        )
+        """list_by_type() filters by status in the query."""
+        await entity_manager.list_by_type(EntityType.TASK, status="doing")
 
-        results = await entity_manager.list_by_type(EntityType.TASK, status="doing")
-
-        assert len(results) == 1
-        assert results[0].id == "task-001"
+        query, params = _last_query(mock_driver)
+        assert "n.status IN $status" in query
+        assert params["status"] == ["doing"]
 
     @pytest.mark.asyncio
     async def test_list_by_type_multiple_statuses(
@@ -696,39 +780,10 @@ class TestEntityListByType:
         mock_driver: MagicMock,
     ) -> None:
         """list_by_type() supports comma-separated status values."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Task 1",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "doing"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Task 2",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "blocked"}),
-                },
-                {
-                    "uuid": "task-003",
-                    "name": "Task 3",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "done"}),
-                },
-            ],
-            None,
-            None,
-        )
+        await entity_manager.list_by_type(EntityType.TASK, status="Doing, blocked")
 
-        results = await entity_manager.list_by_type(EntityType.TASK, status="doing,blocked")
-
-        assert len(results) == 2
-        ids = {r.id for r in results}
-        assert ids == {"task-001", "task-002"}
+        _, params = _last_query(mock_driver)
+        assert params["status"] == ["doing", "blocked"]
 
     @pytest.mark.asyncio
     async def test_list_by_type_with_priority_filter(
@@ -736,32 +791,12 @@ class TestEntityListByType:
         entity_manager: EntityManager,
         mock_driver: MagicMock,
     ) -> None:
-        """list_by_type() filters by priority from metadata."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Critical Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo", "priority": "critical"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Low Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo", "priority": "low"}),
-                },
-            ],
-            None,
-            None,
-        )
-
-        results = await entity_manager.list_by_type(EntityType.TASK, priority="critical")
+        """list_by_type() filters by priority in the query."""
+        await entity_manager.list_by_type(EntityType.TASK, priority="critical")
 
-        assert len(results) == 1
-        assert results[0].id == "task-001"
+        query, params = _last_query(mock_driver)
+        assert "n.priority IN $priority" in query
+        assert params["priority"] == ["critical"]
 
     @pytest.mark.asyncio
     async def test_list_by_type_with_project_filter(
@@ -769,32 +804,12 @@ class TestEntityListByType:
         entity_manager: EntityManager,
         mock_driver: MagicMock,
     ) -> None:
-        """list_by_type() filters by project_id."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Task 1",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"project_id": "project-001", "status": "todo"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Task 2",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"project_id": "project-002", "status": "todo"}),
-                },
-            ],
-            None,
-            None,
-        )
+        """list_by_type() filters by project_id in the query."""
+        await entity_manager.list_by_type(EntityType.TASK, project_id="project-001")
 
-        results = await entity_manager.list_by_type(EntityType.TASK, project_id="project-001")
-
-        assert len(results) == 1
-        assert results[0].id == "task-001"
+        query, params = _last_query(mock_driver)
+        assert "n.project_id = $project_id" in query
+        assert params["project_id"] == "project-001"
 
     @pytest.mark.asyncio
     async def test_list_by_type_with_tags_filter(
@@ -802,32 +817,12 @@ class TestEntityListByType:
         entity_manager: EntityManager,
         mock_driver: MagicMock,
     ) -> None:
-        """list_by_type() filters by tags (any match)."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Task 1",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"tags": ["backend", "api"], "status": "todo"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Task 2",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"tags": ["frontend"], "status": "todo"}),
-                },
-            ],
-            None,
-            None,
-        )
-
-        results = await entity_manager.list_by_type(EntityType.TASK, tags=["backend"])
+        """list_by_type() filters by tags (any match) in the query."""
+        await entity_manager.list_by_type(EntityType.TASK, tags=["backend"])
 
-        assert len(results) == 1
-        assert results[0].id == "task-001"
+        query, params = _last_query(mock_driver)
+        assert "any(tag IN n.tags WHERE tag IN $tags)" in query
+        assert params["tags"] == ["backend"]
 
     @pytest.mark.asyncio
     async def test_list_by_type_excludes_archived_by_default(
@@ -836,31 +831,10 @@ class TestEntityListByType:
         mock_driver: MagicMock,
     ) -> None:
         """list_by_type() excludes archived entities by default."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Active Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Archived Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "archived"}),
-                },
-            ],
-            None,
-            None,
-        )
-
-        results = await entity_manager.list_by_type(EntityType.TASK)
+        await entity_manager.list_by_type(EntityType.TASK)
 
-        assert len(results) == 1
-        assert results[0].id == "task-001"
+        query, _ = _last_query(mock_driver)
+        assert "n.status <> 'archived'" in query
 
     @pytest.mark.asyncio
     async def test_list_by_type_include_archived(
@@ -869,30 +843,10 @@ class TestEntityListByType:
         mock_driver: MagicMock,
     ) -> None:
         """list_by_type() can include archived entities."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Active Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Archived Task",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "archived"}),
-                },
-            ],
-            None,
-            None,
-        )
+        await entity_manager.list_by_type(EntityType.TASK, include_archived=True)
 
-        results = await entity_manager.list_by_type(EntityType.TASK, include_archived=True)
-
-        assert len(results) == 2
+        query, _ = _last_query(mock_driver)
+        assert "archived" not in query
 
     @pytest.mark.asyncio
     async def test_list_by_type_pagination(
@@ -909,6 +863,7 @@ class TestEntityListByType:
                     "entity_type": "task",
                     "group_id": "test-org-123",
                     "metadata": json.dumps({"status": "todo"}),
+                    "created_at": f"2024-01-{20 - i:02d}T00:00:00+00:00",
                 }
                 for i in range(10)
             ],
@@ -972,35 +927,54 @@ class TestEntityListByType:
         mock_driver: MagicMock,
     ) -> None:
         """list_by_type() can filter for entities without an epic."""
-        mock_driver.execute_query.return_value = (
-            [
-                {
-                    "uuid": "task-001",
-                    "name": "Task with Epic",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo", "epic_id": "epic-001"}),
-                },
-                {
-                    "uuid": "task-002",
-                    "name": "Task without Epic",
-                    "entity_type": "task",
-                    "group_id": "test-org-123",
-                    "metadata": json.dumps({"status": "todo"}),
-                },
-            ],
-            None,
-            None,
-        )
+        await entity_manager.list_by_type(EntityType.TASK, no_epic=True)
 
-        results = await entity_manager.list_by_type(EntityType.TASK, no_epic=True)
+        query, _ = _last_query(mock_driver)
+        assert "n.epic_id IS NULL" in query
 
-        assert len(results) == 1
-        assert results[0].id == "task-002"
+    @pytest.mark.asyncio
+    async def test_list_by_type_queries_each_label_with_limit(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """list_by_type() runs one bounded, labelled query per entity label."""
+        await entity_manager.list_by_type(EntityType.TASK, limit=50, offset=100)
+
+        calls = mock_driver.execute_query.call_args_list
+        assert [c.args[0].split("WHERE")[0].strip() for c in calls] == [
+            "MATCH (n:Entity)",
+            "MATCH (n:Episodic)",
+        ]
+        for call in calls:
+            assert "LIMIT $limit" in call.args[0]
+            assert call.kwargs["limit"] == 150
+
+    @pytest.mark.asyncio
+    async def test_list_by_type_merges_labels_newest_first(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """Pages from both labels are merged by created_at before slicing."""
+
+        def record(uuid: str, created_at: str) -> dict[str, str]:
+            return {
+                "uuid": uuid,
+                "name": uuid,
+                "entity_type": "task",
+                "created_at": created_at,
+                "metadata": "{}",
+            }
+
+        mock_driver.execute_query.side_effect = [
+            ([record("direct-1", "2024-01-03"), record("direct-2", "2024-01-01")], None, None),
+            ([record("episode-1", "2024-01-02")], None, None),
+        ]
 
+        results = await entity_manager.list_by_type(EntityType.TASK, limit=2, offset=1)
 
-class TestEntityListAll:
-    """Test listing all entities."""
+        assert [r.id for r in results] == ["episode-1", "direct-2"]
 
     @pytest.mark.asyncio
     async def test_list_all_basic(
@@ -1041,6 +1015,128 @@ class TestEntityListAll:
 # =============================================================================
 
 
+def _task_records(count: int) -> list[dict]:
+    """Task records ordered newest first, as the list queries return them."""
+    return [
+        {
+            "uuid": f"task-{i:03d}",
+            "name": f"Task {i}",
+            "entity_type": "task",
+            "group_id": "test-org-123",
+            "metadata": json.dumps({"status": "todo"}),
+            "created_at": f"2024-01-{20 - i:02d}T00:00:00+00:00",
+            "updated_at": f"2024-02-{20 - i:02d}T00:00:00+00:00",
+        }
+        for i in range(count)
+    ]
+
+
+class TestEntityListPage:
+    """Test keyset cursor pagination."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_returns_cursor(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """list_page() fetches one extra row to decide whether a next page exists."""
+        mock_driver.execute_query.return_value = (_task_records(4), None, None)
+
+        page = await entity_manager.list_page([EntityType.TASK], 3, cursor="", status="todo")
+
+        assert [e.id for e in page.entities] == ["task-000", "task-001", "task-002"]
+        assert page.next_cursor is not None
+        query, params = _last_query(mock_driver)
+        assert "ORDER BY coalesce(n.created_at, n.updated_at, '') DESC, n.uuid DESC" in query
+        assert "n.created_at IS NOT NULL" not in query
+        assert "$after_value" not in query
+        assert params["limit"] == 4
+
+    @pytest.mark.asyncio
+    async def test_next_page_seeks_past_cursor(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """The cursor becomes a keyset condition instead of a SKIP."""
+        mock_driver.execute_query.return_value = (_task_records(4), None, None)
+        first = await entity_manager.list_page([EntityType.TASK], 3, cursor="")
+
+        mock_driver.execute_query.return_value = (_task_records(1), None, None)
+        page = await entity_manager.list_page([EntityType.TASK], 3, cursor=first.next_cursor)
+
+        query, params = _last_query(mock_driver)
+        assert "coalesce(n.created_at, n.updated_at, '') < $after_value" in query
+        assert "n.uuid < $after_id" in query
+        assert params["after_value"] == "2024-01-18T00:00:00+00:00"
+        assert params["after_id"] == "task-002"
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_ascending_order(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """Ascending listings seek with > and order ASC."""
+        mock_driver.execute_query.return_value = (_task_records(4), None, None)
+        first = await entity_manager.list_page(
+            None, 3, cursor="", order_by="updated_at", descending=False
+        )
+        mock_driver.execute_query.return_value = ([], None, None)
+
+        await entity_manager.list_page(
+            None, 3, cursor=first.next_cursor or "", order_by="updated_at", descending=False
+        )
+
+        query, _ = _last_query(mock_driver)
+        assert "coalesce(n.updated_at, n.created_at, '') > $after_value" in query
+        assert "ORDER BY coalesce(n.updated_at, n.created_at, '') ASC, n.uuid ASC" in query
+
+    @pytest.mark.asyncio
+    async def test_missing_sort_timestamp_falls_back(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """Nodes without created_at are paged by updated_at instead of dropped."""
+        records = _task_records(4)
+        del records[2]["created_at"]
+        records[2]["updated_at"] = "2024-01-18T12:00:00+00:00"
+        mock_driver.execute_query.return_value = (records, None, None)
+        first = await entity_manager.list_page([EntityType.TASK], 3, cursor="")
+
+        mock_driver.execute_query.return_value = ([], None, None)
+        await entity_manager.list_page([EntityType.TASK], 3, cursor=first.next_cursor or "")
+
+        query, params = _last_query(mock_driver)
+        assert "n.created_at IS NOT NULL" not in query
+        assert params["after_value"] == "2024-01-18T12:00:00+00:00"
+        assert params["after_id"] == "task-002"
+
+    @pytest.mark.asyncio
+    async def test_cursor_ordering_mismatch(
+        self,
+        entity_manager: EntityManager,
+        mock_driver: MagicMock,
+    ) -> None:
+        """A cursor issued for one ordering cannot be reused with another."""
+        mock_driver.execute_query.return_value = (_task_records(4), None, None)
+        first = await entity_manager.list_page([EntityType.TASK], 3, cursor="")
+
+        with pytest.raises(ValidationError):
+            await entity_manager.list_page(
+                [EntityType.TASK], 3, cursor=first.next_cursor or "", order_by="updated_at"
+            )
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor(self, entity_manager: EntityManager) -> None:
+        """Garbage cursors are rejected before querying."""
+        with pytest.raises(ValidationError):
+            await entity_manager.list_page([EntityType.TASK], 3, cursor="not-a-cursor")
+
+
 class TestEntitySearch:
     """Test semantic search operations."""
 
@@ -289,14 +289,9 @@ class TestRelationshipCreate:
 class TestRelationshipBulkCreate:
     """Test bulk relationship creation."""
 
-    @pytest.mark.asyncio
-    async def test_bulk_create_success(
-        self,
-        relationship_manager: RelationshipManager,
-        mock_driver: MagicMock,
-    ) -> None:
-        """create_bulk() creates multiple relationships."""
-        relationships = [
+    @staticmethod
+    def _chain(count: int) -> list[Relationship]:
+        return [
             Relationship(
                 id=f"rel-{i}",
                 relationship_type=RelationshipType.RELATED_TO,
@@ -304,57 +299,112 @@ class TestRelationshipBulkCreate:
                 target_id=f"entity-{i + 1}",
                 weight=1.0,
             )
-            for i in range(5)
+            for i in range(count)
         ]
 
-        with patch.object(
-            EntityEdge,
-            "get_between_nodes",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
-            created, failed = await relationship_manager.create_bulk(relationships)
+    @staticmethod
+    def _graph(mock_graph_client: MagicMock, episodic: set[str] | None = None) -> list[str]:
+        """Resolve every id as an Entity (or Episodic) node and record the writes."""
+        episodic = episodic or set()
+        writes: list[str] = []
+
+        async def read(query: str, org_id: str, **params: object) -> list[dict[str, str]]:
+            ids = params["ids"]
+            assert isinstance(ids, list)
+            wanted = [i for i in ids if i.startswith("entity-")]
+            if ":Episodic" in query:
+                return [{"uuid": i} for i in wanted if i in episodic]
+            return [{"uuid": i} for i in wanted if i not in episodic]
+
+        async def write(query: str, org_id: str, **params: object) -> list[dict[str, int]]:
+            writes.append(query)
+            rels = params["rels"]
+            assert isinstance(rels, list)
+            return [{"created": len(rels)}]
+
+        mock_graph_client.execute_read_org = AsyncMock(side_effect=read)
+        mock_graph_client.execute_write_org = AsyncMock(side_effect=write)
+        return writes
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_success(
+        self,
+        relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
+    ) -> None:
+        """create_bulk() writes edges in UNWIND batches with labelled endpoints."""
+        writes = self._graph(mock_graph_client)
 
-            assert created == 5
-            assert failed == 0
+        result = await relationship_manager.create_bulk(self._chain(5), batch_size=2)
+
+        assert (result.created, result.existing, result.failed) == (5, 0, 0)
+        assert len(writes) == 3
+        assert all("MATCH (source:Entity {uuid: rel.source_uuid})" in q for q in writes)
+        assert all("MERGE (source)-[r:RELATED_TO {uuid: rel.uuid}]->(target)" in q for q in writes)
 
     @pytest.mark.asyncio
-    async def test_bulk_create_partial_failure(
+    async def test_bulk_create_groups_by_endpoint_labels(
         self,
         relationship_manager: RelationshipManager,
-        mock_driver: MagicMock,
+        mock_graph_client: MagicMock,
     ) -> None:
-        """create_bulk() tracks partial failures."""
-        relationships = [
-            Relationship(
-                id=f"rel-{i}",
-                relationship_type=RelationshipType.RELATED_TO,
-                source_id=f"entity-{i}",
-                target_id=f"entity-{i + 1}",
-                weight=1.0,
-            )
-            for i in range(3)
-        ]
+        """Edges touching Episodic nodes are matched with the Episodic label."""
+        writes = self._graph(mock_graph_client, episodic={"entity-2"})
 
-        call_count = 0
+        result = await relationship_manager.create_bulk(self._chain(3))
 
-        async def flaky_get_between(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
-                raise Exception("Random failure")
-            return []
+        assert result.created == 3
+        assert len(writes) == 3
+        assert any("MATCH (target:Episodic" in q for q in writes)
+        assert any("MATCH (source:Episodic" in q for q in writes)
 
-        with patch.object(
-            EntityEdge,
-            "get_between_nodes",
-            new_callable=AsyncMock,
-            side_effect=flaky_get_between,
-        ):
-            created, failed = await relationship_manager.create_bulk(relationships)
+    @pytest.mark.asyncio
+    async def test_bulk_create_counts_existing(
+        self,
+        relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
+    ) -> None:
+        """Edges the graph already has, and repeats in the input, count as existing."""
+        self._graph(mock_graph_client)
+        mock_graph_client.execute_write_org = AsyncMock(return_value=[{"created": 1}])
+        rels = self._chain(3)
+        rels.append(rels[0].model_copy(update={"id": "rel-repeat"}))
+
+        result = await relationship_manager.create_bulk(rels)
+
+        assert (result.created, result.existing, result.failed) == (1, 3, 0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_missing_endpoints_fail(
+        self,
+        relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
+    ) -> None:
+        """Edges whose endpoints don't exist are not written."""
+        writes = self._graph(mock_graph_client)
+        rels = self._chain(2)
+        rels[1] = rels[1].model_copy(update={"target_id": "missing"})
+
+        result = await relationship_manager.create_bulk(rels)
+
+        assert (result.created, result.failed) == (1, 1)
+        assert len(writes) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_partial_failure(
+        self,
+        relationship_manager: RelationshipManager,
+        mock_graph_client: MagicMock,
+    ) -> None:
+        """A failed batch counts its edges as failed and later batches still run."""
+        self._graph(mock_graph_client)
+        mock_graph_client.execute_write_org = AsyncMock(
+            side_effect=[[{"created": 2}], Exception("Random failure"), [{"created": 1}]]
+        )
+
+        result = await relationship_manager.create_bulk(self._chain(5), batch_size=2)
 
-            assert created == 2
-            assert failed == 1
+        assert (result.created, result.existing, result.failed) == (3, 0, 2)
 
 
 # =============================================================================
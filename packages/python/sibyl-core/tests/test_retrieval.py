@@ -1,11 +1,14 @@
 """Tests for sibyl-core retrieval module.
 
-Covers BM25 keyword search, deduplication, RRF fusion, and temporal decay.
+Covers BM25 keyword search, deduplication, RRF fusion, temporal decay, and
+the query-embedding cache.
 """
 
 from __future__ import annotations
 
+import asyncio
 import math
+from array import array
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
@@ -25,6 +28,7 @@ from sibyl_core.retrieval.dedup import (
     cosine_similarity,
     jaccard_similarity,
 )
+from sibyl_core.retrieval.embedding_cache import CachingEmbedder, EmbeddingCache
 from sibyl_core.retrieval.fusion import (
     FusionConfig,
     default_dedup_key,
@@ -33,6 +37,7 @@ from sibyl_core.retrieval.fusion import (
     rrf_score,
     weighted_score_merge,
 )
+from sibyl_core.retrieval.linking import EntityNameIndex
 from sibyl_core.retrieval.temporal import (
     TemporalConfig,
     calculate_age_days,
@@ -88,6 +93,14 @@ class TestTokenize:
         assert "test123" in tokens
         assert "symbol" in tokens
 
+    def test_tokenize_snake_case_identifiers(self) -> None:
+        """Underscore identifiers keep the whole token plus their parts."""
+        tokens = tokenize("raise ERR_CONN_RESET from parse_config()")
+        assert "err_conn_reset" in tokens
+        assert "parse_config" in tokens
+        assert "conn" in tokens
+        assert "config" in tokens
+
     def test_tokenize_numbers(self) -> None:
         """Numbers are preserved as tokens."""
         tokens = tokenize("Python 3 is version 3", min_length=1)
@@ -276,6 +289,39 @@ class TestBM25Index:
         results = index.search("Python", limit=3)
         assert len(results) == 3
 
+    def test_bm25_index_postings_follow_updates(self) -> None:
+        """Updates and removals keep postings and length totals consistent."""
+        index = BM25Index()
+        index.add({"id": "1", "name": "python python asyncio"})
+        index.add({"id": "2", "name": "python web"})
+        index.add({"id": "1", "name": "rust tokio"})
+        index.remove("2")
+
+        assert index.search("python") == []
+        assert index.search("tokio")[0][0]["id"] == "1"
+        assert index._total_length == 2
+        assert index._avg_doc_length == 2.0
+        assert index.vocabulary_size == 2
+
+    def test_bm25_index_pruned_top_k_matches_exhaustive(self) -> None:
+        """MaxScore pruning returns the same top-k as scoring every document."""
+        index = BM25Index()
+        words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "theta", "kappa"]
+        for i in range(200):
+            text = " ".join(words[(i * j) % len(words)] for j in range(1, 2 + i % 7))
+            index.add({"id": str(i), "name": text})
+
+        for query in ["alpha", "beta gamma", "zeta theta kappa", "alpha alpha delta"]:
+            terms = tokenize(query)
+            exhaustive = sorted(
+                ((doc_id, index._score_document(doc_id, terms)) for doc_id in index._entities),
+                key=lambda x: x[1],
+                reverse=True,
+            )
+            expected = [score for _, score in exhaustive if score > 0][:5]
+            actual = [score for _, score in index.search(query, limit=5)]
+            assert actual == pytest.approx(expected)
+
 
 class TestBM25ScoreCalculation:
     """Test BM25 score formula correctness."""
@@ -1095,3 +1141,230 @@ class TestEdgeCases:
         )
 
         assert boosted == pytest.approx(0.1)
+
+
+class TestEntityNameIndex:
+    """Tests for name-based entity linking."""
+
+    def test_exact_multiword_match(self) -> None:
+        """Names mentioned verbatim link with full confidence."""
+        names = EntityNameIndex()
+        names.add("e1", "OAuth Callback Handler")
+        names.add("e2", "Rate limiter")
+
+        assert names.link("Why does the oauth callback-handler fail?") == [("e1", 1.0)]
+
+    def test_short_single_word_not_linked(self) -> None:
+        """Short single-word names are too ambiguous to link."""
+        names = EntityNameIndex()
+        names.add("e1", "api")
+
+        assert names.link("api errors") == []
+
+    def test_fuzzy_match(self) -> None:
+        """Small spelling differences still link, below full confidence."""
+        names = EntityNameIndex()
+        names.add("e1", "connection pooling")
+
+        linked = names.link("connection poolling settings")
+        assert [eid for eid, _ in linked] == ["e1"]
+        assert 0.85 <= linked[0][1] < 1.0
+
+    def test_remove_and_rename(self) -> None:
+        """Re-adding an entity replaces its old name."""
+        names = EntityNameIndex()
+        names.add("e1", "old name here")
+        names.add("e1", "new name here")
+        assert names.link("old name here") == []
+        assert names.link("new name here") == [("e1", 1.0)]
+        names.remove("e1")
+        assert names.size == 0
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for the shared cache tier."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.data: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def get(self, key: str) -> bytes | None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+
+class TestEmbeddingCache:
+    """Tests for the content-addressed query-embedding cache."""
+
+    @staticmethod
+    def counting_embedder(calls: list[str]):
+        async def embed(text: str) -> list[float]:
+            calls.append(text)
+            await asyncio.sleep(0.01)
+            return [float(len(text)), 0.5]
+
+        return embed
+
+    def test_key_normalizes_whitespace(self) -> None:
+        """Whitespace differences share a key; model and dimensions do not."""
+        key = EmbeddingCache.make_key("m", 1536, "oauth  token\nrefresh ")
+        assert key == EmbeddingCache.make_key("m", 1536, "oauth token refresh")
+        assert key != EmbeddingCache.make_key("m", 1024, "oauth token refresh")
+        assert key != EmbeddingCache.make_key("other", 1536, "oauth token refresh")
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self) -> None:
+        """The second lookup is served from memory."""
+        cache = EmbeddingCache()
+        calls: list[str] = []
+
+        first = await cache.get_or_embed("m", 2, "query", self.counting_embedder(calls))
+        second = await cache.get_or_embed("m", 2, " query ", self.counting_embedder(calls))
+
+        assert first == second
+        assert calls == ["query"]
+        assert cache.stats.misses == 1
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self) -> None:
+        """Concurrent identical requests make a single embedding call."""
+        cache = EmbeddingCache()
+        calls: list[str] = []
+        embed = self.counting_embedder(calls)
+
+        results = await asyncio.gather(*(cache.get_or_embed("m", 2, "q", embed) for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(r == results[0] for r in results)
+        assert cache.stats.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_waiters_and_is_not_cached(self) -> None:
+        """A failed embedding fails every coalesced caller and is retried next time."""
+        cache = EmbeddingCache()
+
+        async def failing(text: str) -> list[float]:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("rate limited")
+
+        results = await asyncio.gather(
+            *(cache.get_or_embed("m", 2, "q", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        calls: list[str] = []
+        await cache.get_or_embed("m", 2, "q", self.counting_embedder(calls))
+        assert calls == ["q"]
+
+    @pytest.mark.asyncio
+    async def test_first_caller_cancelled_does_not_fail_waiters(self) -> None:
+        """A timed-out first caller leaves the shared lookup running for others."""
+        cache = EmbeddingCache()
+        calls: list[str] = []
+
+        async def slow(text: str) -> list[float]:
+            calls.append(text)
+            await asyncio.sleep(0.2)
+            return [1.0, 0.5]
+
+        first = asyncio.create_task(asyncio.wait_for(cache.get_or_embed("m", 2, "q", slow), 0.05))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_embed("m", 2, "q", slow))
+
+        with pytest.raises(TimeoutError):
+            await first
+        assert await second == [1.0, 0.5]
+        assert calls == ["q"]
+        assert await cache.get_or_embed("m", 2, "q", slow) == [1.0, 0.5]
+        assert calls == ["q"]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """The least recently used vector is evicted past maxsize."""
+        cache = EmbeddingCache(maxsize=2)
+        calls: list[str] = []
+        embed = self.counting_embedder(calls)
+
+        for text in ("a", "b", "a", "c", "a", "b"):
+            await cache.get_or_embed("m", 2, text, embed)
+
+        assert calls == ["a", "b", "c", "b"]
+        assert cache.size == 2
+
+    async def test_vectors_are_stored_as_float32(self) -> None:
+        """Memory holds float32 arrays; every caller gets the same rounded list."""
+        cache = EmbeddingCache()
+
+        async def embed(_: str) -> list[float]:
+            return [0.1, 0.25]
+
+        first = await cache.get_or_embed("m", 2, "q", embed)
+        second = await cache.get_or_embed("m", 2, "q", embed)
+
+        _, stored = next(iter(cache._memory.values()))
+        assert stored.typecode == "f"
+        assert first == second == [array("f", [0.1])[0], 0.25]
+        assert first != [0.1, 0.25]
+        second.append(1.0)
+        assert await cache.get_or_embed("m", 2, "q", embed) == first
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_processes(self) -> None:
+        """A second process finds the vector in Redis instead of calling the API."""
+        redis = FakeRedis()
+        calls: list[str] = []
+        embed = self.counting_embedder(calls)
+        vector = await EmbeddingCache(redis=redis).get_or_embed("m", 2, "q", embed)
+
+        other = EmbeddingCache(redis=redis)
+        assert await other.get_or_embed("m", 2, "q", embed) == vector
+        assert calls == ["q"]
+        assert other.stats.redis_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_through(self) -> None:
+        """Redis errors are counted and the embedding is computed anyway."""
+        cache = EmbeddingCache(redis=FakeRedis(fail=True))
+        calls: list[str] = []
+
+        await cache.get_or_embed("m", 2, "q", self.counting_embedder(calls))
+
+        assert calls == ["q"]
+        assert cache.stats.redis_errors == 2
+
+    @pytest.mark.asyncio
+    async def test_caching_embedder_wraps_single_texts(self) -> None:
+        """Graphiti's single-text create() calls go through the cache; batches do not."""
+
+        class Inner:
+            config = type("Config", (), {"embedding_model": "m", "embedding_dim": 2})()
+
+            def __init__(self) -> None:
+                self.calls: list[object] = []
+
+            async def create(self, input_data: object) -> list[float]:
+                self.calls.append(input_data)
+                return [1.0, 2.0]
+
+            async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+                self.calls.append(input_data_list)
+                return [[1.0, 2.0]] * len(input_data_list)
+
+        inner = Inner()
+        embedder = CachingEmbedder(inner, EmbeddingCache())  # type: ignore[arg-type]
+
+        await embedder.create(input_data=["query"])
+        await embedder.create("query")
+        await embedder.create_batch(["a", "b"])
+        await embedder.create_batch(["a", "b"])
+
+        assert inner.calls == [["query"], ["a", "b"], ["a", "b"]]
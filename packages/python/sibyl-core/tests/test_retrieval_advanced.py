@@ -2,12 +2,13 @@
 
 Covers:
 - EntityDeduplicator: vectorized similarity, pair finding, merge suggestions
-- Hybrid search: vector + graph fusion, RRF merge, temporal boosting
+- Hybrid search: vector + BM25 + graph fusion, RRF merge, temporal boosting
 - Score normalization and result merging from multiple sources
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -16,7 +17,14 @@ from unittest.mock import AsyncMock, MagicMock
 import numpy as np
 import pytest
 
+from sibyl_core.config import core_config
 from sibyl_core.models.entities import Entity, EntityType
+from sibyl_core.retrieval.bm25 import (
+    BM25_CONTENT_CHARS,
+    get_org_bm25_index,
+    index_org_entity,
+    reset_org_bm25_indexes,
+)
 from sibyl_core.retrieval.dedup import (
     DedupConfig,
     DuplicatePair,
@@ -26,10 +34,12 @@ from sibyl_core.retrieval.dedup import (
     jaccard_similarity,
 )
 from sibyl_core.retrieval.hybrid import (
+    BM25_REFRESH_SECONDS,
     HybridConfig,
     HybridResult,
     graph_traversal,
     hybrid_search,
+    keyword_search,
     simple_hybrid_search,
     vector_search,
 )
@@ -115,6 +125,7 @@ class MockEntityManagerForHybrid:
 
     search_results: list[tuple[Entity, float]] = field(default_factory=list)
     search_calls: list[dict[str, Any]] = field(default_factory=list)
+    index_entities: list[Entity] = field(default_factory=list)
 
     async def search(
         self,
@@ -129,6 +140,18 @@ class MockEntityManagerForHybrid:
             results = [(e, s) for e, s in results if e.entity_type in entity_types]
         return results[:limit]
 
+    async def list_for_search_index(
+        self,
+        *,
+        after_id: str | None = None,
+        updated_since: str | None = None,
+        limit: int = 1000,
+        content_chars: int = 4000,
+    ) -> list[Entity]:
+        """Return a uuid-ordered page of index entities."""
+        ordered = sorted(self.index_entities, key=lambda e: e.id)
+        return [e for e in ordered if after_id is None or e.id > after_id][:limit]
+
 
 @dataclass
 class MockGraphClientForHybrid:
@@ -467,6 +490,149 @@ class TestEntityDeduplicatorFindDuplicates:
         assert len(client.query_history) >= 1
 
 
+class TestEntityDeduplicatorBlocked:
+    """Test tiled, type-blocked and approximate duplicate search."""
+
+    @staticmethod
+    def _clusters(count: int, size: int, dim: int = 16) -> list[tuple[str, str, str, list[float]]]:
+        """Clusters of near-identical embeddings, alternating between two types."""
+        rng = np.random.default_rng(7)
+        entities = []
+        for c in range(count):
+            center = rng.normal(size=dim)
+            for m in range(size):
+                vector = center + rng.normal(scale=0.01, size=dim)
+                etype = "topic" if c % 2 == 0 else "pattern"
+                entities.append((f"id{c:03d}_{m}", f"Cluster {c}", etype, vector.tolist()))
+        return entities
+
+    def _dedup(self, **config: Any) -> EntityDeduplicator:
+        config.setdefault("min_name_overlap", 0.0)
+        return EntityDeduplicator(
+            client=MockGraphClientForDedup(),  # type: ignore[arg-type]
+            entity_manager=MockEntityManagerForDedup(),  # type: ignore[arg-type]
+            config=DedupConfig(**config),
+        )
+
+    @pytest.mark.parametrize("same_type_only", [True, False])
+    def test_tiles_match_single_pass(self, same_type_only: bool) -> None:
+        """Small tiles find exactly the pairs of one whole-matrix pass."""
+        entities = self._clusters(count=20, size=4)
+        whole = self._dedup(same_type_only=same_type_only, top_k=None)
+        tiled = self._dedup(same_type_only=same_type_only, top_k=None, max_tile_memory_mb=0.001)
+
+        expected = whole._find_similar_pairs_vectorized(entities, threshold=0.95)
+        found = tiled._find_similar_pairs_vectorized(entities, threshold=0.95)
+
+        found_ids = {(p.entity1_id, p.entity2_id) for p in found}
+        assert found_ids == {(p.entity1_id, p.entity2_id) for p in expected}
+        assert len(found_ids) == 20 * 6  # 4 members per cluster -> 6 pairs
+
+    def test_top_k_limits_candidates_per_entity(self) -> None:
+        """Each entity keeps only its top_k most similar candidates."""
+        entities = self._clusters(count=1, size=6)
+        dedup = self._dedup(top_k=2)
+
+        pairs = dedup._find_similar_pairs_vectorized(entities, threshold=0.95)
+
+        per_entity: dict[str, int] = {}
+        for pair in pairs:
+            per_entity[pair.entity1_id] = per_entity.get(pair.entity1_id, 0) + 1
+        assert max(per_entity.values()) == 2
+        assert len(pairs) == 2 + 2 + 2 + 2 + 1
+
+    def test_name_filter_runs_before_top_k(self) -> None:
+        """Candidates rejected by name don't crowd out a matching one."""
+        base = [1.0, 0.0, 0.0]
+        entities = [
+            ("a", "OAuth token refresh", "topic", base),
+            ("b", "Unrelated closer one", "topic", [1.0, 0.01, 0.0]),
+            ("c", "Something else close", "topic", [1.0, 0.02, 0.0]),
+            ("d", "OAuth token refresh flow", "topic", [1.0, 0.1, 0.0]),
+        ]
+        dedup = self._dedup(top_k=1, min_name_overlap=0.5)
+
+        pairs = dedup._find_similar_pairs_vectorized(entities, threshold=0.95)
+
+        assert ("a", "d") in {(p.entity1_id, p.entity2_id) for p in pairs}
+
+    def test_top_k_is_exact_by_default(self) -> None:
+        """Without an explicit top_k every pair above the threshold is kept."""
+        entities = self._clusters(count=1, size=30)
+        dedup = self._dedup()
+
+        pairs = dedup._find_similar_pairs_vectorized(entities, threshold=0.95)
+
+        assert dedup.config.top_k is None
+        assert len(pairs) == 30 * 29 // 2
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_fetched_in_pages(self) -> None:
+        """Embeddings are read with keyset pagination on the uuid."""
+        entities = self._clusters(count=3, size=2)
+        afters: list[str] = []
+
+        async def execute_query(query: str, **params: Any) -> list[Any]:
+            afters.append(params["after"])
+            remaining = [e for e in entities if e[0] > params["after"]]
+            return remaining[: params["limit"]]
+
+        client = MagicMock()
+        client.client.driver.execute_query = execute_query
+        dedup = EntityDeduplicator(
+            client=client,
+            entity_manager=MockEntityManagerForDedup(),  # type: ignore[arg-type]
+            config=DedupConfig(min_name_overlap=0.0, fetch_page_size=4),
+        )
+
+        pairs = await dedup.find_duplicates(threshold=0.95)
+
+        assert afters == ["", entities[3][0]]
+        assert len(pairs) == 3
+
+    @pytest.mark.asyncio
+    async def test_approximate_mode_uses_vector_index(self) -> None:
+        """Approximate mode queries kNN per entity and keeps each pair once."""
+        queries: list[str] = []
+
+        async def execute_query(query: str, **params: Any) -> list[Any]:
+            queries.append(query)
+            if "queryNodes" in query:
+                assert params["k"] == 4
+                knn = {
+                    "a": [("b", "Python async", 0.99)],
+                    "b": [("a", "Python async", 0.99)],
+                    "c": [("a", "Python async", 0.97)],
+                }
+                return [
+                    {
+                        "id": entity_id,
+                        "name": "Go channels" if entity_id == "c" else "Python async",
+                        "type": "topic",
+                        "other_id": other,
+                        "other_name": other_name,
+                        "similarity": sim,
+                    }
+                    for entity_id in params["ids"]
+                    for other, other_name, sim in knn[entity_id]
+                ]
+            assert "name_embedding AS embedding" not in query
+            return [(i, "", "topic", []) for i in ("a", "b", "c") if i > params["after"]]
+
+        client = MagicMock()
+        client.client.driver.execute_query = execute_query
+        dedup = EntityDeduplicator(
+            client=client,
+            entity_manager=MockEntityManagerForDedup(),  # type: ignore[arg-type]
+            config=DedupConfig(approximate=True, top_k=3, batch_size=2, min_name_overlap=0.5),
+        )
+
+        pairs = await dedup.find_duplicates(threshold=0.95)
+
+        assert [(p.entity1_id, p.entity2_id) for p in pairs] == [("a", "b")]
+        assert sum("queryNodes" in q for q in queries) == 2
+
+
 class TestEntityDeduplicatorMerge:
     """Test entity merge operations."""
 
@@ -853,6 +1019,205 @@ class TestHybridSearch:
         assert result.total == 5
 
 
+class TestKeywordSearch:
+    """Test BM25 keyword search over per-org indexes."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_indexes(self) -> None:
+        reset_org_bm25_indexes()
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_builds_index_on_first_query(self) -> None:
+        """First query loads the org's entities and finds exact identifiers."""
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [
+            make_entity_for_test("e1", name="ERR_CONN_RESET handling"),
+            make_entity_for_test("e2", name="Retry backoff pattern"),
+        ]
+
+        results = await keyword_search("ERR_CONN_RESET", manager, "org_kw")  # type: ignore[arg-type]
+
+        assert [e.id for e, _ in results] == ["e1"]
+        assert get_org_bm25_index("org_kw").loaded is True
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_sees_incremental_writes(self) -> None:
+        """Entity writes after the initial load are reflected immediately."""
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [make_entity_for_test("e1", name="Initial entity")]
+        await keyword_search("initial", manager, "org_inc")  # type: ignore[arg-type]
+
+        index_org_entity("org_inc", make_entity_for_test("e2", name="parse_config helper"))
+        results = await keyword_search("parse_config", manager, "org_inc")  # type: ignore[arg-type]
+
+        assert [e.id for e, _ in results] == ["e2"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_writes_truncate_content(self) -> None:
+        """Incremental writes index the same content prefix as the graph load."""
+        manager = MockEntityManagerForHybrid()
+        await keyword_search("warmup", manager, "org_trunc")  # type: ignore[arg-type]
+
+        entity = make_entity_for_test("e1", name="Long note")
+        entity.content = "word " * BM25_CONTENT_CHARS + "needle"
+        index_org_entity("org_trunc", entity)
+
+        indexed = get_org_bm25_index("org_trunc").get("e1")
+        assert indexed is not None
+        assert len(indexed.content) == BM25_CONTENT_CHARS
+        assert entity.content.endswith("needle")
+        assert await keyword_search("needle", manager, "org_trunc") == []  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_stale_index_refreshes_in_background(self) -> None:
+        """A due catch-up refresh runs as a task instead of delaying the query."""
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [make_entity_for_test("e1", name="Initial entity")]
+        await keyword_search("initial", manager, "org_refresh")  # type: ignore[arg-type]
+        index = get_org_bm25_index("org_refresh")
+        index.refreshed_at -= BM25_REFRESH_SECONDS + 1
+
+        release = asyncio.Event()
+        list_page = manager.list_for_search_index
+
+        async def slow_list(**kwargs: Any) -> list[Entity]:
+            await release.wait()
+            return await list_page(**kwargs)
+
+        manager.list_for_search_index = slow_list  # type: ignore[method-assign]
+        manager.index_entities.append(make_entity_for_test("e2", name="Written elsewhere"))
+
+        results = await keyword_search("initial", manager, "org_refresh")  # type: ignore[arg-type]
+
+        assert [e.id for e, _ in results] == ["e1"]
+        assert index.refresh_task is not None
+        assert not index.refresh_task.done()
+
+        release.set()
+        await index.refresh_task
+        results = await keyword_search("elsewhere", manager, "org_refresh")  # type: ignore[arg-type]
+        assert [e.id for e, _ in results] == ["e2"]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_org_index_is_evicted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only the most recently queried orgs keep an index in process."""
+        monkeypatch.setattr(core_config, "bm25_max_org_indexes", 2)
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [make_entity_for_test("e1", name="Shared entity")]
+
+        await keyword_search("shared", manager, "org_a")  # type: ignore[arg-type]
+        await keyword_search("shared", manager, "org_b")  # type: ignore[arg-type]
+        org_a = get_org_bm25_index("org_a")
+        await keyword_search("shared", manager, "org_c")  # type: ignore[arg-type]
+
+        assert get_org_bm25_index("org_a") is org_a
+        assert get_org_bm25_index("org_b").loaded is False
+        assert org_a.size == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_org_index_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An index nobody queried within the TTL is dropped and its refresh cancelled."""
+        monkeypatch.setattr(core_config, "bm25_index_ttl_seconds", 60.0)
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [make_entity_for_test("e1", name="Idle entity")]
+        await keyword_search("idle", manager, "org_idle")  # type: ignore[arg-type]
+        idle = get_org_bm25_index("org_idle")
+        idle.used_at -= 61
+        idle.refresh_task = asyncio.create_task(asyncio.sleep(60))
+
+        await keyword_search("idle", manager, "org_active")  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+
+        assert idle.size == 0
+        assert idle.refresh_task.cancelled()
+        assert get_org_bm25_index("org_idle") is not idle
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_type_filter(self) -> None:
+        """Entity type filter applies to BM25 results."""
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [
+            make_entity_for_test("t1", name="redis timeout", entity_type=EntityType.TOPIC),
+            make_entity_for_test("p1", name="redis timeout", entity_type=EntityType.PATTERN),
+        ]
+
+        results = await keyword_search(
+            "redis timeout",
+            manager,  # type: ignore[arg-type]
+            "org_types",
+            entity_types=[EntityType.PATTERN],
+        )
+
+        assert [e.id for e, _ in results] == ["p1"]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_fuses_bm25_results(self) -> None:
+        """hybrid_search runs BM25 alongside vector search when org-scoped."""
+        client = MockGraphClientForHybrid()
+        manager = MockEntityManagerForHybrid()
+        keyword_hit = make_entity_for_test("kw", name="E1234 decoder failure")
+        manager.index_entities = [keyword_hit]
+        manager.search_results = [(make_entity_for_test("vec", name="Decoder notes"), 0.9)]
+
+        result = await hybrid_search(
+            "E1234",
+            client,  # type: ignore[arg-type]
+            manager,  # type: ignore[arg-type]
+            config=HybridConfig(graph_weight=0, apply_temporal=False),
+            group_id="org_hybrid",
+        )
+
+        assert "bm25" in result.metadata["sources"]
+        assert result.metadata["bm25_count"] == 1
+        assert {e.id for e in result.entities} == {"kw", "vec"}
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_seeds_graph_from_linked_entities(self) -> None:
+        """Entities named in the query seed graph traversal directly."""
+        client = MockGraphClientForHybrid()
+        client.traversal_results = [
+            {"id": "nb", "name": "Neighbor", "type": "topic", "description": "", "distance": 1}
+        ]
+        manager = MockEntityManagerForHybrid()
+        manager.index_entities = [make_entity_for_test("oauth", name="OAuth callback handler")]
+        manager.search_results = [(make_entity_for_test("vec", name="Login notes"), 0.9)]
+        await keyword_search("warmup", manager, "org_link")  # type: ignore[arg-type]
+
+        result = await hybrid_search(
+            "why does the oauth callback handler fail",
+            client,  # type: ignore[arg-type]
+            manager,  # type: ignore[arg-type]
+            config=HybridConfig(apply_temporal=False),
+            group_id="org_link",
+        )
+
+        assert result.metadata["graph_seed_source"] == "linked"
+        assert result.metadata["linked_entities"] == ["oauth"]
+        assert "nb" in {e.id for e in result.entities}
+        timings = result.metadata["timings_ms"]
+        assert {"linking", "vector", "bm25", "graph", "fusion", "total"} <= timings.keys()
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_falls_back_to_vector_seeds(self) -> None:
+        """Without linked entities, top vector results seed traversal."""
+        client = MockGraphClientForHybrid()
+        manager = MockEntityManagerForHybrid()
+        manager.search_results = [(make_entity_for_test("vec", name="Login notes"), 0.9)]
+
+        result = await hybrid_search(
+            "unrelated question",
+            client,  # type: ignore[arg-type]
+            manager,  # type: ignore[arg-type]
+            config=HybridConfig(apply_temporal=False),
+            group_id="org_fallback",
+        )
+
+        assert result.metadata["graph_seed_source"] == "vector"
+        assert result.metadata["linked_entities"] == []
+
+
 class TestSimpleHybridSearch:
     """Test simple_hybrid_search function."""
 
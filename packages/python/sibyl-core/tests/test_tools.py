@@ -6,6 +6,7 @@ of EntityManager dependencies.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -844,6 +845,80 @@ class TestSearchTool:
             assert isinstance(response.total, int)
             assert isinstance(response.filters, dict)
 
+    @pytest.mark.asyncio
+    async def test_search_runs_branches_concurrently(self) -> None:
+        """Graph and document branches overlap instead of running back to back."""
+        from sibyl_core.tools.search import search
+
+        both_started = asyncio.Event()
+        started: list[str] = []
+
+        def branch(name: str, result: SearchResult):
+            async def run(*_args: Any, **_kwargs: Any) -> list[SearchResult]:
+                started.append(name)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return [result]
+
+            return run
+
+        graph_hit = SearchResult(id="g1", type="pattern", name="G", content="", score=0.9)
+        doc_hit = SearchResult(
+            id="d1", type="document", name="D", content="", score=0.8, result_origin="document"
+        )
+        with (
+            patch("sibyl_core.tools.search._search_graph", branch("graph", graph_hit)),
+            patch("sibyl_core.tools.search._search_documents", branch("documents", doc_hit)),
+        ):
+            response = await search(query="test", organization_id="org_123")
+
+        assert [r.id for r in response.results] == ["g1", "d1"]
+        assert response.partial is False
+        assert response.metadata["branches"] == {"graph": "ok", "documents": "ok"}
+        assert set(response.metadata["timings_ms"]) == {"graph", "documents"}
+
+    @pytest.mark.asyncio
+    async def test_search_returns_partial_results_on_branch_timeout(self) -> None:
+        """A slow branch is cut off and the other branch's results are returned."""
+        from sibyl_core.tools.search import search
+
+        async def slow_graph(*_args: Any, **_kwargs: Any) -> list[SearchResult]:
+            await asyncio.sleep(5)
+            return []
+
+        doc_hit = SearchResult(
+            id="d1", type="document", name="D", content="", score=0.8, result_origin="document"
+        )
+        with (
+            patch("sibyl_core.tools.search._search_graph", slow_graph),
+            patch("sibyl_core.tools.search._search_documents", AsyncMock(return_value=[doc_hit])),
+            patch.dict(
+                "sibyl_core.tools.search.TIMEOUTS", {"search_graph": 0.05, "search_documents": 1}
+            ),
+        ):
+            response = await search(query="test", organization_id="org_123")
+
+        assert [r.id for r in response.results] == ["d1"]
+        assert response.partial is True
+        assert response.metadata["branches"] == {"graph": "timeout", "documents": "ok"}
+        assert response.metadata["timings_ms"]["graph"] < 1000
+
+    @pytest.mark.asyncio
+    async def test_search_branch_error_is_reported(self) -> None:
+        """A failing branch is reported as an error without failing the search."""
+        from sibyl_core.tools.search import search
+
+        with patch(
+            "sibyl_core.tools.search._search_documents",
+            AsyncMock(side_effect=RuntimeError("pgvector down")),
+        ):
+            response = await search(query="test", organization_id="org_123", include_graph=False)
+
+        assert response.total == 0
+        assert response.partial is True
+        assert response.metadata["branches"] == {"documents": "error"}
+
 
 # =============================================================================
 # Explore Tool Tests
@@ -1020,6 +1095,37 @@ class TestExploreTool:
             assert isinstance(response.entities, list)
             assert isinstance(response.total, int)
 
+    @pytest.mark.asyncio
+    async def test_explore_cursor_page_scopes_query_to_accessible_projects(self) -> None:
+        """Cursor listing pushes RBAC scoping into the page query."""
+        from sibyl_core.graph.entities import EntityPage
+        from sibyl_core.tools.explore import explore
+
+        mock_client = AsyncMock()
+        mock_entity_manager = AsyncMock()
+        mock_entity_manager.list_page = AsyncMock(return_value=EntityPage(entities=[]))
+
+        with (
+            patch(
+                "sibyl_core.tools.explore.get_graph_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "sibyl_core.tools.explore.EntityManager",
+                return_value=mock_entity_manager,
+            ),
+        ):
+            await explore(
+                mode="list",
+                cursor="",
+                accessible_projects={"proj_b", "proj_a"},
+                organization_id="org_123",
+            )
+
+        kwargs = mock_entity_manager.list_page.call_args.kwargs
+        assert kwargs["project_ids"] == ["proj_a", "proj_b"]
+        assert kwargs["include_unassigned"] is True
+
 
 class TestExploreEntityFilters:
     """Test explore entity filtering logic."""
@@ -1278,7 +1384,7 @@ class TestAddTool:
         mock_entity_manager = MagicMock()
         created_id = None
 
-        async def capture_create(entity):
+        async def capture_create(entity, **_kwargs):
             nonlocal created_id
             created_id = entity.id
             return entity.id
@@ -1307,6 +1413,43 @@ class TestAddTool:
 class TestAddEntityTypes:
     """Test add tool with different entity types."""
 
+    @pytest.mark.asyncio
+    async def test_add_embeds_once(self) -> None:
+        """Sync add reuses one embedding for conflicts, auto-links and the node write."""
+        from sibyl_core.tools.add import add
+
+        embedding = [0.2] * 1536
+        mock_client = AsyncMock()
+        mock_entity_manager = MagicMock()
+        mock_entity_manager.embed = AsyncMock(return_value=embedding)
+        mock_entity_manager.search = AsyncMock(return_value=[])
+        mock_entity_manager.search_by_embedding = AsyncMock(return_value=[])
+        mock_entity_manager.create_direct = AsyncMock(side_effect=lambda e, **_: e.id)
+
+        with (
+            patch("sibyl_core.tools.add.get_graph_client", return_value=mock_client),
+            patch("sibyl_core.tools.add.EntityManager", return_value=mock_entity_manager),
+            patch("sibyl_core.tools.add.RelationshipManager"),
+            patch("sibyl_core.tools.conflicts.get_graph_client", return_value=mock_client),
+            patch("sibyl_core.tools.conflicts.EntityManager", return_value=mock_entity_manager),
+        ):
+            response = await add(
+                title="Retry pattern",
+                content="Retry transient errors with backoff",
+                entity_type="pattern",
+                metadata={"organization_id": "org_123"},
+                sync=True,
+            )
+
+        assert response.success is True
+        mock_entity_manager.embed.assert_awaited_once()
+        mock_entity_manager.search.assert_not_awaited()
+        assert mock_entity_manager.search_by_embedding.await_count == 2  # Conflicts, links
+        for call in mock_entity_manager.search_by_embedding.await_args_list:
+            assert call.args[0] is embedding
+        assert mock_entity_manager.create_direct.await_args.kwargs["embedding"] is embedding
+        assert {"embed", "conflicts", "create", "links", "total"} <= response.timings_ms.keys()
+
     @pytest.mark.asyncio
     async def test_add_pattern(self) -> None:
         """Add creates Pattern entity."""
@@ -1316,7 +1459,7 @@ class TestAddEntityTypes:
         mock_entity_manager = MagicMock()
         created_entity = None
 
-        async def capture_create(entity):
+        async def capture_create(entity, **_kwargs):
             nonlocal created_entity
             created_entity = entity
             return entity.id
@@ -1350,7 +1493,7 @@ class TestAddEntityTypes:
         mock_entity_manager = MagicMock()
         created_entity = None
 
-        async def capture_create(entity):
+        async def capture_create(entity, **_kwargs):
             nonlocal created_entity
             created_entity = entity
             return entity.id
@@ -1384,7 +1527,7 @@ class TestAddEntityTypes:
         mock_rel_manager = MagicMock()
         created_relationships = []
 
-        async def capture_create(entity):
+        async def capture_create(entity, **_kwargs):
             return entity.id
 
         async def capture_rel_create(rel):
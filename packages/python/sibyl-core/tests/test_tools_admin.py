@@ -0,0 +1,335 @@
+"""Tests for streamed graph backup export and batched, resumable restore."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sibyl_core.graph.entities import EntityPage
+from sibyl_core.graph.relationships import RelationshipPage
+from sibyl_core.models.entities import Entity, EntityType, Relationship, RelationshipType
+from sibyl_core.tools import admin
+from sibyl_core.tools.admin import (
+    BackupData,
+    export_backup_ndjson,
+    iter_backup_records,
+    read_backup_ndjson,
+    restore_backup,
+    restore_backup_stream,
+)
+
+ORG_ID = "org_1"
+
+
+def make_entity(i: int) -> Entity:
+    return Entity(
+        id=f"entity_{i:05d}",
+        entity_type=EntityType.PATTERN,
+        name=f"Pattern {i}",
+        description=f"Pattern number {i}",
+    )
+
+
+def make_relationship(i: int, source: int, target: int) -> Relationship:
+    return Relationship(
+        id=f"rel_{i:05d}",
+        relationship_type=RelationshipType.RELATED_TO,
+        source_id=f"entity_{source:05d}",
+        target_id=f"entity_{target:05d}",
+    )
+
+
+def backup_records(entities: int, relationships: int) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] = [{"kind": "header", "version": admin.BACKUP_VERSION}]
+    records += [
+        {"kind": "entity", "data": make_entity(i).model_dump(mode="json")} for i in range(entities)
+    ]
+    records += [
+        {"kind": "relationship", "data": make_relationship(i, i, i + 1).model_dump(mode="json")}
+        for i in range(relationships)
+    ]
+    records.append(
+        {"kind": "footer", "entity_count": entities, "relationship_count": relationships}
+    )
+    return records
+
+
+async def fake_embed_batch(texts: list[str]) -> list[list[float]]:
+    return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+
+class FakeGraph:
+    """Answers the restore's UNWIND queries from in-memory node and edge sets."""
+
+    def __init__(self, existing: set[str] | None = None, *, fail_on_write: int = 0) -> None:
+        self.nodes: dict[str, str] = dict.fromkeys(existing or set(), "Entity")
+        self.edges: set[tuple[str, str, str]] = set()
+        self.embeddings: dict[str, list[float]] = {}
+        self.writes = 0
+        self.fail_on_write = fail_on_write
+        self.client = MagicMock()
+        self.client.embedder.create_batch = AsyncMock(side_effect=fake_embed_batch)
+
+    async def execute_read_org(
+        self, query: str, organization_id: str, **params: Any
+    ) -> list[dict[str, Any]]:
+        label = "Episodic" if ":Episodic" in query else "Entity"
+        return [{"uuid": i} for i in params["ids"] if self.nodes.get(i) == label]
+
+    async def execute_write_org(
+        self, query: str, organization_id: str, **params: Any
+    ) -> list[dict[str, Any]]:
+        self.writes += 1
+        if self.writes == self.fail_on_write:
+            raise ConnectionError("connection lost")
+        if "vecf32" in query:
+            for row in params["rows"]:
+                if row["uuid"] in self.nodes:
+                    self.embeddings[row["uuid"]] = row["embedding"]
+            return [{"updated": len(params["rows"])}]
+        if "CREATE (n:" in query:
+            for node in params["nodes"]:
+                self.nodes[node["uuid"]] = "Entity"
+            return []
+        if "MERGE" in query:
+            created = 0
+            for rel in params["rels"]:
+                if rel["from_uuid"] in self.nodes and rel["to_uuid"] in self.nodes:
+                    self.edges.add((rel["from_uuid"], rel["to_uuid"], query))
+                    created += 1
+            return [{"created": created}]
+        return [{"updated": len(params.get("updates", []))}]
+
+
+@pytest.fixture
+def graph(monkeypatch: pytest.MonkeyPatch) -> FakeGraph:
+    fake = FakeGraph()
+    monkeypatch.setattr(admin, "get_graph_client", AsyncMock(return_value=fake))
+    return fake
+
+
+# =============================================================================
+# Export
+# =============================================================================
+
+
+class TestIterBackupRecords:
+    async def test_pages_through_everything(
+        self, graph: FakeGraph, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        entities = [make_entity(i) for i in range(5)]
+        relationships = [make_relationship(i, i, i + 1) for i in range(3)]
+        entity_cursors: list[str] = []
+        rel_cursors: list[str] = []
+
+        async def list_page(self: Any, types: Any, limit: int, **kwargs: Any) -> EntityPage:
+            cursor = kwargs["cursor"]
+            entity_cursors.append(cursor)
+            start = int(cursor or 0)
+            nxt = str(start + limit) if start + limit < len(entities) else None
+            return EntityPage(entities=entities[start : start + limit], next_cursor=nxt)
+
+        async def list_rel_page(self: Any, limit: int, *, after_id: str) -> RelationshipPage:
+            rel_cursors.append(after_id)
+            start = int(after_id or 0)
+            nxt = str(start + limit) if start + limit < len(relationships) else None
+            page = relationships[start : start + limit]
+            return RelationshipPage(relationships=page, next_cursor=nxt)
+
+        monkeypatch.setattr(admin.EntityManager, "list_page", list_page)
+        monkeypatch.setattr(admin.RelationshipManager, "list_page", list_rel_page)
+
+        records = [r async for r in iter_backup_records(organization_id=ORG_ID, page_size=2)]
+
+        kinds = [r["kind"] for r in records]
+        assert kinds == ["header"] + ["entity"] * 5 + ["relationship"] * 3 + ["footer"]
+        assert records[-1] == {"kind": "footer", "entity_count": 5, "relationship_count": 3}
+        assert entity_cursors == ["", "2", "4"]
+        assert rel_cursors == ["", "2"]
+
+    async def test_export_writes_one_line_per_record(
+        self, graph: FakeGraph, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        # Built once: entities get fresh timestamps on every construction
+        records = backup_records(3, 2)
+
+        async def fake_records(**_kwargs: Any) -> Any:
+            for record in records:
+                yield record
+
+        monkeypatch.setattr(admin, "iter_backup_records", fake_records)
+        path = tmp_path / "graph.ndjson"
+
+        with path.open("wb") as f:
+            result = await export_backup_ndjson(f.write, organization_id=ORG_ID, page_size=2)
+
+        assert result.success
+        assert (result.entity_count, result.relationship_count) == (3, 2)
+        assert list(read_backup_ndjson(path)) == records
+
+    async def test_export_failure_is_reported(
+        self, graph: FakeGraph, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def failing_records(**_kwargs: Any) -> Any:
+            yield {"kind": "header"}
+            raise ConnectionError("graph went away")
+
+        monkeypatch.setattr(admin, "iter_backup_records", failing_records)
+
+        result = await export_backup_ndjson(lambda _data: None, organization_id=ORG_ID)
+
+        assert not result.success
+        assert "graph went away" in result.message
+
+
+# =============================================================================
+# Restore
+# =============================================================================
+
+
+class TestRestoreBackupStream:
+    async def test_restores_in_batches(self, graph: FakeGraph) -> None:
+        result = await restore_backup_stream(
+            backup_records(10, 9), organization_id=ORG_ID, batch_size=4
+        )
+
+        assert result.success, result.errors
+        assert result.entities_restored == 10
+        assert result.relationships_restored == 9
+        assert len(graph.nodes) == 10
+        assert len(graph.edges) == 9
+        # Per batch holding entities: one node write and one embedding write;
+        # one edge write per batch with edges
+        assert graph.writes == 3 * 2 + 3
+        assert graph.client.embedder.create_batch.await_count == 3
+
+    async def test_embeddings_survive_round_trip(
+        self, graph: FakeGraph, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Exported entities come back with a name_embedding, reusing any in the record."""
+        entities = [make_entity(i) for i in range(3)]
+
+        async def list_page(self: Any, types: Any, limit: int, **kwargs: Any) -> EntityPage:
+            return EntityPage(entities=entities)
+
+        async def list_rel_page(self: Any, limit: int, *, after_id: str) -> RelationshipPage:
+            return RelationshipPage(relationships=[])
+
+        monkeypatch.setattr(admin.EntityManager, "list_page", list_page)
+        monkeypatch.setattr(admin.RelationshipManager, "list_page", list_rel_page)
+        records = [r async for r in iter_backup_records(organization_id=ORG_ID)]
+        records[1]["data"]["embedding"] = [0.5, 0.5, 0.5]
+
+        result = await restore_backup_stream(records, organization_id=ORG_ID)
+
+        assert result.success, result.errors
+        assert set(graph.embeddings) == {entity.id for entity in entities}
+        assert graph.embeddings["entity_00000"] == [0.5, 0.5, 0.5]
+        text = admin.EntityManager.embedding_text(entities[1])
+        assert graph.embeddings["entity_00001"] == [float(len(text)), 1.0, 0.0]
+        # Only the entities without a stored vector are embedded, in one call
+        graph.client.embedder.create_batch.assert_awaited_once()
+        assert len(graph.client.embedder.create_batch.await_args.args[0]) == 2
+
+    async def test_embedder_failure_stops_before_writing(self, graph: FakeGraph) -> None:
+        graph.client.embedder.create_batch.side_effect = RuntimeError("embedder down")
+
+        result = await restore_backup_stream(backup_records(3, 0), organization_id=ORG_ID)
+
+        assert not result.success
+        assert "embedder down" in result.errors[0]
+        assert graph.nodes == {}
+
+    async def test_skips_existing_entities(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = FakeGraph(existing={"entity_00000", "entity_00001"})
+        monkeypatch.setattr(admin, "get_graph_client", AsyncMock(return_value=graph))
+
+        result = await restore_backup_stream(backup_records(5, 0), organization_id=ORG_ID)
+
+        assert result.entities_restored == 3
+        assert result.entities_skipped == 2
+
+    async def test_missing_endpoints_are_skipped(self, graph: FakeGraph) -> None:
+        records = backup_records(2, 0)
+        dangling = make_relationship(0, 0, 99).model_dump(mode="json")
+        records.insert(-1, {"kind": "relationship", "data": dangling})
+
+        result = await restore_backup_stream(records, organization_id=ORG_ID)
+
+        assert result.relationships_restored == 0
+        assert result.relationships_skipped == 1
+
+    async def test_invalid_records_are_reported(self, graph: FakeGraph) -> None:
+        records = backup_records(2, 0)
+        records.insert(1, {"kind": "entity", "data": {"id": "broken"}})
+
+        result = await restore_backup_stream(records, organization_id=ORG_ID)
+
+        assert not result.success
+        assert result.entities_restored == 2
+        assert "Entity broken" in result.errors[0]
+
+    async def test_truncated_stream_is_reported(self, graph: FakeGraph) -> None:
+        result = await restore_backup_stream(backup_records(2, 0)[:-1], organization_id=ORG_ID)
+
+        assert not result.success
+        assert "truncated" in result.errors[0]
+
+    async def test_resumes_from_checkpoint(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        checkpoint = tmp_path / "restore.checkpoint"
+        # Two writes per batch (nodes, embeddings): fail on the third batch's nodes
+        graph = FakeGraph(fail_on_write=5)
+        monkeypatch.setattr(admin, "get_graph_client", AsyncMock(return_value=graph))
+
+        first = await restore_backup_stream(
+            backup_records(10, 0), organization_id=ORG_ID, batch_size=4, checkpoint_path=checkpoint
+        )
+
+        assert not first.success
+        assert "connection lost" in first.errors[0]
+        assert json.loads(checkpoint.read_text())["records_done"] == 8
+
+        graph.fail_on_write = 0
+        second = await restore_backup_stream(
+            backup_records(10, 0), organization_id=ORG_ID, batch_size=4, checkpoint_path=checkpoint
+        )
+
+        assert second.success, second.errors
+        assert second.entities_restored == 10
+        assert len(graph.nodes) == 10
+        assert not checkpoint.exists()
+
+    async def test_checkpoint_for_another_org_is_rejected(
+        self, graph: FakeGraph, tmp_path: Path
+    ) -> None:
+        checkpoint = tmp_path / "restore.checkpoint"
+        checkpoint.write_text(json.dumps({"organization_id": "org_2", "records_done": 4}))
+
+        result = await restore_backup_stream(
+            backup_records(2, 0), organization_id=ORG_ID, checkpoint_path=checkpoint
+        )
+
+        assert not result.success
+        assert graph.writes == 0
+
+    async def test_restore_backup_data_uses_the_stream(self, graph: FakeGraph) -> None:
+        backup = BackupData(
+            version="2.0",
+            created_at="",
+            organization_id=ORG_ID,
+            entity_count=2,
+            relationship_count=1,
+            entities=[make_entity(i).model_dump(mode="json") for i in range(2)],
+            relationships=[make_relationship(0, 0, 1).model_dump(mode="json")],
+        )
+
+        result = await restore_backup(backup, organization_id=ORG_ID)
+
+        assert result.success, result.errors
+        assert (result.entities_restored, result.relationships_restored) == (2, 1)
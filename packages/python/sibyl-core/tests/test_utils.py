@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from sibyl_core.errors import ValidationError
 from sibyl_core.tools.helpers import (
     MAX_CONTENT_LENGTH,
     MAX_TITLE_LENGTH,
@@ -21,6 +22,7 @@ from sibyl_core.tools.helpers import (
     _serialize_enum,
     auto_tag_task,
 )
+from sibyl_core.utils.pagination import decode_cursor, encode_cursor
 from sibyl_core.utils.resilience import (
     GRAPH_RETRY,
     RetryConfig,
@@ -948,3 +950,31 @@ class TestDepthClamping:
         )
 
         assert result.depth == 1  # include_transitive=False forces depth to 1
+
+
+class TestPaginationCursor:
+    """Tests for keyset pagination cursors."""
+
+    def test_round_trip(self) -> None:
+        """A cursor decodes to the sort key it was built from."""
+        token = encode_cursor("created_at", "2024-01-01T00:00:00+00:00", "task_1")
+
+        assert decode_cursor(token, "created_at") == ("2024-01-01T00:00:00+00:00", "task_1")
+        assert "=" not in token
+
+    def test_empty_is_first_page(self) -> None:
+        """An empty cursor requests the first page."""
+        assert decode_cursor("", "created_at") is None
+
+    def test_ordering_mismatch(self) -> None:
+        """Cursors are bound to the ordering they were issued for."""
+        token = encode_cursor("created_at", "2024-01-01", "task_1")
+
+        with pytest.raises(ValidationError, match="ordering"):
+            decode_cursor(token, "updated_at")
+
+    @pytest.mark.parametrize("token", ["%%%", "bm90LWpzb24", "WzFd"])
+    def test_malformed(self, token: str) -> None:
+        """Undecodable or wrongly shaped tokens raise ValidationError."""
+        with pytest.raises(ValidationError):
+            decode_cursor(token, "created_at")